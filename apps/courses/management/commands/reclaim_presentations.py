@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from apps.courses.services.presentation.reclaimer import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MIN_AGE,
+    OrphanedFileReclaimer,
+)
+
+
+class Command(BaseCommand):
+    help = "Remove presentation and preview files that no database row references"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only report orphaned files")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Files checked against the database per query",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=DEFAULT_MIN_AGE,
+            help="Skip files modified within this many seconds (uploads still in flight)",
+        )
+
+    def handle(self, *args, **options):
+        reclaimer = OrphanedFileReclaimer(batch_size=options["batch_size"], min_age=options["min_age"])
+        verbose = options["verbosity"] > 1
+
+        def report_orphan(name, size):
+            if verbose or options["dry_run"]:
+                self.stdout.write(f"{name} ({size} bytes)")
+
+        report = reclaimer.reclaim(dry_run=options["dry_run"], on_orphan=report_orphan)
+        action = "Would remove" if options["dry_run"] else "Removed"
+        self.stdout.write(self.style.SUCCESS(
+            f"Scanned {report.scanned} files; {action} {report.orphaned} orphans "
+            f"({report.reclaimed_bytes} bytes)"
+        ))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from apps.courses.services.presentation.previews import PresentationPreviewService
+from common.enums import ModelFields, PreviewStatus
+
+
+class Command(BaseCommand):
+    help = "Render previews that failed or stayed pending past PRESENTATION_PREVIEW_TIMEOUT (their job was lost)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only list the previews that would be rendered")
+
+    def handle(self, *args, **options):
+        service = PresentationPreviewService()
+        blobs = service.retryable().values_list(ModelFields.BLOB.value, flat=True).iterator()
+        rendered = 0
+        for blob in blobs:
+            if options["dry_run"]:
+                self.stdout.write(blob)
+                rendered += 1
+                continue
+            # Renders inline; a row another process claimed meanwhile is left to it
+            if service.generate(blob).status == PreviewStatus.READY.value:
+                rendered += 1
+        action = "Would render" if options["dry_run"] else "Rendered"
+        self.stdout.write(self.style.SUCCESS(f"{action} {rendered} previews"))
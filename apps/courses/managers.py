@@ -1,7 +1,7 @@
 from django.db import models
-from django.db.models import Count
+from django.db.models import Count, OuterRef, Subquery
 
-from common.enums import ModelFields
+from common.enums import ModelFields, SerializerFields
 
 
 class CourseQuerySet(models.QuerySet):
@@ -12,3 +12,18 @@ class CourseQuerySet(models.QuerySet):
         )
 
 
+
+
+class LectureQuerySet(models.QuerySet):
+    def with_previews(self):
+        """Attach preview status and artefact names of each lecture's presentation blob"""
+        from .models import PresentationPreview
+
+        previews = PresentationPreview.objects.filter(
+            **{ModelFields.BLOB.value: OuterRef(ModelFields.PRESENTATION.value)}
+        )
+        return self.annotate(**{
+            SerializerFields.PREVIEW_STATUS.value: Subquery(previews.values(ModelFields.STATUS.value)[:1]),
+            SerializerFields.PREVIEW_THUMBNAIL.value: Subquery(previews.values(ModelFields.THUMBNAIL.value)[:1]),
+            SerializerFields.PREVIEW_IMAGE.value: Subquery(previews.values(ModelFields.PREVIEW.value)[:1]),
+        })
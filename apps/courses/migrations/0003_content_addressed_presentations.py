@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:23
+
+import apps.courses.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='lecture',
+            name='presentation',
+            field=models.FileField(db_index=True, storage=apps.courses.storage.presentation_storage, upload_to='presentations/'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0003_content_addressed_presentations'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PresentationPreview',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('blob', models.CharField(max_length=100, unique=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed'), ('unavailable', 'Unavailable')], default='pending', max_length=20)),
+                ('thumbnail', models.FileField(blank=True, upload_to='previews/')),
+                ('preview', models.FileField(blank=True, upload_to='previews/')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
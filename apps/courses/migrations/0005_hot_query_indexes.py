@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Composite indexes that match both the filter and the ORDER BY of the hot
+# list queries (SQLite plans lost their "USE TEMP B-TREE FOR ORDER BY" step).
+# They are created before the single-column foreign key indexes they make
+# redundant are dropped, so no lookup is ever left without an index.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0004_presentation_previews'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['-created_at'], name='course_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='coursestudent',
+            index=models.Index(fields=['user', 'course'], name='course_student_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lecture',
+            index=models.Index(fields=['course', 'created_at'], name='lecture_course_created_idx'),
+        ),
+        migrations.AlterModelOptions(
+            name='lecture',
+            options={'ordering': ['created_at', 'id']},
+        ),
+        migrations.AlterField(
+            model_name='coursestudent',
+            name='course',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='courses.course'),
+        ),
+        migrations.AlterField(
+            model_name='coursestudent',
+            name='user',
+            field=models.ForeignKey(db_index=False, limit_choices_to={'role': 'student'}, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='lecture',
+            name='course',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='courses.course'),
+        ),
+    ]
@@ -7,9 +7,12 @@ from common.enums import (
     ModelVerboseNames,
     ModelFields,
     ConstraintNames,
+    IndexNames,
     UploadPaths,
+    PreviewStatus,
 )
-from .managers import CourseQuerySet
+from .managers import CourseQuerySet, LectureQuerySet
+from .storage import presentation_storage
 
 
 class Course(models.Model):
@@ -39,6 +42,9 @@ class Course(models.Model):
 
     class Meta:
         ordering = [f'-{ModelFields.CREATED_AT.value}']
+        indexes = [
+            models.Index(fields=[f'-{ModelFields.CREATED_AT.value}'], name=IndexNames.COURSE_CREATED.value),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=[ModelFields.NAME.value, ModelFields.PRIMARY_OWNER.value],
@@ -76,15 +82,23 @@ class CourseTeacher(models.Model):
 
 
 class CourseStudent(models.Model):
-    course = models.ForeignKey(Course, on_delete=models.CASCADE)
+    # Both foreign keys lead a composite index below, so neither gets its own
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, db_index=False)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         limit_choices_to={UserFields.ROLE.value: UserRole.STUDENT.value},
+        db_index=False,
     )
     enrolled_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
+        indexes = [
+            models.Index(
+                fields=[ModelFields.USER.value, ModelFields.COURSE.value],
+                name=IndexNames.COURSE_STUDENT_USER_COURSE.value,
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=[ModelFields.COURSE.value, ModelFields.USER.value],
@@ -101,13 +115,25 @@ class CourseStudent(models.Model):
 
 
 class Lecture(models.Model):
-    course = models.ForeignKey(Course, on_delete=models.CASCADE)
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, db_index=False)
     topic = models.CharField(max_length=255)
-    presentation = models.FileField(upload_to=UploadPaths.PRESENTATIONS.value)
+    presentation = models.FileField(
+        upload_to=UploadPaths.PRESENTATIONS.value,
+        storage=presentation_storage,
+        db_index=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    objects = LectureQuerySet.as_manager()
 
     class Meta:
+        ordering = [ModelFields.CREATED_AT.value, ModelFields.ID.value]
+        indexes = [
+            models.Index(
+                fields=[ModelFields.COURSE.value, ModelFields.CREATED_AT.value],
+                name=IndexNames.LECTURE_COURSE_CREATED.value,
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=[ModelFields.COURSE.value, ModelFields.TOPIC.value],
@@ -116,4 +142,18 @@ class Lecture(models.Model):
         ]
 
 
+class PresentationPreview(models.Model):
+    """Rendered first-page artefacts of one presentation blob, shared by every lecture storing it"""
+    blob = models.CharField(max_length=100, unique=True)
+    status = models.CharField(
+        max_length=20,
+        choices=PreviewStatus.choices(),
+        default=PreviewStatus.PENDING.value,
+    )
+    thumbnail = models.FileField(upload_to=UploadPaths.PREVIEWS.value, blank=True)
+    preview = models.FileField(upload_to=UploadPaths.PREVIEWS.value, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
+    def __str__(self):
+        return f"{self.blob} ({self.status})"
@@ -1,11 +1,14 @@
+from django.urls import reverse
 from rest_framework import serializers
-from common.enums import ModelFields, SerializerFields, RequestData, SerializerKwargs
-from apps.courses.models import Course, Lecture
+from common.enums import ModelFields, SerializerFields, RequestData, SerializerKwargs, PreviewStatus, URLPatterns
+from apps.courses.models import Course, Lecture, PresentationPreview
 from apps.users.serializers import UserListSerializer
+from common.expansion import SparseFieldsetMixin
+from apps.courses.services.presentation import build_url_signer
 from apps.courses.services import CourseCreationService, CourseUpdateService, CourseCreationRequest, CourseUpdateRequest
 
 
-class CourseListSerializer(serializers.ModelSerializer):
+class CourseListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     primary_owner = UserListSerializer(read_only=True)
     teacher_count = serializers.IntegerField(read_only=True)
     student_count = serializers.IntegerField(read_only=True)
@@ -135,14 +138,68 @@ class CourseUpdateSerializer(serializers.ModelSerializer):
         return course_service.update_course(instance, request)
 
 
-class LectureSerializer(serializers.ModelSerializer):
+class LectureSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    preview_status = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
+    preview_url = serializers.SerializerMethodField()
+
     class Meta:
         model = Lecture
         fields = [
             ModelFields.ID.value,
             ModelFields.TOPIC.value,
             ModelFields.PRESENTATION.value,
+            SerializerFields.PREVIEW_STATUS.value,
+            SerializerFields.THUMBNAIL_URL.value,
+            SerializerFields.PREVIEW_URL.value,
             ModelFields.CREATED_AT.value,
             ModelFields.UPDATED_AT.value,
         ]
         read_only_fields = [ModelFields.ID.value, ModelFields.CREATED_AT.value, ModelFields.UPDATED_AT.value]
+
+    def _preview_values(self, obj) -> dict:
+        """
+        Preview columns come annotated by ``with_previews()``; other lectures fall back to a lookup.
+
+        Lookups are remembered per blob, so a nested list whose rows share a
+        lecture (submissions of one homework) looks the preview up once.
+        """
+        keys = (
+            SerializerFields.PREVIEW_STATUS.value,
+            SerializerFields.PREVIEW_THUMBNAIL.value,
+            SerializerFields.PREVIEW_IMAGE.value,
+        )
+        if not hasattr(obj, keys[0]):
+            looked_up = self.__dict__.setdefault("_looked_up_previews", {})
+            blob = obj.presentation.name
+            if blob not in looked_up:
+                looked_up[blob] = (
+                    PresentationPreview.objects
+                    .filter(**{ModelFields.BLOB.value: blob})
+                    .values_list(ModelFields.STATUS.value, ModelFields.THUMBNAIL.value, ModelFields.PREVIEW.value)
+                    .first()
+                ) or (None, None, None)
+            for key, value in zip(keys, looked_up[blob]):
+                setattr(obj, key, value)
+        return {key: getattr(obj, key) for key in keys}
+
+    def _artefact_url(self, name):
+        """A short-lived signed link: artefacts are private to the course, and media URLs are not served"""
+        if not name:
+            return None
+        signer = self.__dict__.setdefault("_artefact_signer", build_url_signer())
+        url = reverse(
+            URLPatterns.PRESENTATION_PREVIEW_DOWNLOAD.value,
+            kwargs={URLPatterns.TOKEN.value: signer.sign_artefact(name)},
+        )
+        request = self.context.get(RequestData.REQUEST.value)
+        return request.build_absolute_uri(url) if request else url
+
+    def get_preview_status(self, obj):
+        return self._preview_values(obj)[SerializerFields.PREVIEW_STATUS.value] or PreviewStatus.PENDING.value
+
+    def get_thumbnail_url(self, obj):
+        return self._artefact_url(self._preview_values(obj)[SerializerFields.PREVIEW_THUMBNAIL.value])
+
+    def get_preview_url(self, obj):
+        return self._artefact_url(self._preview_values(obj)[SerializerFields.PREVIEW_IMAGE.value])
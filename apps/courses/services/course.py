@@ -3,6 +3,7 @@ from django.db import transaction
 from rest_framework.exceptions import ValidationError
 
 from apps.courses.models import Course
+from common.identity_map import register
 from .dtos import CourseCreationRequest, CourseUpdateRequest, CourseValidationResult, CourseUpdateValidationResult
 from .validation import (
     CourseCreationValidator,
@@ -55,6 +56,8 @@ class CourseUpdateService:
 
     def update_course(self, instance: Course, request: CourseUpdateRequest) -> Course:
         """Update an existing course with all validations and relationships"""
+        register(instance)
+
         # Validate all inputs
         validation_result = self.validation_service.validate_course_update(request)
 
@@ -1,6 +1,7 @@
 from .course import CourseCreationRequest, CourseUpdateRequest, CourseValidationResult, CourseUpdateValidationResult
 from .user import UserValidationResult
 from .lecture import LectureCreationRequest, LectureUpdateRequest, LectureValidationResult
+from .presentation import ByteRange, PresentationFile, ReclaimReport
 
 __all__ = [
     'CourseCreationRequest',
@@ -11,4 +12,7 @@ __all__ = [
     'LectureCreationRequest',
     'LectureUpdateRequest',
     'LectureValidationResult',
+    'ByteRange',
+    'PresentationFile',
+    'ReclaimReport',
 ]
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    """Inclusive byte range requested through an HTTP ``Range`` header"""
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    def content_range(self, size: int) -> str:
+        return f"bytes {self.start}-{self.end}/{size}"
+
+
+@dataclass(frozen=True)
+class PresentationFile:
+    """Storage metadata needed to answer conditional and range requests"""
+    name: str
+    size: int
+    modified_at: datetime
+    content_type: str
+    filename: str
+
+    @property
+    def last_modified(self) -> int:
+        return int(self.modified_at.timestamp())
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.last_modified:x}-{self.size:x}"'
+
+
+@dataclass
+class ReclaimReport:
+    """Outcome of an orphaned-file sweep over presentation storage"""
+    scanned: int = 0
+    orphaned: int = 0
+    removed: int = 0
+    reclaimed_bytes: int = 0
@@ -6,7 +6,9 @@ from apps.courses.models import Course, Lecture
 from apps.courses.services.dtos import LectureCreationRequest, LectureUpdateRequest
 from apps.courses.services.lecture.validation import LectureCreationValidator, LectureUpdateValidator
 from apps.courses.services.shared.ownership_guard import CourseOwnershipGuard
-from apps.courses.services.protocols import OwnershipGuard, LectureService
+from apps.courses.services.presentation.collector import ReferenceCountingCollector
+from apps.courses.services.presentation.previews import PresentationPreviewService
+from apps.courses.services.protocols import OwnershipGuard, LectureService, PresentationCollector, PreviewGenerator
 from common.enums import ModelFields
 
 
@@ -14,6 +16,7 @@ from common.enums import ModelFields
 class LectureCreationService:
     validation_service: LectureCreationValidator = field(default_factory=LectureCreationValidator)
     ownership_guard: OwnershipGuard = field(default_factory=CourseOwnershipGuard)
+    preview_generator: PreviewGenerator = field(default_factory=PresentationPreviewService)
 
     def create_lecture(self, request: LectureCreationRequest, course: Course, user) -> Lecture:
         """Create a new lecture with full validation"""
@@ -24,7 +27,9 @@ class LectureCreationService:
         if not validation_result.is_valid:
             raise ValidationError(validation_result.errors)
 
-        return self._create_lecture_with_validation(request, course)
+        lecture = self._create_lecture_with_validation(request, course)
+        self.preview_generator.schedule(lecture)
+        return lecture
 
     @transaction.atomic
     def _create_lecture_with_validation(self, request: LectureCreationRequest, course: Course) -> Lecture:
@@ -41,6 +46,8 @@ class LectureUpdateService:
     """Handles lecture updates with validation and business logic"""
     validation_service: LectureUpdateValidator = field(default_factory=LectureUpdateValidator)
     ownership_guard: OwnershipGuard = field(default_factory=CourseOwnershipGuard)
+    presentation_collector: PresentationCollector = field(default_factory=ReferenceCountingCollector)
+    preview_generator: PreviewGenerator = field(default_factory=PresentationPreviewService)
 
     def update_lecture(self, instance: Lecture, request: LectureUpdateRequest, user) -> Lecture:
         """Update an existing lecture with full validation"""
@@ -60,10 +67,16 @@ class LectureUpdateService:
         """Update lecture in a transaction"""
         if request.topic is not None:
             instance.topic = request.topic
+        previous_presentation = instance.presentation.name
         if request.presentation is not None:
             instance.presentation = request.presentation
         
         instance.save()
+
+        # Identical content maps to the same blob, so only a changed name drops a reference
+        if instance.presentation.name != previous_presentation:
+            self.presentation_collector.release(previous_presentation)
+            self.preview_generator.schedule(instance)
         return instance
 
 
@@ -0,0 +1,42 @@
+from .delivery import (
+    DirectFileDelivery,
+    XAccelRedirectDelivery,
+    XSendfileDelivery,
+    SignedUrlDelivery,
+    PresentationUrlSigner,
+    RangeNotSatisfiable,
+    parse_range_header,
+    build_presentation_delivery,
+    build_url_signer,
+)
+from .collector import ReferenceCountingCollector
+from .reclaimer import OrphanedFileReclaimer, ReclaimTarget, iter_stored_files
+from .previews import PresentationPreviewService, PdfRenderer, ImageRenderer
+from .services import PresentationDownloadService
+
+__all__ = [
+    # Delivery strategies
+    'DirectFileDelivery',
+    'XAccelRedirectDelivery',
+    'XSendfileDelivery',
+    'SignedUrlDelivery',
+    'PresentationUrlSigner',
+    'RangeNotSatisfiable',
+    'parse_range_header',
+    'build_presentation_delivery',
+    'build_url_signer',
+
+    # Storage reclamation
+    'ReferenceCountingCollector',
+    'OrphanedFileReclaimer',
+    'ReclaimTarget',
+    'iter_stored_files',
+
+    # Previews
+    'PresentationPreviewService',
+    'PdfRenderer',
+    'ImageRenderer',
+
+    # Services
+    'PresentationDownloadService',
+]
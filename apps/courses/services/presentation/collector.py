@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.courses.models import Lecture, PresentationPreview
+from apps.courses.services.protocols import PresentationCollector
+from common.enums import ModelFields
+
+
+@dataclass
+class ReferenceCountingCollector(PresentationCollector):
+    """
+    Garbage-collects content-addressed presentation blobs.
+
+    A blob is shared by every lecture whose ``presentation`` holds its name,
+    so the reference count is simply the number of such rows. The check runs
+    after the surrounding transaction commits: a rollback keeps the file,
+    and a lecture that picked up the same blob in the meantime keeps it alive.
+    A lecture still being saved is not counted yet, so a blob written or
+    re-uploaded within the last ``min_age`` seconds (default
+    ``PRESENTATION_COLLECT_MIN_AGE``) is kept and left to the orphan sweep.
+    Rendered previews of the blob are removed along with it.
+    """
+    min_age: Optional[float] = None
+
+    def release(self, name: str) -> None:
+        if name:
+            transaction.on_commit(partial(self.collect, name))
+
+    def reference_count(self, name: str) -> int:
+        return Lecture.objects.filter(**{ModelFields.PRESENTATION.value: name}).count()
+
+    def collect(self, name: str) -> bool:
+        """Delete the blob when nothing references it; returns whether it was removed"""
+        if self.reference_count(name):
+            return False
+
+        storage = Lecture._meta.get_field(ModelFields.PRESENTATION.value).storage
+        min_age = settings.PRESENTATION_COLLECT_MIN_AGE if self.min_age is None else self.min_age
+        if not storage.delete_unless_touched(name, min_age):
+            return False
+
+        for preview in PresentationPreview.objects.filter(**{ModelFields.BLOB.value: name}):
+            preview.thumbnail.delete(save=False)
+            preview.preview.delete(save=False)
+            preview.delete()
+        return True
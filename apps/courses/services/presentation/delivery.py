@@ -0,0 +1,261 @@
+import mimetypes
+import os
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core import signing
+from django.http import FileResponse, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+from django.utils.text import slugify
+from rest_framework.exceptions import NotFound
+
+from apps.courses.models import Lecture
+from apps.courses.services.dtos import ByteRange, PresentationFile
+from apps.courses.services.protocols import PresentationDelivery
+from common.enums import ErrorMessages, HttpHeaders, HttpStatus, PresentationDeliveryBackends, URLPatterns
+
+RANGE_UNIT = "bytes"
+STREAM_CHUNK_SIZE = 64 * 1024
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+DEFAULT_DOWNLOAD_NAME = "presentation"
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+SIGNED_URL_SALT = "apps.courses.presentation"
+SIGNED_ARTEFACT_SALT = "apps.courses.presentation.previews"
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when a syntactically valid range lies outside the file"""
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[ByteRange]:
+    """
+    Parse a single ``bytes=`` range.
+
+    Returns None when the header is absent, malformed or asks for several
+    ranges, in which case the full file is served as RFC 9110 allows.
+    """
+    if not header:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != RANGE_UNIT or "," in spec:
+        return None
+
+    first, separator, last = spec.strip().partition("-")
+    if not separator:
+        return None
+
+    try:
+        if first == "":
+            suffix_length = int(last)
+            if suffix_length <= 0 or size == 0:
+                raise RangeNotSatisfiable()
+            return ByteRange(start=max(size - suffix_length, 0), end=size - 1)
+
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+
+    if start > end and last:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    return ByteRange(start=start, end=min(end, size - 1))
+
+
+def describe_presentation(lecture: Lecture) -> PresentationFile:
+    """Collect size, mtime and type of the lecture presentation from its storage"""
+    presentation = lecture.presentation
+    if not presentation or not presentation.storage.exists(presentation.name):
+        raise NotFound(ErrorMessages.PRESENTATION_NOT_FOUND.value)
+
+    content_type, _ = mimetypes.guess_type(presentation.name)
+    # Stored names are content digests, so offer the lecture topic to the client instead
+    extension = os.path.splitext(presentation.name)[1]
+    return PresentationFile(
+        name=presentation.name,
+        size=presentation.storage.size(presentation.name),
+        modified_at=presentation.storage.get_modified_time(presentation.name),
+        content_type=content_type or DEFAULT_CONTENT_TYPE,
+        filename=f"{slugify(lecture.topic) or DEFAULT_DOWNLOAD_NAME}{extension}",
+    )
+
+
+def _read_range(handle, byte_range: ByteRange) -> Iterator[bytes]:
+    """Yield exactly ``byte_range.length`` bytes starting at ``byte_range.start``"""
+    try:
+        handle.seek(byte_range.start)
+        remaining = byte_range.length
+        while remaining > 0:
+            chunk = handle.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        handle.close()
+
+
+def _apply_validators(response, presentation: PresentationFile):
+    response[HttpHeaders.ETAG.value] = presentation.etag
+    response[HttpHeaders.LAST_MODIFIED.value] = http_date(presentation.last_modified)
+    response[HttpHeaders.CACHE_CONTROL.value] = PRIVATE_CACHE_CONTROL
+    return response
+
+
+@dataclass
+class DirectFileDelivery(PresentationDelivery):
+    """
+    Serves the file from the application process.
+
+    Full downloads go through ``FileResponse`` so WSGI servers can use
+    ``wsgi.file_wrapper``/sendfile; partial downloads stream only the
+    requested slice.
+    """
+    as_attachment: bool = False
+
+    def deliver(self, request, lecture: Lecture):
+        presentation = describe_presentation(lecture)
+
+        not_modified = get_conditional_response(
+            request,
+            etag=presentation.etag,
+            last_modified=presentation.last_modified,
+        )
+        if not_modified is not None:
+            return _apply_validators(not_modified, presentation)
+
+        try:
+            byte_range = (
+                parse_range_header(request.META.get(HttpHeaders.RANGE.value), presentation.size)
+                if self._range_applies(request, presentation)
+                else None
+            )
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=HttpStatus.RANGE_NOT_SATISFIABLE.value)
+            response[HttpHeaders.CONTENT_RANGE.value] = f"{RANGE_UNIT} */{presentation.size}"
+            return response
+
+        handle = lecture.presentation.storage.open(presentation.name, "rb")
+        if byte_range is None:
+            response = FileResponse(
+                handle,
+                content_type=presentation.content_type,
+                as_attachment=self.as_attachment,
+                filename=presentation.filename,
+            )
+        else:
+            response = StreamingHttpResponse(
+                _read_range(handle, byte_range),
+                status=HttpStatus.PARTIAL_CONTENT.value,
+                content_type=presentation.content_type,
+            )
+            response[HttpHeaders.CONTENT_LENGTH.value] = str(byte_range.length)
+            response[HttpHeaders.CONTENT_RANGE.value] = byte_range.content_range(presentation.size)
+            response[HttpHeaders.CONTENT_DISPOSITION.value] = content_disposition_header(
+                self.as_attachment, presentation.filename
+            )
+
+        response[HttpHeaders.ACCEPT_RANGES.value] = RANGE_UNIT
+        return _apply_validators(response, presentation)
+
+    def _range_applies(self, request, presentation: PresentationFile) -> bool:
+        """Honour ``If-Range``: only serve a slice of the representation the client already has"""
+        if_range = request.META.get(HttpHeaders.IF_RANGE.value)
+        if not if_range:
+            return True
+        if if_range.startswith('"'):
+            return if_range == presentation.etag
+        return parse_http_date_safe(if_range) == presentation.last_modified
+
+
+@dataclass
+class XAccelRedirectDelivery(PresentationDelivery):
+    """Hands the transfer to nginx through an ``internal`` location"""
+    internal_prefix: str = "/protected-media/"
+
+    def deliver(self, request, lecture: Lecture):
+        presentation = describe_presentation(lecture)
+        response = HttpResponse(content_type=presentation.content_type)
+        response[HttpHeaders.X_ACCEL_REDIRECT.value] = f"{self.internal_prefix}{quote(presentation.name)}"
+        response[HttpHeaders.CONTENT_DISPOSITION.value] = content_disposition_header(False, presentation.filename)
+        return response
+
+
+@dataclass
+class XSendfileDelivery(PresentationDelivery):
+    """Hands the transfer to Apache/lighttpd through ``X-Sendfile``"""
+
+    def deliver(self, request, lecture: Lecture):
+        presentation = describe_presentation(lecture)
+        response = HttpResponse(content_type=presentation.content_type)
+        response[HttpHeaders.X_SENDFILE.value] = lecture.presentation.path
+        response[HttpHeaders.CONTENT_DISPOSITION.value] = content_disposition_header(False, presentation.filename)
+        return response
+
+
+@dataclass
+class PresentationUrlSigner:
+    """
+    Issues and verifies short-lived download tokens bound to the current file.
+
+    Preview artefacts get tokens of their own, bound to the artefact name
+    and issued only in responses to users who may see the lecture.
+    """
+    max_age: int = 300
+    salt: str = SIGNED_URL_SALT
+    artefact_salt: str = SIGNED_ARTEFACT_SALT
+
+    def sign(self, lecture: Lecture) -> str:
+        return signing.dumps([lecture.id, lecture.presentation.name], salt=self.salt, compress=True)
+
+    def unsign(self, token: str) -> tuple[int, str]:
+        try:
+            lecture_id, name = signing.loads(token, salt=self.salt, max_age=self.max_age)
+        except (signing.BadSignature, ValueError, TypeError):
+            raise NotFound(ErrorMessages.DOWNLOAD_LINK_INVALID.value)
+        return lecture_id, name
+
+    def sign_artefact(self, name: str) -> str:
+        return signing.dumps(name, salt=self.artefact_salt)
+
+    def unsign_artefact(self, token: str) -> str:
+        try:
+            name = signing.loads(token, salt=self.artefact_salt, max_age=self.max_age)
+        except (signing.BadSignature, ValueError, TypeError):
+            raise NotFound(ErrorMessages.DOWNLOAD_LINK_INVALID.value)
+        return name
+
+
+@dataclass
+class SignedUrlDelivery(PresentationDelivery):
+    """Redirects to a short-lived signed URL that needs no further authentication"""
+    signer: PresentationUrlSigner = field(default_factory=PresentationUrlSigner)
+
+    def deliver(self, request, lecture: Lecture):
+        describe_presentation(lecture)
+        token = self.signer.sign(lecture)
+        return HttpResponseRedirect(
+            reverse(URLPatterns.PRESENTATION_SIGNED_DOWNLOAD.value, kwargs={URLPatterns.TOKEN.value: token})
+        )
+
+
+def build_url_signer() -> PresentationUrlSigner:
+    return PresentationUrlSigner(max_age=settings.PRESENTATION_SIGNED_URL_MAX_AGE)
+
+
+def build_presentation_delivery() -> PresentationDelivery:
+    """Create the delivery strategy selected by ``PRESENTATION_DELIVERY_BACKEND``"""
+    backend = PresentationDeliveryBackends(settings.PRESENTATION_DELIVERY_BACKEND)
+    if backend == PresentationDeliveryBackends.X_ACCEL_REDIRECT:
+        return XAccelRedirectDelivery(internal_prefix=settings.PRESENTATION_ACCEL_REDIRECT_PREFIX)
+    if backend == PresentationDeliveryBackends.X_SENDFILE:
+        return XSendfileDelivery()
+    if backend == PresentationDeliveryBackends.SIGNED_URL:
+        return SignedUrlDelivery(signer=build_url_signer())
+    return DirectFileDelivery()
@@ -0,0 +1,153 @@
+import io
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import partial
+from typing import BinaryIO, Optional, Sequence
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from apps.courses.models import Lecture, PresentationPreview
+from apps.courses.services.protocols import PresentationRenderer, PreviewGenerator
+from common.enums import JobQueues, ModelFields, PreviewStatus
+from common.jobs import LocalJobQueue
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:  # pragma: no cover - optional dependency
+    fitz = None
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+PNG_FORMAT = "png"
+PDF_EXTENSIONS = (".pdf",)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+THUMBNAIL_SUFFIX = "thumbnail"
+PREVIEW_SUFFIX = "preview"
+
+
+class PdfRenderer(PresentationRenderer):
+    """Rasterises the first PDF page with PyMuPDF"""
+
+    def supports(self, name: str) -> bool:
+        return fitz is not None and name.lower().endswith(PDF_EXTENSIONS)
+
+    def render(self, handle: BinaryIO, widths: Sequence[int]) -> list[bytes]:
+        with fitz.open(stream=handle.read(), filetype=PDF_EXTENSIONS[0].lstrip(".")) as document:
+            page = document.load_page(0)
+            images = []
+            for width in widths:
+                zoom = width / page.rect.width
+                pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+                images.append(pixmap.tobytes(PNG_FORMAT))
+            return images
+
+
+class ImageRenderer(PresentationRenderer):
+    """Downscales image presentations with Pillow"""
+
+    def supports(self, name: str) -> bool:
+        return Image is not None and name.lower().endswith(IMAGE_EXTENSIONS)
+
+    def render(self, handle: BinaryIO, widths: Sequence[int]) -> list[bytes]:
+        with Image.open(handle) as source:
+            source = source.convert("RGB")
+            images = []
+            for width in widths:
+                resized = source.copy()
+                resized.thumbnail((width, source.height))  # keeps aspect ratio, never upscales
+                buffer = io.BytesIO()
+                resized.save(buffer, format=PNG_FORMAT)
+                images.append(buffer.getvalue())
+            return images
+
+
+def default_renderers() -> list[PresentationRenderer]:
+    return [PdfRenderer(), ImageRenderer()]
+
+
+def build_job_queue() -> LocalJobQueue:
+    return LocalJobQueue(JobQueues.PRESENTATION_PREVIEWS.value, workers=settings.PRESENTATION_PREVIEW_WORKERS)
+
+
+@dataclass
+class PresentationPreviewService(PreviewGenerator):
+    """
+    Renders a thumbnail and a low-resolution preview of each presentation blob.
+
+    Results are stored per blob, and blob names are content digests, so a
+    preview is rendered once per distinct file no matter how many lectures
+    share it or how often it is re-uploaded. A row left ``pending`` for
+    longer than ``PRESENTATION_PREVIEW_TIMEOUT`` lost its job (a worker
+    restarted before the queue drained) and is rendered again, like a failed one.
+    """
+    queue: LocalJobQueue = field(default_factory=build_job_queue)
+    renderers: list[PresentationRenderer] = field(default_factory=default_renderers)
+
+    def schedule(self, lecture: Lecture) -> None:
+        name = lecture.presentation.name
+        if name:
+            transaction.on_commit(partial(self.queue.submit, self.generate, name))
+
+    def generate(self, name: str) -> PresentationPreview:
+        """Render artefacts for a stored blob unless they already exist or are being built"""
+        preview, created = PresentationPreview.objects.get_or_create(**{ModelFields.BLOB.value: name})
+        if not created and not self._claim(preview):
+            return preview
+
+        renderer = self._renderer_for(name)
+        if renderer is None:
+            return self._set_status(preview, PreviewStatus.UNAVAILABLE)
+
+        storage = Lecture._meta.get_field(ModelFields.PRESENTATION.value).storage
+        try:
+            with storage.open(name, "rb") as handle:
+                thumbnail, image = renderer.render(
+                    handle,
+                    (settings.PRESENTATION_THUMBNAIL_WIDTH, settings.PRESENTATION_PREVIEW_WIDTH),
+                )
+        except Exception:
+            logger.exception("Rendering preview for %s failed", name)
+            return self._set_status(preview, PreviewStatus.FAILED)
+
+        stem = os.path.splitext(os.path.basename(name))[0]
+        preview.thumbnail.save(f"{stem}-{THUMBNAIL_SUFFIX}.{PNG_FORMAT}", ContentFile(thumbnail), save=False)
+        preview.preview.save(f"{stem}-{PREVIEW_SUFFIX}.{PNG_FORMAT}", ContentFile(image), save=False)
+        return self._set_status(preview, PreviewStatus.READY)
+
+    def retryable(self) -> QuerySet:
+        """Failed previews and those pending past the timeout"""
+        stale = timezone.now() - timedelta(seconds=settings.PRESENTATION_PREVIEW_TIMEOUT)
+        return PresentationPreview.objects.filter(
+            Q(**{ModelFields.STATUS.value: PreviewStatus.FAILED.value})
+            | Q(**{ModelFields.STATUS.value: PreviewStatus.PENDING.value, f"{ModelFields.UPDATED_AT.value}__lt": stale})
+        )
+
+    def _claim(self, preview: PresentationPreview) -> bool:
+        """Take a retryable preview back to pending; of concurrent callers only one wins the UPDATE"""
+        claimed = self.retryable().filter(pk=preview.pk).update(**{
+            ModelFields.STATUS.value: PreviewStatus.PENDING.value,
+            ModelFields.UPDATED_AT.value: timezone.now(),
+        })
+        if claimed:
+            preview.status = PreviewStatus.PENDING.value
+        return bool(claimed)
+
+    def _renderer_for(self, name: str) -> Optional[PresentationRenderer]:
+        return next((renderer for renderer in self.renderers if renderer.supports(name)), None)
+
+    @staticmethod
+    def _set_status(preview: PresentationPreview, status: PreviewStatus) -> PresentationPreview:
+        preview.status = status.value
+        preview.save()
+        return preview
@@ -0,0 +1,109 @@
+import os
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Iterator, Optional
+
+from django.db import models
+
+from apps.courses.models import Lecture, PresentationPreview
+from apps.courses.services.dtos import ReclaimReport
+from common.enums import ModelFields, UploadPaths
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MIN_AGE = 60 * 60  # seconds
+
+
+@dataclass(frozen=True)
+class ReclaimTarget:
+    """A storage prefix and the model columns that may reference files below it"""
+    prefix: str
+    model: type[models.Model]
+    fields: tuple[str, ...]
+
+    @property
+    def storage(self):
+        return self.model._meta.get_field(self.fields[0]).storage
+
+    def referenced(self, names: list[str]) -> set[str]:
+        found = set()
+        for column in self.fields:
+            found.update(
+                self.model.objects
+                .filter(**{f"{column}__in": names})
+                .values_list(column, flat=True)
+            )
+        return found
+
+
+def default_targets() -> list[ReclaimTarget]:
+    return [
+        ReclaimTarget(UploadPaths.PRESENTATIONS.value, Lecture, (ModelFields.PRESENTATION.value,)),
+        ReclaimTarget(
+            UploadPaths.PREVIEWS.value,
+            PresentationPreview,
+            (ModelFields.THUMBNAIL.value, ModelFields.PREVIEW.value),
+        ),
+    ]
+
+
+def iter_stored_files(root: str, prefix: str) -> Iterator[os.DirEntry]:
+    """Walk ``root/prefix`` lazily with ``os.scandir``; memory grows with directory depth, not file count"""
+    pending = [os.path.join(root, prefix)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+@dataclass
+class OrphanedFileReclaimer:
+    """
+    Diffs the storage tree against database references and removes orphans.
+
+    Files are streamed from disk and checked in fixed-size batches with one
+    ``IN`` query per referencing column, so memory stays constant however
+    large the media volume grows. Files younger than ``min_age`` are left
+    alone: their lecture may belong to a transaction that has not committed.
+    """
+    batch_size: int = DEFAULT_BATCH_SIZE
+    min_age: int = DEFAULT_MIN_AGE
+    targets: list[ReclaimTarget] = field(default_factory=default_targets)
+
+    def reclaim(self, *, dry_run: bool = False, on_orphan: Optional[Callable[[str, int], None]] = None) -> ReclaimReport:
+        report = ReclaimReport()
+        cutoff = time.time() - self.min_age
+
+        for target in self.targets:
+            storage = target.storage
+            entries = iter_stored_files(storage.location, target.prefix)
+            while batch := list(islice(entries, self.batch_size)):
+                report.scanned += len(batch)
+                by_name = {
+                    os.path.relpath(entry.path, storage.location).replace(os.sep, "/"): entry
+                    for entry in batch
+                }
+                referenced = target.referenced(list(by_name))
+
+                for name, entry in by_name.items():
+                    if name in referenced:
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                    if stat.st_mtime > cutoff:
+                        continue
+
+                    report.orphaned += 1
+                    report.reclaimed_bytes += stat.st_size
+                    if on_orphan is not None:
+                        on_orphan(name, stat.st_size)
+                    if not dry_run:
+                        storage.delete(name)
+                        report.removed += 1
+        return report
@@ -0,0 +1,59 @@
+import mimetypes
+from dataclasses import dataclass, field
+
+from django.db.models import Q
+from django.http import FileResponse
+from rest_framework.exceptions import NotFound
+
+from apps.courses.models import Lecture, PresentationPreview
+from apps.courses.services.presentation.delivery import (
+    DEFAULT_CONTENT_TYPE,
+    DirectFileDelivery,
+    PresentationUrlSigner,
+    build_presentation_delivery,
+    build_url_signer,
+)
+from apps.courses.services.protocols import MembershipGuard, PresentationDelivery
+from apps.courses.services.shared.membership_guard import CourseMembershipGuard
+from common.enums import ErrorMessages, HttpHeaders, ModelFields
+
+
+@dataclass
+class PresentationDownloadService:
+    """Authorizes presentation downloads once and delegates the transfer"""
+    membership_guard: MembershipGuard = field(default_factory=CourseMembershipGuard)
+    delivery: PresentationDelivery = field(default_factory=build_presentation_delivery)
+    signer: PresentationUrlSigner = field(default_factory=build_url_signer)
+    direct_delivery: PresentationDelivery = field(default_factory=DirectFileDelivery)
+
+    def download(self, *, request, lecture: Lecture, user):
+        """Serve the presentation of a lecture to a course member"""
+        self.membership_guard.ensure_member(lecture.course, user)
+        return self.delivery.deliver(request, lecture)
+
+    def download_signed(self, *, request, token: str):
+        """Serve a presentation for a previously issued signed URL"""
+        lecture_id, name = self.signer.unsign(token)
+
+        # The token is bound to the file name, so replaced presentations invalidate old links
+        lecture = Lecture.objects.filter(id=lecture_id, presentation=name).first()
+        if lecture is None:
+            raise NotFound(ErrorMessages.DOWNLOAD_LINK_INVALID.value)
+
+        return self.direct_delivery.deliver(request, lecture)
+
+    def download_preview(self, *, request, token: str):
+        """Serve a thumbnail or preview image for a signed URL issued in a lecture response"""
+        name = self.signer.unsign_artefact(token)
+
+        # Artefacts removed with their blob, or rendered again under another name, invalidate old links
+        artefact = Q(**{ModelFields.THUMBNAIL.value: name}) | Q(**{ModelFields.PREVIEW.value: name})
+        storage = PresentationPreview._meta.get_field(ModelFields.PREVIEW.value).storage
+        if not PresentationPreview.objects.filter(artefact).exists() or not storage.exists(name):
+            raise NotFound(ErrorMessages.DOWNLOAD_LINK_INVALID.value)
+
+        content_type, _ = mimetypes.guess_type(name)
+        response = FileResponse(storage.open(name, "rb"), content_type=content_type or DEFAULT_CONTENT_TYPE)
+        # Only this browser may keep it, and no longer than the link is valid
+        response[HttpHeaders.CACHE_CONTROL.value] = f"private, max-age={self.signer.max_age}"
+        return response
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import BinaryIO, Sequence
 
 from apps.courses.models import Lecture
 
@@ -13,6 +14,15 @@ class OwnershipGuard(ABC):
         pass
 
 
+class MembershipGuard(ABC):
+    """Interface for course membership (read access) validation"""
+
+    @abstractmethod
+    def ensure_member(self, course, user) -> None:
+        """Ensure user is an owner, teacher or enrolled student of the course"""
+        pass
+
+
 class LectureService(ABC):
     """Interface for lecture CRUD operations"""
     
@@ -30,3 +40,44 @@ class LectureService(ABC):
     def delete(self, *, instance, user) -> None:
         """Delete a lecture"""
         pass
+
+
+class PresentationDelivery(ABC):
+    """Interface for turning a lecture presentation into an HTTP response"""
+
+    @abstractmethod
+    def deliver(self, request, lecture: Lecture):
+        """Build the response that transfers the presentation bytes"""
+        pass
+
+
+class PresentationCollector(ABC):
+    """Interface for reclaiming presentation blobs no lecture references any more"""
+
+    @abstractmethod
+    def release(self, name: str) -> None:
+        """Drop one reference to a stored blob and collect it once unreferenced"""
+        pass
+
+
+class PresentationRenderer(ABC):
+    """Interface for rasterising the first page of a presentation"""
+
+    @abstractmethod
+    def supports(self, name: str) -> bool:
+        """Whether this renderer can handle the stored file (format and installed libraries)"""
+        pass
+
+    @abstractmethod
+    def render(self, handle: BinaryIO, widths: Sequence[int]) -> list[bytes]:
+        """Return one PNG per requested width"""
+        pass
+
+
+class PreviewGenerator(ABC):
+    """Interface for producing lecture presentation previews off the request path"""
+
+    @abstractmethod
+    def schedule(self, lecture: Lecture) -> None:
+        """Queue preview generation for the lecture's presentation once the transaction commits"""
+        pass
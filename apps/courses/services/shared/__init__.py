@@ -1,5 +1,7 @@
 from .ownership_guard import CourseOwnershipGuard
+from .membership_guard import CourseMembershipGuard
 
 __all__ = [
     'CourseOwnershipGuard',
+    'CourseMembershipGuard',
 ]
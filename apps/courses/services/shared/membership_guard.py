@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from django.db.models import Q
+from rest_framework.exceptions import PermissionDenied
+
+from apps.courses.models import Course
+from apps.courses.services.protocols import MembershipGuard
+from common.enums import ErrorMessages
+
+
+@dataclass
+class CourseMembershipGuard(MembershipGuard):
+    """Allows course owners, assigned teachers and enrolled students"""
+
+    def ensure_member(self, course, user) -> None:
+        if not user or not user.is_authenticated:
+            raise PermissionDenied(ErrorMessages.COURSE_ACCESS_DENIED.value)
+
+        if course.primary_owner_id == user.id:
+            return
+
+        # Single query covering both membership tables
+        is_member = (
+            Course.objects
+            .filter(id=course.id)
+            .filter(Q(teachers__id=user.id) | Q(students__id=user.id))
+            .exists()
+        )
+        if not is_member:
+            raise PermissionDenied(ErrorMessages.COURSE_ACCESS_DENIED.value)
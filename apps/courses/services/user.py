@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from rest_framework.exceptions import ValidationError
 from common.enums import UserRole, UserFields, ErrorMessages
+from common.identity_map import fetch
 
 User = get_user_model()
 
@@ -9,7 +10,7 @@ class UserService:
     @staticmethod
     def get_user_by_role_or_raise(user_id: int, role: UserRole) -> User:
         try:
-            user = User.objects.get(id=user_id)
+            user = fetch(User, user_id)
         except User.DoesNotExist:
             raise ValidationError(ErrorMessages.USER_DOESNT_EXIST.value)
 
@@ -3,6 +3,7 @@ from typing import List, Optional
 from rest_framework.exceptions import ValidationError
 
 from common.enums import UserRole, FieldDisplayNames
+from common.identity_map import fetch
 from apps.courses.services.dtos import CourseUpdateRequest, CourseUpdateValidationResult, UserValidationResult
 from .interfaces import CourseUpdateValidatorInterface, CourseUniquenessValidatorInterface, \
     BusinessRuleValidatorInterface
@@ -97,7 +98,7 @@ class CourseUpdateValidator(BaseValidator, CourseUpdateValidatorInterface):
                 primary_owner_id = context.request.primary_owner_id
                 if primary_owner_id is None:
                     from apps.courses.models import Course
-                    current_course = Course.objects.get(id=context.request.course_id)
+                    current_course = fetch(Course, context.request.course_id)
                     primary_owner_id = current_course.primary_owner_id
                 
                 self.uniqueness_validator.validate_course_uniqueness_for_update(
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.courses.models import Lecture
+from apps.courses.services.presentation.collector import ReferenceCountingCollector
+
+presentation_collector = ReferenceCountingCollector()
+
+
+@receiver(post_delete, sender=Lecture)
+def release_lecture_presentation(sender, instance: Lecture, **kwargs):
+    """Lectures also disappear through course cascades, so blob release lives on the signal"""
+    presentation_collector.release(instance.presentation.name)
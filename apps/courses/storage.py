@@ -0,0 +1,90 @@
+import hashlib
+import os
+import time
+import uuid
+
+from django.core.files.storage import FileSystemStorage
+
+from common.enums import UploadPaths
+
+DIGEST_ALGORITHM = "sha256"
+SHARD_PREFIX_LENGTH = 2
+TEMPORARY_SUFFIX = ".part"
+RETIRED_SUFFIX = ".retired"
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage that names every blob after the digest of its bytes.
+
+    Identical uploads resolve to the same ``presentations/<aa>/<digest><ext>``
+    path, so a re-upload of known content returns the existing name without
+    writing anything. New blobs are written under a temporary name and
+    published with an atomic rename, which makes concurrent uploads of the
+    same content harmless and never exposes half-written files.
+    """
+
+    def __init__(self, prefix: str = UploadPaths.PRESENTATIONS.value, **kwargs):
+        super().__init__(**kwargs)
+        self.prefix = prefix
+
+    def digest(self, content) -> str:
+        """Hash the upload chunk by chunk; Django has already spooled it to memory or a temp file"""
+        hasher = hashlib.new(DIGEST_ALGORITHM)
+        for chunk in content.chunks():
+            hasher.update(chunk if isinstance(chunk, bytes) else chunk.encode())
+        return hasher.hexdigest()
+
+    def blob_name(self, digest: str, original_name: str) -> str:
+        extension = os.path.splitext(original_name)[1].lower()
+        return f"{self.prefix}{digest[:SHARD_PREFIX_LENGTH]}/{digest}{extension}"
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is derived from the content in _save, so the
+        # upload name never needs to be made unique.
+        return name
+
+    def _save(self, name, content):
+        name = self.blob_name(self.digest(content), name)
+        if self.exists(name):
+            try:
+                # Refresh the mtime so the collectors' grace period covers the new reference
+                os.utime(self.path(name))
+                return name
+            except FileNotFoundError:
+                pass  # retired by a collector in between: write a fresh copy
+
+        temporary_name = f"{name}.{uuid.uuid4().hex}{TEMPORARY_SUFFIX}"
+        temporary_name = super()._save(temporary_name, content)
+        os.replace(self.path(temporary_name), self.path(name))
+        return name
+
+    def delete_unless_touched(self, name: str, min_age: float) -> bool:
+        """
+        Delete the blob unless it was written or re-uploaded within the last ``min_age`` seconds.
+
+        The file is renamed aside before its mtime is checked. From then on an
+        upload of the same content writes a fresh copy instead of touching it,
+        and an upload that touched it just before shows in the renamed file,
+        which is then put back unless a fresh copy already exists.
+        """
+        path = self.path(name)
+        retired = f"{path}.{uuid.uuid4().hex}{RETIRED_SUFFIX}"
+        try:
+            os.rename(path, retired)
+        except FileNotFoundError:
+            return False
+        if os.stat(retired).st_mtime > time.time() - min_age:
+            try:
+                os.link(retired, path)
+            except FileExistsError:
+                pass
+            os.remove(retired)
+            return False
+        os.remove(retired)
+        return True
+
+
+def presentation_storage() -> ContentAddressedStorage:
+    """Storage callable for ``Lecture.presentation``; keeps migrations free of storage arguments"""
+    return ContentAddressedStorage()
@@ -1,11 +1,17 @@
 import io
+import os
+from datetime import timedelta
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework import status
 
-from apps.courses.models import Course, Lecture
+from apps.courses.models import Course, Lecture, PresentationPreview
+from apps.courses.services.presentation import PresentationPreviewService, ReferenceCountingCollector
 from common.enums import UserRole
 
 
@@ -169,3 +175,245 @@ def test_course_add_members_after_create(api_client, teacher, other_teacher, stu
     assert found["teacher_count"] >= 1
     assert found["student_count"] >= 1
 
+
+
+# Presentation downloads
+@pytest.fixture
+def presentation_lecture(settings, tmp_path, teacher, student):
+    settings.MEDIA_ROOT = tmp_path
+    settings.PRESENTATION_PREVIEW_WORKERS = 0
+    c = Course.objects.create(name="C-DL", description="D", primary_owner=teacher)
+    c.students.add(student)
+    return Lecture.objects.create(
+        course=c,
+        topic="Slides",
+        presentation=SimpleUploadedFile("deck.pdf", b"0123456789" * 10, content_type="application/pdf"),
+    )
+
+
+def presentation_url(lecture):
+    return f"/api/courses/{lecture.course_id}/lectures/{lecture.id}/presentation/"
+
+
+def test_enrolled_student_downloads_full_presentation(api_client, student, presentation_lecture):
+    resp = auth(api_client, student).get(presentation_url(presentation_lecture))
+    assert resp.status_code == status.HTTP_200_OK
+    assert b"".join(resp.streaming_content) == b"0123456789" * 10
+    assert resp["Accept-Ranges"] == "bytes"
+    assert resp["ETag"]
+
+
+def test_presentation_range_and_conditional_requests(api_client, student, presentation_lecture):
+    client = auth(api_client, student)
+    url = presentation_url(presentation_lecture)
+
+    partial = client.get(url, HTTP_RANGE="bytes=10-19")
+    assert partial.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert b"".join(partial.streaming_content) == b"0123456789"
+    assert partial["Content-Range"] == "bytes 10-19/100"
+
+    suffix = client.get(url, HTTP_RANGE="bytes=-5")
+    assert b"".join(suffix.streaming_content) == b"56789"
+
+    unsatisfiable = client.get(url, HTTP_RANGE="bytes=500-")
+    assert unsatisfiable.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+
+    etag = partial["ETag"]
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+    # A stale If-Range validator downgrades the range request to a full response
+    stale = client.get(url, HTTP_RANGE="bytes=0-1", HTTP_IF_RANGE='"stale"')
+    assert stale.status_code == status.HTTP_200_OK
+
+
+def test_non_member_cannot_download_presentation(api_client, other_teacher, presentation_lecture):
+    resp = auth(api_client, other_teacher).get(presentation_url(presentation_lecture))
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_presentation_offloaded_with_x_accel_redirect(settings, api_client, teacher, presentation_lecture):
+    settings.PRESENTATION_DELIVERY_BACKEND = "x-accel-redirect"
+    resp = auth(api_client, teacher).get(presentation_url(presentation_lecture))
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["X-Accel-Redirect"] == f"/protected-media/{presentation_lecture.presentation.name}"
+    assert resp.content == b""
+
+
+def test_presentation_signed_url_flow(settings, api_client, student, presentation_lecture):
+    settings.PRESENTATION_DELIVERY_BACKEND = "signed-url"
+    redirect = auth(api_client, student).get(presentation_url(presentation_lecture))
+    assert redirect.status_code == status.HTTP_302_FOUND
+
+    anonymous = APIClient()
+    resp = anonymous.get(redirect["Location"], HTTP_RANGE="bytes=0-3")
+    assert resp.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert b"".join(resp.streaming_content) == b"0123"
+
+    tampered = anonymous.get(redirect["Location"].rstrip("/") + "x/")
+    assert tampered.status_code == status.HTTP_404_NOT_FOUND
+
+
+# Content-addressed presentation storage
+def test_identical_presentations_share_one_blob(api_client, teacher, presentation_lecture, django_capture_on_commit_callbacks,
+                                               settings):
+    settings.PRESENTATION_COLLECT_MIN_AGE = 0
+    course = presentation_lecture.course
+    storage = presentation_lecture.presentation.storage
+    blob = presentation_lecture.presentation.name
+    assert blob.startswith("presentations/") and "deck" not in blob
+
+    with django_capture_on_commit_callbacks(execute=True):
+        resp = auth(api_client, teacher).post(
+            f"/api/courses/{course.id}/lectures/",
+            {"topic": "Copy", "presentation": SimpleUploadedFile("copy.pdf", b"0123456789" * 10)},
+            format="multipart",
+        )
+    assert resp.status_code == status.HTTP_201_CREATED
+    copy = Lecture.objects.get(topic="Copy")
+    assert copy.presentation.name == blob
+    assert len(storage.listdir(blob.rsplit("/", 1)[0])[1]) == 1
+
+    # Dropping one reference keeps the blob for the other lecture
+    with django_capture_on_commit_callbacks(execute=True):
+        auth(api_client, teacher).delete(f"/api/courses/{course.id}/lectures/{copy.id}/")
+    assert storage.exists(blob)
+
+    # Replacing the last reference collects the old blob
+    with django_capture_on_commit_callbacks(execute=True):
+        resp = auth(api_client, teacher).patch(
+            f"/api/courses/{course.id}/lectures/{presentation_lecture.id}/",
+            {"presentation": SimpleUploadedFile("v2.pdf", b"new slides")},
+            format="multipart",
+        )
+    assert resp.status_code == status.HTTP_200_OK
+    assert not storage.exists(blob)
+
+    presentation_lecture.refresh_from_db()
+    replacement = presentation_lecture.presentation.name
+    with django_capture_on_commit_callbacks(execute=True):
+        course.delete()
+    assert not storage.exists(replacement)
+
+
+def test_collector_keeps_blob_touched_by_a_pending_upload(presentation_lecture):
+    storage = presentation_lecture.presentation.storage
+    blob = presentation_lecture.presentation.name
+    Lecture.objects.all().delete()
+    # Another upload of the same content refreshed the blob; its lecture has not committed yet
+    assert storage.save("again.pdf", io.BytesIO(b"0123456789" * 10)) == blob
+    collector = ReferenceCountingCollector(min_age=60)
+    assert not collector.collect(blob)
+    assert storage.exists(blob)
+
+    past = os.path.getmtime(storage.path(blob)) - 120
+    os.utime(storage.path(blob), (past, past))
+    assert collector.collect(blob)
+    assert not storage.exists(blob)
+    assert storage.listdir(blob.rsplit("/", 1)[0])[1] == []
+
+
+# Presentation previews
+class CountingRenderer:
+    def __init__(self):
+        self.calls = 0
+
+    def supports(self, name):
+        return name.endswith(".pdf")
+
+    def render(self, handle, widths):
+        self.calls += 1
+        return [f"png-{width}".encode() for width in widths]
+
+
+def test_previews_rendered_once_per_blob_and_listed(api_client, teacher, presentation_lecture):
+    renderer = CountingRenderer()
+    service = PresentationPreviewService(renderers=[renderer])
+    blob = presentation_lecture.presentation.name
+    Lecture.objects.create(
+        course=presentation_lecture.course,
+        topic="Same deck",
+        presentation=SimpleUploadedFile("again.pdf", b"0123456789" * 10),
+    )
+
+    assert service.generate(blob).status == "ready"
+    assert service.generate(blob).status == "ready"
+    assert renderer.calls == 1
+
+    resp = auth(api_client, teacher).get(f"/api/courses/{presentation_lecture.course_id}/lectures/")
+    assert resp.status_code == status.HTTP_200_OK
+    for lecture in resp.data["results"]:
+        assert lecture["preview_status"] == "ready"
+        # Signed links that need no bearer token, never the raw media URL
+        assert "/api/presentations/previews/" in lecture["thumbnail_url"]
+        thumbnail = APIClient().get(lecture["thumbnail_url"])
+        assert thumbnail.status_code == status.HTTP_200_OK
+        assert thumbnail["Content-Type"] == "image/png"
+        assert b"".join(thumbnail.streaming_content) == b"png-320"
+        assert b"".join(APIClient().get(lecture["preview_url"]).streaming_content) == b"png-1024"
+    assert APIClient().get(lecture["thumbnail_url"].rstrip("/") + "x/").status_code == status.HTTP_404_NOT_FOUND
+
+    # The artefacts go away together with the last reference to the blob
+    preview = PresentationPreview.objects.get(blob=blob)
+    storage = preview.thumbnail.storage
+    thumbnail = preview.thumbnail.name
+    Lecture.objects.all().delete()
+    assert ReferenceCountingCollector(min_age=0).collect(blob)
+    assert not storage.exists(thumbnail)
+    assert not PresentationPreview.objects.filter(blob=blob).exists()
+    # Links handed out earlier stop working with them
+    assert APIClient().get(lecture["thumbnail_url"]).status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_previews_stuck_pending_are_rendered_again(presentation_lecture, settings):
+    settings.PRESENTATION_PREVIEW_TIMEOUT = 60
+    blob = presentation_lecture.presentation.name
+    PresentationPreview.objects.create(blob=blob)
+    renderer = CountingRenderer()
+    service = PresentationPreviewService(renderers=[renderer])
+    # Its job may still be running
+    assert service.generate(blob).status == "pending" and renderer.calls == 0
+
+    # The job was lost with its worker
+    PresentationPreview.objects.filter(blob=blob).update(updated_at=timezone.now() - timedelta(minutes=5))
+    out = io.StringIO()
+    call_command("render_previews", "--dry-run", stdout=out)
+    assert blob in out.getvalue()
+    assert service.generate(blob).status == "ready" and renderer.calls == 1
+    assert not service.retryable().exists()
+
+
+def test_preview_scheduled_after_lecture_create(api_client, teacher, presentation_lecture, django_capture_on_commit_callbacks):
+    course = presentation_lecture.course
+    with django_capture_on_commit_callbacks(execute=True):
+        resp = auth(api_client, teacher).post(
+            f"/api/courses/{course.id}/lectures/",
+            {"topic": "Notes", "presentation": SimpleUploadedFile("notes.txt", b"plain text")},
+            format="multipart",
+        )
+    assert resp.status_code == status.HTTP_201_CREATED
+    # No renderer handles plain text, so the pipeline records that instead of retrying
+    lecture = Lecture.objects.get(topic="Notes")
+    assert PresentationPreview.objects.get(blob=lecture.presentation.name).status == "unavailable"
+
+    detail = auth(api_client, teacher).get(f"/api/courses/{course.id}/lectures/{lecture.id}/")
+    assert detail.data["preview_status"] == "unavailable"
+    assert detail.data["thumbnail_url"] is None
+
+
+# Orphaned file reclamation
+def test_reclaim_presentations_removes_only_old_orphans(presentation_lecture, tmp_path):
+    legacy = tmp_path / "presentations" / "legacy.pdf"
+    legacy.write_bytes(b"left behind by a replaced upload")
+    os.utime(legacy, (0, 0))
+    fresh = tmp_path / "presentations" / "in-flight.pdf"
+    fresh.write_bytes(b"upload whose transaction has not committed yet")
+
+    out = io.StringIO()
+    call_command("reclaim_presentations", "--dry-run", "--batch-size=1", stdout=out)
+    assert "presentations/legacy.pdf" in out.getvalue()
+    assert legacy.exists()
+
+    call_command("reclaim_presentations", "--batch-size=1", stdout=io.StringIO())
+    assert not legacy.exists()
+    assert fresh.exists()
+    assert presentation_lecture.presentation.storage.exists(presentation_lecture.presentation.name)
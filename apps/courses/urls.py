@@ -1,7 +1,12 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from apps.courses.views import CourseViewSet, LectureViewSet
+from apps.courses.views import (
+    CourseViewSet,
+    LectureViewSet,
+    PresentationPreviewDownloadView,
+    PresentationSignedDownloadView,
+)
 from common.enums import URLPatterns, HTTPMethods, ViewActions
 
 router = DefaultRouter()
@@ -19,7 +24,14 @@ lecture_detail = LectureViewSet.as_view({
     HTTPMethods.DELETE.value: ViewActions.DESTROY.value,
 })
 
+lecture_presentation = LectureViewSet.as_view({
+    HTTPMethods.GET.value: ViewActions.DOWNLOAD.value,
+})
+
 urlpatterns = router.urls + [
     path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/', lecture_list, name=URLPatterns.LECTURE_LIST.value),
     path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.PK.value}>/', lecture_detail, name=URLPatterns.LECTURE_DETAIL.value),
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.PK.value}>/{URLPatterns.PRESENTATION.value}/', lecture_presentation, name=URLPatterns.LECTURE_PRESENTATION.value),
+    path(f'{URLPatterns.PRESENTATIONS.value}/{URLPatterns.SIGNED.value}/<str:{URLPatterns.TOKEN.value}>/', PresentationSignedDownloadView.as_view(), name=URLPatterns.PRESENTATION_SIGNED_DOWNLOAD.value),
+    path(f'{URLPatterns.PRESENTATIONS.value}/{URLPatterns.PREVIEWS.value}/<str:{URLPatterns.TOKEN.value}>/', PresentationPreviewDownloadView.as_view(), name=URLPatterns.PRESENTATION_PREVIEW_DOWNLOAD.value),
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 from rest_framework import viewsets
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.exceptions import NotFound
 
@@ -12,14 +13,16 @@ from apps.courses.serializers import (
 from apps.courses.models import Course, Lecture
 from apps.courses.services.shared import CourseOwnershipGuard
 from apps.courses.services.lecture import LectureManagementService
+from apps.courses.services.presentation import PresentationDownloadService
 from apps.courses.services.protocols import OwnershipGuard, LectureService
 from apps.courses.pagination import CustomPageNumberPagination
 from apps.users.permissions import DenyBlacklistedToken
 from apps.courses.permissions import IsCoursePrimaryOwner
-from common.enums import ViewActions, ModelFields, HttpStatus, ErrorMessages
+from common.enums import ViewActions, ModelFields, HttpStatus, ErrorMessages, URLPatterns
+from common.expansion import ExpansionQuerysetMixin
 
 
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseViewSet(ExpansionQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing courses with full CRUD operations.
     
@@ -105,7 +108,7 @@ class CourseViewSet(viewsets.ModelViewSet):
         return self.update(request, *args, **kwargs)
 
 
-class LectureViewSet(viewsets.ModelViewSet):
+class LectureViewSet(ExpansionQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing lectures within courses with full CRUD operations.
 
@@ -115,6 +118,7 @@ class LectureViewSet(viewsets.ModelViewSet):
     - PUT /courses/{course_pk}/lectures/{id}/ - Full update (replaces all fields)
     - PATCH /courses/{course_pk}/lectures/{id}/ - Partial update (updates only provided fields)
     - DELETE /courses/{course_pk}/lectures/{id}/ - Delete lecture
+    - GET /courses/{course_pk}/lectures/{id}/presentation/ - Download presentation (Range/conditional aware)
     """
     permission_classes = [IsAuthenticated, DenyBlacklistedToken]
     serializer_class = LectureSerializer
@@ -124,6 +128,13 @@ class LectureViewSet(viewsets.ModelViewSet):
         super().__init__(**kwargs)
         self.ownership_guard: OwnershipGuard = CourseOwnershipGuard()
         self.lecture_service: LectureService = LectureManagementService(ownership_guard=self.ownership_guard)
+        self.presentation_service: PresentationDownloadService = PresentationDownloadService()
+
+    def perform_content_negotiation(self, request, force=False):
+        """Binary downloads must not be rejected because of a non-JSON Accept header"""
+        if self.action == ViewActions.DOWNLOAD.value:
+            force = True
+        return super().perform_content_negotiation(request, force=force)
 
     def _get_course(self) -> Course:
         """Get course from URL parameter with proper error handling"""
@@ -134,7 +145,7 @@ class LectureViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Filter lectures by course from URL parameter"""
-        return (
+        queryset = (
             Lecture.objects
             .select_related(
                 ModelFields.COURSE.value,
@@ -142,11 +153,15 @@ class LectureViewSet(viewsets.ModelViewSet):
             )
             .filter(course_id=self.kwargs[ModelFields.COURSE_PK.value])
         )
+        # Writes may swap the blob, so their responses look previews up afresh
+        if self.action in (ViewActions.LIST.value, ViewActions.RETRIEVE.value):
+            queryset = queryset.with_previews()
+        return queryset
 
     def perform_create(self, serializer):
         """POST"""
         course = self._get_course()
-        self.lecture_service.create(
+        serializer.instance = self.lecture_service.create(
             course=course,
             user=self.request.user,
             validated_data=serializer.validated_data
@@ -165,6 +180,53 @@ class LectureViewSet(viewsets.ModelViewSet):
         """DELETE - Delete lecture using service layer"""
         self.lecture_service.delete(instance=instance, user=self.request.user)
 
+    def download(self, request, *args, **kwargs):
+        """GET - Serve the presentation file to course members"""
+        lecture = self.get_object()
+        return self.presentation_service.download(request=request, lecture=lecture, user=request.user)
+
+
+class PresentationSignedDownloadView(APIView):
+    """
+    Serves a presentation for a short-lived signed URL.
+
+    - GET /presentations/signed/{token}/ - Download without further authentication
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.presentation_service: PresentationDownloadService = PresentationDownloadService()
+
+    def perform_content_negotiation(self, request, force=False):
+        return super().perform_content_negotiation(request, force=True)
 
+    def get(self, request, *args, **kwargs):
+        return self.presentation_service.download_signed(
+            request=request,
+            token=kwargs[URLPatterns.TOKEN.value]
+        )
+
+
+class PresentationPreviewDownloadView(APIView):
+    """
+    Serves a presentation thumbnail or preview for a short-lived signed URL.
+
+    - GET /presentations/previews/{token}/ - Image without further authentication, so it works as an ``<img>`` source
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.presentation_service: PresentationDownloadService = PresentationDownloadService()
 
+    def perform_content_negotiation(self, request, force=False):
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request, *args, **kwargs):
+        return self.presentation_service.download_preview(
+            request=request,
+            token=kwargs[URLPatterns.TOKEN.value]
+        )
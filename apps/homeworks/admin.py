@@ -21,11 +21,17 @@ class HomeworkAdmin(admin.ModelAdmin):
 class HomeworkSubmissionAdmin(admin.ModelAdmin):
     list_display = [ModelFields.HOMEWORK.value, ModelFields.STUDENT.value, ModelFields.SUBMITTED_AT.value, ModelFields.IS_SUBMITTED.value]
     list_filter = [ModelFields.SUBMITTED_AT.value, ModelFields.IS_SUBMITTED.value]
-    search_fields = [ModelFields.CONTENT.value]
-    readonly_fields = [ModelFields.SUBMITTED_AT.value, ModelFields.UPDATED_AT.value]
+    search_fields = [ModelFields.INLINE_CONTENT.value, ModelFields.CONTENT_PREVIEW.value]
+    readonly_fields = [
+        ModelFields.SUBMITTED_AT.value,
+        ModelFields.UPDATED_AT.value,
+        ModelFields.CONTENT_LENGTH.value,
+        ModelFields.CONTENT_PREVIEW.value,
+        ModelFields.CONTENT_COMPRESSED.value,
+    ]
     
     def get_queryset(self, request):
         return super().get_queryset(request).select_related(
             ModelFields.HOMEWORK.value, 
             ModelFields.STUDENT.value
-        )
+        ).defer(ModelFields.INLINE_CONTENT.value)
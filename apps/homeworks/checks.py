@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.db import DatabaseCache
+from django.core.checks import Error, Tags, Warning, register
+from django.db import DatabaseError, connections, router
+
+from apps.homeworks.services.statistics.cache import GradeStatisticsCache
+
+PER_PROCESS_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+MIGRATIONS_TABLE = "django_migrations"
+
+
+@register(Tags.caches)
+def statistics_cache_is_shared(app_configs, **kwargs):
+    """Grade statistics are invalidated through the cache, so every worker has to see the same one"""
+    alias = GradeStatisticsCache.alias
+    backend = settings.CACHES.get(alias, {}).get("BACKEND")
+    if backend not in PER_PROCESS_BACKENDS:
+        return []
+    return [
+        Warning(
+            f"The '{alias}' cache ({backend}) is private to each process.",
+            hint="Other workers keep serving grade statistics until GRADE_STATISTICS_CACHE_TIMEOUT after a grade "
+                 "changes; configure a shared backend (REDIS_URL or the database cache).",
+            id="homeworks.W001",
+        )
+    ]
+
+
+@register(Tags.caches)
+def statistics_cache_table_exists(app_configs, **kwargs):
+    """
+    A database cache without its table fails every statistics read and grade invalidation.
+
+    Skipped until the database has been migrated, so ``migrate`` can still
+    set up a fresh one, and when the database cannot be reached at all.
+    """
+    alias = GradeStatisticsCache.alias
+    if alias not in settings.CACHES:
+        return []
+    backend = caches[alias]
+    if not isinstance(backend, DatabaseCache):
+        return []
+    connection = connections[router.db_for_read(backend.cache_model_class)]
+    try:
+        tables = connection.introspection.table_names()
+    except DatabaseError:
+        return []
+    if MIGRATIONS_TABLE not in tables or backend._table in tables:
+        return []
+    return [
+        Error(
+            f"The '{alias}' cache table '{backend._table}' does not exist.",
+            hint="Run manage.py createcachetable.",
+            id="homeworks.E001",
+        )
+    ]
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.homeworks.services.submission.revisions import SubmissionRevisionManagementService
+
+
+class Command(BaseCommand):
+    help = "Drop submission revisions beyond the retention limit (normally done as snapshots are written)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=settings.SUBMISSION_REVISION_LIMIT,
+            help="Newest revisions to keep per submission; the rest of the oldest kept snapshot group stays too",
+        )
+
+    def handle(self, *args, **options):
+        deleted = SubmissionRevisionManagementService(limit=options["limit"]).compact_all()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} revisions"))
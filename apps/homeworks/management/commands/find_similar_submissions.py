@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.courses.models import Course
+from apps.homeworks.models import Homework, HomeworkSubmission
+from apps.homeworks.services.similarity import SubmissionSimilarityService
+from common.enums import ModelFields
+
+
+class Command(BaseCommand):
+    help = "Sign submissions that have no similarity signature yet and report near-duplicate pairs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--homework",
+            type=int,
+            action="append",
+            default=[],
+            help="Homework id to report on (repeatable); every homework when omitted",
+        )
+        parser.add_argument("--reindex", action="store_true", help="Re-sign every submission, not only unsigned ones")
+        parser.add_argument("--threshold", type=float, default=settings.SUBMISSION_SIMILARITY_THRESHOLD)
+        parser.add_argument(
+            "--across-courses",
+            action="store_true",
+            help="Also match against submissions to other homeworks, in any course",
+        )
+        parser.add_argument("--batch-size", type=int, default=settings.SUBMISSION_SIMILARITY_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        service = SubmissionSimilarityService(batch_size=options["batch_size"])
+        homeworks = Homework.objects.order_by(ModelFields.ID.value)
+        submissions = HomeworkSubmission.objects.all()
+        if options["homework"]:
+            homeworks = homeworks.filter(**{f"{ModelFields.ID.value}__in": options["homework"]})
+            submissions = submissions.filter(**{f"{ModelFields.HOMEWORK.value}__in": options["homework"]})
+        if not options["reindex"]:
+            submissions = submissions.filter(**{f"{ModelFields.SIMILARITY_SIGNATURE.value}__isnull": True})
+
+        signed = service.index(submissions)
+        self.stdout.write(f"Signed {signed} submissions")
+
+        course_ids = Course.objects.values(ModelFields.ID.value) if options["across_courses"] else None
+        found = 0
+        for homework in homeworks.iterator():
+            indexed, pairs = service.find_pairs(homework, threshold=options["threshold"], course_ids=course_ids)
+            for pair in pairs:
+                self.stdout.write(
+                    f"homework {homework.id}: submission {pair.submission_id} (student {pair.student_id}) ~ "
+                    f"submission {pair.other_submission_id} (student {pair.other_student_id}, "
+                    f"homework {pair.other_homework_id}): {pair.similarity:.2f}"
+                )
+            found += len(pairs)
+        self.stdout.write(self.style.SUCCESS(f"Found {found} similar pairs"))
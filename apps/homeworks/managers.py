@@ -0,0 +1,13 @@
+from django.db import models
+
+from common.enums import ModelFields
+
+
+class HomeworkSubmissionQuerySet(models.QuerySet):
+    def without_content(self):
+        """Skip the submission body; rows still carry ``content_preview`` and ``content_length``"""
+        return self.defer(ModelFields.INLINE_CONTENT.value)
+
+    def with_content(self):
+        """Load the body eagerly, including the compressed copy of large submissions"""
+        return self.defer(None).select_related(ModelFields.COMPRESSED_CONTENT.value)
@@ -0,0 +1,91 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:56
+
+import zlib
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+PREVIEW_LENGTH = 200
+BATCH_SIZE = 500
+
+
+def split_existing_content(apps, schema_editor):
+    """Fill length/preview for every submission and move large bodies into the compressed table"""
+    HomeworkSubmission = apps.get_model('homeworks', 'HomeworkSubmission')
+    SubmissionContent = apps.get_model('homeworks', 'SubmissionContent')
+    threshold = settings.SUBMISSION_CONTENT_COMPRESSION_THRESHOLD
+
+    pending = []
+    for submission in HomeworkSubmission.objects.only('id', 'inline_content').iterator(chunk_size=BATCH_SIZE):
+        text = submission.inline_content
+        submission.content_length = len(text)
+        submission.content_preview = text[:PREVIEW_LENGTH]
+        encoded = text.encode('utf-8')
+        if len(encoded) > threshold:
+            SubmissionContent.objects.create(submission_id=submission.id, data=zlib.compress(encoded, 6))
+            submission.content_compressed = True
+            submission.inline_content = ''
+        pending.append(submission)
+        if len(pending) >= BATCH_SIZE:
+            _flush(HomeworkSubmission, pending)
+    _flush(HomeworkSubmission, pending)
+
+
+def _flush(model, pending):
+    model.objects.bulk_update(
+        pending, ['inline_content', 'content_length', 'content_preview', 'content_compressed'],
+    )
+    pending.clear()
+
+
+def restore_content(apps, schema_editor):
+    HomeworkSubmission = apps.get_model('homeworks', 'HomeworkSubmission')
+    SubmissionContent = apps.get_model('homeworks', 'SubmissionContent')
+    for body in SubmissionContent.objects.iterator(chunk_size=BATCH_SIZE):
+        HomeworkSubmission.objects.filter(id=body.submission_id).update(
+            inline_content=zlib.decompress(bytes(body.data)).decode('utf-8'),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homeworks', '0004_gradecomment'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='homeworksubmission',
+            old_name='content',
+            new_name='inline_content',
+        ),
+        migrations.AlterField(
+            model_name='homeworksubmission',
+            name='inline_content',
+            field=models.TextField(blank=True, db_column='content'),
+        ),
+        migrations.AddField(
+            model_name='homeworksubmission',
+            name='content_compressed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='homeworksubmission',
+            name='content_length',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='homeworksubmission',
+            name='content_preview',
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.CreateModel(
+            name='SubmissionContent',
+            fields=[
+                ('submission', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='compressed_content', serialize=False, to='homeworks.homeworksubmission')),
+                ('data', models.BinaryField()),
+            ],
+        ),
+        migrations.RunPython(split_existing_content, restore_content),
+    ]
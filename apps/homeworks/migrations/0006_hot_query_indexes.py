@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# See courses/0005_hot_query_indexes: indexes are added first, then the
+# foreign key indexes they cover are dropped. (homework, student) lookups
+# already use the unique constraint's index and need nothing new.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0005_hot_query_indexes'),
+        ('homeworks', '0005_submission_content_compression'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gradecomment',
+            index=models.Index(fields=['grade', 'created_at'], name='grade_comment_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='homework',
+            index=models.Index(fields=['lecture', 'due_date'], name='homework_lecture_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='homeworksubmission',
+            index=models.Index(fields=['student', '-submitted_at'], name='submission_student_recent_idx'),
+        ),
+        migrations.AlterModelOptions(
+            name='gradecomment',
+            options={'ordering': ['created_at', 'id']},
+        ),
+        migrations.AlterModelOptions(
+            name='homework',
+            options={'ordering': ['due_date', 'id']},
+        ),
+        migrations.AlterField(
+            model_name='gradecomment',
+            name='grade',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='grade_comments', to='homeworks.homeworkgrade'),
+        ),
+        migrations.AlterField(
+            model_name='homework',
+            name='lecture',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='homeworks', to='courses.lecture'),
+        ),
+        migrations.AlterField(
+            model_name='homeworksubmission',
+            name='student',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='homework_submissions', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
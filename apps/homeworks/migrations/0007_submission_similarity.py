@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homeworks', '0006_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionSignature',
+            fields=[
+                ('submission', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='similarity_signature', serialize=False, to='homeworks.homeworksubmission')),
+                ('signature', models.BinaryField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SubmissionBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band_key', models.BigIntegerField()),
+                ('homework', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='similarity_bands', to='homeworks.homework')),
+                ('submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similarity_bands', to='homeworks.homeworksubmission')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['homework', 'band_key'], name='similarity_band_homework_idx'), models.Index(fields=['band_key'], name='similarity_band_key_idx')],
+            },
+        ),
+    ]
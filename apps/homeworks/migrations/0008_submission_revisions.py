@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('homeworks', '0007_submission_similarity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField()),
+                ('is_snapshot', models.BooleanField()),
+                ('depth', models.PositiveSmallIntegerField(default=0)),
+                ('data', models.BinaryField()),
+                ('content_length', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('submission', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='revisions', to='homeworks.homeworksubmission')),
+            ],
+            options={
+                'ordering': ['submission', 'number'],
+                'constraints': [models.UniqueConstraint(fields=('submission', 'number'), name='unique_revision_number_per_submission')],
+            },
+        ),
+    ]
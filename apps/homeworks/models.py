@@ -1,14 +1,20 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from apps.courses.models import Lecture
-from common.enums import ModelFields, RelatedNames, ConstraintNames
+from apps.homeworks.managers import HomeworkSubmissionQuerySet
+from common.compression import compress_text, decompress_text, should_compress
+from common.enums import ModelFields, RelatedNames, ConstraintNames, IndexNames
+
+CONTENT_PREVIEW_LENGTH = 200
 
 User = get_user_model()
 
 
 class Homework(models.Model):
     """Homework assignment for a specific lecture"""
-    lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name=RelatedNames.LECTURE_HOMEWORKS.value)
+    lecture = models.ForeignKey(
+        Lecture, on_delete=models.CASCADE, related_name=RelatedNames.LECTURE_HOMEWORKS.value, db_index=False,
+    )
     title = models.CharField(max_length=255)
     description = models.TextField()
     due_date = models.DateTimeField()
@@ -17,6 +23,13 @@ class Homework(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
+        ordering = [ModelFields.DUE_DATE.value, ModelFields.ID.value]
+        indexes = [
+            models.Index(
+                fields=[ModelFields.LECTURE.value, ModelFields.DUE_DATE.value],
+                name=IndexNames.HOMEWORK_LECTURE_DUE.value,
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=[ModelFields.LECTURE.value, ModelFields.TITLE.value],
@@ -29,15 +42,42 @@ class Homework(models.Model):
 
 
 class HomeworkSubmission(models.Model):
-    """Student submission for a homework assignment"""
+    """
+    Student submission for a homework assignment.
+
+    ``content`` is the body as a plain attribute (and constructor kwarg).
+    Short bodies live in ``inline_content``; bodies above
+    ``SUBMISSION_CONTENT_COMPRESSION_THRESHOLD`` bytes are compressed into
+    ``SubmissionContent`` and only loaded when ``content`` is read. List
+    queries can defer the body and still show its preview and length.
+    """
     homework = models.ForeignKey(Homework, on_delete=models.CASCADE, related_name=RelatedNames.HOMEWORK_SUBMISSIONS.value)
-    student = models.ForeignKey(User, on_delete=models.CASCADE, related_name=RelatedNames.USER_HOMEWORK_SUBMISSIONS.value)
-    content = models.TextField()
+    student = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name=RelatedNames.USER_HOMEWORK_SUBMISSIONS.value, db_index=False,
+    )
+    inline_content = models.TextField(blank=True, db_column=ModelFields.CONTENT.value)
+    content_length = models.PositiveIntegerField(default=0)
+    content_preview = models.CharField(max_length=CONTENT_PREVIEW_LENGTH, blank=True)
+    content_compressed = models.BooleanField(default=False)
     submitted_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_submitted = models.BooleanField(default=True)  # True when submitted for review
 
+    objects = HomeworkSubmissionQuerySet.as_manager()
+
+    # Body assigned through ``content`` (or already decompressed), and whether it still has to be written
+    _content = None
+    _content_dirty = False
+    _drop_compressed = False
+
     class Meta:
+        # (homework, student) lookups are served by the unique constraint's index
+        indexes = [
+            models.Index(
+                fields=[ModelFields.STUDENT.value, f'-{ModelFields.SUBMITTED_AT.value}'],
+                name=IndexNames.SUBMISSION_STUDENT_SUBMITTED.value,
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=[ModelFields.HOMEWORK.value, ModelFields.STUDENT.value],
@@ -48,6 +88,124 @@ class HomeworkSubmission(models.Model):
     def __str__(self):
         return f"{self.student.email} - {self.homework.title}"
 
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            if self.content_compressed:
+                body = getattr(self, ModelFields.COMPRESSED_CONTENT.value)
+                self._content = decompress_text(body.data)
+            else:
+                return self.inline_content
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        compress = should_compress(value)
+        self._drop_compressed = self._drop_compressed or (self.content_compressed and not compress)
+        self._content = value
+        self._content_dirty = True
+        self.content_compressed = compress
+        self.inline_content = "" if compress else value
+        self.content_length = len(value)
+        self.content_preview = value[:CONTENT_PREVIEW_LENGTH]
+
+    def save(self, *args, **kwargs):
+        if not (self._content_dirty and (self.content_compressed or self._drop_compressed)):
+            super().save(*args, **kwargs)
+            self._content_dirty = False
+            return
+
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            if self.content_compressed:
+                SubmissionContent.objects.update_or_create(
+                    **{ModelFields.SUBMISSION.value: self},
+                    defaults={ModelFields.DATA.value: compress_text(self._content)},
+                )
+            else:
+                SubmissionContent.objects.filter(**{ModelFields.SUBMISSION.value: self}).delete()
+        self._content_dirty = False
+        self._drop_compressed = False
+
+
+class SubmissionContent(models.Model):
+    """zlib-compressed body of a large submission, kept out of the submissions table"""
+    submission = models.OneToOneField(
+        HomeworkSubmission,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name=ModelFields.COMPRESSED_CONTENT.value,
+    )
+    data = models.BinaryField()
+
+
+class SubmissionRevision(models.Model):
+    """
+    One saved version of a submission's content.
+
+    A snapshot holds the whole text; any other revision holds a line delta
+    against the revision before it (``common.delta``). Both are
+    zlib-compressed. ``depth`` counts the deltas since the last snapshot,
+    which bounds how many rows rebuilding a version reads.
+    """
+    submission = models.ForeignKey(
+        HomeworkSubmission, on_delete=models.CASCADE, related_name=RelatedNames.SUBMISSION_REVISIONS.value,
+        db_index=False,
+    )
+    number = models.PositiveIntegerField()
+    is_snapshot = models.BooleanField()
+    depth = models.PositiveSmallIntegerField(default=0)
+    data = models.BinaryField()
+    content_length = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        # (submission, number) lookups and ranges are served by the unique constraint's index
+        ordering = [ModelFields.SUBMISSION.value, ModelFields.NUMBER.value]
+        constraints = [
+            models.UniqueConstraint(
+                fields=[ModelFields.SUBMISSION.value, ModelFields.NUMBER.value],
+                name=ConstraintNames.UNIQUE_REVISION_NUMBER.value,
+            )
+        ]
+
+
+class SubmissionSignature(models.Model):
+    """MinHash signature of a submission's content (packed unsigned 32-bit integers)"""
+    submission = models.OneToOneField(
+        HomeworkSubmission,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name=ModelFields.SIMILARITY_SIGNATURE.value,
+    )
+    signature = models.BinaryField()
+
+
+class SubmissionBand(models.Model):
+    """
+    One LSH band of a submission's signature.
+
+    Submissions whose signatures agree on every row of a band share its
+    ``band_key``, which makes them candidate near-duplicates. ``homework``
+    is copied from the submission so a homework's bands are one index range.
+    """
+    submission = models.ForeignKey(
+        HomeworkSubmission, on_delete=models.CASCADE, related_name=RelatedNames.SUBMISSION_SIMILARITY_BANDS.value,
+    )
+    homework = models.ForeignKey(
+        Homework, on_delete=models.CASCADE, related_name=RelatedNames.HOMEWORK_SIMILARITY_BANDS.value, db_index=False,
+    )
+    band_key = models.BigIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=[ModelFields.HOMEWORK.value, ModelFields.BAND_KEY.value],
+                name=IndexNames.SIMILARITY_BAND_HOMEWORK.value,
+            ),
+            models.Index(fields=[ModelFields.BAND_KEY.value], name=IndexNames.SIMILARITY_BAND_KEY.value),
+        ]
+
 
 class HomeworkGrade(models.Model):
     """Grade and comments for a homework submission"""
@@ -72,11 +230,22 @@ class HomeworkGrade(models.Model):
 
 class GradeComment(models.Model):
     """Threaded comments for a grade (teacher or student)"""
-    grade = models.ForeignKey(HomeworkGrade, on_delete=models.CASCADE, related_name=RelatedNames.GRADE_COMMENTS.value)
+    grade = models.ForeignKey(
+        HomeworkGrade, on_delete=models.CASCADE, related_name=RelatedNames.GRADE_COMMENTS.value, db_index=False,
+    )
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name=RelatedNames.USER_GRADE_COMMENTS.value)
     comment = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        ordering = [ModelFields.CREATED_AT.value, ModelFields.ID.value]
+        indexes = [
+            models.Index(
+                fields=[ModelFields.GRADE.value, ModelFields.CREATED_AT.value],
+                name=IndexNames.GRADE_COMMENT_GRADE_CREATED.value,
+            ),
+        ]
+
     def __str__(self):
         return f"Comment by {self.author.email} on grade {self.grade_id}"
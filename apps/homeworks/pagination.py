@@ -1,6 +1,7 @@
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
-from common.enums import PaginationFields
+from common.enums import ModelFields, PaginationFields
+from common.pagination import KeysetPagination
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -22,3 +23,12 @@ class CustomPageNumberPagination(PageNumberPagination):
                 PaginationFields.PAGE_SIZE.value: self.get_page_size(self.request),
             }
         })
+
+
+class DueDateCursorPagination(KeysetPagination):
+    ordering = (ModelFields.DUE_DATE.value, ModelFields.ID.value)
+
+
+class SubmissionAgeCursorPagination(KeysetPagination):
+    """Oldest submission first"""
+    ordering = (ModelFields.SUBMITTED_AT.value, ModelFields.ID.value)
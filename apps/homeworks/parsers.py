@@ -0,0 +1,33 @@
+import codecs
+import csv
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from common.enums import ContentTypes, ErrorMessages
+
+
+class CSVParser(BaseParser):
+    """
+    Parses ``text/csv`` bodies into a list of row dicts keyed by the header.
+
+    Blank cells are dropped so optional columns behave like missing JSON keys.
+    """
+    media_type = ContentTypes.CSV.value
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        # utf-8-sig also strips the BOM spreadsheet exports like to prepend
+        if codecs.lookup(encoding).name == "utf-8":
+            encoding = "utf-8-sig"
+
+        try:
+            reader = csv.DictReader(codecs.iterdecode(stream, encoding))
+            return [
+                {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+                for row in reader
+            ]
+        except (csv.Error, UnicodeDecodeError) as exc:
+            raise ParseError(ErrorMessages.CSV_PARSE_ERROR.value.format(error=exc))
@@ -0,0 +1,20 @@
+from rest_framework.renderers import BaseRenderer
+
+from common.enums import ContentTypes
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets clients negotiate ``text/event-stream``.
+
+    Views that accept it answer with a ``StreamingHttpResponse`` of events;
+    only errors (already plain strings or dicts) ever reach ``render``.
+    """
+    media_type = ContentTypes.EVENT_STREAM.value
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, bytes):
+            return data
+        return str(data).encode(self.charset)
@@ -1,11 +1,12 @@
 from rest_framework import serializers
-from apps.homeworks.models import Homework, HomeworkSubmission, HomeworkGrade, GradeComment
+from apps.homeworks.models import Homework, HomeworkSubmission, HomeworkGrade, GradeComment, SubmissionRevision
 from apps.courses.serializers import LectureSerializer
 from apps.users.serializers import UserListSerializer
-from common.enums import ModelFields
+from common.enums import ModelFields, SerializerFields, ErrorMessages, HomeworkProgress, SimilarityScope
+from common.expansion import SparseFieldsetMixin
 
 
-class HomeworkSerializer(serializers.ModelSerializer):
+class HomeworkSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for homework assignments"""
     lecture = LectureSerializer(read_only=True)
     created_by = UserListSerializer(read_only=True)
@@ -54,33 +55,42 @@ class HomeworkUpdateSerializer(serializers.ModelSerializer):
         ]
 
 
-class HomeworkSubmissionSerializer(serializers.ModelSerializer):
-    """Serializer for homework submissions"""
+class HomeworkSubmissionListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """Serializer for homework submissions in lists; the body is summarised by its preview and length"""
     homework = HomeworkSerializer(read_only=True)
     student = UserListSerializer(read_only=True)
-    
+
     class Meta:
         model = HomeworkSubmission
         fields = [
             ModelFields.ID.value,
             ModelFields.HOMEWORK.value,
             ModelFields.STUDENT.value,
-            ModelFields.CONTENT.value,
+            ModelFields.CONTENT_PREVIEW.value,
+            ModelFields.CONTENT_LENGTH.value,
             ModelFields.SUBMITTED_AT.value,
             ModelFields.UPDATED_AT.value,
             ModelFields.IS_SUBMITTED.value,
         ]
-        read_only_fields = [
-            ModelFields.ID.value,
-            ModelFields.HOMEWORK.value,
-            ModelFields.STUDENT.value,
-            ModelFields.SUBMITTED_AT.value,
-            ModelFields.UPDATED_AT.value,
+        read_only_fields = fields
+
+
+class HomeworkSubmissionSerializer(HomeworkSubmissionListSerializer):
+    """Serializer for a single homework submission, including its full content"""
+    content = serializers.CharField(read_only=True)
+
+    class Meta(HomeworkSubmissionListSerializer.Meta):
+        fields = [
+            *HomeworkSubmissionListSerializer.Meta.fields[:3],
+            ModelFields.CONTENT.value,
+            *HomeworkSubmissionListSerializer.Meta.fields[3:],
         ]
+        read_only_fields = fields
 
 
 class HomeworkSubmissionCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating homework submissions"""
+    content = serializers.CharField()
     
     class Meta:
         model = HomeworkSubmission
@@ -91,6 +101,7 @@ class HomeworkSubmissionCreateSerializer(serializers.ModelSerializer):
 
 class HomeworkSubmissionUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating homework submissions"""
+    content = serializers.CharField(required=False)
     
     class Meta:
         model = HomeworkSubmission
@@ -100,9 +111,9 @@ class HomeworkSubmissionUpdateSerializer(serializers.ModelSerializer):
         ]
 
 
-class HomeworkGradeSerializer(serializers.ModelSerializer):
+class HomeworkGradeSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for homework grades"""
-    submission = HomeworkSubmissionSerializer(read_only=True)
+    submission = HomeworkSubmissionListSerializer(read_only=True)
     graded_by = UserListSerializer(read_only=True)
     
     class Meta:
@@ -147,7 +158,173 @@ class HomeworkGradeUpdateSerializer(serializers.ModelSerializer):
         ]
 
 
-class GradeCommentSerializer(serializers.ModelSerializer):
+class BulkGradeRowSerializer(serializers.Serializer):
+    """Serializer for one row of a bulk grading request (JSON object or CSV line)"""
+    submission_id = serializers.IntegerField(required=False, min_value=1)
+    student_email = serializers.EmailField(required=False)
+    grade = serializers.DecimalField(max_digits=5, decimal_places=2)
+    comments = serializers.CharField(required=False, allow_blank=True)
+
+    def validate(self, attrs):
+        if SerializerFields.SUBMISSION_ID.value not in attrs and SerializerFields.STUDENT_EMAIL.value not in attrs:
+            raise serializers.ValidationError(ErrorMessages.BULK_GRADE_ROW_TARGET_REQUIRED.value)
+        return attrs
+
+
+class BulkGradeRowResultSerializer(serializers.Serializer):
+    """Serializer for the per-row outcome of a bulk grading request"""
+    row = serializers.IntegerField()
+    status = serializers.CharField()
+    submission_id = serializers.IntegerField(allow_null=True)
+    grade_id = serializers.IntegerField(allow_null=True)
+    errors = serializers.ListField(child=serializers.CharField())
+
+
+class BulkHomeworkRowSerializer(serializers.Serializer):
+    """Serializer for one row of a bulk homework creation request (JSON object or CSV line)"""
+    lecture_id = serializers.IntegerField(min_value=1)
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField()
+    due_date = serializers.DateTimeField()
+
+
+class BulkHomeworkRowResultSerializer(serializers.Serializer):
+    """Serializer for the per-row outcome of a bulk homework creation request"""
+    row = serializers.IntegerField()
+    status = serializers.CharField()
+    lecture_id = serializers.IntegerField(allow_null=True)
+    homework_id = serializers.IntegerField(allow_null=True)
+    errors = serializers.ListField(child=serializers.CharField())
+
+
+class GradebookColumnSerializer(serializers.Serializer):
+    """Serializer for one homework column of the course gradebook"""
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    lecture_id = serializers.IntegerField()
+    lecture_topic = serializers.CharField()
+
+
+class GradebookRowSerializer(serializers.Serializer):
+    """Serializer for one student's gradebook row; grades follow the column order"""
+    student_id = serializers.IntegerField()
+    student_email = serializers.EmailField()
+    grades = serializers.ListField(child=serializers.FloatField(allow_null=True))
+
+
+class StudentHomeworkSerializer(serializers.Serializer):
+    """Serializer for one row of a student's homework dashboard"""
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    due_date = serializers.DateTimeField()
+    course_id = serializers.IntegerField()
+    course_name = serializers.CharField()
+    lecture_id = serializers.IntegerField()
+    lecture_topic = serializers.CharField()
+    status = serializers.CharField()
+    submission_id = serializers.IntegerField(allow_null=True)
+    submitted_at = serializers.DateTimeField(allow_null=True)
+    grade_id = serializers.IntegerField(allow_null=True)
+    grade = serializers.DecimalField(max_digits=5, decimal_places=2, allow_null=True)
+
+
+class StudentHomeworkFilterSerializer(serializers.Serializer):
+    """Query parameters of the student homework dashboard"""
+    status = serializers.ChoiceField(choices=[progress.value for progress in HomeworkProgress], required=False)
+    due_before = serializers.DateTimeField(required=False)
+
+
+class GradingQueueItemSerializer(serializers.Serializer):
+    """Serializer for one ungraded submission in a teacher's grading queue"""
+    id = serializers.IntegerField()
+    submitted_at = serializers.DateTimeField()
+    content_length = serializers.IntegerField()
+    content_preview = serializers.CharField()
+    student_id = serializers.IntegerField()
+    student_email = serializers.EmailField()
+    homework_id = serializers.IntegerField()
+    homework_title = serializers.CharField()
+    lecture_id = serializers.IntegerField()
+    lecture_topic = serializers.CharField()
+    course_id = serializers.IntegerField()
+    course_name = serializers.CharField()
+
+
+class GradingQueueCourseSerializer(serializers.Serializer):
+    """Serializer for the number of ungraded submissions in one course"""
+    course_id = serializers.IntegerField()
+    course_name = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class HistogramBinSerializer(serializers.Serializer):
+    lower = serializers.FloatField()
+    upper = serializers.FloatField()
+    count = serializers.IntegerField()
+
+
+class GradeStatisticsSerializer(serializers.Serializer):
+    """Serializer for the grade distribution of a homework, lecture or course"""
+    scope = serializers.CharField()
+    id = serializers.IntegerField()
+    count = serializers.IntegerField()
+    mean = serializers.FloatField(allow_null=True)
+    median = serializers.FloatField(allow_null=True)
+    stddev = serializers.FloatField(allow_null=True)
+    min = serializers.FloatField(allow_null=True)
+    max = serializers.FloatField(allow_null=True)
+    percentiles = serializers.DictField(child=serializers.FloatField())
+    histogram = HistogramBinSerializer(many=True)
+
+
+class SubmissionRevisionSerializer(serializers.ModelSerializer):
+    """Serializer for one kept revision, without its content"""
+
+    class Meta:
+        model = SubmissionRevision
+        fields = [
+            ModelFields.NUMBER.value,
+            ModelFields.IS_SNAPSHOT.value,
+            ModelFields.CONTENT_LENGTH.value,
+            ModelFields.CREATED_AT.value,
+        ]
+
+
+class SubmissionVersionSerializer(serializers.Serializer):
+    """Serializer for a submission's content as of one revision"""
+    number = serializers.IntegerField()
+    created_at = serializers.DateTimeField()
+    content_length = serializers.IntegerField()
+    content = serializers.CharField()
+
+
+class SimilarityFilterSerializer(serializers.Serializer):
+    """Query parameters of the similarity report"""
+    scope = serializers.ChoiceField(
+        choices=[scope.value for scope in SimilarityScope], required=False, default=SimilarityScope.HOMEWORK.value,
+    )
+    threshold = serializers.FloatField(min_value=0, max_value=1, required=False)
+
+
+class SimilarPairSerializer(serializers.Serializer):
+    submission_id = serializers.IntegerField()
+    student_id = serializers.IntegerField()
+    other_submission_id = serializers.IntegerField()
+    other_student_id = serializers.IntegerField()
+    other_homework_id = serializers.IntegerField()
+    similarity = serializers.FloatField()
+
+
+class SimilarityReportSerializer(serializers.Serializer):
+    """Serializer for the near-duplicate submissions of a homework"""
+    homework_id = serializers.IntegerField()
+    scope = serializers.CharField()
+    threshold = serializers.FloatField()
+    indexed = serializers.IntegerField()
+    pairs = SimilarPairSerializer(many=True)
+
+
+class GradeCommentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     author = UserListSerializer(read_only=True)
 
     class Meta:
@@ -167,6 +344,12 @@ class GradeCommentSerializer(serializers.ModelSerializer):
         ]
 
 
+class GradeCommentPollSerializer(serializers.Serializer):
+    """Query parameters of the incremental comment fetch and the comment stream"""
+    since_id = serializers.IntegerField(min_value=0, required=False)
+    timeout = serializers.FloatField(min_value=0, required=False)
+
+
 class GradeCommentCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = GradeComment
@@ -0,0 +1,8 @@
+# Student dashboard services
+from .grading_queue import GradingQueueManagementService
+from .services import StudentHomeworkManagementService
+
+__all__ = [
+    'GradingQueueManagementService',
+    'StudentHomeworkManagementService',
+]
@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+
+from django.db.models import Count, Exists, F, OuterRef, QuerySet
+from rest_framework.exceptions import PermissionDenied
+
+from apps.homeworks.models import HomeworkGrade, HomeworkSubmission
+from apps.homeworks.services.protocols import GradingQueueService
+from apps.homeworks.services.shared.teaching import taught_course_ids
+from common.enums import ErrorMessages, ModelFields, SerializerFields, UserFields, UserRole
+
+LOOKUP_SEPARATOR = "__"
+
+COURSE_ID_PATH = LOOKUP_SEPARATOR.join((ModelFields.HOMEWORK.value, ModelFields.LECTURE.value, ModelFields.COURSE.value, ModelFields.ID.value))
+COURSE_NAME_PATH = LOOKUP_SEPARATOR.join((ModelFields.HOMEWORK.value, ModelFields.LECTURE.value, ModelFields.COURSE.value, ModelFields.NAME.value))
+LECTURE_ID_PATH = LOOKUP_SEPARATOR.join((ModelFields.HOMEWORK.value, ModelFields.LECTURE.value, ModelFields.ID.value))
+LECTURE_TOPIC_PATH = LOOKUP_SEPARATOR.join((ModelFields.HOMEWORK.value, ModelFields.LECTURE.value, ModelFields.TOPIC.value))
+HOMEWORK_TITLE_PATH = LOOKUP_SEPARATOR.join((ModelFields.HOMEWORK.value, ModelFields.TITLE.value))
+STUDENT_EMAIL_PATH = LOOKUP_SEPARATOR.join((ModelFields.STUDENT.value, UserFields.EMAIL.value))
+COURSE_ID_IN = f"{COURSE_ID_PATH}__in"
+
+
+@dataclass
+class GradingQueueManagementService(GradingQueueService):
+    """
+    Submitted but ungraded work across every course a teacher owns or teaches.
+
+    The taught courses are a subquery, so the submissions are reached
+    through the ``(homework, student)`` index of each of their homeworks.
+    "Ungraded" is a ``NOT EXISTS`` anti-join probing the unique
+    ``submission_id`` index of the grade table. The same filtered queryset
+    feeds both the keyset-paginated list and the per-course counts.
+    """
+
+    def submissions(self, *, user) -> QuerySet:
+        return self._pending(user).values(
+            ModelFields.ID.value,
+            ModelFields.SUBMITTED_AT.value,
+            ModelFields.CONTENT_LENGTH.value,
+            ModelFields.CONTENT_PREVIEW.value,
+            SerializerFields.HOMEWORK_ID.value,
+            SerializerFields.STUDENT_ID.value,
+            **{
+                SerializerFields.HOMEWORK_TITLE.value: F(HOMEWORK_TITLE_PATH),
+                SerializerFields.LECTURE_ID.value: F(LECTURE_ID_PATH),
+                SerializerFields.LECTURE_TOPIC.value: F(LECTURE_TOPIC_PATH),
+                SerializerFields.COURSE_ID.value: F(COURSE_ID_PATH),
+                SerializerFields.COURSE_NAME.value: F(COURSE_NAME_PATH),
+                SerializerFields.STUDENT_EMAIL.value: F(STUDENT_EMAIL_PATH),
+            },
+        )
+
+    def course_counts(self, *, user) -> QuerySet:
+        return (
+            self._pending(user)
+            .values(**{
+                SerializerFields.COURSE_ID.value: F(COURSE_ID_PATH),
+                SerializerFields.COURSE_NAME.value: F(COURSE_NAME_PATH),
+            })
+            .annotate(**{SerializerFields.COUNT.value: Count(ModelFields.ID.value)})
+            .order_by(SerializerFields.COURSE_ID.value)
+        )
+
+    @staticmethod
+    def _pending(user) -> QuerySet:
+        if user.role != UserRole.TEACHER.value:
+            raise PermissionDenied(ErrorMessages.USER_MUST_BE_TEACHER.value)
+
+        graded = HomeworkGrade.objects.filter(**{ModelFields.SUBMISSION.value: OuterRef(ModelFields.ID.value)})
+        return (
+            HomeworkSubmission.objects
+            .filter(**{COURSE_ID_IN: taught_course_ids(user), ModelFields.IS_SUBMITTED.value: True})
+            .filter(~Exists(graded))
+        )
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+
+from django.db.models import Case, F, FilteredRelation, Q, QuerySet, Value, When
+from rest_framework.exceptions import PermissionDenied
+
+from apps.homeworks.models import Homework
+from apps.homeworks.services.protocols import StudentHomeworkService
+from common.enums import ErrorMessages, HomeworkProgress, ModelFields, RelatedNames, SerializerFields, UserRole
+
+LOOKUP_SEPARATOR = "__"
+OWN_SUBMISSION = "own_submission"
+
+ENROLLED_STUDENT_PATH = LOOKUP_SEPARATOR.join((
+    ModelFields.LECTURE.value, ModelFields.COURSE.value, ModelFields.STUDENTS.value,
+))
+SUBMISSION_STUDENT_PATH = LOOKUP_SEPARATOR.join((RelatedNames.HOMEWORK_SUBMISSIONS.value, ModelFields.STUDENT.value))
+OWN_SUBMISSION_ID_PATH = LOOKUP_SEPARATOR.join((OWN_SUBMISSION, ModelFields.ID.value))
+OWN_SUBMISSION_SUBMITTED_AT_PATH = LOOKUP_SEPARATOR.join((OWN_SUBMISSION, ModelFields.SUBMITTED_AT.value))
+OWN_SUBMISSION_IS_SUBMITTED_PATH = LOOKUP_SEPARATOR.join((OWN_SUBMISSION, ModelFields.IS_SUBMITTED.value))
+OWN_GRADE_ID_PATH = LOOKUP_SEPARATOR.join((OWN_SUBMISSION, ModelFields.GRADE.value, ModelFields.ID.value))
+OWN_GRADE_PATH = LOOKUP_SEPARATOR.join((OWN_SUBMISSION, ModelFields.GRADE.value, ModelFields.GRADE.value))
+LECTURE_TOPIC_PATH = LOOKUP_SEPARATOR.join((ModelFields.LECTURE.value, ModelFields.TOPIC.value))
+COURSE_ID_PATH = LOOKUP_SEPARATOR.join((ModelFields.LECTURE.value, ModelFields.COURSE.value, ModelFields.ID.value))
+COURSE_NAME_PATH = LOOKUP_SEPARATOR.join((ModelFields.LECTURE.value, ModelFields.COURSE.value, ModelFields.NAME.value))
+
+
+@dataclass
+class StudentHomeworkManagementService(StudentHomeworkService):
+    """
+    A student's homework across every course they are enrolled in.
+
+    One query joins enrollment → lecture → homework and left-joins the
+    student's own submission and its grade, so the progress of each
+    homework is computed in SQL and can be filtered on. Rows come back as
+    plain dicts ordered by ``(due_date, id)``, ready for keyset pagination.
+    """
+
+    def homeworks(self, *, user, status=None, due_before=None) -> QuerySet:
+        if user.role != UserRole.STUDENT.value:
+            raise PermissionDenied(ErrorMessages.USER_MUST_BE_STUDENT.value)
+
+        queryset = (
+            Homework.objects
+            .filter(**{ENROLLED_STUDENT_PATH: user})
+            .annotate(**{OWN_SUBMISSION: FilteredRelation(
+                RelatedNames.HOMEWORK_SUBMISSIONS.value, condition=Q(**{SUBMISSION_STUDENT_PATH: user}),
+            )})
+            .annotate(**{ModelFields.STATUS.value: self._progress()})
+        )
+        if status is not None:
+            queryset = queryset.filter(**{ModelFields.STATUS.value: status})
+        if due_before is not None:
+            queryset = queryset.filter(**{f"{ModelFields.DUE_DATE.value}__lt": due_before})
+
+        return queryset.order_by(ModelFields.DUE_DATE.value, ModelFields.ID.value).values(
+            ModelFields.ID.value,
+            ModelFields.TITLE.value,
+            ModelFields.DUE_DATE.value,
+            SerializerFields.LECTURE_ID.value,
+            ModelFields.STATUS.value,
+            **{
+                SerializerFields.LECTURE_TOPIC.value: F(LECTURE_TOPIC_PATH),
+                SerializerFields.COURSE_ID.value: F(COURSE_ID_PATH),
+                SerializerFields.COURSE_NAME.value: F(COURSE_NAME_PATH),
+                SerializerFields.SUBMISSION_ID.value: F(OWN_SUBMISSION_ID_PATH),
+                ModelFields.SUBMITTED_AT.value: F(OWN_SUBMISSION_SUBMITTED_AT_PATH),
+                SerializerFields.GRADE_ID.value: F(OWN_GRADE_ID_PATH),
+                ModelFields.GRADE.value: F(OWN_GRADE_PATH),
+            },
+        )
+
+    @staticmethod
+    def _progress() -> Case:
+        return Case(
+            When(**{f"{OWN_GRADE_PATH}__isnull": False}, then=Value(HomeworkProgress.GRADED.value)),
+            When(**{OWN_SUBMISSION_IS_SUBMITTED_PATH: True}, then=Value(HomeworkProgress.SUBMITTED.value)),
+            default=Value(HomeworkProgress.PENDING.value),
+        )
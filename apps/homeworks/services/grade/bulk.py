@@ -0,0 +1,151 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.homeworks.models import Homework, HomeworkGrade, HomeworkSubmission
+from apps.homeworks.services.grade.dtos import BulkGradeReport, BulkGradeRow, BulkGradeRowResult
+from apps.homeworks.services.grade.validation import GradeBusinessRuleValidator
+from apps.homeworks.services.protocols import BulkGradeService, HomeworkOwnershipGuard
+from apps.homeworks.services.shared.ownership_guard import HomeworkOwnershipGuardImpl
+from apps.homeworks.services.statistics.cache import GradeStatisticsCache
+from apps.homeworks.services.shared import events
+from apps.homeworks.services.validation.interfaces import GradeBusinessRuleValidatorInterface
+from apps.notifications.services.outbox import TransactionalOutbox
+from apps.notifications.services.protocols import EventOutbox
+from common.enums import BulkRowStatus, ErrorMessages, ModelFields, NotificationEvents
+
+MAX_BULK_GRADE_ROWS = 1000
+
+
+@dataclass
+class BulkGradeManagementService(BulkGradeService):
+    """
+    Grades a whole homework in a constant number of queries.
+
+    Permission is checked once for the homework, every row is matched to a
+    submission with one set-based query, and all writes happen in one
+    transaction through ``bulk_create``/``bulk_update``. Rows that fail do
+    not block the valid ones; each row gets its own result.
+    """
+    ownership_guard: HomeworkOwnershipGuard = field(default_factory=HomeworkOwnershipGuardImpl)
+    business_rule_validator: GradeBusinessRuleValidatorInterface = field(default_factory=GradeBusinessRuleValidator)
+    statistics_cache: GradeStatisticsCache = field(default_factory=GradeStatisticsCache)
+    outbox: EventOutbox = field(default_factory=TransactionalOutbox)
+
+    def grade_homework(self, *, homework: Homework, user, rows: list[BulkGradeRow],
+                       rejected: Iterable[BulkGradeRowResult] = ()) -> BulkGradeReport:
+        self.ownership_guard.ensure_owner(homework, user)
+
+        results = {result.row: result for result in rejected}
+        if not rows and not results:
+            raise ValidationError(ErrorMessages.BULK_GRADE_ROWS_REQUIRED.value)
+        if len(rows) + len(results) > MAX_BULK_GRADE_ROWS:
+            raise ValidationError(ErrorMessages.BULK_GRADE_TOO_MANY_ROWS.value.format(limit=MAX_BULK_GRADE_ROWS))
+
+        accepted = []
+        for row in rows:
+            try:
+                self.business_rule_validator.validate_grade_value(row.grade)
+            except ValidationError as e:
+                results[row.row] = self._error(row, str(e.detail[0]))
+            else:
+                accepted.append(row)
+
+        by_id, by_email = self._load_submissions(homework, accepted)
+        claimed = set()
+        to_create, to_update = [], []
+        for row in accepted:
+            submission = by_id.get(row.submission_id) if row.submission_id is not None else by_email.get(row.student_email)
+            if submission is None:
+                results[row.row] = self._error(row, ErrorMessages.SUBMISSION_NOT_IN_HOMEWORK.value)
+                continue
+            if submission.id in claimed:
+                results[row.row] = self._error(row, ErrorMessages.BULK_GRADE_DUPLICATE_ROW.value)
+                continue
+            claimed.add(submission.id)
+
+            existing = self._existing_grade(submission)
+            if existing is None:
+                to_create.append((row, HomeworkGrade(
+                    submission=submission,
+                    grade=row.grade,
+                    comments=row.comments or "",
+                    graded_by=user,
+                )))
+            else:
+                existing.grade = row.grade
+                if row.comments is not None:
+                    existing.comments = row.comments
+                to_update.append((row, existing))
+
+        self._write(homework, to_create, to_update)
+        if to_create or to_update:
+            self.statistics_cache.invalidate_course(homework.lecture.course_id)
+
+        for status, pairs in ((BulkRowStatus.CREATED, to_create), (BulkRowStatus.UPDATED, to_update)):
+            for row, grade in pairs:
+                results[row.row] = BulkGradeRowResult(
+                    row=row.row,
+                    status=status.value,
+                    submission_id=grade.submission_id,
+                    grade_id=grade.id,
+                )
+        return BulkGradeReport(results=[results[index] for index in sorted(results)])
+
+    @staticmethod
+    def _load_submissions(homework: Homework, rows: list[BulkGradeRow]):
+        ids = {row.submission_id for row in rows if row.submission_id is not None}
+        emails = {row.student_email for row in rows if row.submission_id is None}
+        if not ids and not emails:
+            return {}, {}
+
+        submissions = (
+            HomeworkSubmission.objects
+            .filter(homework=homework)
+            .filter(Q(id__in=ids) | Q(**{f"{ModelFields.STUDENT.value}__email__in": emails}))
+            .select_related(ModelFields.STUDENT.value, ModelFields.GRADE.value)
+            .without_content()
+        )
+        by_id, by_email = {}, {}
+        for submission in submissions:
+            by_id[submission.id] = submission
+            by_email[submission.student.email] = submission
+        return by_id, by_email
+
+    @staticmethod
+    def _existing_grade(submission: HomeworkSubmission) -> Optional[HomeworkGrade]:
+        # The reverse one-to-one was loaded by select_related; a missing grade raises instead of querying
+        try:
+            return getattr(submission, ModelFields.GRADE.value)
+        except HomeworkGrade.DoesNotExist:
+            return None
+
+    @transaction.atomic
+    def _write(self, homework: Homework, to_create, to_update) -> None:
+        if to_create:
+            created = HomeworkGrade.objects.bulk_create([grade for _, grade in to_create])
+            self.outbox.record_many(
+                NotificationEvents.GRADE_CREATED, [events.grade_created(grade, homework) for grade in created],
+            )
+        if to_update:
+            # bulk_update bypasses save(), so auto_now has to be applied by hand
+            now = timezone.now()
+            for _, grade in to_update:
+                grade.updated_at = now
+            HomeworkGrade.objects.bulk_update(
+                [grade for _, grade in to_update],
+                [ModelFields.GRADE.value, ModelFields.COMMENTS.value, ModelFields.UPDATED_AT.value],
+            )
+
+    @staticmethod
+    def _error(row: BulkGradeRow, message: str) -> BulkGradeRowResult:
+        return BulkGradeRowResult(
+            row=row.row,
+            status=BulkRowStatus.ERROR.value,
+            submission_id=row.submission_id,
+            errors=[message],
+        )
@@ -1,13 +1,99 @@
-from dataclasses import dataclass
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from django.db import connection, transaction
 from rest_framework.exceptions import PermissionDenied
 
 from apps.homeworks.models import GradeComment
 from apps.homeworks.services.protocols import GradeCommentService
-from common.enums import ErrorMessages, ModelFields
+from apps.homeworks.services.shared import events
+from apps.notifications.services.outbox import TransactionalOutbox
+from apps.notifications.services.protocols import EventOutbox
+from common.broker import LocalBroker, Subscription, broker as default_broker, publish_on_commit
+from common.enums import BrokerTopics, ErrorMessages, ModelFields, NotificationEvents
+
+
+# How long a delivered comment id may still be overtaken by a smaller id whose transaction commits later
+SETTLE_SECONDS = 10.0
+
+
+def comments_topic(grade_id: int) -> str:
+    return BrokerTopics.GRADE_COMMENTS.value.format(grade_id=grade_id)
+
+
+def release_connection() -> None:
+    """Hand the database connection back while a listener sleeps; the next query reconnects"""
+    if not connection.in_atomic_block:
+        connection.close()
+
+
+@dataclass
+class GradeCommentFeed:
+    """
+    New comments on one grade for a connection that was authorized once.
+
+    The first ``wait`` hands back the backlog read from the database when
+    the feed was opened. After that the broker only wakes the feed: every
+    wake and every timeout re-reads the grade's comments, so comments posted
+    through other worker processes arrive by the next heartbeat at the
+    latest. Ids are not committed in order, so each read reaches back over
+    the ids delivered in the last ``settle`` seconds and returns the ones
+    not seen yet. The connection is handed back between reads.
+    """
+    subscription: Subscription
+    grade_id: int
+    last_id: int
+    backlog: list = field(default_factory=list)
+    settle: float = SETTLE_SECONDS
+    # (delivered at, last_id before that delivery) and the ids delivered since the oldest of them
+    _recent: deque = field(default_factory=deque)
+    _seen: set = field(default_factory=set)
+
+    def wait(self, timeout: Optional[float]) -> list:
+        if self.backlog:
+            comments, self.backlog = self.backlog, []
+        else:
+            self.subscription.wait(timeout)
+            comments = self._read()
+        if comments:
+            self._recent.append((time.monotonic(), self.last_id))
+            self._seen.update(comment.id for comment in comments)
+            self.last_id = max(self.last_id, comments[-1].id)
+        return comments
+
+    def _read(self) -> list:
+        now = time.monotonic()
+        while self._recent and now - self._recent[0][0] > self.settle:
+            self._recent.popleft()
+        floor = self._recent[0][1] if self._recent else self.last_id
+        self._seen = {comment_id for comment_id in self._seen if comment_id > floor}
+        comments = list(
+            GradeComment.objects
+            .filter(**{ModelFields.GRADE.value: self.grade_id, f"{ModelFields.ID.value}__gt": floor})
+            .exclude(**{f"{ModelFields.ID.value}__in": self._seen})
+            .select_related(ModelFields.AUTHOR.value)
+            .order_by(ModelFields.ID.value)
+        )
+        release_connection()
+        return comments
+
+    def close(self) -> None:
+        self.subscription.close()
+
+    def __enter__(self) -> "GradeCommentFeed":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 @dataclass
 class GradeCommentManagementService(GradeCommentService):
+    broker: LocalBroker = field(default_factory=lambda: default_broker)
+    outbox: EventOutbox = field(default_factory=TransactionalOutbox)
+
     def _ensure_can_view(self, *, grade, user) -> None:
         if not user or not user.is_authenticated:
             raise PermissionDenied(ErrorMessages.COURSE_ACCESS_DENIED.value)
@@ -32,14 +118,29 @@ class GradeCommentManagementService(GradeCommentService):
         # Same rule as view - students must be enrolled to comment
         self._ensure_can_view(grade=grade, user=user)
 
-    def list(self, *, grade, user):
+    def list(self, *, grade, user, since_id=None):
         self._ensure_can_view(grade=grade, user=user)
-        return GradeComment.objects.filter(grade=grade).select_related(ModelFields.AUTHOR.value)
+        comments = GradeComment.objects.filter(grade=grade).select_related(ModelFields.AUTHOR.value)
+        if since_id is not None:
+            comments = comments.filter(**{f"{ModelFields.ID.value}__gt": since_id})
+        return comments
+
+    def listen(self, *, grade, user, since_id=0) -> GradeCommentFeed:
+        self._ensure_can_view(grade=grade, user=user)
+        # Subscribe before reading the backlog so nothing committed in between is missed
+        subscription = self.broker.subscribe(comments_topic(grade.id))
+        feed = GradeCommentFeed(subscription=subscription, grade_id=grade.id, last_id=since_id)
+        feed.backlog = feed._read()
+        return feed
 
     def create(self, *, grade, user, validated_data):
         self._ensure_can_comment(grade=grade, user=user)
-        return GradeComment.objects.create(
-            grade=grade,
-            author=user,
-            comment=validated_data[ModelFields.COMMENT.value]
-        )
+        with transaction.atomic():
+            comment = GradeComment.objects.create(
+                grade=grade,
+                author=user,
+                comment=validated_data[ModelFields.COMMENT.value]
+            )
+            self.outbox.record(NotificationEvents.COMMENT_CREATED, events.comment_created(comment, grade))
+            publish_on_commit(comments_topic(grade.id), comment)
+        return comment
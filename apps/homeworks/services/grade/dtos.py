@@ -24,3 +24,32 @@ class GradeValidationResult:
     """DTO for grade validation result"""
     is_valid: bool = True
     errors: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BulkGradeRow:
+    """DTO for one row of a bulk grading request, addressed by submission or student email"""
+    row: int
+    grade: Optional[Decimal] = None
+    comments: Optional[str] = None
+    submission_id: Optional[int] = None
+    student_email: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BulkGradeRowResult:
+    """DTO for the outcome of one bulk grading row"""
+    row: int
+    status: str
+    submission_id: Optional[int] = None
+    grade_id: Optional[int] = None
+    errors: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BulkGradeReport:
+    """DTO for the outcome of a bulk grading request"""
+    results: List[BulkGradeRowResult] = field(default_factory=list)
+
+    def count(self, status: str) -> int:
+        return sum(1 for result in self.results if result.status == status)
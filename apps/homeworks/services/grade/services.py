@@ -7,7 +7,12 @@ from apps.homeworks.services.grade.validation import GradeCreationValidator, Gra
 from apps.homeworks.services.validation.interfaces import GradeCreationValidatorInterface, GradeUpdateValidatorInterface
 from apps.homeworks.services.shared.ownership_guard import GradeOwnershipGuardImpl
 from apps.homeworks.services.protocols import GradeOwnershipGuard, GradeService
-from common.enums import ModelFields, UserRole, ErrorMessages
+from apps.homeworks.services.statistics.cache import GradeStatisticsCache
+from apps.homeworks.services.shared import events
+from apps.notifications.services.outbox import TransactionalOutbox
+from apps.notifications.services.protocols import EventOutbox
+from common.enums import ModelFields, UserRole, ErrorMessages, NotificationEvents
+from common.identity_map import fetch, register
 from apps.homeworks.models import HomeworkGrade, HomeworkSubmission
 from rest_framework.exceptions import PermissionDenied
 
@@ -16,6 +21,7 @@ class GradeCreationService:
     """Handles grade creation with validation and business logic"""
     validation_service: GradeCreationValidatorInterface = field(default_factory=GradeCreationValidator)
     ownership_guard: GradeOwnershipGuard = field(default_factory=GradeOwnershipGuardImpl)
+    outbox: EventOutbox = field(default_factory=TransactionalOutbox)
 
     def create_grade(self, request: GradeCreationRequest, user) -> HomeworkGrade:
         """Create a new grade with full validation"""
@@ -33,14 +39,15 @@ class GradeCreationService:
 
     @transaction.atomic
     def _create_grade_with_validation(self, request: GradeCreationRequest, user) -> HomeworkGrade:
-        """Create grade in a transaction"""
-        submission = HomeworkSubmission.objects.get(id=request.submission_id)
-        return HomeworkGrade.objects.create(
-            submission=submission,
+        """Create grade in a transaction, together with its outbox event"""
+        grade = HomeworkGrade.objects.create(
+            submission=fetch(HomeworkSubmission, request.submission_id),
             grade=request.grade,
             comments=request.comments,
             graded_by=user
         )
+        self.outbox.record(NotificationEvents.GRADE_CREATED, events.grade_created(grade, grade.submission.homework))
+        return grade
 
 
 @dataclass
@@ -80,15 +87,19 @@ class GradeManagementService(GradeService):
     creation_service: GradeCreationService = field(default_factory=GradeCreationService)
     update_service: GradeUpdateService = field(default_factory=GradeUpdateService)
     ownership_guard: GradeOwnershipGuard = field(default_factory=GradeOwnershipGuardImpl)
+    statistics_cache: GradeStatisticsCache = field(default_factory=GradeStatisticsCache)
 
     def create(self, *, submission, user, validated_data) -> HomeworkGrade:
         """Create a new grade"""
+        register(submission, user)
         request = GradeCreationRequest(
             submission_id=submission.id,
             grade=validated_data.get(ModelFields.GRADE.value),
             comments=validated_data.get(ModelFields.COMMENTS.value, "")
         )
-        return self.creation_service.create_grade(request, user)
+        grade = self.creation_service.create_grade(request, user)
+        self.statistics_cache.invalidate_course(self._course_id(grade))
+        return grade
 
     def update(self, *, instance, user, validated_data, partial=False) -> HomeworkGrade:
         """Update an existing grade"""
@@ -97,30 +108,38 @@ class GradeManagementService(GradeService):
             grade=validated_data.get(ModelFields.GRADE.value),
             comments=validated_data.get(ModelFields.COMMENTS.value)
         )
-        return self.update_service.update_grade(instance, request, user)
+        grade = self.update_service.update_grade(instance, request, user)
+        self.statistics_cache.invalidate_course(self._course_id(grade))
+        return grade
 
     def delete(self, *, instance, user) -> None:
         """Delete a grade"""
         self.ownership_guard.ensure_owner(instance, user)
+        # The post_delete receiver invalidates the course statistics, as for every cascaded grade
         instance.delete()
 
-    def get_grades_for_submission(self, *, submission_id, user):
+    @staticmethod
+    def _course_id(grade: HomeworkGrade) -> int:
+        return grade.submission.homework.lecture.course_id
+
+    def get_grades_for_submission(self, *, submission_id, user, submission=None):
         """Get grades for a specific submission"""
         
 
         if not user or not user.is_authenticated:
             raise PermissionDenied(ErrorMessages.COURSE_ACCESS_DENIED.value)
 
-        # Load submission and course to authorize access
-        try:
-            submission = HomeworkSubmission.objects.select_related(
-                ModelFields.HOMEWORK.value,
-                f"{ModelFields.HOMEWORK.value}__{ModelFields.LECTURE.value}",
-                f"{ModelFields.HOMEWORK.value}__{ModelFields.LECTURE.value}__{ModelFields.COURSE.value}",
-            ).get(id=submission_id)
-        except HomeworkSubmission.DoesNotExist:
-            # Mirror list behavior for nonexistent submission
-            raise PermissionDenied(ErrorMessages.COURSE_ACCESS_DENIED.value)
+        # Load submission and course to authorize access, unless the caller already resolved them
+        if submission is None:
+            try:
+                submission = HomeworkSubmission.objects.select_related(
+                    ModelFields.HOMEWORK.value,
+                    f"{ModelFields.HOMEWORK.value}__{ModelFields.LECTURE.value}",
+                    f"{ModelFields.HOMEWORK.value}__{ModelFields.LECTURE.value}__{ModelFields.COURSE.value}",
+                ).get(id=submission_id)
+            except HomeworkSubmission.DoesNotExist:
+                # Mirror list behavior for nonexistent submission
+                raise PermissionDenied(ErrorMessages.COURSE_ACCESS_DENIED.value)
 
         course = submission.homework.lecture.course
 
@@ -140,6 +159,7 @@ class GradeManagementService(GradeService):
                     f"{ModelFields.SUBMISSION.value}__{ModelFields.HOMEWORK.value}__{ModelFields.LECTURE.value}__{ModelFields.COURSE.value}",
                     ModelFields.GRADED_BY.value,
                 )
+                .defer(f"{ModelFields.SUBMISSION.value}__{ModelFields.INLINE_CONTENT.value}")
                 .filter(submission_id=submission_id)
             )
             return queryset
@@ -160,6 +180,7 @@ class GradeManagementService(GradeService):
                 f"{ModelFields.SUBMISSION.value}__{ModelFields.HOMEWORK.value}__{ModelFields.LECTURE.value}__{ModelFields.COURSE.value}",
                 ModelFields.GRADED_BY.value,
             )
+            .defer(f"{ModelFields.SUBMISSION.value}__{ModelFields.INLINE_CONTENT.value}")
             .filter(submission_id=submission_id)
         )
 
@@ -10,6 +10,7 @@ from apps.homeworks.services.validation.interfaces import (
 )
 from apps.homeworks.services.validation.base import BaseValidator
 from common.enums import ErrorMessages, UserRole
+from common.identity_map import fetch
 
 
 @dataclass
@@ -72,13 +73,13 @@ class GradeCreationValidator(GradeCreationValidatorInterface, BaseValidator):
     def _validate_submission_exists(self, submission_id: int) -> None:
         """Validate that submission exists"""
         try:
-            HomeworkSubmission.objects.get(id=submission_id)
+            fetch(HomeworkSubmission, submission_id)
         except HomeworkSubmission.DoesNotExist:
             raise ValidationError(ErrorMessages.SUBMISSION_DOESNT_EXIST.value)
 
     def _validate_grade_uniqueness(self, submission_id: int) -> None:
         """Validate grade uniqueness"""
-        submission = HomeworkSubmission.objects.get(id=submission_id)
+        submission = fetch(HomeworkSubmission, submission_id)
         self.uniqueness_validator.validate_grade_uniqueness(submission)
 
     def _validate_user_is_teacher(self, user_id: int) -> None:
@@ -0,0 +1,9 @@
+# Gradebook services
+from .dtos import GradebookColumn, GradebookRow
+from .services import GradebookManagementService
+
+__all__ = [
+    'GradebookColumn',
+    'GradebookRow',
+    'GradebookManagementService',
+]
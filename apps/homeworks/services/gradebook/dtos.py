@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class GradebookColumn:
+    """DTO for one homework column of the gradebook"""
+    id: int
+    title: str
+    lecture_id: int
+    lecture_topic: str
+
+
+@dataclass(frozen=True)
+class GradebookRow:
+    """DTO for one student's row; ``grades`` follows the column order, None where ungraded"""
+    student_id: int
+    student_email: str
+    grades: tuple[Optional[float], ...]
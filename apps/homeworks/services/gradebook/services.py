@@ -0,0 +1,119 @@
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+from django.db.models import QuerySet
+
+from apps.homeworks.models import Homework, HomeworkGrade
+from apps.homeworks.services.gradebook.dtos import GradebookColumn, GradebookRow
+from apps.homeworks.services.protocols import CourseTeacherGuard, GradebookService
+from apps.homeworks.services.shared.ownership_guard import CourseTeacherGuardImpl
+from common.enums import ModelFields, SerializerFields, UserFields
+
+LOOKUP_SEPARATOR = "__"
+GRADE_TYPECODE = "d"
+UNGRADED = math.nan
+CSV_COLUMN_LABEL = "{topic} / {title}"
+CSV_GRADE_FORMAT = "{:.2f}"
+CSV_CHUNK_SIZE = 2000
+
+LECTURE_ID_PATH = LOOKUP_SEPARATOR.join((ModelFields.LECTURE.value, ModelFields.ID.value))
+LECTURE_TOPIC_PATH = LOOKUP_SEPARATOR.join((ModelFields.LECTURE.value, ModelFields.TOPIC.value))
+LECTURE_COURSE_ID_PATH = LOOKUP_SEPARATOR.join((ModelFields.LECTURE.value, ModelFields.COURSE.value, ModelFields.ID.value))
+STUDENT_ID_PATH = LOOKUP_SEPARATOR.join((ModelFields.SUBMISSION.value, ModelFields.STUDENT.value, ModelFields.ID.value))
+HOMEWORK_ID_PATH = LOOKUP_SEPARATOR.join((ModelFields.SUBMISSION.value, ModelFields.HOMEWORK.value, ModelFields.ID.value))
+COURSE_ID_PATH = LOOKUP_SEPARATOR.join((
+    ModelFields.SUBMISSION.value, ModelFields.HOMEWORK.value, ModelFields.LECTURE.value, ModelFields.COURSE.value,
+    ModelFields.ID.value,
+))
+
+
+@dataclass
+class GradebookManagementService(GradebookService):
+    """
+    Builds the students × homeworks grade matrix of a course.
+
+    Grades come from one joined query over grade → submission → homework →
+    lecture that returns bare ``(student, homework, grade)`` tuples. Each
+    student's row is pivoted into a float array indexed by column, so the
+    matrix never exists as model instances. The CSV export merges that query
+    with the ordered student list and emits one row at a time. Columns are
+    read first and without a snapshot, so grades of homeworks created in
+    between are left out rather than failing the response mid-stream.
+    """
+    teacher_guard: CourseTeacherGuard = field(default_factory=CourseTeacherGuardImpl)
+
+    def columns(self, *, course, user) -> list[GradebookColumn]:
+        """Homeworks ordered by lecture; also the permission check for the whole gradebook"""
+        self.teacher_guard.ensure_teacher(course, user)
+        homeworks = (
+            Homework.objects
+            .filter(**{LECTURE_COURSE_ID_PATH: course.id})
+            .order_by(LECTURE_ID_PATH, ModelFields.ID.value)
+            .values_list(ModelFields.ID.value, ModelFields.TITLE.value, LECTURE_ID_PATH, LECTURE_TOPIC_PATH)
+        )
+        return [GradebookColumn(*values) for values in homeworks]
+
+    @staticmethod
+    def students(course) -> QuerySet:
+        """``(id, email)`` of enrolled students in row order"""
+        return course.students.order_by(ModelFields.ID.value).values_list(ModelFields.ID.value, UserFields.EMAIL.value)
+
+    def rows(self, *, course, columns: list[GradebookColumn], students: Iterable[tuple]) -> list[GradebookRow]:
+        students = list(students)
+        positions = self._positions(columns)
+        matrix = {student_id: self._empty_row(len(columns)) for student_id, _ in students}
+        grades = self._grades(course).filter(**{f"{STUDENT_ID_PATH}__in": list(matrix)})
+        for student_id, homework_id, grade in grades:
+            position = positions.get(homework_id)
+            if position is not None:  # None: a homework added after the columns were read
+                matrix[student_id][position] = float(grade)
+        return [
+            GradebookRow(student_id=student_id, student_email=email, grades=self._as_tuple(matrix[student_id]))
+            for student_id, email in students
+        ]
+
+    def iter_csv_rows(self, *, course, columns: list[GradebookColumn]) -> Iterator[list]:
+        positions = self._positions(columns)
+        yield [
+            SerializerFields.STUDENT_ID.value,
+            SerializerFields.STUDENT_EMAIL.value,
+            *(CSV_COLUMN_LABEL.format(topic=column.lecture_topic, title=column.title) for column in columns),
+        ]
+
+        # Both sides are ordered by student id, so a single merge pass pivots the matrix
+        grades = self._grades(course).iterator(chunk_size=CSV_CHUNK_SIZE)
+        pending = next(grades, None)
+        for student_id, email in self.students(course).iterator(chunk_size=CSV_CHUNK_SIZE):
+            values = self._empty_row(len(columns))
+            while pending is not None and pending[0] < student_id:
+                # Grades of students who have since left the course
+                pending = next(grades, None)
+            while pending is not None and pending[0] == student_id:
+                position = positions.get(pending[1])
+                if position is not None:
+                    values[position] = float(pending[2])
+                pending = next(grades, None)
+            yield [student_id, email, *("" if math.isnan(value) else CSV_GRADE_FORMAT.format(value) for value in values)]
+
+    @staticmethod
+    def _grades(course) -> QuerySet:
+        return (
+            HomeworkGrade.objects
+            .filter(**{COURSE_ID_PATH: course.id, f"{ModelFields.GRADE.value}__isnull": False})
+            .order_by(STUDENT_ID_PATH)
+            .values_list(STUDENT_ID_PATH, HOMEWORK_ID_PATH, ModelFields.GRADE.value)
+        )
+
+    @staticmethod
+    def _positions(columns: list[GradebookColumn]) -> dict[int, int]:
+        return {column.id: position for position, column in enumerate(columns)}
+
+    @staticmethod
+    def _empty_row(width: int) -> array:
+        return array(GRADE_TYPECODE, [UNGRADED]) * width
+
+    @staticmethod
+    def _as_tuple(values: array) -> tuple:
+        return tuple(None if math.isnan(value) else value for value in values)
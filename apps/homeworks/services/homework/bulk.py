@@ -0,0 +1,118 @@
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from django.db import transaction
+from rest_framework.exceptions import PermissionDenied, ValidationError
+
+from apps.courses.models import Lecture
+from apps.homeworks.models import Homework
+from apps.homeworks.services.homework.dtos import BulkHomeworkReport, BulkHomeworkRow, BulkHomeworkRowResult
+from apps.homeworks.services.protocols import BulkHomeworkService, CourseTeacherGuard
+from apps.homeworks.services.shared import events
+from apps.homeworks.services.shared.ownership_guard import CourseTeacherGuardImpl
+from apps.notifications.services.outbox import TransactionalOutbox
+from apps.notifications.services.protocols import EventOutbox
+from common.enums import BulkRowStatus, ErrorMessages, ModelFields, NotificationEvents, SerializerFields, UserRole
+
+MAX_BULK_HOMEWORK_ROWS = 500
+
+
+@dataclass
+class BulkHomeworkManagementService(BulkHomeworkService):
+    """
+    Publishes homeworks to many lectures of a course in a constant number of queries.
+
+    Permission is checked once for the course, the lectures are loaded with
+    one query, and ``UNIQUE_HOMEWORK_TITLE_PER_LECTURE`` is checked for every
+    row at once: one query finds the ``(lecture, title)`` pairs that already
+    exist and a set catches pairs repeated inside the request. The valid rows
+    are written with a single ``bulk_create``; the others get their own error.
+    """
+    teacher_guard: CourseTeacherGuard = field(default_factory=CourseTeacherGuardImpl)
+    outbox: EventOutbox = field(default_factory=TransactionalOutbox)
+
+    def create_homeworks(self, *, course, user, rows: list[BulkHomeworkRow],
+                         rejected: Iterable[BulkHomeworkRowResult] = ()) -> BulkHomeworkReport:
+        if user.role != UserRole.TEACHER.value:
+            raise PermissionDenied(ErrorMessages.USER_MUST_BE_TEACHER.value)
+        self.teacher_guard.ensure_teacher(course, user)
+
+        results = {result.row: result for result in rejected}
+        if not rows and not results:
+            raise ValidationError(ErrorMessages.BULK_HOMEWORK_ROWS_REQUIRED.value)
+        if len(rows) + len(results) > MAX_BULK_HOMEWORK_ROWS:
+            raise ValidationError(ErrorMessages.BULK_HOMEWORK_TOO_MANY_ROWS.value.format(limit=MAX_BULK_HOMEWORK_ROWS))
+
+        lectures = self._load_lectures(course, rows)
+        existing = self._existing_titles(rows, lectures)
+        claimed = set()
+        to_create = []
+        for row in rows:
+            lecture = lectures.get(row.lecture_id)
+            if lecture is None:
+                results[row.row] = self._error(row, ErrorMessages.LECTURE_NOT_IN_COURSE.value)
+                continue
+            key = (row.lecture_id, row.title)
+            if key in existing:
+                results[row.row] = self._error(row, ErrorMessages.HOMEWORK_TITLE_ALREADY_EXISTS.value.format(title=row.title))
+                continue
+            if key in claimed:
+                results[row.row] = self._error(row, ErrorMessages.BULK_HOMEWORK_DUPLICATE_ROW.value.format(title=row.title))
+                continue
+            claimed.add(key)
+            to_create.append((row, Homework(
+                lecture=lecture,
+                title=row.title,
+                description=row.description,
+                due_date=row.due_date,
+                created_by=user,
+            )))
+
+        self._write(to_create)
+        for row, homework in to_create:
+            results[row.row] = BulkHomeworkRowResult(
+                row=row.row,
+                status=BulkRowStatus.CREATED.value,
+                lecture_id=homework.lecture_id,
+                homework_id=homework.id,
+            )
+        return BulkHomeworkReport(results=[results[index] for index in sorted(results)])
+
+    @staticmethod
+    def _load_lectures(course, rows: list[BulkHomeworkRow]) -> dict[int, Lecture]:
+        ids = {row.lecture_id for row in rows}
+        if not ids:
+            return {}
+        lectures = Lecture.objects.filter(course=course, id__in=ids).only(ModelFields.ID.value, ModelFields.COURSE.value)
+        return {lecture.id: lecture for lecture in lectures}
+
+    @staticmethod
+    def _existing_titles(rows: list[BulkHomeworkRow], lectures: dict[int, Lecture]) -> set[tuple[int, str]]:
+        """``(lecture_id, title)`` pairs the unique constraint would reject; a superset query filtered in Python"""
+        titles = {row.title for row in rows if row.lecture_id in lectures}
+        if not titles:
+            return set()
+        pairs = (
+            Homework.objects
+            .filter(lecture_id__in=list(lectures), title__in=titles)
+            .values_list(SerializerFields.LECTURE_ID.value, ModelFields.TITLE.value)
+        )
+        return set(pairs)
+
+    @transaction.atomic
+    def _write(self, to_create) -> None:
+        if not to_create:
+            return
+        created = Homework.objects.bulk_create([homework for _, homework in to_create])
+        self.outbox.record_many(
+            NotificationEvents.HOMEWORK_PUBLISHED, [events.homework_published(homework) for homework in created],
+        )
+
+    @staticmethod
+    def _error(row: BulkHomeworkRow, message: str) -> BulkHomeworkRowResult:
+        return BulkHomeworkRowResult(
+            row=row.row,
+            status=BulkRowStatus.ERROR.value,
+            lecture_id=row.lecture_id,
+            errors=[message],
+        )
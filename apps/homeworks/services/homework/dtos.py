@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 from common.enums import ErrorMessages
 
 
@@ -38,3 +39,32 @@ class HomeworkValidationResult:
     """Result of homework validation"""
     is_valid: bool = True
     errors: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BulkHomeworkRow:
+    """DTO for one row of a bulk homework creation request"""
+    row: int
+    lecture_id: int
+    title: str
+    description: str
+    due_date: datetime
+
+
+@dataclass(frozen=True)
+class BulkHomeworkRowResult:
+    """DTO for the outcome of one bulk homework creation row"""
+    row: int
+    status: str
+    lecture_id: Optional[int] = None
+    homework_id: Optional[int] = None
+    errors: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BulkHomeworkReport:
+    """DTO for the outcome of a bulk homework creation request"""
+    results: List[BulkHomeworkRowResult] = field(default_factory=list)
+
+    def count(self, status: str) -> int:
+        return sum(1 for result in self.results if result.status == status)
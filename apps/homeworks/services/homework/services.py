@@ -9,7 +9,10 @@ from apps.homeworks.services.homework.validation import HomeworkCreationValidato
 from apps.homeworks.services.validation.interfaces import HomeworkCreationValidatorInterface, HomeworkUpdateValidatorInterface
 from apps.homeworks.services.shared.ownership_guard import HomeworkOwnershipGuardImpl
 from apps.homeworks.services.protocols import HomeworkOwnershipGuard, HomeworkService
-from common.enums import ModelFields, ErrorMessages, UserRole
+from apps.homeworks.services.shared import events
+from apps.notifications.services.outbox import TransactionalOutbox
+from apps.notifications.services.protocols import EventOutbox
+from common.enums import ModelFields, ErrorMessages, UserRole, NotificationEvents
 
 
 @dataclass
@@ -17,6 +20,7 @@ class HomeworkCreationService:
     """Handles homework creation with validation and business logic"""
     validation_service: HomeworkCreationValidatorInterface = field(default_factory=HomeworkCreationValidator)
     ownership_guard: HomeworkOwnershipGuard = field(default_factory=HomeworkOwnershipGuardImpl)
+    outbox: EventOutbox = field(default_factory=TransactionalOutbox)
 
     def create_homework(self, request: HomeworkCreationRequest, lecture: Lecture, user) -> Homework:
         """Create a new homework with full validation"""
@@ -41,14 +45,16 @@ class HomeworkCreationService:
 
     @transaction.atomic
     def _create_homework_with_validation(self, request: HomeworkCreationRequest, lecture: Lecture, user) -> Homework:
-        """Create homework in a transaction"""
-        return Homework.objects.create(
+        """Create homework in a transaction, together with its outbox event"""
+        homework = Homework.objects.create(
             lecture=lecture,
             title=request.title,
             description=request.description,
             due_date=request.due_date,
             created_by=user
         )
+        self.outbox.record(NotificationEvents.HOMEWORK_PUBLISHED, events.homework_published(homework))
+        return homework
 
 
 @dataclass
@@ -53,7 +53,7 @@ class SubmissionService(ABC):
 
     @abstractmethod
     def update(self, *, instance, user, validated_data, partial=False) -> None:
-        """Update an existing submission"""
+        """Update an existing submission and return the row as saved, which may be a fresh copy of ``instance``"""
         pass
 
     @abstractmethod
@@ -67,6 +67,31 @@ class SubmissionService(ABC):
         pass
 
 
+class SubmissionRevisionService(ABC):
+    """Interface for the content history of submissions"""
+
+    @abstractmethod
+    def record(self, submission, content, previous=None) -> None:
+        pass
+
+    @abstractmethod
+    def revisions(self, *, submission, user) -> None:
+        pass
+
+    @abstractmethod
+    def version(self, *, submission, user, number) -> None:
+        pass
+
+
+class SubmissionExporter(ABC):
+    """Interface for streaming every submission of a homework"""
+
+    @abstractmethod
+    def export(self, *, homework, user, export_format) -> None:
+        """Return an ExportStream in the requested format"""
+        pass
+
+
 class GradeOwnershipGuard(ABC):
     """Interface for grade ownership/permission validation"""
 
@@ -95,8 +120,108 @@ class GradeService(ABC):
         pass
 
     @abstractmethod
-    def get_grades_for_submission(self, *, submission_id, user) -> None:
-        """Get grades for a specific submission"""
+    def get_grades_for_submission(self, *, submission_id, user, submission=None) -> None:
+        """Get grades for a specific submission; ``submission`` skips reloading an already resolved one"""
+        pass
+
+
+class BulkGradeService(ABC):
+    """Interface for grading many submissions of a homework at once"""
+
+    @abstractmethod
+    def grade_homework(self, *, homework, user, rows, rejected=()) -> None:
+        """Create or update grades for the given rows and report per-row outcomes"""
+        pass
+
+
+class BulkHomeworkService(ABC):
+    """Interface for publishing homeworks to many lectures of a course at once"""
+
+    @abstractmethod
+    def create_homeworks(self, *, course, user, rows, rejected=()) -> None:
+        """Create homeworks for the given rows and report per-row outcomes"""
+        pass
+
+
+class CourseTeacherGuard(ABC):
+    """Interface for course-wide teacher permission validation"""
+
+    @abstractmethod
+    def ensure_teacher(self, course, user) -> None:
+        """Ensure user teaches (or owns) the course"""
+        pass
+
+
+class GradebookService(ABC):
+    """Interface for the students × homeworks grade matrix of a course"""
+
+    @abstractmethod
+    def columns(self, *, course, user) -> None:
+        """Homeworks of the course in gradebook column order"""
+        pass
+
+    @abstractmethod
+    def students(self, course) -> None:
+        """(id, email) of the enrolled students in row order, ready to paginate"""
+        pass
+
+    @abstractmethod
+    def rows(self, *, course, columns, students) -> None:
+        """Grade rows for the given (id, email) students"""
+        pass
+
+    @abstractmethod
+    def iter_csv_rows(self, *, course, columns) -> None:
+        """Yield the whole gradebook as CSV rows, header first"""
+        pass
+
+
+class GradeStatisticsService(ABC):
+    """Interface for grade distribution statistics"""
+
+    @abstractmethod
+    def statistics(self, *, hierarchy, user) -> None:
+        """Statistics for the deepest of homework, lecture or course in the hierarchy"""
+        pass
+
+
+class StudentHomeworkService(ABC):
+    """Interface for a student's homework across all enrolled courses"""
+
+    @abstractmethod
+    def homeworks(self, *, user, status=None, due_before=None) -> None:
+        """Homeworks with the student's progress, ordered by due date"""
+        pass
+
+
+class GradingQueueService(ABC):
+    """Interface for the submitted but ungraded work of a teacher's courses"""
+
+    @abstractmethod
+    def submissions(self, *, user) -> None:
+        """Ungraded submissions, oldest first"""
+        pass
+
+    @abstractmethod
+    def course_counts(self, *, user) -> None:
+        """Number of ungraded submissions per course"""
+        pass
+
+
+class SimilarityService(ABC):
+    """Interface for near-duplicate submission detection"""
+
+    @abstractmethod
+    def schedule(self, submission) -> None:
+        """(Re)index the submission once the current transaction commits"""
+        pass
+
+    @abstractmethod
+    def index(self, submissions) -> None:
+        pass
+
+    @abstractmethod
+    def report(self, *, homework, user, scope, threshold) -> None:
         pass
 
 
@@ -104,7 +229,12 @@ class GradeCommentService(ABC):
     """Interface for grade comment operations"""
 
     @abstractmethod
-    def list(self, *, grade, user) -> None:
+    def list(self, *, grade, user, since_id=None) -> None:
+        pass
+
+    @abstractmethod
+    def listen(self, *, grade, user, since_id=0) -> None:
+        """Authorize once and return a feed of comments newer than ``since_id``"""
         pass
 
     @abstractmethod
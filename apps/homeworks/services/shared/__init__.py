@@ -1 +1,9 @@
 # Shared homework services
+from .dtos import ResourceHierarchy
+from .hierarchy import HierarchyResolver, NestedHierarchyMixin
+
+__all__ = [
+    'ResourceHierarchy',
+    'HierarchyResolver',
+    'NestedHierarchyMixin',
+]
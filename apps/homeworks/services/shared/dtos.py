@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from apps.courses.models import Course, Lecture
+from apps.homeworks.models import Homework, HomeworkSubmission, HomeworkGrade
+
+
+@dataclass(frozen=True)
+class ResourceHierarchy:
+    """DTO for the course → lecture → homework → submission → grade chain named by a nested URL"""
+    course: Course
+    lecture: Optional[Lecture] = None
+    homework: Optional[Homework] = None
+    submission: Optional[HomeworkSubmission] = None
+    grade: Optional[HomeworkGrade] = None
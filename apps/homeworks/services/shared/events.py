@@ -0,0 +1,38 @@
+"""Payloads of the notification events homework services record in the outbox"""
+from common.enums import ModelFields, SerializerFields
+
+
+def _homework_fields(homework) -> dict:
+    return {
+        SerializerFields.COURSE_ID.value: homework.lecture.course_id,
+        SerializerFields.LECTURE_ID.value: homework.lecture_id,
+        SerializerFields.HOMEWORK_ID.value: homework.id,
+        SerializerFields.HOMEWORK_TITLE.value: homework.title,
+    }
+
+
+def homework_published(homework) -> dict:
+    return {**_homework_fields(homework), ModelFields.DUE_DATE.value: homework.due_date}
+
+
+def grade_created(grade, homework) -> dict:
+    return {
+        **_homework_fields(homework),
+        SerializerFields.SUBMISSION_ID.value: grade.submission_id,
+        SerializerFields.STUDENT_ID.value: grade.submission.student_id,
+        SerializerFields.GRADE_ID.value: grade.id,
+        ModelFields.GRADE.value: grade.grade,
+        SerializerFields.GRADED_BY_ID.value: grade.graded_by_id,
+    }
+
+
+def comment_created(comment, grade) -> dict:
+    submission = grade.submission
+    return {
+        **_homework_fields(submission.homework),
+        SerializerFields.SUBMISSION_ID.value: submission.id,
+        SerializerFields.STUDENT_ID.value: submission.student_id,
+        SerializerFields.GRADE_ID.value: grade.id,
+        SerializerFields.COMMENT_ID.value: comment.id,
+        SerializerFields.AUTHOR_ID.value: comment.author_id,
+    }
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from rest_framework.exceptions import NotFound
+
+from apps.courses.models import Course, Lecture
+from apps.homeworks.models import Homework, HomeworkSubmission, HomeworkGrade
+from apps.homeworks.services.shared.dtos import ResourceHierarchy
+from common.enums import ErrorMessages, ModelFields, RequestData
+from common.identity_map import register
+
+LOOKUP_SEPARATOR = "__"
+ID_SUFFIX = "_id"
+
+# (level, model, message when missing), outermost first; each level is the FK parent of the next
+HIERARCHY_LEVELS = (
+    (ModelFields.COURSE.value, Course, ErrorMessages.COURSE_DOESNT_EXIST),
+    (ModelFields.LECTURE.value, Lecture, ErrorMessages.LECTURE_DOESNT_EXIST),
+    (ModelFields.HOMEWORK.value, Homework, ErrorMessages.HOMEWORK_DOESNT_EXIST),
+    (ModelFields.SUBMISSION.value, HomeworkSubmission, ErrorMessages.SUBMISSION_DOESNT_EXIST),
+    (ModelFields.GRADE.value, HomeworkGrade, ErrorMessages.GRADE_DOESNT_EXIST),
+)
+
+# Large columns never needed for authorization; loaded lazily if a caller reads them
+DEFERRED_FIELDS = {
+    ModelFields.SUBMISSION.value: (ModelFields.INLINE_CONTENT.value,),
+}
+
+
+@dataclass
+class HierarchyResolver:
+    """
+    Loads a nested URL's resource chain with a single joined query.
+
+    Only the deepest requested object is queried; its parents arrive through
+    ``select_related`` and every parent id from the URL is part of the filter,
+    so a homework requested under the wrong lecture is simply not found.
+    """
+
+    def resolve(self, ids: dict) -> ResourceHierarchy:
+        levels = [level for level in HIERARCHY_LEVELS if ids.get(level[0]) is not None]
+        depth = len(levels)
+        if not depth or [level[0] for level in levels] != [level[0] for level in HIERARCHY_LEVELS[:depth]]:
+            raise ValueError("Hierarchy ids must name a contiguous chain starting at the course")
+
+        leaf_name, leaf_model, missing_message = levels[-1]
+        parents = [level[0] for level in reversed(levels[:-1])]
+
+        filters = {ModelFields.ID.value: ids[leaf_name]}
+        for position, parent in enumerate(parents):
+            path = LOOKUP_SEPARATOR.join(parents[:position + 1])
+            filters[f"{path}{ID_SUFFIX}"] = ids[parent]
+
+        queryset = leaf_model.objects.filter(**filters)
+        if parents:
+            queryset = queryset.select_related(LOOKUP_SEPARATOR.join(parents))
+        deferred = [
+            LOOKUP_SEPARATOR.join((*parents[:position], name))
+            for position, level in enumerate([leaf_name, *parents])
+            for name in DEFERRED_FIELDS.get(level, ())
+        ]
+        if deferred:
+            queryset = queryset.defer(*deferred)
+        leaf = queryset.first()
+        if leaf is None:
+            raise NotFound(missing_message.value)
+
+        resolved = {leaf_name: leaf}
+        node = leaf
+        for parent in parents:
+            node = getattr(node, parent)
+            resolved[parent] = node
+        return ResourceHierarchy(**resolved)
+
+
+class NestedHierarchyMixin:
+    """
+    View mixin resolving the URL parents before the handler runs.
+
+    ``hierarchy_url_kwargs`` maps hierarchy levels to URL kwargs. The chain
+    is resolved after authentication and permission checks and cached on the
+    request, so guards and services receive fully loaded parents.
+    """
+    hierarchy_url_kwargs: dict = {}
+    hierarchy_resolver: HierarchyResolver = HierarchyResolver()
+
+    def get_hierarchy_url_kwargs(self) -> dict:
+        return self.hierarchy_url_kwargs
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        ids = {level: self.kwargs.get(kwarg) for level, kwarg in self.get_hierarchy_url_kwargs().items()}
+        hierarchy = self.hierarchy_resolver.resolve(ids)
+        setattr(request, RequestData.RESOURCE_HIERARCHY.value, hierarchy)
+        register(request.user, *vars(hierarchy).values())
+
+    @property
+    def hierarchy(self) -> Optional[ResourceHierarchy]:
+        return getattr(self.request, RequestData.RESOURCE_HIERARCHY.value, None)
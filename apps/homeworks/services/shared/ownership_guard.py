@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from rest_framework.exceptions import PermissionDenied
 
-from apps.homeworks.services.protocols import HomeworkOwnershipGuard, SubmissionOwnershipGuard, GradeOwnershipGuard
+from apps.homeworks.services.protocols import (
+    HomeworkOwnershipGuard, SubmissionOwnershipGuard, GradeOwnershipGuard, CourseTeacherGuard,
+)
 from common.enums import ErrorMessages, UserRole
 
 
@@ -82,3 +84,20 @@ class GradeOwnershipGuardImpl(GradeOwnershipGuard):
             return
 
         raise PermissionDenied(ErrorMessages.ONLY_GRADED_BY_TEACHER_CAN_UPDATE.value)
+
+
+@dataclass
+class CourseTeacherGuardImpl(CourseTeacherGuard):
+    """Guards course-wide views that only the course's teachers may see"""
+
+    def ensure_teacher(self, course, user) -> None:
+        if not user or not user.is_authenticated:
+            raise PermissionDenied(ErrorMessages.COURSE_ACCESS_DENIED.value)
+
+        if course.primary_owner_id == user.id:
+            return
+
+        if course.teachers.filter(id=user.id).exists():
+            return
+
+        raise PermissionDenied(ErrorMessages.COURSE_ACCESS_DENIED.value)
@@ -0,0 +1,12 @@
+from django.db.models import Q, QuerySet
+
+from apps.courses.models import Course, CourseTeacher
+from common.enums import ModelFields
+
+
+def taught_course_ids(user) -> QuerySet:
+    """Ids of the courses ``user`` owns or co-teaches, for use as a subquery"""
+    co_taught = CourseTeacher.objects.filter(**{ModelFields.USER.value: user}).values(ModelFields.COURSE.value)
+    return Course.objects.filter(
+        Q(**{ModelFields.PRIMARY_OWNER.value: user}) | Q(**{f"{ModelFields.ID.value}__in": co_taught})
+    ).values(ModelFields.ID.value)
@@ -0,0 +1,11 @@
+# Near-duplicate submission detection
+from .dtos import SimilarPair, SimilarityReport
+from .minhash import MinHasher
+from .services import SubmissionSimilarityService
+
+__all__ = [
+    'SimilarPair',
+    'SimilarityReport',
+    'MinHasher',
+    'SubmissionSimilarityService',
+]
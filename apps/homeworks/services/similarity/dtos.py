@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class SimilarPair:
+    """DTO for two submissions whose estimated similarity reached the threshold"""
+    submission_id: int
+    student_id: int
+    other_submission_id: int
+    other_student_id: int
+    other_homework_id: int
+    similarity: float
+
+
+@dataclass(frozen=True)
+class SimilarityReport:
+    """DTO for the near-duplicates found for one homework"""
+    homework_id: int
+    scope: str
+    threshold: float
+    indexed: int
+    pairs: list[SimilarPair] = field(default_factory=list)
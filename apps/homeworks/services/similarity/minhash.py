@@ -0,0 +1,93 @@
+import hashlib
+import random
+import re
+import sys
+from array import array
+from typing import Optional
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+SIGNATURE_TYPECODE = "I"
+HASH_BYTES = 8
+BYTE_ORDER = "little"
+DEFAULT_SEED = 1
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _hash(data: bytes, *, signed: bool = False) -> int:
+    digest = hashlib.blake2b(data, digest_size=HASH_BYTES).digest()
+    return int.from_bytes(digest, BYTE_ORDER, signed=signed)
+
+
+def shingles(text: str, size: int) -> set[int]:
+    """Hashes of the overlapping ``size``-word windows of ``text``, ignoring case and punctuation"""
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) <= size:
+        return {_hash(" ".join(tokens).encode())} if tokens else set()
+    return {_hash(" ".join(tokens[start:start + size]).encode()) for start in range(len(tokens) - size + 1)}
+
+
+class MinHasher:
+    """
+    MinHash signatures and their LSH band keys.
+
+    Each of ``permutations`` hash functions is ``(a * x + b) mod p`` over
+    the shingle hashes; the signature keeps the minimum of each, truncated
+    to 32 bits. The fraction of equal positions in two signatures estimates
+    the Jaccard similarity of their shingle sets. The signature is cut into
+    ``bands`` bands of equal rows, and two submissions become a candidate
+    pair when any band matches exactly, with probability
+    ``1 - (1 - s ** rows) ** bands`` for similarity ``s``.
+    """
+
+    def __init__(self, *, permutations: int, bands: int, shingle_size: int, seed: int = DEFAULT_SEED):
+        if permutations % bands:
+            raise ValueError("permutations must be a multiple of bands")
+        generator = random.Random(seed)
+        self._coefficients = [
+            (generator.randrange(1, MERSENNE_PRIME), generator.randrange(0, MERSENNE_PRIME))
+            for _ in range(permutations)
+        ]
+        self.bands = bands
+        self.rows = permutations // bands
+        self.shingle_size = shingle_size
+
+    def signature(self, text: str) -> Optional[array]:
+        """None for text without a single word: nothing to compare"""
+        hashes = list(shingles(text, self.shingle_size))
+        if not hashes:
+            return None
+        return array(SIGNATURE_TYPECODE, (
+            min((a * value + b) % MERSENNE_PRIME for value in hashes) & MAX_HASH
+            for a, b in self._coefficients
+        ))
+
+    def band_keys(self, signature: array) -> list[int]:
+        """Signed 64-bit key per band; the band number is hashed in so equal rows in different bands differ"""
+        return [
+            _hash(
+                band.to_bytes(2, BYTE_ORDER) + self.pack(signature[band * self.rows:(band + 1) * self.rows]),
+                signed=True,
+            )
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def similarity(first: array, second: array) -> float:
+        return sum(a == b for a, b in zip(first, second)) / len(first)
+
+    @staticmethod
+    def pack(signature: array) -> bytes:
+        """Fixed little-endian layout, so stored signatures and band keys agree across machines"""
+        if sys.byteorder != BYTE_ORDER:
+            signature = array(SIGNATURE_TYPECODE, signature)
+            signature.byteswap()
+        return signature.tobytes()
+
+    @staticmethod
+    def unpack(data) -> array:
+        signature = array(SIGNATURE_TYPECODE)
+        signature.frombytes(bytes(data))
+        if sys.byteorder != BYTE_ORDER:
+            signature.byteswap()
+        return signature
@@ -0,0 +1,170 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import combinations, islice
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+
+from apps.homeworks.models import Homework, HomeworkSubmission, SubmissionBand, SubmissionSignature
+from apps.homeworks.services.protocols import HomeworkOwnershipGuard, SimilarityService
+from apps.homeworks.services.shared.ownership_guard import HomeworkOwnershipGuardImpl
+from apps.homeworks.services.shared.teaching import taught_course_ids
+from apps.homeworks.services.similarity.dtos import SimilarPair, SimilarityReport
+from apps.homeworks.services.similarity.minhash import MinHasher
+from common.compression import decompress_text
+from common.enums import JobQueues, ModelFields, SimilarityScope
+from common.jobs import LocalJobQueue
+
+LOOKUP_SEPARATOR = "__"
+SIMILARITY_DIGITS = 4
+
+SUBMISSION_ID = f"{ModelFields.SUBMISSION.value}_{ModelFields.ID.value}"
+HOMEWORK_ID = f"{ModelFields.HOMEWORK.value}_{ModelFields.ID.value}"
+COMPRESSED_DATA_PATH = LOOKUP_SEPARATOR.join((ModelFields.COMPRESSED_CONTENT.value, ModelFields.DATA.value))
+STUDENT_ID_PATH = LOOKUP_SEPARATOR.join((ModelFields.SUBMISSION.value, f"{ModelFields.STUDENT.value}_{ModelFields.ID.value}"))
+HOMEWORK_ID_PATH = LOOKUP_SEPARATOR.join((ModelFields.SUBMISSION.value, HOMEWORK_ID))
+BAND_COURSE_PATH = LOOKUP_SEPARATOR.join((ModelFields.HOMEWORK.value, ModelFields.LECTURE.value, ModelFields.COURSE.value))
+
+
+def build_job_queue() -> LocalJobQueue:
+    return LocalJobQueue(JobQueues.SUBMISSION_SIMILARITY.value, workers=settings.SUBMISSION_SIMILARITY_WORKERS)
+
+
+@lru_cache
+def _hasher(permutations: int, bands: int, shingle_size: int) -> MinHasher:
+    return MinHasher(permutations=permutations, bands=bands, shingle_size=shingle_size)
+
+
+def build_hasher() -> MinHasher:
+    return _hasher(
+        settings.SUBMISSION_SIMILARITY_PERMUTATIONS,
+        settings.SUBMISSION_SIMILARITY_BANDS,
+        settings.SUBMISSION_SIMILARITY_SHINGLE_SIZE,
+    )
+
+
+@dataclass
+class SubmissionSimilarityService(SimilarityService):
+    """
+    Finds near-duplicate submissions with MinHash and locality-sensitive hashing.
+
+    A submission is shingled and signed once, after the write that changed
+    its content commits; the signature and one key per LSH band are stored.
+    A report never compares submissions pairwise: it groups the homework's
+    band keys (one index range), so only submissions agreeing on a whole
+    band become candidates, and only their signatures are compared.
+    """
+    queue: LocalJobQueue = field(default_factory=build_job_queue)
+    hasher: MinHasher = field(default_factory=build_hasher)
+    ownership_guard: HomeworkOwnershipGuard = field(default_factory=HomeworkOwnershipGuardImpl)
+    batch_size: int = field(default_factory=lambda: settings.SUBMISSION_SIMILARITY_BATCH_SIZE)
+
+    def schedule(self, submission: HomeworkSubmission) -> None:
+        submissions = HomeworkSubmission.objects.filter(**{ModelFields.ID.value: submission.id})
+        transaction.on_commit(partial(self.queue.submit, self.index, submissions))
+
+    def index(self, submissions: QuerySet) -> int:
+        """Replace the signatures of ``submissions`` in keyset batches; returns how many were signed"""
+        rows = submissions.order_by(ModelFields.ID.value).values_list(
+            ModelFields.ID.value,
+            HOMEWORK_ID,
+            ModelFields.INLINE_CONTENT.value,
+            ModelFields.CONTENT_COMPRESSED.value,
+            COMPRESSED_DATA_PATH,
+        )
+        signed, last_id = 0, 0
+        while batch := list(rows.filter(**{f"{ModelFields.ID.value}__gt": last_id})[:self.batch_size]):
+            signed += self._store(batch)
+            last_id = batch[-1][0]
+        return signed
+
+    def report(self, *, homework: Homework, user, scope: str, threshold: float) -> SimilarityReport:
+        self.ownership_guard.ensure_owner(homework, user)
+        course_ids = taught_course_ids(user) if scope == SimilarityScope.COURSES.value else None
+        indexed, pairs = self.find_pairs(homework, threshold=threshold, course_ids=course_ids)
+        return SimilarityReport(homework_id=homework.id, scope=scope, threshold=threshold, indexed=indexed, pairs=pairs)
+
+    def find_pairs(self, homework: Homework, *, threshold: float,
+                   course_ids: Optional[Iterable] = None) -> tuple[int, list[SimilarPair]]:
+        """
+        Pairs within ``homework`` at or above ``threshold``; with ``course_ids``
+        (ids or a subquery) also pairs with other homeworks of those courses.
+        Returns how many of the homework's submissions are indexed, and the pairs.
+        """
+        own = SubmissionBand.objects.filter(**{ModelFields.HOMEWORK.value: homework})
+        buckets: dict[int, list[int]] = defaultdict(list)
+        indexed: set[int] = set()
+        for band_key, submission_id in own.values_list(ModelFields.BAND_KEY.value, SUBMISSION_ID):
+            buckets[band_key].append(submission_id)
+            indexed.add(submission_id)
+
+        candidates: set[tuple[int, int]] = set()
+        for members in buckets.values():
+            candidates.update(combinations(sorted(members), 2))
+        if course_ids is not None:
+            others = (
+                SubmissionBand.objects
+                .filter(**{
+                    f"{ModelFields.BAND_KEY.value}__in": own.values(ModelFields.BAND_KEY.value),
+                    f"{BAND_COURSE_PATH}__in": course_ids,
+                })
+                .exclude(**{ModelFields.HOMEWORK.value: homework})
+                .values_list(ModelFields.BAND_KEY.value, SUBMISSION_ID)
+            )
+            for band_key, other_id in others:
+                candidates.update((submission_id, other_id) for submission_id in buckets[band_key])
+
+        signatures = self._signatures({submission_id for pair in candidates for submission_id in pair})
+        pairs = []
+        for first, second in candidates:
+            if first not in signatures or second not in signatures:
+                continue  # re-indexed since the bands were read
+            student_id, _, signature = signatures[first]
+            other_student_id, other_homework_id, other_signature = signatures[second]
+            similarity = self.hasher.similarity(signature, other_signature)
+            if similarity >= threshold:
+                pairs.append(SimilarPair(
+                    submission_id=first,
+                    student_id=student_id,
+                    other_submission_id=second,
+                    other_student_id=other_student_id,
+                    other_homework_id=other_homework_id,
+                    similarity=round(similarity, SIMILARITY_DIGITS),
+                ))
+        pairs.sort(key=lambda pair: (-pair.similarity, pair.submission_id, pair.other_submission_id))
+        return len(indexed), pairs
+
+    def _signatures(self, submission_ids: set[int]) -> dict[int, tuple]:
+        """``submission id -> (student id, homework id, signature)``, fetched in chunks of ``batch_size``"""
+        signatures = {}
+        pending = iter(sorted(submission_ids))
+        while chunk := list(islice(pending, self.batch_size)):
+            rows = SubmissionSignature.objects.filter(**{f"{SUBMISSION_ID}__in": chunk}).values_list(
+                SUBMISSION_ID, STUDENT_ID_PATH, HOMEWORK_ID_PATH, ModelFields.SIGNATURE.value,
+            )
+            for submission_id, student_id, homework_id, data in rows:
+                signatures[submission_id] = (student_id, homework_id, self.hasher.unpack(data))
+        return signatures
+
+    def _store(self, batch: list[tuple]) -> int:
+        signatures, bands = [], []
+        for submission_id, homework_id, inline, compressed, data in batch:
+            signature = self.hasher.signature(decompress_text(data) if compressed else inline)
+            if signature is None:
+                continue
+            signatures.append(SubmissionSignature(submission_id=submission_id, signature=self.hasher.pack(signature)))
+            bands.extend(
+                SubmissionBand(submission_id=submission_id, homework_id=homework_id, band_key=band_key)
+                for band_key in self.hasher.band_keys(signature)
+            )
+
+        submission_ids = {f"{SUBMISSION_ID}__in": [row[0] for row in batch]}
+        with transaction.atomic():
+            SubmissionBand.objects.filter(**submission_ids).delete()
+            SubmissionSignature.objects.filter(**submission_ids).delete()
+            SubmissionSignature.objects.bulk_create(signatures)
+            SubmissionBand.objects.bulk_create(bands, batch_size=self.batch_size)
+        return len(signatures)
@@ -0,0 +1,11 @@
+# Grade statistics services
+from .cache import GradeStatisticsCache
+from .dtos import GradeStatistics, HistogramBin
+from .services import GradeStatisticsManagementService
+
+__all__ = [
+    'GradeStatisticsCache',
+    'GradeStatistics',
+    'HistogramBin',
+    'GradeStatisticsManagementService',
+]
@@ -0,0 +1,88 @@
+import logging
+from dataclasses import dataclass
+from typing import Optional
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "grade-statistics"
+CACHE_ALIAS = "grade_statistics"
+
+
+@dataclass
+class GradeStatisticsCache:
+    """
+    Caches computed statistics under a per-course grade-change version.
+
+    Every write to a grade replaces its course's version once the transaction
+    commits, which orphans all cached results for the course at once; stale
+    entries simply expire. Replacing after commit keeps a concurrent reader
+    from caching pre-commit grades under the new version. Each version is a
+    fresh random token rather than an increment, so two bumps racing on a
+    backend without atomic increments (the database cache) still end on a
+    version no reader has cached under, and an evicted version never revives
+    old entries.
+
+    The cache only saves work: when it is unreachable, reads miss, writes are
+    dropped and statistics are computed from the grades.
+    """
+    alias: str = CACHE_ALIAS
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    @staticmethod
+    def _version_key(course_id: int) -> str:
+        return f"{KEY_PREFIX}:version:{course_id}"
+
+    def version(self, course_id: int) -> Optional[str]:
+        key = self._version_key(course_id)
+        try:
+            version = self.backend.get(key)
+            if version is None:
+                self.backend.add(key, uuid4().hex, timeout=None)
+                version = self.backend.get(key)
+            return version
+        except Exception:
+            logger.warning("Grade statistics cache unavailable; reading course %s without it", course_id, exc_info=True)
+            return None
+
+    def key(self, course_id: int, scope: str, object_id: int) -> Optional[str]:
+        """None when the course's version cannot be read; such results are neither looked up nor stored"""
+        version = self.version(course_id)
+        if version is None:
+            return None
+        return f"{KEY_PREFIX}:{course_id}:v{version}:{scope}:{object_id}"
+
+    def get(self, key: Optional[str]):
+        if key is None:
+            return None
+        try:
+            return self.backend.get(key)
+        except Exception:
+            logger.warning("Grade statistics cache read failed for %s", key, exc_info=True)
+            return None
+
+    def set(self, key: Optional[str], value) -> None:
+        if key is None:
+            return
+        try:
+            self.backend.set(key, value, timeout=settings.GRADE_STATISTICS_CACHE_TIMEOUT)
+        except Exception:
+            logger.warning("Grade statistics cache write failed for %s", key, exc_info=True)
+
+    def invalidate_course(self, course_id: int) -> None:
+        # robust: a failing bump must not stop the other on-commit callbacks of the transaction
+        transaction.on_commit(lambda: self._bump(course_id), robust=True)
+
+    def _bump(self, course_id: int) -> None:
+        try:
+            self.backend.set(self._version_key(course_id), uuid4().hex, timeout=None)
+        except Exception:
+            # The grade write has committed; cached results expire after GRADE_STATISTICS_CACHE_TIMEOUT
+            logger.error("Could not invalidate grade statistics of course %s", course_id, exc_info=True)
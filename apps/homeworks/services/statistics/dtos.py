@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class HistogramBin:
+    """DTO for one grade bucket; ``upper`` is exclusive except for the last bin"""
+    lower: float
+    upper: float
+    count: int
+
+
+@dataclass(frozen=True)
+class GradeStatistics:
+    """DTO for the grade distribution of a homework, lecture or course"""
+    scope: str
+    id: int
+    count: int
+    mean: Optional[float] = None
+    median: Optional[float] = None
+    stddev: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    percentiles: dict = field(default_factory=dict)
+    histogram: list[HistogramBin] = field(default_factory=list)
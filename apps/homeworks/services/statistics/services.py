@@ -0,0 +1,122 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+
+from django.db.models import FloatField
+from django.db.models.functions import Cast
+
+from apps.homeworks.models import HomeworkGrade
+from apps.homeworks.services.protocols import CourseTeacherGuard, GradeStatisticsService
+from apps.homeworks.services.shared.dtos import ResourceHierarchy
+from apps.homeworks.services.shared.ownership_guard import CourseTeacherGuardImpl
+from apps.homeworks.services.statistics.cache import GradeStatisticsCache
+from apps.homeworks.services.statistics.dtos import GradeStatistics, HistogramBin
+from common.enums import ModelFields, StatisticsScope
+
+LOOKUP_SEPARATOR = "__"
+GRADE_TYPECODE = "d"
+VALUE_ALIAS = "value"
+PERCENTILES = (10, 25, 50, 75, 90)
+PERCENTILE_KEY = "p{rank}"
+GRADE_MIN = 0.0
+GRADE_MAX = 100.0
+HISTOGRAM_BINS = 10
+
+SCOPE_LOOKUPS = {
+    StatisticsScope.HOMEWORK: LOOKUP_SEPARATOR.join((ModelFields.SUBMISSION.value, ModelFields.HOMEWORK.value, ModelFields.ID.value)),
+    StatisticsScope.LECTURE: LOOKUP_SEPARATOR.join((
+        ModelFields.SUBMISSION.value, ModelFields.HOMEWORK.value, ModelFields.LECTURE.value, ModelFields.ID.value,
+    )),
+    StatisticsScope.COURSE: LOOKUP_SEPARATOR.join((
+        ModelFields.SUBMISSION.value, ModelFields.HOMEWORK.value, ModelFields.LECTURE.value, ModelFields.COURSE.value,
+        ModelFields.ID.value,
+    )),
+}
+
+
+def percentile(values: array, rank: float) -> float:
+    """Linear interpolation between closest ranks of already sorted values"""
+    position = (len(values) - 1) * rank / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def histogram(values: array, bins: int = HISTOGRAM_BINS, low: float = GRADE_MIN, high: float = GRADE_MAX) -> list[HistogramBin]:
+    """Equal-width buckets counted by bisecting the sorted values at each edge"""
+    width = (high - low) / bins
+    edges = [low + width * index for index in range(bins)] + [high]
+    result = []
+    for index in range(bins):
+        lower, upper = edges[index], edges[index + 1]
+        last = index == bins - 1
+        end = bisect_right(values, upper) if last else bisect_left(values, upper)
+        result.append(HistogramBin(lower=lower, upper=upper, count=end - bisect_left(values, lower)))
+    return result
+
+
+def describe(scope: StatisticsScope, object_id: int, values: array) -> GradeStatistics:
+    """Summarise sorted grades; every figure is a pass over (or a lookup into) one flat array"""
+    count = len(values)
+    if not count:
+        return GradeStatistics(scope=scope.value, id=object_id, count=0, histogram=histogram(values))
+
+    mean = math.fsum(values) / count
+    variance = math.fsum((value - mean) ** 2 for value in values) / count
+    return GradeStatistics(
+        scope=scope.value,
+        id=object_id,
+        count=count,
+        mean=mean,
+        median=percentile(values, 50),
+        stddev=math.sqrt(variance),
+        min=values[0],
+        max=values[-1],
+        percentiles={PERCENTILE_KEY.format(rank=rank): percentile(values, rank) for rank in PERCENTILES},
+        histogram=histogram(values),
+    )
+
+
+@dataclass
+class GradeStatisticsManagementService(GradeStatisticsService):
+    """
+    Grade distributions per homework, lecture or course, for the course's teachers.
+
+    Grades are pulled as one sorted column of floats and summarised without
+    building model instances. Results are cached until the next grade write
+    in the course bumps its version.
+    """
+    teacher_guard: CourseTeacherGuard = field(default_factory=CourseTeacherGuardImpl)
+    cache: GradeStatisticsCache = field(default_factory=GradeStatisticsCache)
+
+    def statistics(self, *, hierarchy: ResourceHierarchy, user) -> GradeStatistics:
+        course = hierarchy.course
+        self.teacher_guard.ensure_teacher(course, user)
+
+        scope, target = self._scope(hierarchy)
+        key = self.cache.key(course.id, scope.value, target.id)
+        result = self.cache.get(key)
+        if result is None:
+            result = describe(scope, target.id, self.grades(scope, target.id))
+            self.cache.set(key, result)
+        return result
+
+    @staticmethod
+    def grades(scope: StatisticsScope, object_id: int) -> array:
+        values = (
+            HomeworkGrade.objects
+            .filter(**{SCOPE_LOOKUPS[scope]: object_id, f"{ModelFields.GRADE.value}__isnull": False})
+            .annotate(**{VALUE_ALIAS: Cast(ModelFields.GRADE.value, FloatField())})
+            .order_by(VALUE_ALIAS)
+            .values_list(VALUE_ALIAS, flat=True)
+        )
+        return array(GRADE_TYPECODE, values)
+
+    @staticmethod
+    def _scope(hierarchy: ResourceHierarchy):
+        if hierarchy.homework is not None:
+            return StatisticsScope.HOMEWORK, hierarchy.homework
+        if hierarchy.lecture is not None:
+            return StatisticsScope.LECTURE, hierarchy.lecture
+        return StatisticsScope.COURSE, hierarchy.course
@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import Optional, List
+from datetime import datetime
+from typing import Iterable, Optional, List
 from common.enums import ErrorMessages
 
 
@@ -44,3 +45,20 @@ class SubmissionUpdateRequest(BaseUpdateRequest):
 @dataclass(frozen=True)
 class SubmissionValidationResult(BaseValidationResult):
     pass
+
+
+@dataclass(frozen=True)
+class ExportStream:
+    """DTO for a streamed download: lazily produced chunks plus how to label them"""
+    chunks: Iterable
+    content_type: str
+    filename: str
+
+
+@dataclass(frozen=True)
+class SubmissionVersion:
+    """DTO for a submission's content as of one revision"""
+    number: int
+    created_at: datetime
+    content_length: int
+    content: str
@@ -0,0 +1,106 @@
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from django.utils.text import slugify
+from rest_framework.exceptions import ValidationError
+
+from apps.homeworks.models import Homework, HomeworkSubmission
+from apps.homeworks.services.protocols import HomeworkOwnershipGuard, SubmissionExporter
+from apps.homeworks.services.shared.ownership_guard import HomeworkOwnershipGuardImpl
+from apps.homeworks.services.submission.dtos import ExportStream
+from common.enums import ContentTypes, ErrorMessages, ExportFormats, ModelFields, SerializerFields, URLPatterns, \
+    UserFields
+from common.compression import decompress_text
+from common.streaming import iter_csv, iter_jsonl, iter_zip
+
+LOOKUP_SEPARATOR = "__"
+EXPORT_CHUNK_SIZE = 1000
+ZIP_MEMBER_NAME = "{id}-{email}.txt"
+ZIP_MANIFEST_NAME = "submissions.csv"
+
+# Output column -> ORM lookup; rows are flat tuples, never model instances
+EXPORT_COLUMNS = {
+    ModelFields.ID.value: ModelFields.ID.value,
+    SerializerFields.STUDENT_ID.value: f"{ModelFields.STUDENT.value}{LOOKUP_SEPARATOR}{ModelFields.ID.value}",
+    SerializerFields.STUDENT_EMAIL.value: f"{ModelFields.STUDENT.value}{LOOKUP_SEPARATOR}{UserFields.EMAIL.value}",
+    ModelFields.IS_SUBMITTED.value: ModelFields.IS_SUBMITTED.value,
+    ModelFields.SUBMITTED_AT.value: ModelFields.SUBMITTED_AT.value,
+    ModelFields.UPDATED_AT.value: ModelFields.UPDATED_AT.value,
+    ModelFields.GRADE.value: f"{ModelFields.GRADE.value}{LOOKUP_SEPARATOR}{ModelFields.GRADE.value}",
+    SerializerFields.GRADE_COMMENTS.value: f"{ModelFields.GRADE.value}{LOOKUP_SEPARATOR}{ModelFields.COMMENTS.value}",
+    ModelFields.GRADED_AT.value: f"{ModelFields.GRADE.value}{LOOKUP_SEPARATOR}{ModelFields.GRADED_AT.value}",
+}
+CONTENT_COLUMN = ModelFields.CONTENT.value
+# Inline body, whether it was compressed, and the compressed copy (NULL for short bodies)
+CONTENT_LOOKUPS = (
+    ModelFields.INLINE_CONTENT.value,
+    ModelFields.CONTENT_COMPRESSED.value,
+    f"{ModelFields.COMPRESSED_CONTENT.value}{LOOKUP_SEPARATOR}{ModelFields.DATA.value}",
+)
+
+
+@dataclass
+class SubmissionExportService(SubmissionExporter):
+    """
+    Streams every submission of a homework as JSON Lines, CSV or a ZIP archive.
+
+    Rows are read with ``values_list`` projections through ``.iterator()``,
+    so memory stays flat however many submissions the homework has. The
+    ZIP holds one text file per submission plus a CSV manifest written from
+    a second pass over the metadata.
+    """
+    ownership_guard: HomeworkOwnershipGuard = field(default_factory=HomeworkOwnershipGuardImpl)
+    chunk_size: int = EXPORT_CHUNK_SIZE
+
+    def export(self, *, homework: Homework, user, export_format: str) -> ExportStream:
+        self.ownership_guard.ensure_owner(homework, user)
+        writers = {
+            ExportFormats.JSONL.value: (self._jsonl, ContentTypes.JSONL),
+            ExportFormats.CSV.value: (self._csv, ContentTypes.CSV),
+            ExportFormats.ZIP.value: (self._zip, ContentTypes.ZIP),
+        }
+        if export_format not in writers:
+            raise ValidationError(ErrorMessages.UNSUPPORTED_EXPORT_FORMAT.value.format(format=export_format))
+
+        writer, content_type = writers[export_format]
+        filename = f"{slugify(homework.title) or homework.id}-{URLPatterns.SUBMISSIONS.value}.{export_format}"
+        return ExportStream(chunks=writer(homework), content_type=content_type.value, filename=filename)
+
+    def records(self, homework: Homework, with_content: bool = True) -> Iterator[dict]:
+        columns = list(EXPORT_COLUMNS)
+        lookups = [*EXPORT_COLUMNS.values(), *(CONTENT_LOOKUPS if with_content else ())]
+        rows = (
+            HomeworkSubmission.objects
+            .filter(**{ModelFields.HOMEWORK.value: homework})
+            .order_by(ModelFields.ID.value)
+            .values_list(*lookups)
+            .iterator(chunk_size=self.chunk_size)
+        )
+        for row in rows:
+            record = dict(zip(columns, row))
+            if with_content:
+                inline, compressed, data = row[len(columns):]
+                record[CONTENT_COLUMN] = decompress_text(data) if compressed else inline
+            yield record
+
+    def _jsonl(self, homework: Homework) -> Iterator[str]:
+        return iter_jsonl(self.records(homework))
+
+    def _csv(self, homework: Homework) -> Iterator[str]:
+        return iter_csv(self._table(self.records(homework), [*EXPORT_COLUMNS, CONTENT_COLUMN]))
+
+    def _zip(self, homework: Homework) -> Iterator[bytes]:
+        def entries():
+            for record in self.records(homework):
+                name = ZIP_MEMBER_NAME.format(id=record[ModelFields.ID.value], email=record[SerializerFields.STUDENT_EMAIL.value])
+                yield name, (record[CONTENT_COLUMN],)
+            manifest = self._table(self.records(homework, with_content=False), list(EXPORT_COLUMNS))
+            yield ZIP_MANIFEST_NAME, iter_csv(manifest)
+
+        return iter_zip(entries())
+
+    @staticmethod
+    def _table(records, columns: list[str]) -> Iterator[list]:
+        yield columns
+        for record in records:
+            yield [record[column] for column in columns]
@@ -0,0 +1,139 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Max, QuerySet, Subquery
+from rest_framework.exceptions import NotFound
+
+from apps.homeworks.models import HomeworkSubmission, SubmissionRevision
+from apps.homeworks.services.protocols import SubmissionOwnershipGuard, SubmissionRevisionService
+from apps.homeworks.services.shared.ownership_guard import SubmissionOwnershipGuardImpl
+from apps.homeworks.services.submission.dtos import SubmissionVersion
+from common import delta
+from common.compression import compress_text, decompress_text
+from common.enums import ErrorMessages, ModelFields
+
+NUMBER_DESC = f"-{ModelFields.NUMBER.value}"
+LATEST = "latest"
+
+
+@dataclass
+class SubmissionRevisionManagementService(SubmissionRevisionService):
+    """
+    Keeps the content history of submissions.
+
+    Each write stores a compressed delta against the previous revision;
+    every ``snapshot_interval`` revisions, or whenever the delta would not
+    be smaller, the full text is stored instead. Rebuilding any version
+    reads one snapshot and at most ``snapshot_interval - 1`` deltas in one
+    query. Once a submission has more than ``limit`` revisions, each write
+    also drops the snapshot groups that lie wholly before the last
+    ``limit``. The oldest kept revision is therefore always a snapshot,
+    nothing has to be rebased, and at most ``limit + snapshot_interval - 1``
+    revisions are kept.
+    """
+    ownership_guard: SubmissionOwnershipGuard = field(default_factory=SubmissionOwnershipGuardImpl)
+    snapshot_interval: int = field(default_factory=lambda: settings.SUBMISSION_REVISION_SNAPSHOT_INTERVAL)
+    limit: int = field(default_factory=lambda: settings.SUBMISSION_REVISION_LIMIT)
+
+    def record(self, submission: HomeworkSubmission, content: str,
+               previous: Optional[str] = None) -> Optional[SubmissionRevision]:
+        """
+        Save ``content`` as the newest revision; call it in the transaction that writes it,
+        holding the submission's row lock so revision numbers and delta bases
+        cannot interleave. ``previous`` is the stored content it replaces,
+        which starts the history of submissions written before revisions were kept.
+        """
+        latest = self._history(submission).order_by(NUMBER_DESC).values_list(
+            ModelFields.NUMBER.value, ModelFields.DEPTH.value,
+        ).first()
+        if latest is None and previous is not None:
+            latest = (self._snapshot(submission, 1, previous).number, 0)
+        if latest is None:
+            return self._snapshot(submission, 1, content)
+        if previous == content:
+            return None
+
+        number, depth = latest[0] + 1, latest[1] + 1
+        snapshot = compress_text(content)
+        changes = delta.encode(delta.diff(previous, content))
+        if depth >= self.snapshot_interval or len(changes) >= len(snapshot):
+            revision = self._create(submission, number, 0, snapshot, content)
+        else:
+            revision = self._create(submission, number, depth, changes, content)
+        if number > self.limit:
+            self._compact(submission.id, number)
+        return revision
+
+    def revisions(self, *, submission, user) -> QuerySet:
+        """Every kept revision, newest first, without the stored data"""
+        self.ownership_guard.ensure_owner(submission, user)
+        return self._history(submission).defer(ModelFields.DATA.value).order_by(NUMBER_DESC)
+
+    def version(self, *, submission, user, number: int) -> SubmissionVersion:
+        self.ownership_guard.ensure_owner(submission, user)
+        base = (
+            self._history(submission)
+            .filter(**{ModelFields.IS_SNAPSHOT.value: True, f"{ModelFields.NUMBER.value}__lte": number})
+            .order_by(NUMBER_DESC)
+            .values(ModelFields.NUMBER.value)[:1]
+        )
+        chain = list(
+            self._history(submission)
+            .filter(**{
+                f"{ModelFields.NUMBER.value}__gte": Subquery(base),
+                f"{ModelFields.NUMBER.value}__lte": number,
+            })
+            .order_by(ModelFields.NUMBER.value)
+        )
+        if not chain or chain[-1].number != number:
+            raise NotFound(ErrorMessages.REVISION_DOESNT_EXIST.value)
+
+        content = decompress_text(chain[0].data)
+        for revision in chain[1:]:
+            content = delta.apply(content, delta.decode(revision.data))
+        last = chain[-1]
+        return SubmissionVersion(
+            number=last.number, created_at=last.created_at, content_length=last.content_length, content=content,
+        )
+
+    def compact_all(self) -> int:
+        """Apply the current ``limit`` to every submission (after lowering it); returns revisions deleted"""
+        histories = (
+            SubmissionRevision.objects
+            .values(ModelFields.SUBMISSION.value)
+            .annotate(**{LATEST: Max(ModelFields.NUMBER.value)})
+            .filter(**{f"{LATEST}__gt": self.limit})
+            .values_list(ModelFields.SUBMISSION.value, LATEST)
+        )
+        return sum(self._compact(submission_id, latest) for submission_id, latest in histories)
+
+    def _compact(self, submission_id: int, latest: int) -> int:
+        """One DELETE: everything before the newest snapshot that still leaves ``limit`` revisions"""
+        history = SubmissionRevision.objects.filter(**{ModelFields.SUBMISSION.value: submission_id})
+        oldest_kept = (
+            history
+            .filter(**{ModelFields.IS_SNAPSHOT.value: True, f"{ModelFields.NUMBER.value}__lte": latest - self.limit + 1})
+            .order_by(NUMBER_DESC)
+            .values(ModelFields.NUMBER.value)[:1]
+        )
+        deleted, _ = history.filter(**{f"{ModelFields.NUMBER.value}__lt": Subquery(oldest_kept)}).delete()
+        return deleted
+
+    def _snapshot(self, submission: HomeworkSubmission, number: int, content: str) -> SubmissionRevision:
+        return self._create(submission, number, 0, compress_text(content), content)
+
+    @staticmethod
+    def _create(submission, number: int, depth: int, data: bytes, content: str) -> SubmissionRevision:
+        return SubmissionRevision.objects.create(
+            submission=submission,
+            number=number,
+            is_snapshot=depth == 0,
+            depth=depth,
+            data=data,
+            content_length=len(content),
+        )
+
+    @staticmethod
+    def _history(submission) -> QuerySet:
+        return SubmissionRevision.objects.filter(**{ModelFields.SUBMISSION.value: submission})
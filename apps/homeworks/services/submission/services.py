@@ -7,15 +7,24 @@ from apps.homeworks.services.submission.dtos import SubmissionCreationRequest, S
 from apps.homeworks.services.submission.validation import SubmissionCreationValidator, SubmissionUpdateValidator
 from apps.homeworks.services.validation.interfaces import SubmissionCreationValidatorInterface, SubmissionUpdateValidatorInterface
 from apps.homeworks.services.shared.ownership_guard import SubmissionOwnershipGuardImpl
-from apps.homeworks.services.protocols import SubmissionOwnershipGuard, SubmissionService
+from apps.homeworks.services.protocols import (
+    SimilarityService, SubmissionOwnershipGuard, SubmissionRevisionService, SubmissionService,
+)
+from apps.homeworks.services.similarity import SubmissionSimilarityService
+from apps.homeworks.services.submission.revisions import SubmissionRevisionManagementService
 from common.enums import ModelFields, UserRole, ErrorMessages
 
+# Lock only the submission row, not the nullable side of the compressed-body join
+LOCK_SUBMISSION_ROW = ("self",)
+
 
 @dataclass
 class SubmissionCreationService:
     """Handles submission creation with validation and business logic"""
     validation_service: SubmissionCreationValidatorInterface = field(default_factory=SubmissionCreationValidator)
     ownership_guard: SubmissionOwnershipGuard = field(default_factory=SubmissionOwnershipGuardImpl)
+    similarity_service: SimilarityService = field(default_factory=SubmissionSimilarityService)
+    revision_service: SubmissionRevisionService = field(default_factory=SubmissionRevisionManagementService)
 
     def create_submission(self, request: SubmissionCreationRequest, homework: Homework, user) -> HomeworkSubmission:
         """Create a new submission with full validation"""
@@ -38,12 +47,15 @@ class SubmissionCreationService:
 
     @transaction.atomic
     def _create_submission_with_validation(self, request: SubmissionCreationRequest, homework: Homework, user) -> HomeworkSubmission:
-        """Create submission in a transaction"""
-        return HomeworkSubmission.objects.create(
+        """Create submission and its first revision in a transaction; the similarity signature is built after commit"""
+        submission = HomeworkSubmission.objects.create(
             homework=homework,
             student=user,
             content=request.content
         )
+        self.revision_service.record(submission, request.content)
+        self.similarity_service.schedule(submission)
+        return submission
 
 
 @dataclass
@@ -51,6 +63,8 @@ class SubmissionUpdateService:
     """Handles submission updates with validation and business logic"""
     validation_service: SubmissionUpdateValidatorInterface = field(default_factory=SubmissionUpdateValidator)
     ownership_guard: SubmissionOwnershipGuard = field(default_factory=SubmissionOwnershipGuardImpl)
+    similarity_service: SimilarityService = field(default_factory=SubmissionSimilarityService)
+    revision_service: SubmissionRevisionService = field(default_factory=SubmissionRevisionManagementService)
 
     def update_submission(self, instance: HomeworkSubmission, request: SubmissionUpdateRequest, user) -> HomeworkSubmission:
         """Update an existing submission with full validation"""
@@ -67,14 +81,32 @@ class SubmissionUpdateService:
 
     @transaction.atomic
     def _update_submission_with_validation(self, instance: HomeworkSubmission, request: SubmissionUpdateRequest) -> HomeworkSubmission:
-        """Update submission in a transaction"""
+        """
+        Update submission in a transaction, keeping the replaced content as a revision.
+
+        The row is read again under a lock, so concurrent updates of one
+        submission queue up and the revision delta is built against the
+        stored content rather than the copy the caller loaded. Returns that
+        fresh row.
+        """
+        submission = (
+            HomeworkSubmission.objects
+            .with_content()
+            .select_for_update(of=LOCK_SUBMISSION_ROW)
+            .get(pk=instance.pk)
+        )
+        previous = None
         if request.content is not None:
-            instance.content = request.content
+            previous = submission.content
+            submission.content = request.content
+            self.similarity_service.schedule(submission)
         if request.is_submitted is not None:
-            instance.is_submitted = request.is_submitted
+            submission.is_submitted = request.is_submitted
 
-        instance.save()
-        return instance
+        submission.save()
+        if previous is not None:
+            self.revision_service.record(submission, request.content, previous=previous)
+        return submission
 
 
 @dataclass
@@ -118,6 +150,7 @@ class SubmissionManagementService(SubmissionService):
                 f"{ModelFields.HOMEWORK.value}__{ModelFields.LECTURE.value}",
                 f"{ModelFields.HOMEWORK.value}__{ModelFields.LECTURE.value}__{ModelFields.COURSE.value}",
                 f"{ModelFields.HOMEWORK.value}__{ModelFields.LECTURE.value}__{ModelFields.COURSE.value}__{ModelFields.PRIMARY_OWNER.value}",
+                f"{ModelFields.HOMEWORK.value}__{ModelFields.CREATED_BY.value}",
                 ModelFields.STUDENT.value,
             )
             .filter(homework_id=homework_id)
@@ -0,0 +1,65 @@
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, pre_delete
+from django.dispatch import receiver
+
+from apps.courses.models import Lecture
+from apps.homeworks.models import Homework, HomeworkGrade, HomeworkSubmission
+from apps.homeworks.services.statistics.cache import GradeStatisticsCache
+from common.enums import ModelFields
+
+User = get_user_model()
+statistics_cache = GradeStatisticsCache()
+
+LOOKUP_SEPARATOR = "__"
+SUBMISSION_COURSE = LOOKUP_SEPARATOR.join(
+    (ModelFields.HOMEWORK.value, ModelFields.LECTURE.value, f"{ModelFields.COURSE.value}_id")
+)
+GRADE_COURSE = f"{ModelFields.SUBMISSION.value}{LOOKUP_SEPARATOR}{SUBMISSION_COURSE}"
+
+
+def _started_at(model, origin) -> bool:
+    """
+    Whether the delete was called on ``model`` itself rather than reached through a cascade.
+
+    Grades also disappear when their homework, lecture or account goes, so
+    each level bumps its course once from the object the delete started at
+    instead of once per cascaded row.
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(origin_model, model)
+
+
+@receiver(post_delete, sender=Lecture)
+def invalidate_lecture_statistics(sender, instance: Lecture, origin=None, **kwargs):
+    if _started_at(Lecture, origin):
+        statistics_cache.invalidate_course(instance.course_id)
+
+
+@receiver(post_delete, sender=Homework)
+def invalidate_homework_statistics(sender, instance: Homework, origin=None, **kwargs):
+    if _started_at(Homework, origin):
+        statistics_cache.invalidate_course(instance.lecture.course_id)
+
+
+@receiver(post_delete, sender=HomeworkSubmission)
+def invalidate_submission_statistics(sender, instance: HomeworkSubmission, origin=None, **kwargs):
+    if _started_at(HomeworkSubmission, origin):
+        statistics_cache.invalidate_course(instance.homework.lecture.course_id)
+
+
+@receiver(post_delete, sender=HomeworkGrade)
+def invalidate_grade_statistics(sender, instance: HomeworkGrade, origin=None, **kwargs):
+    if _started_at(HomeworkGrade, origin):
+        statistics_cache.invalidate_course(instance.submission.homework.lecture.course_id)
+
+
+@receiver(pre_delete, sender=User)
+def invalidate_account_statistics(sender, instance, origin=None, **kwargs):
+    """Before the cascade, while the account's submissions and given grades can still name their courses"""
+    if not _started_at(User, origin):
+        return
+    submitted = HomeworkSubmission.objects.filter(**{ModelFields.STUDENT.value: instance}).values_list(SUBMISSION_COURSE)
+    graded = HomeworkGrade.objects.filter(**{ModelFields.GRADED_BY.value: instance}).values_list(GRADE_COURSE)
+    for course_id in {course_id for (course_id,) in submitted.union(graded)}:
+        statistics_cache.invalidate_course(course_id)
@@ -1,12 +1,29 @@
+import io
+import json
+import threading
+import zipfile
+
 import pytest
 pytestmark = pytest.mark.django_db
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from rest_framework.test import APIClient
 from rest_framework import status
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from apps.courses.models import Course, Lecture
-from apps.homeworks.models import Homework, HomeworkSubmission, HomeworkGrade
-from common.enums import UserRole, ErrorMessages
+from apps.homeworks.models import Homework, HomeworkSubmission, HomeworkGrade, SubmissionContent, GradeComment, \
+    SubmissionRevision, SubmissionSignature
+from apps.homeworks.checks import statistics_cache_table_exists
+from apps.homeworks.services.grade.comment_services import GradeCommentManagementService, comments_topic
+from apps.homeworks.services.similarity import MinHasher, SubmissionSimilarityService
+from apps.homeworks.services.similarity.minhash import shingles
+from apps.homeworks.services.statistics import GradeStatisticsCache
+from apps.notifications.models import OutboxEvent
+from common.broker import broker
+from common.enums import UserRole, ErrorMessages, NotificationEvents
+from common.identity_map import fetch, identity_scope
 
 
 User = get_user_model()
@@ -207,4 +224,667 @@ def test_empty_content_validation_on_submission_patch(api_client, student, submi
     resp = auth(api_client, student).patch(url, {"content": "   "}, format="json")
     assert resp.status_code == status.HTTP_400_BAD_REQUEST
 
+
+# Sparse fieldsets / expansion
+def test_grade_list_sparse_fields_and_expansion(api_client, teacher, submission):
+    HomeworkGrade.objects.create(submission=submission, grade=91, comments="Great", graded_by=teacher)
+    url = grades_list_url(
+        submission.homework.lecture.course_id,
+        submission.homework.lecture_id,
+        submission.homework_id,
+        submission.id,
+    )
+    client = auth(api_client, teacher)
+
+    sparse = client.get(url, {"fields": "id,grade,submission.id,submission.student.email"})
+    assert sparse.status_code == status.HTTP_200_OK
+    row = sparse.data["results"][0]
+    assert set(row) == {"id", "grade", "submission"}
+    assert row["submission"] == {"id": submission.id, "student": {"email": "student@example.com"}}
+
+    with CaptureQueriesContext(connection) as queries:
+        collapsed = client.get(url, {"expand": "graded_by"})
+    row = collapsed.data["results"][0]
+    assert row["submission"] == submission.id
+    assert row["graded_by"]["email"] == "teacher@example.com"
+    grade_select = next(q["sql"] for q in queries if 'FROM "homeworks_homeworkgrade"' in q["sql"] and "LIMIT" in q["sql"])
+    assert '"homeworks_homework"' not in grade_select
+
+    full = client.get(url)
+    assert full.data["results"][0]["submission"]["homework"]["lecture"]["topic"] == "L1"
+
+
+# Nested URL hierarchy
+def test_mismatched_url_parents_return_404(api_client, teacher, submission, other_teacher):
+    homework = submission.homework
+    other_course = Course.objects.create(name="C2", description="D", primary_owner=teacher)
+    other_lecture = Lecture.objects.create(course=other_course, topic="L2", presentation="q.pdf")
+
+    wrong_lecture = grades_list_url(homework.lecture.course_id, other_lecture.id, homework.id, submission.id)
+    resp = auth(api_client, teacher).get(wrong_lecture)
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert resp.data["detail"] == ErrorMessages.SUBMISSION_DOESNT_EXIST.value
+
+    wrong_course = f"/api/courses/{other_course.id}/lectures/{homework.lecture_id}/homeworks/"
+    assert auth(api_client, teacher).get(wrong_course).status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_grade_comments_resolve_chain_in_one_query(api_client, teacher, submission, django_assert_num_queries):
+    grade = HomeworkGrade.objects.create(submission=submission, grade=75, comments="", graded_by=teacher)
+    homework = submission.homework
+    url = grade_comments_url(homework.lecture.course_id, homework.lecture_id, homework.id, submission.id, grade.id)
+    client = auth(api_client, teacher)
+
+    # joined hierarchy, comment count, comment page
+    with django_assert_num_queries(3):
+        resp = client.get(url)
+    assert resp.status_code == status.HTTP_200_OK
+
+    other = HomeworkSubmission.objects.create(
+        homework=homework,
+        student=User.objects.create_user(email="s3@example.com", password="x", role=UserRole.STUDENT.value),
+        content="Other",
+    )
+    foreign = grade_comments_url(homework.lecture.course_id, homework.lecture_id, homework.id, other.id, grade.id)
+    assert client.get(foreign).status_code == status.HTTP_404_NOT_FOUND
+
+
+# Bulk grading
+def bulk_grades_url(homework):
+    return f"/api/courses/{homework.lecture.course_id}/lectures/{homework.lecture_id}/homeworks/{homework.id}/grades/bulk/"
+
+
+def test_bulk_grading_json_reports_per_row(api_client, teacher, submission, course, django_assert_max_num_queries):
+    homework = submission.homework
+    second_student = User.objects.create_user(email="s4@example.com", password="x", role=UserRole.STUDENT.value)
+    course.students.add(second_student)
+    second = HomeworkSubmission.objects.create(homework=homework, student=second_student, content="B")
+    HomeworkGrade.objects.create(submission=second, grade=10, comments="old", graded_by=teacher)
+
+    rows = [
+        {"submission_id": submission.id, "grade": "95.5", "comments": "Great"},
+        {"student_email": "s4@example.com", "grade": 70},
+        {"student_email": "nobody@example.com", "grade": 50},
+        {"submission_id": submission.id, "grade": 60},
+        {"grade": 40},
+        {"submission_id": second.id, "grade": 101},
+    ]
+    with django_assert_max_num_queries(8):
+        resp = auth(api_client, teacher).post(bulk_grades_url(homework), rows, format="json")
+    assert resp.status_code == status.HTTP_200_OK
+    assert (resp.data["created"], resp.data["updated"], resp.data["failed"]) == (1, 1, 4)
+    statuses = [result["status"] for result in resp.data["results"]]
+    assert statuses == ["created", "updated", "error", "error", "error", "error"]
+    assert resp.data["results"][3]["errors"] == [ErrorMessages.BULK_GRADE_DUPLICATE_ROW.value]
+
+    second.grade.refresh_from_db()
+    assert second.grade.grade == 70 and second.grade.comments == "old"
+    assert HomeworkGrade.objects.get(submission=submission).comments == "Great"
+
+
+def test_bulk_grading_accepts_csv(api_client, teacher, student, submission):
+    body = "\ufeffstudent_email,grade,comments\nstudent@example.com,88,Well done\n"
+    resp = auth(api_client, teacher).post(
+        bulk_grades_url(submission.homework), body.encode("utf-8"), content_type="text/csv"
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.data["created"] == 1
+    assert HomeworkGrade.objects.get(submission=submission).grade == 88
+
+    denied = auth(api_client, student).post(
+        bulk_grades_url(submission.homework), body.encode("utf-8"), content_type="text/csv"
+    )
+    assert denied.status_code == status.HTTP_403_FORBIDDEN
+
+
+
+def test_bulk_homework_creation_checks_titles_as_a_set(api_client, settings, teacher, other_teacher, homework, course,
+                                                       django_assert_max_num_queries):
+    settings.NOTIFICATION_DISPATCH_WORKERS = 0
+    second = Lecture.objects.create(course=course, topic="L2", presentation="p2.pdf")
+    foreign_course = Course.objects.create(name="C2", description="Desc", primary_owner=other_teacher)
+    foreign = Lecture.objects.create(course=foreign_course, topic="F1", presentation="f.pdf")
+    due = "2030-01-01T00:00:00Z"
+    url = f"/api/courses/{course.id}/homeworks/bulk/"
+    rows = [
+        {"lecture_id": homework.lecture_id, "title": "HW2", "description": "D", "due_date": due},
+        {"lecture_id": second.id, "title": "HW1", "description": "D", "due_date": due},
+        {"lecture_id": homework.lecture_id, "title": "HW1", "description": "D", "due_date": due},
+        {"lecture_id": second.id, "title": "HW1", "description": "D", "due_date": due},
+        {"lecture_id": foreign.id, "title": "HW9", "description": "D", "due_date": due},
+        {"lecture_id": second.id, "title": "HW3", "description": "D"},
+    ]
+    with django_assert_max_num_queries(7):
+        resp = auth(api_client, teacher).post(url, {"homeworks": rows}, format="json")
+    assert resp.status_code == status.HTTP_200_OK
+    assert (resp.data["created"], resp.data["failed"]) == (2, 4)
+    results = resp.data["results"]
+    assert [result["status"] for result in results] == ["created", "created", "error", "error", "error", "error"]
+    assert results[2]["errors"] == [ErrorMessages.HOMEWORK_TITLE_ALREADY_EXISTS.value.format(title="HW1")]
+    assert results[3]["errors"] == [ErrorMessages.BULK_HOMEWORK_DUPLICATE_ROW.value.format(title="HW1")]
+    assert results[4]["errors"] == [ErrorMessages.LECTURE_NOT_IN_COURSE.value]
+    assert Homework.objects.get(id=results[1]["homework_id"]).lecture_id == second.id
+    assert OutboxEvent.objects.filter(event_type=NotificationEvents.HOMEWORK_PUBLISHED.value).count() == 2
+
+    denied = auth(api_client, other_teacher).post(url, rows[:1], format="json")
+    assert denied.status_code == status.HTTP_403_FORBIDDEN
+
+
+# Identity map
+def test_identity_map_loads_each_row_once(submission, django_assert_num_queries):
+    with identity_scope():
+        with django_assert_num_queries(2):
+            first = fetch(HomeworkSubmission, submission.id)
+            assert fetch(HomeworkSubmission, submission.id) is first
+            with pytest.raises(HomeworkSubmission.DoesNotExist):
+                fetch(HomeworkSubmission, 0)
+            with pytest.raises(HomeworkSubmission.DoesNotExist):
+                fetch(HomeworkSubmission, 0)
+
+
+def test_grade_creation_reuses_resolved_rows(api_client, teacher, submission, django_assert_num_queries):
+    homework = submission.homework
+    url = grades_list_url(homework.lecture.course_id, homework.lecture_id, homework.id, submission.id)
+    client = auth(api_client, teacher)
+
+    # joined hierarchy, uniqueness check, savepoint, grade insert, outbox insert, release
+    with django_assert_num_queries(6):
+        resp = client.post(url, {"grade": 80, "comments": "Solid"}, format="json")
+    assert resp.status_code == status.HTTP_201_CREATED
+
+
+# Gradebook
+def gradebook_url(course_id):
+    return f"/api/courses/{course_id}/gradebook/"
+
+
+@pytest.fixture
+def gradebook(course, homework, submission, teacher):
+    second = Homework.objects.create(
+        lecture=homework.lecture, title="HW2", description="D", due_date="2030-01-01T00:00:00Z", created_by=teacher,
+    )
+    late = User.objects.create_user(email="s5@example.com", password="x", role=UserRole.STUDENT.value)
+    course.students.add(late)
+    HomeworkGrade.objects.create(submission=submission, grade=88.5, comments="", graded_by=teacher)
+    graded = HomeworkSubmission.objects.create(homework=second, student=late, content="B")
+    HomeworkGrade.objects.create(submission=graded, grade=70, comments="", graded_by=teacher)
+    return course, homework, second
+
+
+def test_gradebook_pivots_grades_per_student(api_client, teacher, student, gradebook, django_assert_num_queries):
+    course, first, second = gradebook
+    client = auth(api_client, teacher)
+
+    # hierarchy, columns, student count, student page, grades (the primary owner skips the teacher lookup)
+    with django_assert_num_queries(5):
+        resp = client.get(gradebook_url(course.id))
+    assert resp.status_code == status.HTTP_200_OK
+    assert [column["id"] for column in resp.data["homeworks"]] == [first.id, second.id]
+    assert [(row["student_email"], row["grades"]) for row in resp.data["results"]] == [
+        ("student@example.com", [88.5, None]),
+        ("s5@example.com", [None, 70.0]),
+    ]
+
+    assert auth(api_client, student).get(gradebook_url(course.id)).status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_gradebook_csv_export_streams(api_client, teacher, student, gradebook):
+    course, _, _ = gradebook
+    late = User.objects.get(email="s5@example.com")
+    resp = auth(api_client, teacher).get(gradebook_url(course.id), {"export": "csv"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.streaming
+    assert resp["Content-Disposition"] == 'attachment; filename="c1-gradebook.csv"'
+    lines = b"".join(resp.streaming_content).decode().splitlines()
+    assert lines == [
+        "student_id,student_email,L1 / HW1,L1 / HW2",
+        f"{student.id},student@example.com,88.50,",
+        f"{late.id},s5@example.com,,70.00",
+    ]
+
+    bad = auth(api_client, teacher).get(gradebook_url(course.id), {"export": "xlsx"})
+    assert bad.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_gradebook_skips_homework_created_after_its_columns(teacher, student, gradebook):
+    from apps.homeworks.services.gradebook.services import GradebookManagementService
+    course, _, _ = gradebook
+    service = GradebookManagementService()
+    # Columns were read before HW2 existed; its grade arrives with the grades query
+    columns = service.columns(course=course, user=teacher)[:1]
+
+    rows = service.rows(course=course, columns=columns, students=service.students(course))
+    assert [row.grades for row in rows] == [(88.5,), (None,)]
+    assert [line[2:] for line in service.iter_csv_rows(course=course, columns=columns)][1:] == [["88.50"], [""]]
+
+
+# Grade statistics
+@pytest.fixture
+def graded_homework(course, homework, teacher):
+    caches[GradeStatisticsCache.alias].clear()
+    for index, value in enumerate((50, 70, 90)):
+        graded = User.objects.create_user(email=f"g{index}@example.com", password="x", role=UserRole.STUDENT.value)
+        course.students.add(graded)
+        submission = HomeworkSubmission.objects.create(homework=homework, student=graded, content="A")
+        HomeworkGrade.objects.create(submission=submission, grade=value, comments="", graded_by=teacher)
+    return homework
+
+
+def test_homework_statistics(api_client, teacher, student, graded_homework):
+    homework = graded_homework
+    url = f"/api/courses/{homework.lecture.course_id}/lectures/{homework.lecture_id}/homeworks/{homework.id}/statistics/"
+    resp = auth(api_client, teacher).get(url)
+    assert resp.status_code == status.HTTP_200_OK
+    data = resp.data
+    assert (data["scope"], data["count"], data["mean"], data["median"]) == ("homework", 3, 70.0, 70.0)
+    assert (data["min"], data["max"], data["percentiles"]["p25"]) == (50.0, 90.0, 60.0)
+    assert data["stddev"] == pytest.approx(16.3299, abs=1e-4)
+    assert [bucket["count"] for bucket in data["histogram"]] == [0, 0, 0, 0, 0, 1, 0, 1, 0, 1]
+
+    course_url = f"/api/courses/{homework.lecture.course_id}/statistics/"
+    assert auth(api_client, student).get(course_url).status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_statistics_cached_until_grade_changes(api_client, teacher, submission, graded_homework,
+                                               django_capture_on_commit_callbacks, settings):
+    settings.NOTIFICATION_DISPATCH_WORKERS = 0
+    homework = graded_homework
+    url = f"/api/courses/{homework.lecture.course_id}/statistics/"
+    client = auth(api_client, teacher)
+    assert client.get(url).data["count"] == 3
+
+    # the joined hierarchy and the cache entry only; no grade is read again
+    with CaptureQueriesContext(connection) as queries:
+        assert client.get(url).data["count"] == 3
+    assert not any(HomeworkGrade._meta.db_table in query["sql"] for query in queries.captured_queries)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        created = client.post(
+            grades_list_url(homework.lecture.course_id, homework.lecture_id, homework.id, submission.id),
+            {"grade": 100, "comments": ""},
+            format="json",
+        )
+    assert created.status_code == status.HTTP_201_CREATED
+    refreshed = client.get(url).data
+    assert (refreshed["count"], refreshed["max"]) == (4, 100.0)
+
+
+def test_statistics_invalidated_when_grades_go_with_their_homework(api_client, teacher, graded_homework,
+                                                                   django_capture_on_commit_callbacks):
+    homework = graded_homework
+    url = f"/api/courses/{homework.lecture.course_id}/statistics/"
+    client = auth(api_client, teacher)
+    assert client.get(url).data["count"] == 3
+
+    with django_capture_on_commit_callbacks(execute=True):
+        deleted = client.delete(
+            f"/api/courses/{homework.lecture.course_id}/lectures/{homework.lecture_id}/homeworks/{homework.id}/"
+        )
+    assert deleted.status_code == status.HTTP_204_NO_CONTENT
+    assert client.get(url).data["count"] == 0
+
+
+class UnreachableCache:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("cache is down")
+        return fail
+
+
+def test_statistics_computed_when_the_cache_is_unreachable(api_client, teacher, submission, graded_homework,
+                                                           django_capture_on_commit_callbacks, monkeypatch):
+    monkeypatch.setattr(GradeStatisticsCache, "backend", UnreachableCache())
+    homework = graded_homework
+    client = auth(api_client, teacher)
+    assert client.get(f"/api/courses/{homework.lecture.course_id}/statistics/").data["count"] == 3
+
+    with django_capture_on_commit_callbacks(execute=True):
+        created = client.post(
+            grades_list_url(homework.lecture.course_id, homework.lecture_id, homework.id, submission.id),
+            {"grade": 100, "comments": ""},
+            format="json",
+        )
+    assert created.status_code == status.HTTP_201_CREATED
+
+
+def test_check_fails_without_the_statistics_cache_table(settings):
+    assert statistics_cache_table_exists(None) == []
+    settings.CACHES = {
+        **settings.CACHES,
+        GradeStatisticsCache.alias: {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "absent"},
+    }
+    assert [error.id for error in statistics_cache_table_exists(None)] == ["homeworks.E001"]
+
+
+# Submission export
+def submissions_export_url(homework):
+    return f"/api/courses/{homework.lecture.course_id}/lectures/{homework.lecture_id}/homeworks/{homework.id}/submissions/export/"
+
+
+def test_submission_export_formats(api_client, teacher, student, submission):
+    HomeworkGrade.objects.create(submission=submission, grade=64, comments="ok", graded_by=teacher)
+    homework = submission.homework
+    client = auth(api_client, teacher)
+
+    jsonl = client.get(submissions_export_url(homework))
+    assert jsonl.status_code == status.HTTP_200_OK
+    assert jsonl["Content-Type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in b"".join(jsonl.streaming_content).decode().splitlines()]
+    assert [(r["id"], r["student_email"], r["content"], r["grade"]) for r in records] == [
+        (submission.id, "student@example.com", "Ans", "64.00"),
+    ]
+
+    csv_resp = client.get(submissions_export_url(homework), {"export": "csv"})
+    lines = b"".join(csv_resp.streaming_content).decode().splitlines()
+    assert lines[0].split(",")[:3] == ["id", "student_id", "student_email"]
+    assert lines[1].endswith(",Ans")
+
+    archive_resp = client.get(submissions_export_url(homework), {"export": "zip"})
+    assert archive_resp["Content-Disposition"] == 'attachment; filename="hw1-submissions.zip"'
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(archive_resp.streaming_content)))
+    assert archive.read(f"{submission.id}-student@example.com.txt") == b"Ans"
+    assert archive.read("submissions.csv").decode().splitlines()[1].startswith(f"{submission.id},{student.id},")
+
+    assert auth(api_client, student).get(submissions_export_url(homework)).status_code == status.HTTP_403_FORBIDDEN
+
+
+# Submission content storage
+def test_large_submission_content_is_compressed_and_deferred(api_client, student, teacher, homework, settings):
+    settings.SUBMISSION_CONTENT_COMPRESSION_THRESHOLD = 64
+    url = f"/api/courses/{homework.lecture.course_id}/lectures/{homework.lecture_id}/homeworks/{homework.id}/submissions/"
+    body = "\n".join(["print('hello')"] * 50)
+    assert auth(api_client, student).post(url, {"content": body}, format="json").status_code == status.HTTP_201_CREATED
+
+    stored = HomeworkSubmission.objects.get(homework=homework)
+    assert (stored.inline_content, stored.content_compressed, stored.content_length) == ("", True, len(body))
+    assert len(bytes(SubmissionContent.objects.get(submission=stored).data)) < len(body)
+    assert stored.content == body
+
+    client = auth(api_client, teacher)
+    with CaptureQueriesContext(connection) as queries:
+        listed = client.get(url)
+    row = listed.data["results"][0]
+    assert "content" not in row
+    assert (row["content_length"], row["content_preview"]) == (len(body), body[:200])
+    assert not any('"homeworks_homeworksubmission"."content"' in q["sql"] for q in queries)
+
+    assert client.get(f"{url}{stored.id}/").data["content"] == body
+
+    stored.content = "short"
+    stored.save()
+    assert not SubmissionContent.objects.filter(submission=stored).exists()
+    assert HomeworkSubmission.objects.get(id=stored.id).content == "short"
+
+
+def test_homework_list_follows_due_date_index(api_client, teacher, lecture, homework):
+    earlier = Homework.objects.create(
+        lecture=lecture, title="HW0", description="D", due_date="2029-06-01T00:00:00Z", created_by=teacher,
+    )
+    auth(api_client, teacher)
+    resp = api_client.get(f"/api/courses/{lecture.course_id}/lectures/{lecture.id}/homeworks/")
+    assert resp.status_code == status.HTTP_200_OK
+    results = resp.data.get("results", resp.data)
+    assert [row["id"] for row in results] == [earlier.id, homework.id]
+
+    plan = Homework.objects.filter(lecture=lecture).explain()
+    if connection.vendor == "sqlite":
+        assert "homework_lecture_due_idx" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_student_homework_dashboard(api_client, teacher, student, lecture, submission, django_assert_num_queries):
+    HomeworkGrade.objects.create(submission=submission, grade=91, graded_by=teacher)
+    pending = Homework.objects.create(
+        lecture=lecture, title="HW0", description="D", due_date="2029-06-01T00:00:00Z", created_by=teacher,
+    )
+    other_course = Course.objects.create(name="Other", description="D", primary_owner=teacher)
+    Homework.objects.create(
+        lecture=Lecture.objects.create(course=other_course, topic="L", presentation="p.pdf"),
+        title="Not enrolled", description="D", due_date="2029-01-01T00:00:00Z", created_by=teacher,
+    )
+    client = auth(api_client, student)
+
+    with django_assert_num_queries(1):
+        resp = client.get("/api/me/homeworks/", {"page_size": 1})
+    assert resp.status_code == status.HTTP_200_OK
+    assert [(row["id"], row["status"], row["submission_id"]) for row in resp.data["results"]] == [
+        (pending.id, "pending", None),
+    ]
+    resp = client.get(resp.data["next"])
+    row = resp.data["results"][0]
+    assert (row["id"], row["status"], row["submission_id"], row["grade"]) == (
+        submission.homework_id, "graded", submission.id, "91.00",
+    )
+    assert resp.data["next"] is None
+
+    graded = client.get("/api/me/homeworks/", {"status": "graded"}).data["results"]
+    assert [row["id"] for row in graded] == [submission.homework_id]
+    due_soon = client.get("/api/me/homeworks/", {"due_before": "2029-12-31T00:00:00Z"}).data["results"]
+    assert [row["id"] for row in due_soon] == [pending.id]
+
+    assert client.get("/api/me/homeworks/", {"status": "late"}).status_code == status.HTTP_400_BAD_REQUEST
+    assert auth(api_client, teacher).get("/api/me/homeworks/").status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_student_homework_pages_through_due_date_ties(api_client, teacher, student, lecture):
+    # More ties than DRF's cursor could step over with its offset (capped at 1000)
+    Homework.objects.bulk_create(
+        Homework(lecture=lecture, title=f"HW{index}", description="D", due_date="2029-06-01T00:00:00Z", created_by=teacher)
+        for index in range(1005)
+    )
+    expected = list(Homework.objects.filter(lecture=lecture).order_by("due_date", "id").values_list("id", flat=True))
+    client = auth(api_client, student)
+
+    seen, url, pages = [], "/api/me/homeworks/?page_size=100", []
+    while url:
+        resp = client.get(url)
+        assert resp.status_code == status.HTTP_200_OK
+        seen += [row["id"] for row in resp.data["results"]]
+        pages.append(resp.data)
+        url = resp.data["next"]
+    assert seen == expected
+
+    back = client.get(pages[-1]["previous"]).data
+    assert [row["id"] for row in back["results"]] == [row["id"] for row in pages[-2]["results"]]
+    assert client.get("/api/me/homeworks/", {"cursor": "not-a-cursor"}).status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_grading_queue_spans_owned_and_cotaught_courses(api_client, teacher, other_teacher, student, unenrolled_student,
+                                                       homework, submission, django_assert_num_queries):
+    def homework_in(name, owner):
+        lecture = Lecture.objects.create(
+            course=Course.objects.create(name=name, description="D", primary_owner=owner), topic="L", presentation="p.pdf",
+        )
+        return Homework.objects.create(lecture=lecture, title="HW", description="D", due_date="2030-01-01T00:00:00Z", created_by=owner)
+
+    cotaught = homework_in("Co-taught", other_teacher)
+    cotaught.lecture.course.teachers.add(teacher)
+    foreign = homework_in("Foreign", other_teacher)
+    waiting = HomeworkSubmission.objects.create(homework=cotaught, student=student, content="A")
+    HomeworkSubmission.objects.create(homework=foreign, student=student, content="A")
+    HomeworkSubmission.objects.create(homework=cotaught, student=unenrolled_student, content="A", is_submitted=False)
+    graded = HomeworkSubmission.objects.create(homework=homework, student=unenrolled_student, content="A")
+    HomeworkGrade.objects.create(submission=graded, grade=50, graded_by=teacher)
+    client = auth(api_client, teacher)
+
+    # one page of submissions, one grouped count
+    with django_assert_num_queries(2):
+        resp = client.get("/api/me/grading-queue/", {"page_size": 1})
+    assert resp.status_code == status.HTTP_200_OK
+    assert [row["id"] for row in resp.data["results"]] == [submission.id]
+    assert [(row["course_name"], row["count"]) for row in resp.data["courses"]] == [("C1", 1), ("Co-taught", 1)]
+    second = client.get(resp.data["next"]).data
+    assert [(row["id"], row["student_email"]) for row in second["results"]] == [(waiting.id, "student@example.com")]
+    assert second["next"] is None
+
+    assert auth(api_client, student).get("/api/me/grading-queue/").status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_grade_comments_incremental_fetch_and_push(api_client, teacher, submission, django_assert_num_queries,
+                                                  django_capture_on_commit_callbacks, settings):
+    settings.NOTIFICATION_DISPATCH_WORKERS = 0
+    grade = HomeworkGrade.objects.create(submission=submission, grade=75, comments="", graded_by=teacher)
+    homework = submission.homework
+    url = grade_comments_url(homework.lecture.course_id, homework.lecture_id, homework.id, submission.id, grade.id)
+    client = auth(api_client, teacher)
+    topic = comments_topic(grade.id)
+
+    with broker.subscribe(topic) as subscription, django_capture_on_commit_callbacks(execute=True):
+        first = client.post(url, {"comment": "First"}, format="json").data
+    assert [comment.id for comment in subscription.wait(0)] == [first["id"]]
+
+    # joined hierarchy, new comments; no count
+    with django_assert_num_queries(2):
+        resp = client.get(url, {"since_id": first["id"]})
+    assert resp.data == []
+    assert [row["id"] for row in client.get(url, {"since_id": 0}).data] == [first["id"]]
+
+    # The broker only wakes a listener; the comments themselves are re-read from the database
+    feed = GradeCommentManagementService().listen(grade=grade, user=teacher, since_id=first["id"])
+    with feed:
+        assert feed.wait(0) == []
+        # Posted through another worker process: in the database, but never published here
+        GradeComment.objects.create(grade=grade, author=teacher, comment="Elsewhere")
+        pushed = GradeComment.objects.create(grade=grade, author=teacher, comment="Pushed")
+        timer = threading.Timer(0.05, broker.publish, args=(topic, pushed))
+        timer.start()
+        assert [comment.comment for comment in feed.wait(5)] == ["Elsewhere", "Pushed"]
+        timer.join()
+        # Nothing is delivered twice
+        assert feed.wait(0) == []
+
+    resp = client.get(f"{url}stream/", {"since_id": first["id"], "timeout": 5})
+    assert [row["comment"] for row in resp.data] == ["Elsewhere", "Pushed"]
+    assert client.get(f"{url}stream/", {"since_id": pushed.id, "timeout": 0}).data == []
+
+    settings.GRADE_COMMENT_STREAM_DURATION = 0
+    resp = client.get(f"{url}stream/", HTTP_ACCEPT="text/event-stream", HTTP_LAST_EVENT_ID="0")
+    assert resp["Content-Type"].startswith("text/event-stream")
+    body = b"".join(resp.streaming_content).decode()
+    resp.close()
+    assert f"id: {first['id']}\ndata: " in body and '"First"' in body
+    assert broker.subscriber_count(topic) == 0
+
+
+
+
+# Revisions
+def submission_url(submission):
+    homework = submission.homework
+    return f"/api/courses/{homework.lecture.course_id}/lectures/{homework.lecture_id}/homeworks/{homework.id}/submissions/{submission.id}/"
+
+
+def test_submission_revisions_rebuild_every_kept_version(api_client, teacher, student, unenrolled_student, submission,
+                                                       settings):
+    settings.SUBMISSION_REVISION_SNAPSHOT_INTERVAL = 4
+    settings.SUBMISSION_REVISION_LIMIT = 6
+    client = auth(api_client, student)
+    drafts = ["Ans"] + [
+        "\n".join(f"Paragraph {line}: {'revised' if line < draft else 'draft'} text" for line in range(10))
+        for draft in range(10)
+    ]
+    for draft in drafts[1:]:
+        assert client.patch(submission_url(submission), {"content": draft}, format="json").status_code == status.HTTP_200_OK
+    client.patch(submission_url(submission), {"content": drafts[-1]}, format="json")  # unchanged: no revision
+
+    revisions = client.get(f"{submission_url(submission)}revisions/").data
+    numbers = [revision["number"] for revision in revisions]
+    assert numbers[0] == len(drafts)
+    # At most LIMIT revisions plus the rest of the oldest snapshot group; the oldest kept is a snapshot
+    assert 6 <= len(numbers) < 6 + 4 and revisions[-1]["is_snapshot"]
+    assert SubmissionRevision.objects.filter(submission=submission, is_snapshot=False).exists()
+
+    teacher_client = auth(APIClient(), teacher)
+    for number in numbers:
+        version = teacher_client.get(f"{submission_url(submission)}revisions/{number}/").data
+        assert version["content"] == drafts[number - 1]
+        assert version["content_length"] == len(drafts[number - 1])
+    assert client.get(f"{submission_url(submission)}revisions/1/").status_code == status.HTTP_404_NOT_FOUND
+    assert auth(APIClient(), unenrolled_student).get(f"{submission_url(submission)}revisions/").status_code \
+        == status.HTTP_403_FORBIDDEN
+
+
+def test_interleaved_submission_updates_build_deltas_on_the_stored_content(teacher, student, submission):
+    from apps.homeworks.services.submission.services import SubmissionManagementService
+    service = SubmissionManagementService()
+    lines = [f"Line {line} of the answer\n" for line in range(40)]
+    submission.content = "".join(lines)
+    submission.save()
+    # Both requests loaded the row before either wrote; the second edit builds on the first one
+    first, second = HomeworkSubmission.objects.get(pk=submission.pk), HomeworkSubmission.objects.get(pk=submission.pk)
+    drafts = ["".join(["Intro\n"] * 5 + lines), "".join(lines[:30] + ["Changed line\n"] + lines[31:])]
+    service.update(instance=first, user=student, validated_data={"content": drafts[0]})
+    saved = service.update(instance=second, user=student, validated_data={"content": drafts[1]})
+
+    assert saved.content == drafts[1]
+    assert SubmissionRevision.objects.filter(submission=submission, is_snapshot=False).count() == 2
+    versions = [
+        service.update_service.revision_service.version(submission=submission, user=teacher, number=number).content
+        for number in (1, 2, 3)
+    ]
+    assert versions == ["".join(lines), *drafts]
+
+
+# Similarity
+ESSAY = (
+    "The mitochondria is the powerhouse of the cell because it converts nutrients into adenosine "
+    "triphosphate through oxidative phosphorylation, a process that relies on the electron transport "
+    "chain embedded in the inner membrane and on a steep proton gradient maintained across it"
+)
+
+
+def similarity_url(homework):
+    return f"/api/courses/{homework.lecture.course_id}/lectures/{homework.lecture_id}/homeworks/{homework.id}/similarity/"
+
+
+def test_similarity_report_finds_near_duplicates(api_client, teacher, student, course, homework, settings,
+                                                 django_capture_on_commit_callbacks, django_assert_num_queries):
+    settings.SUBMISSION_SIMILARITY_WORKERS = 0
+    copier, stranger = (
+        User.objects.create_user(email=f"{name}@example.com", password="x", role=UserRole.STUDENT.value)
+        for name in ("copier", "stranger")
+    )
+    course.students.add(copier, stranger)
+    url = f"/api/courses/{course.id}/lectures/{homework.lecture_id}/homeworks/{homework.id}/submissions/"
+    with django_capture_on_commit_callbacks(execute=True):
+        auth(api_client, student).post(url, {"content": ESSAY}, format="json")
+        auth(api_client, copier).post(url, {"content": ESSAY.replace("steep", "strong") + " indeed"}, format="json")
+        auth(api_client, stranger).post(url, {"content": "Photosynthesis happens in chloroplasts."}, format="json")
+    assert SubmissionSignature.objects.count() == 3
+
+    client = auth(api_client, teacher)
+    # joined hierarchy, band keys, candidate signatures
+    with django_assert_num_queries(3):
+        report = client.get(similarity_url(homework)).data
+    assert report["indexed"] == 3
+    assert [(pair["student_id"], pair["other_student_id"]) for pair in report["pairs"]] == [(student.id, copier.id)]
+    assert report["pairs"][0]["similarity"] >= 0.8
+
+    # A copy handed in for another homework the teacher teaches only shows up in the cross-course scope
+    rerun = Lecture.objects.create(course=course, topic="L1 again")
+    again = Homework.objects.create(lecture=rerun, title="HW1", description="D", due_date="2031-01-01T00:00:00Z", created_by=teacher)
+    copy = HomeworkSubmission.objects.create(homework=again, student=stranger, content=ESSAY)
+    SubmissionSimilarityService().index(HomeworkSubmission.objects.filter(id=copy.id))
+    assert len(client.get(similarity_url(homework)).data["pairs"]) == 1
+    pairs = client.get(similarity_url(homework), {"scope": "courses"}).data["pairs"]
+    # Both the original and the near copy match the verbatim copy in the other homework
+    assert sorted((pair["student_id"], pair["similarity"] == 1.0) for pair in pairs if pair["other_homework_id"] == again.id) \
+        == sorted([(student.id, True), (copier.id, False)])
+
+    assert auth(api_client, student).get(similarity_url(homework)).status_code == status.HTTP_403_FORBIDDEN
+    assert client.get(similarity_url(homework), {"threshold": 2}).status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_minhash_estimates_jaccard_similarity():
+    hasher = MinHasher(permutations=128, bands=16, shingle_size=3)
+    words = ESSAY.split()
+    first, second = " ".join(words[:30]), " ".join(words[10:])
+    first_shingles, second_shingles = shingles(first, 3), shingles(second, 3)
+    jaccard = len(first_shingles & second_shingles) / len(first_shingles | second_shingles)
+    estimate = hasher.similarity(hasher.signature(first), hasher.signature(second))
+    assert estimate == pytest.approx(jaccard, abs=0.15)
+    assert hasher.unpack(hasher.pack(hasher.signature(first))) == hasher.signature(first)
+    assert hasher.signature("...") is None
+
+
 # Create your tests here.
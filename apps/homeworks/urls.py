@@ -1,7 +1,9 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from apps.homeworks.views import HomeworkViewSet, HomeworkSubmissionViewSet, HomeworkGradeViewSet
+from apps.homeworks.views import HomeworkViewSet, HomeworkSubmissionViewSet, HomeworkGradeViewSet, HomeworkBulkGradeView, \
+    CourseGradebookView, GradeStatisticsView, HomeworkSubmissionExportView, StudentHomeworkView, GradingQueueView, \
+    SubmissionSimilarityView, SubmissionRevisionView, CourseBulkHomeworkView
 from common.enums import URLPatterns, HTTPMethods, ViewActions
 
 HTTP_METHOD_MAPPING = {
@@ -14,24 +16,53 @@ HTTP_METHOD_MAPPING = {
 
 homework_views = HomeworkViewSet.as_view(HTTP_METHOD_MAPPING)
 submission_views = HomeworkSubmissionViewSet.as_view(HTTP_METHOD_MAPPING)
+# GET on a single submission retrieves it (with its full content) instead of listing
+submission_detail_views = HomeworkSubmissionViewSet.as_view({
+    **HTTP_METHOD_MAPPING,
+    HTTPMethods.GET.value: ViewActions.RETRIEVE.value,
+})
 grade_views = HomeworkGradeViewSet.as_view(HTTP_METHOD_MAPPING)
 grade_comments_views = HomeworkGradeViewSet.as_view({
     HTTPMethods.GET.value: ViewActions.LIST_COMMENTS.value,
     HTTPMethods.POST.value: ViewActions.CREATE_COMMENT.value,
 })
+grade_comments_stream_views = HomeworkGradeViewSet.as_view({
+    HTTPMethods.GET.value: ViewActions.STREAM_COMMENTS.value,
+})
 
 urlpatterns = [
+    # Student dashboard
+    path(f'{URLPatterns.ME.value}/{URLPatterns.HOMEWORKS.value}/', StudentHomeworkView.as_view(), name=URLPatterns.MY_HOMEWORKS.value),
+    path(f'{URLPatterns.ME.value}/{URLPatterns.GRADING_QUEUE.value}/', GradingQueueView.as_view(), name=URLPatterns.MY_GRADING_QUEUE.value),
+
+    # Gradebook
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.GRADEBOOK.value}/', CourseGradebookView.as_view(), name=URLPatterns.COURSE_GRADEBOOK.value),
+
+    # Statistics
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.STATISTICS.value}/', GradeStatisticsView.as_view(), name=URLPatterns.COURSE_STATISTICS.value),
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.STATISTICS.value}/', GradeStatisticsView.as_view(), name=URLPatterns.LECTURE_STATISTICS.value),
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.STATISTICS.value}/', GradeStatisticsView.as_view(), name=URLPatterns.HOMEWORK_STATISTICS.value),
+
     # HW
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.HOMEWORKS.value}/{URLPatterns.BULK.value}/', CourseBulkHomeworkView.as_view(), name=URLPatterns.HOMEWORK_BULK.value),
     path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/', homework_views, name=URLPatterns.HOMEWORK_LIST.value),
     path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.PK.value}>/', homework_views, name=URLPatterns.HOMEWORK_DETAIL.value),
     
+    # Similarity
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SIMILARITY.value}/', SubmissionSimilarityView.as_view(), name=URLPatterns.HOMEWORK_SIMILARITY.value),
+
     # Submission
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SUBMISSIONS.value}/{URLPatterns.EXPORT.value}/', HomeworkSubmissionExportView.as_view(), name=URLPatterns.SUBMISSION_EXPORT.value),
     path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SUBMISSIONS.value}/', submission_views, name=URLPatterns.SUBMISSION_LIST.value),
-    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SUBMISSIONS.value}/<int:{URLPatterns.PK.value}>/', submission_views, name=URLPatterns.SUBMISSION_DETAIL.value),
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SUBMISSIONS.value}/<int:{URLPatterns.PK.value}>/', submission_detail_views, name=URLPatterns.SUBMISSION_DETAIL.value),
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SUBMISSIONS.value}/<int:{URLPatterns.SUBMISSION.value}>/{URLPatterns.REVISIONS.value}/', SubmissionRevisionView.as_view(), name=URLPatterns.SUBMISSION_REVISIONS.value),
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SUBMISSIONS.value}/<int:{URLPatterns.SUBMISSION.value}>/{URLPatterns.REVISIONS.value}/<int:{URLPatterns.NUMBER.value}>/', SubmissionRevisionView.as_view(), name=URLPatterns.SUBMISSION_REVISION_DETAIL.value),
 
     # Grades
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.GRADES.value}/{URLPatterns.BULK.value}/', HomeworkBulkGradeView.as_view(), name=URLPatterns.GRADE_BULK.value),
     path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SUBMISSIONS.value}/<int:{URLPatterns.SUBMISSION.value}>/{URLPatterns.GRADES.value}/', grade_views, name=URLPatterns.GRADE_LIST.value),
     path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SUBMISSIONS.value}/<int:{URLPatterns.SUBMISSION.value}>/{URLPatterns.GRADES.value}/<int:{URLPatterns.PK.value}>/', grade_views, name=URLPatterns.GRADE_DETAIL.value),
     # Comments
     path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SUBMISSIONS.value}/<int:{URLPatterns.SUBMISSION.value}>/{URLPatterns.GRADES.value}/<int:{URLPatterns.PK.value}>/comments/', grade_comments_views, name=URLPatterns.GRADE_COMMENTS.value),
+    path(f'{URLPatterns.COURSES.value}/<int:{URLPatterns.COURSE_PK.value}>/{URLPatterns.LECTURES.value}/<int:{URLPatterns.LECTURE_PK.value}>/{URLPatterns.HOMEWORKS.value}/<int:{URLPatterns.HOMEWORK.value}>/{URLPatterns.SUBMISSIONS.value}/<int:{URLPatterns.SUBMISSION.value}>/{URLPatterns.GRADES.value}/<int:{URLPatterns.PK.value}>/{URLPatterns.COMMENTS.value}/{URLPatterns.STREAM.value}/', grade_comments_stream_views, name=URLPatterns.GRADE_COMMENTS_STREAM.value),
 ]
@@ -1,6 +1,11 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils.text import slugify
 from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import JSONParser
+from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 
 from apps.homeworks.serializers import (
@@ -8,6 +13,7 @@ from apps.homeworks.serializers import (
     HomeworkCreateSerializer,
     HomeworkUpdateSerializer,
     HomeworkSubmissionSerializer,
+    HomeworkSubmissionListSerializer,
     HomeworkSubmissionCreateSerializer,
     HomeworkSubmissionUpdateSerializer,
     HomeworkGradeSerializer,
@@ -15,20 +21,58 @@ from apps.homeworks.serializers import (
     HomeworkGradeUpdateSerializer,
     GradeCommentSerializer,
     GradeCommentCreateSerializer,
+    GradeCommentPollSerializer,
+    BulkGradeRowSerializer,
+    BulkGradeRowResultSerializer,
+    BulkHomeworkRowSerializer,
+    BulkHomeworkRowResultSerializer,
+    GradebookColumnSerializer,
+    GradebookRowSerializer,
+    GradeStatisticsSerializer,
+    StudentHomeworkSerializer,
+    StudentHomeworkFilterSerializer,
+    GradingQueueItemSerializer,
+    GradingQueueCourseSerializer,
+    SimilarityFilterSerializer,
+    SimilarityReportSerializer,
+    SubmissionRevisionSerializer,
+    SubmissionVersionSerializer,
 )
+from apps.homeworks.parsers import CSVParser
+from apps.homeworks.renderers import EventStreamRenderer
 from apps.homeworks.models import Homework, HomeworkSubmission, HomeworkGrade
 from apps.courses.models import Lecture
+from apps.homeworks.services.shared.hierarchy import NestedHierarchyMixin
 from apps.homeworks.services.homework.services import HomeworkManagementService
+from apps.homeworks.services.homework.bulk import BulkHomeworkManagementService
+from apps.homeworks.services.homework.dtos import BulkHomeworkRow, BulkHomeworkRowResult
 from apps.homeworks.services.submission.services import SubmissionManagementService
 from apps.homeworks.services.grade.services import GradeManagementService
 from apps.homeworks.services.grade.comment_services import GradeCommentManagementService
-from apps.homeworks.services.protocols import HomeworkService, SubmissionService, GradeService, GradeCommentService
-from apps.homeworks.pagination import CustomPageNumberPagination
+from apps.homeworks.services.grade.bulk import BulkGradeManagementService
+from apps.homeworks.services.grade.dtos import BulkGradeRow, BulkGradeRowResult
+from apps.homeworks.services.gradebook import GradebookManagementService
+from apps.homeworks.services.statistics import GradeStatisticsManagementService
+from apps.homeworks.services.submission.export import SubmissionExportService
+from apps.homeworks.services.submission.revisions import SubmissionRevisionManagementService
+from apps.homeworks.services.dashboard import GradingQueueManagementService, StudentHomeworkManagementService
+from apps.homeworks.services.similarity import SubmissionSimilarityService
+from apps.homeworks.services.protocols import (
+    HomeworkService, SubmissionService, GradeService, GradeCommentService, BulkGradeService, GradebookService,
+    GradeStatisticsService, SubmissionExporter, StudentHomeworkService, GradingQueueService, SimilarityService,
+    SubmissionRevisionService, BulkHomeworkService,
+)
+from apps.homeworks.pagination import CustomPageNumberPagination, DueDateCursorPagination, SubmissionAgeCursorPagination
 from apps.users.permissions import DenyBlacklistedToken
-from common.enums import ViewActions, ErrorMessages, URLPatterns
+from common.enums import (
+    ViewActions, ModelFields, URLPatterns, ResponseKeys, BulkRowStatus, ErrorMessages, HttpStatus, ValidationFields,
+    QueryParams, ExportFormats, HttpHeaders, ContentTypes,
+)
+from common.expansion import ExpansionQuerysetMixin
+from common.streaming import ClosingIterator, iter_events, streaming_csv_response, streaming_download
 
 
-class HomeworkViewSet(viewsets.ModelViewSet):
+class HomeworkViewSet(NestedHierarchyMixin, ExpansionQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing homework assignments within lectures with full CRUD operations.
 
@@ -41,6 +85,10 @@ class HomeworkViewSet(viewsets.ModelViewSet):
     """
     permission_classes = [IsAuthenticated, DenyBlacklistedToken]
     pagination_class = CustomPageNumberPagination
+    hierarchy_url_kwargs = {
+        ModelFields.COURSE.value: URLPatterns.COURSE_PK.value,
+        ModelFields.LECTURE.value: URLPatterns.LECTURE_PK.value,
+    }
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -57,11 +105,8 @@ class HomeworkViewSet(viewsets.ModelViewSet):
         return HomeworkSerializer
 
     def _get_lecture(self) -> Lecture:
-        """Get lecture from URL parameter with proper error handling"""
-        try:
-            return Lecture.objects.get(id=self.kwargs[URLPatterns.LECTURE_PK.value])
-        except Lecture.DoesNotExist:
-            raise NotFound(ErrorMessages.COURSE_DOESNT_EXIST.value)
+        """Lecture (with its course) resolved from the URL hierarchy"""
+        return self.hierarchy.lecture
 
     def get_queryset(self):
         """Get homeworks filtered by service layer (thin HTTP layer)"""
@@ -92,7 +137,7 @@ class HomeworkViewSet(viewsets.ModelViewSet):
         self.homework_service.delete(instance=instance, user=self.request.user)
 
 
-class HomeworkSubmissionViewSet(viewsets.ModelViewSet):
+class HomeworkSubmissionViewSet(NestedHierarchyMixin, ExpansionQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing homework submissions with full CRUD operations.
 
@@ -106,6 +151,12 @@ class HomeworkSubmissionViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, DenyBlacklistedToken]
     pagination_class = CustomPageNumberPagination
 
+    hierarchy_url_kwargs = {
+        ModelFields.COURSE.value: URLPatterns.COURSE_PK.value,
+        ModelFields.LECTURE.value: URLPatterns.LECTURE_PK.value,
+        ModelFields.HOMEWORK.value: URLPatterns.HOMEWORK.value,
+    }
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Dependency injection following SOLID principles
@@ -116,23 +167,24 @@ class HomeworkSubmissionViewSet(viewsets.ModelViewSet):
             return HomeworkSubmissionCreateSerializer
         elif self.action in [ViewActions.UPDATE.value, ViewActions.PARTIAL_UPDATE.value]:
             return HomeworkSubmissionUpdateSerializer
-        elif self.action in [ViewActions.LIST.value, ViewActions.RETRIEVE.value]:
-            return HomeworkSubmissionSerializer
+        elif self.action == ViewActions.LIST.value:
+            return HomeworkSubmissionListSerializer
         return HomeworkSubmissionSerializer
 
     def _get_homework(self) -> Homework:
-        """Get homework from URL parameter with proper error handling"""
-        try:
-            return Homework.objects.get(id=self.kwargs[URLPatterns.HOMEWORK.value])
-        except Homework.DoesNotExist:
-            raise NotFound(ErrorMessages.HOMEWORK_DOESNT_EXIST.value)
+        """Homework (with lecture and course) resolved from the URL hierarchy"""
+        return self.hierarchy.homework
 
     def get_queryset(self):
         """Get submissions filtered by service layer (thin HTTP layer)"""
-        return self.submission_service.get_filtered_submissions(
+        queryset = self.submission_service.get_filtered_submissions(
             homework_id=self.kwargs[URLPatterns.HOMEWORK.value],
             user=self.request.user
         )
+        # Lists show a preview; only single-submission actions load (and decompress) the body
+        if self.action == ViewActions.LIST.value:
+            return queryset.without_content()
+        return queryset.with_content()
 
     def perform_create(self, serializer):
         """POST - Create submission using service layer"""
@@ -145,7 +197,7 @@ class HomeworkSubmissionViewSet(viewsets.ModelViewSet):
 
     def perform_update(self, serializer):
         """PUT/PATCH - Update submission using service layer"""
-        self.submission_service.update(
+        serializer.instance = self.submission_service.update(
             instance=serializer.instance,
             user=self.request.user,
             validated_data=serializer.validated_data,
@@ -157,7 +209,62 @@ class HomeworkSubmissionViewSet(viewsets.ModelViewSet):
         self.submission_service.delete(instance=instance, user=self.request.user)
 
 
-class HomeworkGradeViewSet(viewsets.ModelViewSet):
+class SubmissionRevisionView(NestedHierarchyMixin, APIView):
+    """
+    Content history of a submission (its student and the course's teachers).
+
+    - GET /courses/{course_pk}/lectures/{lecture_pk}/homeworks/{homework_pk}/submissions/{submission_pk}/revisions/ - Kept revisions, newest first
+    - GET /courses/{course_pk}/lectures/{lecture_pk}/homeworks/{homework_pk}/submissions/{submission_pk}/revisions/{number}/ - Content as of a revision
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+    hierarchy_url_kwargs = {
+        ModelFields.COURSE.value: URLPatterns.COURSE_PK.value,
+        ModelFields.LECTURE.value: URLPatterns.LECTURE_PK.value,
+        ModelFields.HOMEWORK.value: URLPatterns.HOMEWORK.value,
+        ModelFields.SUBMISSION.value: URLPatterns.SUBMISSION.value,
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.revision_service: SubmissionRevisionService = SubmissionRevisionManagementService()
+
+    def get(self, request, *args, **kwargs):
+        submission = self.hierarchy.submission
+        number = kwargs.get(URLPatterns.NUMBER.value)
+        if number is None:
+            revisions = self.revision_service.revisions(submission=submission, user=request.user)
+            return Response(SubmissionRevisionSerializer(revisions, many=True).data, status=HttpStatus.OK.value)
+        version = self.revision_service.version(submission=submission, user=request.user, number=number)
+        return Response(SubmissionVersionSerializer(version).data, status=HttpStatus.OK.value)
+
+
+class HomeworkSubmissionExportView(NestedHierarchyMixin, APIView):
+    """
+    Streams every submission of a homework for offline review (teachers of the course).
+
+    - GET /courses/{course_pk}/lectures/{lecture_pk}/homeworks/{homework_pk}/submissions/export/?export=jsonl|csv|zip
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+    hierarchy_url_kwargs = {
+        ModelFields.COURSE.value: URLPatterns.COURSE_PK.value,
+        ModelFields.LECTURE.value: URLPatterns.LECTURE_PK.value,
+        ModelFields.HOMEWORK.value: URLPatterns.HOMEWORK.value,
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.export_service: SubmissionExporter = SubmissionExportService()
+
+    def get(self, request, *args, **kwargs):
+        stream = self.export_service.export(
+            homework=self.hierarchy.homework,
+            user=request.user,
+            export_format=request.query_params.get(QueryParams.EXPORT.value, ExportFormats.JSONL.value),
+        )
+        return streaming_download(stream.chunks, stream.content_type, stream.filename)
+
+
+class HomeworkGradeViewSet(NestedHierarchyMixin, ExpansionQuerysetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing homework grades with full CRUD operations.
 
@@ -180,6 +287,25 @@ class HomeworkGradeViewSet(viewsets.ModelViewSet):
         self.grade_service: GradeService = GradeManagementService()
         self.comment_service: GradeCommentService = GradeCommentManagementService()
 
+    def get_hierarchy_url_kwargs(self) -> dict:
+        url_kwargs = {
+            ModelFields.COURSE.value: URLPatterns.COURSE_PK.value,
+            ModelFields.LECTURE.value: URLPatterns.LECTURE_PK.value,
+            ModelFields.HOMEWORK.value: URLPatterns.HOMEWORK.value,
+            ModelFields.SUBMISSION.value: URLPatterns.SUBMISSION.value,
+        }
+        # Comment routes hang off a grade; the CRUD detail routes load it through get_object
+        if self.action in (
+            ViewActions.LIST_COMMENTS.value, ViewActions.CREATE_COMMENT.value, ViewActions.STREAM_COMMENTS.value,
+        ):
+            url_kwargs[ModelFields.GRADE.value] = URLPatterns.PK.value
+        return url_kwargs
+
+    def get_renderers(self):
+        if self.action == ViewActions.STREAM_COMMENTS.value:
+            return [*super().get_renderers(), EventStreamRenderer()]
+        return super().get_renderers()
+
     def get_serializer_class(self):
         if self.action == ViewActions.CREATE_COMMENT.value:
             return GradeCommentCreateSerializer
@@ -194,23 +320,19 @@ class HomeworkGradeViewSet(viewsets.ModelViewSet):
         return HomeworkGradeSerializer
 
     def _get_submission(self) -> HomeworkSubmission:
-        """Get submission from URL parameter with proper error handling"""
-        try:
-            return HomeworkSubmission.objects.get(id=self.kwargs[URLPatterns.SUBMISSION.value])
-        except HomeworkSubmission.DoesNotExist:
-            raise NotFound(ErrorMessages.SUBMISSION_DOESNT_EXIST.value)
+        """Submission (with homework, lecture and course) resolved from the URL hierarchy"""
+        return self.hierarchy.submission
 
     def _get_grade(self) -> HomeworkGrade:
-        try:
-            return HomeworkGrade.objects.get(id=self.kwargs[URLPatterns.PK.value])
-        except HomeworkGrade.DoesNotExist:
-            raise NotFound(ErrorMessages.GRADE_DOESNT_EXIST.value)
+        """Grade resolved from the URL hierarchy, so it always belongs to the URL's submission"""
+        return self.hierarchy.grade
 
     def get_queryset(self):
         """Get grades filtered by service layer (thin HTTP layer)"""
         return self.grade_service.get_grades_for_submission(
             submission_id=self.kwargs[URLPatterns.SUBMISSION.value],
-            user=self.request.user
+            user=self.request.user,
+            submission=self._get_submission(),
         )
 
     def perform_create(self, serializer):
@@ -237,7 +359,13 @@ class HomeworkGradeViewSet(viewsets.ModelViewSet):
 
     def list_comments(self, request, *args, **kwargs):
         grade = self._get_grade()
-        comments = self.comment_service.list(grade=grade, user=request.user)
+        poll = GradeCommentPollSerializer(data=request.query_params)
+        poll.is_valid(raise_exception=True)
+        since_id = poll.validated_data.get(QueryParams.SINCE_ID.value)
+        comments = self.comment_service.list(grade=grade, user=request.user, since_id=since_id)
+        if since_id is not None:
+            # Incremental fetch: only the new comments, without counting the whole thread
+            return Response(GradeCommentSerializer(comments, many=True).data)
         page = self.paginate_queryset(comments)
         serializer = GradeCommentSerializer(page or comments, many=True)
         if page is not None:
@@ -251,3 +379,296 @@ class HomeworkGradeViewSet(viewsets.ModelViewSet):
         comment = self.comment_service.create(grade=grade, user=request.user, validated_data=ser.validated_data)
         from common.enums import HttpStatus
         return Response(GradeCommentSerializer(comment).data, status=HttpStatus.CREATED.value)
+
+    def stream_comments(self, request, *args, **kwargs):
+        """
+        New comments on the grade, pushed as they are posted.
+
+        Long-poll (JSON): answers as soon as there is something newer than
+        ``since_id``, or with ``[]`` after ``timeout`` seconds. With
+        ``Accept: text/event-stream`` the connection stays open and every
+        comment is an event whose id is the comment id. Either way the user
+        is authorized once; while waiting the database connection is handed
+        back, and each wake-up or heartbeat costs one query.
+        """
+        grade = self._get_grade()
+        poll = GradeCommentPollSerializer(data=request.query_params)
+        poll.is_valid(raise_exception=True)
+        since_id = poll.validated_data.get(QueryParams.SINCE_ID.value, self._last_event_id(request))
+        feed = self.comment_service.listen(grade=grade, user=request.user, since_id=since_id)
+
+        if isinstance(request.accepted_renderer, EventStreamRenderer):
+            events = iter_events(
+                feed.wait,
+                lambda comment: (comment.id, GradeCommentSerializer(comment).data),
+                duration=settings.GRADE_COMMENT_STREAM_DURATION,
+                heartbeat=settings.GRADE_COMMENT_STREAM_HEARTBEAT,
+            )
+            response = StreamingHttpResponse(ClosingIterator(events, feed.close), content_type=ContentTypes.EVENT_STREAM.value)
+            response[HttpHeaders.CACHE_CONTROL.value] = "no-cache"
+            response[HttpHeaders.X_ACCEL_BUFFERING.value] = "no"
+            return response
+
+        timeout = min(
+            poll.validated_data.get(QueryParams.TIMEOUT.value, settings.GRADE_COMMENT_POLL_TIMEOUT),
+            settings.GRADE_COMMENT_POLL_TIMEOUT,
+        )
+        with feed:
+            comments = feed.wait(timeout)
+        return Response(GradeCommentSerializer(comments, many=True).data)
+
+    @staticmethod
+    def _last_event_id(request) -> int:
+        """Where a reconnecting event stream left off"""
+        value = request.META.get(HttpHeaders.LAST_EVENT_ID.value, "")
+        return int(value) if value.isdigit() else 0
+
+
+class HomeworkBulkGradeView(NestedHierarchyMixin, APIView):
+    """
+    Grades many submissions of one homework in a single request.
+
+    - POST /courses/{course_pk}/lectures/{lecture_pk}/homeworks/{homework_pk}/grades/bulk/ - JSON list
+      (or {"grades": [...]}) or text/csv with submission_id/student_email, grade, comments columns
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+    parser_classes = [JSONParser, CSVParser]
+    hierarchy_url_kwargs = {
+        ModelFields.COURSE.value: URLPatterns.COURSE_PK.value,
+        ModelFields.LECTURE.value: URLPatterns.LECTURE_PK.value,
+        ModelFields.HOMEWORK.value: URLPatterns.HOMEWORK.value,
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.bulk_grade_service: BulkGradeService = BulkGradeManagementService()
+
+    def post(self, request, *args, **kwargs):
+        rows, rejected = parse_bulk_rows(
+            request.data,
+            key=ResponseKeys.GRADES.value,
+            serializer_class=BulkGradeRowSerializer,
+            row_class=BulkGradeRow,
+            result_class=BulkGradeRowResult,
+            required_message=ErrorMessages.BULK_GRADE_ROWS_REQUIRED.value,
+        )
+        report = self.bulk_grade_service.grade_homework(
+            homework=self.hierarchy.homework,
+            user=request.user,
+            rows=rows,
+            rejected=rejected,
+        )
+        return Response({
+            ResponseKeys.CREATED.value: report.count(BulkRowStatus.CREATED.value),
+            ResponseKeys.UPDATED.value: report.count(BulkRowStatus.UPDATED.value),
+            ResponseKeys.FAILED.value: report.count(BulkRowStatus.ERROR.value),
+            ResponseKeys.RESULTS.value: BulkGradeRowResultSerializer(report.results, many=True).data,
+        }, status=HttpStatus.OK.value)
+
+
+class CourseBulkHomeworkView(NestedHierarchyMixin, APIView):
+    """
+    Publishes homeworks to many lectures of a course in a single request.
+
+    - POST /courses/{course_pk}/homeworks/bulk/ - JSON list (or {"homeworks": [...]})
+      or text/csv with lecture_id, title, description, due_date columns
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+    parser_classes = [JSONParser, CSVParser]
+    hierarchy_url_kwargs = {
+        ModelFields.COURSE.value: URLPatterns.COURSE_PK.value,
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.bulk_homework_service: BulkHomeworkService = BulkHomeworkManagementService()
+
+    def post(self, request, *args, **kwargs):
+        rows, rejected = parse_bulk_rows(
+            request.data,
+            key=ResponseKeys.HOMEWORKS.value,
+            serializer_class=BulkHomeworkRowSerializer,
+            row_class=BulkHomeworkRow,
+            result_class=BulkHomeworkRowResult,
+            required_message=ErrorMessages.BULK_HOMEWORK_ROWS_REQUIRED.value,
+        )
+        report = self.bulk_homework_service.create_homeworks(
+            course=self.hierarchy.course,
+            user=request.user,
+            rows=rows,
+            rejected=rejected,
+        )
+        return Response({
+            ResponseKeys.CREATED.value: report.count(BulkRowStatus.CREATED.value),
+            ResponseKeys.FAILED.value: report.count(BulkRowStatus.ERROR.value),
+            ResponseKeys.RESULTS.value: BulkHomeworkRowResultSerializer(report.results, many=True).data,
+        }, status=HttpStatus.OK.value)
+
+
+def parse_bulk_rows(data, *, key, serializer_class, row_class, result_class, required_message):
+    """
+    Split a bulk upload into valid row DTOs and per-row error results.
+
+    Each row is validated on its own so one bad row does not reject the whole upload.
+    """
+    if isinstance(data, dict):
+        data = data.get(key)
+    if not isinstance(data, list):
+        raise ValidationError(required_message)
+
+    rows, rejected = [], []
+    for index, item in enumerate(data, start=1):
+        serializer = serializer_class(data=item)
+        if serializer.is_valid():
+            rows.append(row_class(row=index, **serializer.validated_data))
+            continue
+        errors = serializer.errors
+        rejected.append(result_class(
+            row=index,
+            status=BulkRowStatus.ERROR.value,
+            errors=[
+                str(message) if name == ValidationFields.NON_FIELD_ERRORS.value else f"{name}: {message}"
+                for name, messages in (errors.items() if isinstance(errors, dict) else [])
+                for message in messages
+            ],
+        ))
+    return rows, rejected
+
+
+class CourseGradebookView(NestedHierarchyMixin, APIView):
+    """
+    Students × homeworks grade matrix of a course, for its teachers.
+
+    - GET /courses/{course_pk}/gradebook/ - JSON, paginated over students; ``homeworks`` lists the columns
+    - GET /courses/{course_pk}/gradebook/?export=csv - the whole matrix as a streamed CSV download
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+    pagination_class = CustomPageNumberPagination
+    hierarchy_url_kwargs = {
+        ModelFields.COURSE.value: URLPatterns.COURSE_PK.value,
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.gradebook_service: GradebookService = GradebookManagementService()
+
+    def get(self, request, *args, **kwargs):
+        course = self.hierarchy.course
+        columns = self.gradebook_service.columns(course=course, user=request.user)
+
+        export = request.query_params.get(QueryParams.EXPORT.value)
+        if export is not None:
+            return self._export(course, columns, export)
+
+        paginator = self.pagination_class()
+        students = paginator.paginate_queryset(self.gradebook_service.students(course), request, view=self)
+        rows = self.gradebook_service.rows(course=course, columns=columns, students=students)
+        response = paginator.get_paginated_response(GradebookRowSerializer(rows, many=True).data)
+        response.data[ResponseKeys.HOMEWORKS.value] = GradebookColumnSerializer(columns, many=True).data
+        return response
+
+    def _export(self, course, columns, export: str):
+        if export != ExportFormats.CSV.value:
+            raise ValidationError(ErrorMessages.UNSUPPORTED_EXPORT_FORMAT.value.format(format=export))
+        filename = f"{slugify(course.name) or course.id}-{URLPatterns.GRADEBOOK.value}.{ExportFormats.CSV.value}"
+        return streaming_csv_response(self.gradebook_service.iter_csv_rows(course=course, columns=columns), filename)
+
+
+class SubmissionSimilarityView(NestedHierarchyMixin, APIView):
+    """
+    Near-duplicate submissions of a homework (teachers of the course).
+
+    - GET /courses/{course_pk}/lectures/{lecture_pk}/homeworks/{homework_pk}/similarity/?scope=homework|courses&threshold=0.8
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+    hierarchy_url_kwargs = {
+        ModelFields.COURSE.value: URLPatterns.COURSE_PK.value,
+        ModelFields.LECTURE.value: URLPatterns.LECTURE_PK.value,
+        ModelFields.HOMEWORK.value: URLPatterns.HOMEWORK.value,
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.similarity_service: SimilarityService = SubmissionSimilarityService()
+
+    def get(self, request, *args, **kwargs):
+        filters = SimilarityFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        report = self.similarity_service.report(
+            homework=self.hierarchy.homework,
+            user=request.user,
+            scope=filters.validated_data[QueryParams.SCOPE.value],
+            threshold=filters.validated_data.get(QueryParams.THRESHOLD.value, settings.SUBMISSION_SIMILARITY_THRESHOLD),
+        )
+        return Response(SimilarityReportSerializer(report).data, status=HttpStatus.OK.value)
+
+
+class GradeStatisticsView(NestedHierarchyMixin, APIView):
+    """
+    Grade distribution (mean, median, stddev, percentiles, histogram) for the course's teachers.
+
+    - GET /courses/{course_pk}/statistics/
+    - GET /courses/{course_pk}/lectures/{lecture_pk}/statistics/
+    - GET /courses/{course_pk}/lectures/{lecture_pk}/homeworks/{homework_pk}/statistics/
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+    hierarchy_url_kwargs = {
+        ModelFields.COURSE.value: URLPatterns.COURSE_PK.value,
+        ModelFields.LECTURE.value: URLPatterns.LECTURE_PK.value,
+        ModelFields.HOMEWORK.value: URLPatterns.HOMEWORK.value,
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.statistics_service: GradeStatisticsService = GradeStatisticsManagementService()
+
+    def get(self, request, *args, **kwargs):
+        result = self.statistics_service.statistics(hierarchy=self.hierarchy, user=request.user)
+        return Response(GradeStatisticsSerializer(result).data, status=HttpStatus.OK.value)
+
+
+class StudentHomeworkView(APIView):
+    """
+    The requesting student's homework across all enrolled courses, soonest due first.
+
+    - GET /me/homeworks/?status=pending|submitted|graded&due_before=<datetime>&cursor=<cursor>
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+    pagination_class = DueDateCursorPagination
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.student_homework_service: StudentHomeworkService = StudentHomeworkManagementService()
+
+    def get(self, request, *args, **kwargs):
+        filters = StudentHomeworkFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        homeworks = self.student_homework_service.homeworks(user=request.user, **filters.validated_data)
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(homeworks, request, view=self)
+        return paginator.get_paginated_response(StudentHomeworkSerializer(page, many=True).data)
+
+
+class GradingQueueView(APIView):
+    """
+    Submitted but ungraded work across every course the requesting teacher owns or teaches, oldest first.
+
+    - GET /me/grading-queue/?cursor=<cursor> - ``courses`` carries the number waiting in each course
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+    pagination_class = SubmissionAgeCursorPagination
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.grading_queue_service: GradingQueueService = GradingQueueManagementService()
+
+    def get(self, request, *args, **kwargs):
+        submissions = self.grading_queue_service.submissions(user=request.user)
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(submissions, request, view=self)
+        response = paginator.get_paginated_response(GradingQueueItemSerializer(page, many=True).data)
+        counts = self.grading_queue_service.course_counts(user=request.user)
+        response.data[ResponseKeys.COURSES.value] = GradingQueueCourseSerializer(counts, many=True).data
+        return response
@@ -0,0 +1,21 @@
+from apps.monitoring.benchmarks.baseline import Regression, compare
+from apps.monitoring.benchmarks.cases import CASES, BenchmarkCase, BenchmarkContext
+from apps.monitoring.benchmarks.datasets import PROFILES, BenchmarkFixtures, DatasetProfile, seed_dataset
+from apps.monitoring.benchmarks.measure import CaseResult, measure
+from apps.monitoring.benchmarks.runner import BenchmarkReport, BenchmarkRunner
+
+__all__ = [
+    "BenchmarkCase",
+    "BenchmarkContext",
+    "BenchmarkFixtures",
+    "BenchmarkReport",
+    "BenchmarkRunner",
+    "CASES",
+    "CaseResult",
+    "DatasetProfile",
+    "PROFILES",
+    "Regression",
+    "compare",
+    "measure",
+    "seed_dataset",
+]
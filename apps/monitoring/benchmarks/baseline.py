@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+# Relative metrics also need an absolute change this large, so timer noise on sub-millisecond cases is ignored
+RELATIVE_METRICS = {"p50_ms": 2.0, "p99_ms": 5.0, "peak_memory_kb": 64.0}
+# Any increase in these is a regression: they do not vary between runs on the same dataset
+EXACT_METRICS = ("queries",)
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A case metric that got worse than the baseline allows"""
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        return f"{self.case}: {self.metric} {self.baseline} -> {self.current}"
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[Regression]:
+    """
+    Regressions of ``current`` against ``baseline`` (both ``BenchmarkReport.as_dict`` output).
+
+    Latency and memory may grow by ``tolerance`` (0.2 = 20%) before they
+    count; query counts may not grow at all. Cases only one side has are
+    skipped, so adding or removing a case never fails a comparison.
+    """
+    regressions = []
+    for name, result in current["cases"].items():
+        reference = baseline["cases"].get(name)
+        if reference is None:
+            continue
+        for metric, floor in RELATIVE_METRICS.items():
+            limit = max(reference[metric] * (1 + tolerance), reference[metric] + floor)
+            if result[metric] > limit:
+                regressions.append(Regression(name, metric, reference[metric], result[metric]))
+        for metric in EXACT_METRICS:
+            if result[metric] > reference[metric]:
+                regressions.append(Regression(name, metric, reference[metric], result[metric]))
+    return regressions
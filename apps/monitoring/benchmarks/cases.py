@@ -0,0 +1,320 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from string import Formatter
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.courses.models import Course
+from apps.courses.serializers import CourseListSerializer
+from apps.homeworks.models import GradeComment, Homework, HomeworkGrade, HomeworkSubmission
+from apps.homeworks.serializers import (
+    GradebookRowSerializer,
+    GradeCommentSerializer,
+    HomeworkGradeSerializer,
+    HomeworkSerializer,
+    HomeworkSubmissionListSerializer,
+)
+from apps.homeworks.services.dashboard import GradingQueueManagementService, StudentHomeworkManagementService
+from apps.homeworks.services.gradebook import GradebookManagementService
+from apps.homeworks.services.homework.services import HomeworkManagementService
+from apps.homeworks.services.shared.hierarchy import HierarchyResolver
+from apps.homeworks.services.shared.ownership_guard import HomeworkOwnershipGuardImpl
+from apps.homeworks.services.similarity import SubmissionSimilarityService
+from apps.homeworks.services.statistics import GradeStatisticsManagementService
+from apps.homeworks.services.submission.services import SubmissionManagementService
+from apps.monitoring.benchmarks.datasets import BENCHMARK_PASSWORD, URL_FIXTURES, BenchmarkFixtures
+from apps.users.services.authentication import AuthTokenService
+from common.enums import AuthHeaders, BenchmarkKinds, ModelFields, StatisticsScope, TokenFields, UserFields
+
+User = get_user_model()
+
+API_PREFIX = "/api/"
+COURSE = "courses/{course}/"
+LECTURE = COURSE + "lectures/{lecture}/"
+HOMEWORK = LECTURE + "homeworks/{homework}/"
+SUBMISSION = HOMEWORK + "submissions/{submission}/"
+GRADE = SUBMISSION + "grades/{grade}/"
+PAGE = 100
+ERROR_STATUS = 400
+LOOKUP_SEPARATOR = "__"
+LOGIN_ITERATIONS = 5
+
+
+class BenchmarkError(Exception):
+    """A case could not run against the seeded dataset"""
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    One measured operation.
+
+    ``prepare`` runs once, untimed, and returns the callable that is timed;
+    anything it loads is outside the measurement. Cases that write run each
+    iteration in a rolled-back transaction. ``needs`` names the fixture ids
+    the case addresses; it is skipped when the dataset left any of them out.
+    """
+    name: str
+    kind: str
+    prepare: Callable[["BenchmarkContext"], Callable[[], Any]]
+    writes: bool = False
+    max_iterations: Optional[int] = None
+    needs: tuple[str, ...] = ()
+
+
+class BenchmarkContext:
+    """The seeded fixtures plus one authenticated API client per user"""
+
+    def __init__(self, fixtures: BenchmarkFixtures):
+        self.fixtures = fixtures
+        self._users: dict[int, Any] = {}
+        self._clients: dict[Optional[int], APIClient] = {}
+
+    def user(self, user_id: int):
+        if user_id not in self._users:
+            self._users[user_id] = User.objects.get(id=user_id)
+        return self._users[user_id]
+
+    def client(self, user_id: Optional[int]) -> APIClient:
+        """A client sending a real access token, so authentication and the blacklist check are measured too"""
+        if user_id not in self._clients:
+            client = APIClient()
+            if user_id is not None:
+                token = AuthTokenService.generate_tokens_for_user(self.user(user_id))[TokenFields.ACCESS_SHORT.value]
+                client.credentials(**{AuthHeaders.AUTH_HEADER_FALLBACK.value: f"{AuthHeaders.BEARER_PREFIX.value}{token}"})
+            self._clients[user_id] = client
+        return self._clients[user_id]
+
+
+def endpoint(name: str, method: str, path: str, *, as_user: Optional[str] = "teacher_id",
+             payload: Optional[Callable[[BenchmarkFixtures], Any]] = None, writes: bool = False,
+             max_iterations: Optional[int] = None, needs: tuple[str, ...] = ()) -> BenchmarkCase:
+    """
+    A request through the full middleware, authentication and view stack; ``as_user`` names a fixture field.
+
+    The ids in ``path`` are needed implicitly; ``needs`` adds the ones only the payload uses.
+    """
+    placeholders = [field_name for _, field_name, _, _ in Formatter().parse(path) if field_name]
+    needs = (*(URL_FIXTURES[placeholder] for placeholder in placeholders), *needs)
+
+    def prepare(context: BenchmarkContext):
+        fixtures = context.fixtures
+        client = context.client(getattr(fixtures, as_user) if as_user else None)
+        url = API_PREFIX + path.format(**fixtures.urls())
+        data = payload(fixtures) if payload else None
+        send = getattr(client, method)
+
+        def call():
+            response = send(url, data, format="json") if data is not None else send(url)
+            if response.status_code >= ERROR_STATUS:
+                raise BenchmarkError(f"{name}: {method.upper()} {url} returned {response.status_code}")
+            if response.streaming:
+                for _ in response.streaming_content:
+                    pass
+            return response
+
+        return call
+
+    return BenchmarkCase(name=name, kind=BenchmarkKinds.ENDPOINT.value, prepare=prepare, writes=writes,
+                         max_iterations=max_iterations, needs=needs)
+
+
+def service(name: str, prepare: Callable[[BenchmarkContext], Callable[[], Any]],
+            needs: tuple[str, ...] = ()) -> BenchmarkCase:
+    return BenchmarkCase(name=name, kind=BenchmarkKinds.SERVICE.value, prepare=prepare, needs=needs)
+
+
+def serializer(name: str, serializer_class, load: Callable[[BenchmarkContext], Any],
+               needs: tuple[str, ...] = ()) -> BenchmarkCase:
+    """Serialization of already loaded objects; the loading query is part of ``prepare``"""
+
+    def prepare(context: BenchmarkContext):
+        instances = load(context)
+        return lambda: serializer_class(instances, many=True).data
+
+    return BenchmarkCase(name=name, kind=BenchmarkKinds.SERIALIZER.value, prepare=prepare, needs=needs)
+
+
+def _path(*fields: ModelFields) -> str:
+    return LOOKUP_SEPARATOR.join(field.value for field in fields)
+
+
+def _due_date() -> str:
+    return (timezone.now() + timedelta(days=7)).isoformat()
+
+
+def _homework_payload(fixtures: BenchmarkFixtures) -> dict:
+    return {"title": "Benchmark homework", "description": "Write-path benchmark", "due_date": _due_date()}
+
+
+def _bulk_homework_payload(fixtures: BenchmarkFixtures) -> list:
+    return [
+        {"lecture_id": lecture_id, "title": f"Weekly {number}", "description": "Bulk benchmark", "due_date": _due_date()}
+        for lecture_id in (fixtures.lecture_id, fixtures.second_lecture_id)
+        for number in range(10)
+    ]
+
+
+def _bulk_grade_payload(fixtures: BenchmarkFixtures) -> list:
+    return [
+        {"submission_id": fixtures.ungraded_submission_id, "grade": 75},
+        {"submission_id": fixtures.submission_id, "grade": 90, "comments": "Regraded"},
+    ]
+
+
+def _login_payload(fixtures: BenchmarkFixtures) -> dict:
+    teacher = User.objects.get(id=fixtures.teacher_id)
+    return {UserFields.EMAIL.value: teacher.email, UserFields.PASSWORD.value: BENCHMARK_PASSWORD}
+
+
+def _ownership_guard(context: BenchmarkContext):
+    homework = (
+        Homework.objects
+        .select_related(_path(ModelFields.LECTURE, ModelFields.COURSE))
+        .get(id=context.fixtures.homework_id)
+    )
+    # The co-teacher is neither the creator nor the owner, so the guard has to query the roster
+    co_teacher = context.user(context.fixtures.co_teacher_id)
+    guard = HomeworkOwnershipGuardImpl()
+    return lambda: guard.ensure_owner(homework, co_teacher)
+
+
+def _hierarchy(context: BenchmarkContext):
+    fixtures = context.fixtures
+    ids = {
+        ModelFields.COURSE.value: fixtures.course_id,
+        ModelFields.LECTURE.value: fixtures.lecture_id,
+        ModelFields.HOMEWORK.value: fixtures.homework_id,
+        ModelFields.SUBMISSION.value: fixtures.submission_id,
+        ModelFields.GRADE.value: fixtures.grade_id,
+    }
+    resolver = HierarchyResolver()
+    return lambda: resolver.resolve(ids)
+
+
+def _gradebook_rows(context: BenchmarkContext):
+    gradebook = GradebookManagementService()
+    course = Course.objects.get(id=context.fixtures.course_id)
+    columns = gradebook.columns(course=course, user=context.user(context.fixtures.teacher_id))
+    students = list(gradebook.students(course)[:PAGE])
+    return lambda: gradebook.rows(course=course, columns=columns, students=students)
+
+
+def _course_grades(context: BenchmarkContext):
+    return lambda: GradeStatisticsManagementService.grades(StatisticsScope.COURSE, context.fixtures.course_id)
+
+
+def _student_homeworks(context: BenchmarkContext):
+    student = context.user(context.fixtures.student_id)
+    dashboard = StudentHomeworkManagementService()
+    return lambda: list(dashboard.homeworks(user=student)[:PAGE])
+
+
+def _grading_queue(context: BenchmarkContext):
+    teacher = context.user(context.fixtures.teacher_id)
+    queue = GradingQueueManagementService()
+    return lambda: list(queue.submissions(user=teacher)[:PAGE])
+
+
+def _similar_pairs(context: BenchmarkContext):
+    similarity = SubmissionSimilarityService()
+    homework = Homework.objects.get(id=context.fixtures.homework_id)
+    similarity.index(HomeworkSubmission.objects.filter(homework=homework))
+    return lambda: similarity.find_pairs(homework, threshold=settings.SUBMISSION_SIMILARITY_THRESHOLD)
+
+
+def _courses(context: BenchmarkContext):
+    teacher = context.user(context.fixtures.teacher_id)
+    return list(Course.objects.filter(primary_owner=teacher).select_related(ModelFields.PRIMARY_OWNER.value)[:PAGE])
+
+
+def _homeworks(context: BenchmarkContext):
+    return list(HomeworkManagementService().get_homeworks_for_lecture(lecture_id=context.fixtures.lecture_id)[:PAGE])
+
+
+def _submissions(context: BenchmarkContext):
+    queryset = SubmissionManagementService().get_filtered_submissions(
+        homework_id=context.fixtures.homework_id, user=context.user(context.fixtures.teacher_id),
+    )
+    return list(queryset.without_content()[:PAGE])
+
+
+def _grades(context: BenchmarkContext):
+    return list(
+        HomeworkGrade.objects
+        .filter(**{_path(ModelFields.SUBMISSION, ModelFields.HOMEWORK, ModelFields.ID): context.fixtures.homework_id})
+        .select_related(_path(ModelFields.SUBMISSION, ModelFields.STUDENT), ModelFields.GRADED_BY.value)
+        .defer(_path(ModelFields.SUBMISSION, ModelFields.INLINE_CONTENT))[:PAGE]
+    )
+
+
+def _gradebook_row_objects(context: BenchmarkContext):
+    return _gradebook_rows(context)()
+
+
+def _comments(context: BenchmarkContext):
+    homework_id = _path(ModelFields.GRADE, ModelFields.SUBMISSION, ModelFields.HOMEWORK, ModelFields.ID)
+    return list(
+        GradeComment.objects
+        .filter(**{homework_id: context.fixtures.homework_id})
+        .select_related(ModelFields.AUTHOR.value)[:PAGE]
+    )
+
+
+CASES = [
+    # Endpoints: authentication
+    endpoint("LoginView.post", "post", "auth/login/", as_user=None, payload=_login_payload, writes=True,
+             max_iterations=LOGIN_ITERATIONS),
+    # Endpoints: reads
+    endpoint("CourseViewSet.list", "get", "courses/"),
+    endpoint("CourseViewSet.retrieve", "get", COURSE),
+    endpoint("LectureViewSet.list", "get", COURSE + "lectures/"),
+    endpoint("LectureViewSet.retrieve", "get", LECTURE),
+    endpoint("HomeworkViewSet.list", "get", LECTURE + "homeworks/"),
+    endpoint("HomeworkSubmissionViewSet.list", "get", HOMEWORK + "submissions/"),
+    endpoint("HomeworkSubmissionViewSet.retrieve", "get", SUBMISSION),
+    endpoint("HomeworkSubmissionExportView.get", "get", HOMEWORK + "submissions/export/?export=csv"),
+    endpoint("SubmissionRevisionView.get", "get", SUBMISSION + "revisions/"),
+    endpoint("SubmissionSimilarityView.get", "get", HOMEWORK + "similarity/"),
+    endpoint("HomeworkGradeViewSet.list", "get", SUBMISSION + "grades/"),
+    endpoint("HomeworkGradeViewSet.list_comments", "get", GRADE + "comments/"),
+    endpoint("CourseGradebookView.get", "get", COURSE + "gradebook/"),
+    endpoint("GradeStatisticsView.get", "get", COURSE + "statistics/"),
+    endpoint("StudentHomeworkView.get", "get", "me/homeworks/", as_user="student_id"),
+    endpoint("GradingQueueView.get", "get", "me/grading-queue/"),
+    endpoint("NotificationListView.get", "get", "me/notifications/", as_user="student_id"),
+    endpoint("RequestMetricsView.get", "get", "metrics/", as_user="staff_id"),
+    # Endpoints: writes, each rolled back
+    endpoint("HomeworkViewSet.create", "post", LECTURE + "homeworks/", payload=_homework_payload, writes=True),
+    endpoint("CourseBulkHomeworkView.post", "post", COURSE + "homeworks/bulk/", payload=_bulk_homework_payload,
+             writes=True, needs=("lecture_id", "second_lecture_id")),
+    endpoint("HomeworkSubmissionViewSet.create", "post", HOMEWORK + "submissions/", as_user="fresh_student_id",
+             payload=lambda fixtures: {"content": "Benchmark answer " * 20}, writes=True),
+    endpoint("HomeworkGradeViewSet.create", "post", HOMEWORK + "submissions/{ungraded}/grades/",
+             payload=lambda fixtures: {"grade": 88, "comments": "Benchmark"}, writes=True),
+    endpoint("HomeworkGradeViewSet.create_comment", "post", GRADE + "comments/",
+             payload=lambda fixtures: {"comment": "Benchmark comment"}, writes=True),
+    endpoint("HomeworkBulkGradeView.post", "post", HOMEWORK + "grades/bulk/", payload=_bulk_grade_payload,
+             writes=True, needs=("submission_id", "ungraded_submission_id")),
+    # Services
+    service("HomeworkOwnershipGuardImpl.ensure_owner", _ownership_guard, needs=("homework_id",)),
+    service("HierarchyResolver.resolve", _hierarchy,
+            needs=("lecture_id", "homework_id", "submission_id", "grade_id")),
+    service("GradebookManagementService.rows", _gradebook_rows),
+    service("GradeStatisticsManagementService.grades", _course_grades),
+    service("StudentHomeworkManagementService.homeworks", _student_homeworks),
+    service("GradingQueueManagementService.submissions", _grading_queue),
+    service("SubmissionSimilarityService.find_pairs", _similar_pairs, needs=("homework_id",)),
+    # Serializers
+    serializer("CourseListSerializer", CourseListSerializer, _courses),
+    serializer("HomeworkSerializer", HomeworkSerializer, _homeworks, needs=("lecture_id",)),
+    serializer("HomeworkSubmissionListSerializer", HomeworkSubmissionListSerializer, _submissions,
+               needs=("homework_id",)),
+    serializer("HomeworkGradeSerializer", HomeworkGradeSerializer, _grades, needs=("homework_id",)),
+    serializer("GradeCommentSerializer", GradeCommentSerializer, _comments, needs=("homework_id",)),
+    serializer("GradebookRowSerializer", GradebookRowSerializer, _gradebook_row_objects),
+]
@@ -0,0 +1,380 @@
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from decimal import Decimal
+from multiprocessing import get_context
+from typing import Callable, Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+from django.utils import timezone
+
+from apps.courses.models import Course, CourseStudent, CourseTeacher, Lecture
+from apps.homeworks.models import GradeComment, Homework, HomeworkGrade, HomeworkSubmission, SubmissionContent
+from apps.monitoring import seed_workers
+from common.compression import compress_text
+from common.enums import DatasetProfiles, ModelFields, UserRole
+
+User = get_user_model()
+
+BENCHMARK_PASSWORD = "benchmark-pass-123"
+DEFAULT_NAMESPACE = "bench"
+ID = ModelFields.ID.value
+BATCH_SIZE = 5000
+COURSES_PER_CHUNK = 100
+PLACEHOLDER_PDF = b"%%PDF-1.4\n%% placeholder %d\n%%%%EOF\n"
+# URL placeholder -> the fixture id it is filled with
+URL_FIXTURES = {
+    "course": "course_id",
+    "lecture": "lecture_id",
+    "homework": "homework_id",
+    "submission": "submission_id",
+    "grade": "grade_id",
+    "ungraded": "ungraded_submission_id",
+}
+WORDS = (
+    "array", "loop", "index", "query", "cache", "thread", "lock", "stack", "heap", "graph", "tree", "hash",
+    "sort", "merge", "split", "parse", "token", "vector", "matrix", "buffer", "stream", "socket", "proof",
+)
+
+
+@dataclass(frozen=True)
+class DatasetProfile:
+    """
+    Shape of a generated dataset; course 0 is the target the benchmark cases run against.
+
+    Rosters hold ``roster_size`` students give or take ``roster_spread``
+    (0.5 = anywhere from half to one and a half times). Grades follow a
+    triangular distribution between ``grade_low`` and ``grade_high`` peaking
+    at ``grade_mode``; answers are ``answer_words`` words give or take half.
+    """
+    courses: int
+    teachers: int
+    students: int
+    lectures_per_course: int
+    homeworks_per_lecture: int
+    roster_size: int
+    target_roster_size: int
+    submission_rate: float
+    graded_rate: float
+    comments_per_grade: int
+    roster_spread: float = 0.0
+    grade_low: float = 40.0
+    grade_high: float = 100.0
+    grade_mode: float = 85.0
+    answer_words: int = 50
+    placeholder_files: int = 4
+
+    def errors(self) -> list[str]:
+        """What makes the profile impossible to seed; empty when it can be written"""
+        errors = []
+        if self.courses < 1 or self.teachers < 1 or self.target_roster_size < 1:
+            errors.append("Courses, teachers and the target roster need at least one row each")
+        counts = ("students", "lectures_per_course", "homeworks_per_lecture", "roster_size", "comments_per_grade")
+        errors += [f"{name} cannot be negative" for name in counts if getattr(self, name) < 0]
+        rates = ("submission_rate", "graded_rate")
+        errors += [f"{name} must be between 0 and 1" for name in rates if not 0 <= getattr(self, name) <= 1]
+        if self.roster_spread < 0:
+            errors.append("roster_spread cannot be negative")
+        if not self.grade_low <= self.grade_mode <= self.grade_high:
+            errors.append("grade_mode must lie between grade_low and grade_high")
+        if self.answer_words < 1:
+            errors.append("answer_words needs at least one word")
+        return errors
+
+
+PROFILES = {
+    DatasetProfiles.SMOKE.value: DatasetProfile(
+        courses=5, teachers=3, students=60, lectures_per_course=2, homeworks_per_lecture=1,
+        roster_size=10, target_roster_size=30, submission_rate=0.9, graded_rate=0.7, comments_per_grade=1,
+    ),
+    DatasetProfiles.MEDIUM.value: DatasetProfile(
+        courses=500, teachers=200, students=5000, lectures_per_course=4, homeworks_per_lecture=1,
+        roster_size=25, target_roster_size=1000, submission_rate=0.85, graded_rate=0.7, comments_per_grade=1,
+        roster_spread=0.5,
+    ),
+    # 10k courses, ~1M submissions and a 5k-student target roster
+    DatasetProfiles.LARGE.value: DatasetProfile(
+        courses=10000, teachers=2000, students=50000, lectures_per_course=4, homeworks_per_lecture=1,
+        roster_size=25, target_roster_size=5000, submission_rate=1.0, graded_rate=0.7, comments_per_grade=1,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkFixtures:
+    """
+    Ids of the rows the benchmark cases address.
+
+    A profile without lectures, homeworks, submissions or grades leaves the
+    ids it could not fill as None; the cases that need them are skipped.
+    """
+    teacher_id: int
+    co_teacher_id: int
+    student_id: int
+    fresh_student_id: int
+    staff_id: int
+    course_id: int
+    lecture_id: Optional[int]
+    second_lecture_id: Optional[int]
+    homework_id: Optional[int]
+    submission_id: Optional[int]
+    grade_id: Optional[int]
+    ungraded_submission_id: Optional[int]
+
+    def urls(self) -> dict:
+        return {placeholder: getattr(self, name) for placeholder, name in URL_FIXTURES.items()}
+
+    def missing(self, names) -> list[str]:
+        return [name for name in names if getattr(self, name) is None]
+
+
+@dataclass(frozen=True)
+class SeededUsers:
+    teachers: list[int]
+    students: list[int]
+    staff_id: int
+
+
+class DatasetSeeder:
+    """
+    Writes a profile's rows with ``bulk_create`` in batches, one transaction per chunk of courses.
+
+    Each chunk draws from its own generator seeded with ``seed`` and the
+    chunk's position, so a profile and seed build the same rows whichever
+    worker writes the chunk. Users share one precomputed password hash and
+    lectures share a few placeholder presentation blobs. In the target
+    course the last enrolled student never submits, so write cases always
+    have a student who can.
+    """
+
+    def __init__(self, profile: DatasetProfile, seed: int = 0, *, batch_size: int = BATCH_SIZE,
+                 namespace: str = DEFAULT_NAMESPACE):
+        self.profile = profile
+        self.seed_value = seed
+        self.batch_size = batch_size
+        self.namespace = namespace
+        self.now = timezone.now()
+
+    def seed(self, workers: int = 1, progress: Optional[Callable[[Counter], None]] = None) -> BenchmarkFixtures:
+        """
+        Write the whole dataset and return the target course's fixtures.
+
+        The chunk holding the target course is written first and in this
+        process, so on an empty database it gets the lowest ids. With
+        ``workers`` > 1 the other chunks are written by that many processes,
+        each with its own connection; that needs a database that accepts
+        concurrent writers.
+        """
+        users = self.seed_users()
+        blobs = self.seed_placeholders()
+        if progress is not None:
+            progress(Counter({User._meta.label: len(users.teachers) + len(users.students) + 1}))
+        starts = range(0, self.profile.courses, COURSES_PER_CHUNK)
+        target_course_id, rows = self.seed_chunk(starts[0], users, blobs)
+        if progress is not None:
+            progress(rows)
+
+        if workers > 1:
+            # Children open their own connections; an inherited one must not be shared
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=get_context("spawn"),
+                initializer=seed_workers.start,
+                # Only plain values cross over: the child cannot import models before django.setup()
+                initargs=(asdict(self.profile), self.seed_value, self.batch_size, self.namespace, asdict(users), blobs),
+            ) as pool:
+                for _, rows in pool.map(seed_workers.seed_chunk, starts[1:]):
+                    if progress is not None:
+                        progress(rows)
+        else:
+            for start in starts[1:]:
+                _, rows = self.seed_chunk(start, users, blobs)
+                if progress is not None:
+                    progress(rows)
+        return self._fixtures(target_course_id, users)
+
+    @transaction.atomic
+    def seed_users(self) -> SeededUsers:
+        password = make_password(BENCHMARK_PASSWORD)
+        teachers = self._users(UserRole.TEACHER, self.profile.teachers, password)
+        students = self._users(UserRole.STUDENT, max(self.profile.students, self.profile.target_roster_size), password)
+        staff = User.objects.create(
+            email=f"staff@{self.namespace}.local", password=password, role=UserRole.TEACHER.value, is_staff=True,
+        )
+        return SeededUsers(teachers=teachers, students=students, staff_id=staff.id)
+
+    def seed_placeholders(self) -> list[str]:
+        """Small distinct presentation files; content-addressed storage keeps one blob per content"""
+        storage = Lecture._meta.get_field(ModelFields.PRESENTATION.value).storage
+        return [
+            storage.save(f"placeholder-{number}.pdf", ContentFile(PLACEHOLDER_PDF % number))
+            for number in range(max(self.profile.placeholder_files, 1))
+        ]
+
+    def _users(self, role: UserRole, count: int, password: str) -> list[int]:
+        users = User.objects.bulk_create(
+            [
+                User(email=f"{role.value}{index}@{self.namespace}.local", password=password, role=role.value)
+                for index in range(count)
+            ],
+            batch_size=self.batch_size,
+        )
+        return [user.id for user in users]
+
+    @transaction.atomic
+    def seed_chunk(self, start: int, users: SeededUsers, blobs: list[str]) -> tuple[Optional[int], Counter]:
+        """Write the courses from ``start`` on with everything in them; returns the target course id (chunk 0 only)"""
+        profile = self.profile
+        rng = random.Random(f"{self.seed_value}:{start}")
+        teachers, students = users.teachers, users.students
+        indexes = range(start, min(start + COURSES_PER_CHUNK, profile.courses))
+        rows = Counter()
+
+        courses = Course.objects.bulk_create([
+            Course(name=f"Course {index}", description="Generated course", primary_owner_id=teachers[index % len(teachers)])
+            for index in indexes
+        ])
+        target_id = courses[0].id if start == 0 else None
+
+        teaching, rosters = [], {}
+        for course in courses:
+            teaching.append(CourseTeacher(course_id=course.id, user_id=course.primary_owner_id))
+            if course.id == target_id:
+                teaching.append(CourseTeacher(course_id=course.id, user_id=teachers[1 % len(teachers)]))
+                rosters[course.id] = students[:profile.target_roster_size]
+            else:
+                rosters[course.id] = rng.sample(students, self._roster_size(rng, len(students)))
+        rows[CourseTeacher] += len(CourseTeacher.objects.bulk_create(
+            teaching, batch_size=self.batch_size, ignore_conflicts=True,
+        ))
+        rows[CourseStudent] += len(CourseStudent.objects.bulk_create(
+            [CourseStudent(course_id=course_id, user_id=user_id) for course_id, roster in rosters.items() for user_id in roster],
+            batch_size=self.batch_size,
+        ))
+
+        lectures = Lecture.objects.bulk_create([
+            Lecture(course_id=course.id, topic=f"Lecture {number}", presentation=rng.choice(blobs))
+            for course in courses
+            for number in range(profile.lectures_per_course)
+        ], batch_size=self.batch_size)
+        owners = {course.id: course.primary_owner_id for course in courses}
+        homeworks = Homework.objects.bulk_create([
+            Homework(
+                lecture_id=lecture.id,
+                title=f"Homework {number}",
+                description="Generated homework",
+                due_date=self.now + timedelta(days=rng.randint(-30, 30)),
+                created_by_id=owners[lecture.course_id],
+            )
+            for lecture in lectures
+            for number in range(profile.homeworks_per_lecture)
+        ], batch_size=self.batch_size)
+        rows.update({Course: len(courses), Lecture: len(lectures), Homework: len(homeworks)})
+
+        course_of = {lecture.id: lecture.course_id for lecture in lectures}
+        graders = {homework.id: owners[course_of[homework.lecture_id]] for homework in homeworks}
+        pending = []
+        for homework in homeworks:
+            roster = rosters[course_of[homework.lecture_id]]
+            if course_of[homework.lecture_id] == target_id:
+                roster = roster[:-1]
+            for student_id in roster:
+                if rng.random() < profile.submission_rate:
+                    pending.append(HomeworkSubmission(
+                        homework_id=homework.id, student_id=student_id, content=self._answer(rng),
+                    ))
+            if len(pending) >= self.batch_size:
+                rows += self._seed_submissions(rng, pending, graders)
+                pending = []
+        rows += self._seed_submissions(rng, pending, graders)
+        return target_id, Counter({model._meta.label: count for model, count in rows.items()})
+
+    def _seed_submissions(self, rng: random.Random, pending: list, graders: dict) -> Counter:
+        if not pending:
+            return Counter()
+        profile = self.profile
+        submissions = HomeworkSubmission.objects.bulk_create(pending, batch_size=self.batch_size)
+        # bulk_create skips save(), which is what stores large bodies compressed
+        bodies = SubmissionContent.objects.bulk_create([
+            SubmissionContent(submission_id=submission.id, data=compress_text(submission.content))
+            for submission in submissions
+            if submission.content_compressed
+        ], batch_size=self.batch_size)
+
+        grades = HomeworkGrade.objects.bulk_create([
+            HomeworkGrade(
+                submission_id=submission.id,
+                grade=Decimal(str(round(rng.triangular(profile.grade_low, profile.grade_high, profile.grade_mode), 2))),
+                comments="Generated feedback",
+                graded_by_id=graders[submission.homework_id],
+            )
+            for submission in submissions
+            if rng.random() < profile.graded_rate
+        ], batch_size=self.batch_size)
+        comments = GradeComment.objects.bulk_create([
+            GradeComment(grade_id=grade.id, author_id=grade.graded_by_id, comment=f"Comment {number}")
+            for grade in grades
+            for number in range(profile.comments_per_grade)
+        ], batch_size=self.batch_size)
+        return Counter({
+            HomeworkSubmission: len(submissions),
+            SubmissionContent: len(bodies),
+            HomeworkGrade: len(grades),
+            GradeComment: len(comments),
+        })
+
+    def _roster_size(self, rng: random.Random, available: int) -> int:
+        spread = self.profile.roster_size * self.profile.roster_spread
+        size = rng.randint(round(self.profile.roster_size - spread), round(self.profile.roster_size + spread))
+        return max(0, min(size, available))
+
+    def _answer(self, rng: random.Random) -> str:
+        words = self.profile.answer_words
+        return " ".join(rng.choices(WORDS, k=rng.randint(max(words // 2, 1), words + words // 2)))
+
+    def _fixtures(self, course_id: int, users: SeededUsers) -> BenchmarkFixtures:
+        lectures = list(Lecture.objects.filter(course_id=course_id).order_by(ID).values_list(ID, flat=True)[:2])
+        homework_id = (
+            Homework.objects.filter(lecture_id__in=lectures[:1]).order_by(ID).values_list(ID, flat=True).first()
+        )
+        graded = ungraded = None
+        if homework_id is not None:
+            submission = ModelFields.SUBMISSION.value
+            graded = (
+                HomeworkGrade.objects
+                .filter(**{f"{submission}__{ModelFields.HOMEWORK.value}_id": homework_id})
+                .order_by(ID)
+                .values_list(ID, f"{submission}_id", f"{submission}__{ModelFields.STUDENT.value}_id")
+                .first()
+            )
+            ungraded = (
+                HomeworkSubmission.objects
+                .filter(homework_id=homework_id, **{f"{ModelFields.GRADE.value}__isnull": True})
+                .order_by(ID)
+                .values_list(ID, flat=True)
+                .first()
+            )
+        grade_id, submission_id, student_id = graded or (None, None, users.students[0])
+        return BenchmarkFixtures(
+            teacher_id=users.teachers[0],
+            co_teacher_id=users.teachers[1 % len(users.teachers)],
+            student_id=student_id,
+            fresh_student_id=users.students[self.profile.target_roster_size - 1],
+            staff_id=users.staff_id,
+            course_id=course_id,
+            lecture_id=lectures[0] if lectures else None,
+            second_lecture_id=lectures[-1] if lectures else None,
+            homework_id=homework_id,
+            submission_id=submission_id,
+            grade_id=grade_id,
+            ungraded_submission_id=ungraded,
+        )
+
+def seed_dataset(profile: DatasetProfile, seed: int = 0) -> BenchmarkFixtures:
+    return DatasetSeeder(profile, seed).seed()
@@ -0,0 +1,82 @@
+import math
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from django.db import transaction
+
+from common.metrics import record_queries
+
+MS = 1000
+KB = 1024
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    """Latency, query and memory figures of one benchmark case"""
+    name: str
+    kind: str
+    iterations: int
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    queries: int
+    peak_memory_kb: float
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of ``samples``"""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(q * len(ordered)), 1) - 1]
+
+
+def run_once(call: Callable[[], Any], writes: bool) -> Any:
+    """Run one iteration; writes happen in a transaction that is rolled back, so every iteration sees the same data"""
+    if not writes:
+        return call()
+    with transaction.atomic():
+        result = call()
+        transaction.set_rollback(True)
+    return result
+
+
+def measure(name: str, kind: str, call: Callable[[], Any], *, iterations: int, warmup: int,
+            writes: bool = False) -> CaseResult:
+    """
+    Time ``call`` ``iterations`` times after ``warmup`` untimed runs.
+
+    Queries are counted on one extra run, so a warm cache is part of the
+    figure. Memory is the tracemalloc peak of one more run, kept apart from
+    the timed runs because tracing slows every allocation down.
+    """
+    for _ in range(warmup):
+        run_once(call, writes)
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run_once(call, writes)
+        samples.append((time.perf_counter() - start) * MS)
+
+    with record_queries() as queries:
+        run_once(call, writes)
+
+    tracemalloc.start()
+    try:
+        run_once(call, writes)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return CaseResult(
+        name=name,
+        kind=kind,
+        iterations=iterations,
+        p50_ms=round(percentile(samples, 0.5), 3),
+        p99_ms=round(percentile(samples, 0.99), 3),
+        mean_ms=round(statistics.fmean(samples), 3),
+        queries=queries.count,
+        peak_memory_kb=round(peak / KB, 1),
+    )
@@ -0,0 +1,88 @@
+import platform
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+import django
+from django.db import connection
+from django.utils import timezone
+
+from apps.monitoring.benchmarks.cases import CASES, BenchmarkCase, BenchmarkContext
+from apps.monitoring.benchmarks.datasets import PROFILES, seed_dataset
+from apps.monitoring.benchmarks.measure import CaseResult, measure
+
+
+@dataclass(frozen=True)
+class BenchmarkReport:
+    """One run of the suite; ``as_dict`` is the JSON written to disk and compared against a baseline"""
+    profile: str
+    seed: int
+    iterations: int
+    seed_seconds: float
+    results: list[CaseResult] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {
+            "profile": self.profile,
+            "seed": self.seed,
+            "iterations": self.iterations,
+            "seed_seconds": self.seed_seconds,
+            "created_at": timezone.now().isoformat(),
+            "environment": {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "machine": platform.machine(),
+            },
+            "cases": {result.name: {key: value for key, value in asdict(result).items() if key != "name"}
+                      for result in self.results},
+            "skipped": self.skipped,
+        }
+
+
+@dataclass
+class BenchmarkRunner:
+    """
+    Seeds a dataset profile and measures every selected case against it.
+
+    The runner writes to whatever database is current; the ``run_benchmarks``
+    command points it at a throwaway test database first.
+    """
+    profile: str
+    seed: int = 0
+    iterations: int = 20
+    warmup: int = 3
+    only: Optional[list[str]] = None
+    cases: list[BenchmarkCase] = field(default_factory=lambda: list(CASES))
+
+    def run(self, progress=None) -> BenchmarkReport:
+        started = time.perf_counter()
+        context = BenchmarkContext(seed_dataset(PROFILES[self.profile], self.seed))
+        seed_seconds = round(time.perf_counter() - started, 2)
+        results, skipped = self.measure_cases(context, progress)
+        return BenchmarkReport(
+            profile=self.profile, seed=self.seed, iterations=self.iterations, seed_seconds=seed_seconds,
+            results=results, skipped=skipped,
+        )
+
+    def measure_cases(self, context: BenchmarkContext, progress=None) -> tuple[list[CaseResult], list[str]]:
+        """Measure the selected cases against seeded fixtures; cases whose rows the dataset lacks are skipped"""
+        results, skipped = [], []
+        for case in self.selected():
+            if context.fixtures.missing(case.needs):
+                skipped.append(case.name)
+                continue
+            call = case.prepare(context)
+            iterations = min(self.iterations, case.max_iterations or self.iterations)
+            result = measure(case.name, case.kind, call, iterations=iterations,
+                             warmup=min(self.warmup, iterations), writes=case.writes)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+        return results, skipped
+
+    def selected(self) -> list[BenchmarkCase]:
+        if not self.only:
+            return list(self.cases)
+        return [case for case in self.cases if any(pattern in case.name for pattern in self.only)]
@@ -0,0 +1,19 @@
+from apps.monitoring.loadtest.client import AsyncHttpClient, HttpError, HttpResponse
+from apps.monitoring.loadtest.journeys import JOURNEYS, Accounts, JourneyAborted, Session
+from apps.monitoring.loadtest.runner import LoadTest
+from apps.monitoring.loadtest.stats import JourneySummary, LoadRecorder, LoadReport, StepSummary
+
+__all__ = [
+    "Accounts",
+    "AsyncHttpClient",
+    "HttpError",
+    "HttpResponse",
+    "JOURNEYS",
+    "JourneyAborted",
+    "JourneySummary",
+    "LoadRecorder",
+    "LoadReport",
+    "LoadTest",
+    "Session",
+    "StepSummary",
+]
@@ -0,0 +1,132 @@
+import asyncio
+import json
+import ssl
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from common.enums import AuthHeaders
+
+HTTPS = "https"
+DEFAULT_PORTS = {"http": 80, HTTPS: 443}
+CRLF = b"\r\n"
+HEADER_END = b"\r\n\r\n"
+CHUNKED = "chunked"
+CLOSE = "close"
+JSON_TYPE = "application/json"
+BODILESS_STATUSES = (204, 304)
+
+
+class HttpError(Exception):
+    """The server closed the connection or sent something that is not an HTTP/1.1 response"""
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+
+class AsyncHttpClient:
+    """
+    Minimal HTTP/1.1 client on asyncio streams, keeping one connection alive per instance.
+
+    One client stands for one user agent: requests are sent one after the
+    other on the same connection, which is reopened when the server closes
+    it. Only what the API needs is supported: JSON bodies, bearer tokens,
+    Content-Length and chunked responses.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or DEFAULT_PORTS[parts.scheme]
+        self.ssl = ssl.create_default_context() if parts.scheme == HTTPS else None
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.token: Optional[str] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, payload: Any = None) -> HttpResponse:
+        body = b"" if payload is None else json.dumps(payload).encode()
+        reused = self._writer is not None
+        try:
+            return await asyncio.wait_for(self._exchange(method, path, body), self.timeout)
+        except (ConnectionError, asyncio.IncompleteReadError, HttpError):
+            await self.close()
+            if not reused:
+                raise
+        # A kept-alive connection the server had already dropped: retry once on a fresh one
+        return await asyncio.wait_for(self._exchange(method, path, body), self.timeout)
+
+    async def close(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _exchange(self, method: str, path: str, body: bytes) -> HttpResponse:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+        headers = {
+            "Host": f"{self.host}:{self.port}",
+            "Accept": JSON_TYPE,
+            "Content-Length": str(len(body)),
+        }
+        if body:
+            headers["Content-Type"] = JSON_TYPE
+        if self.token:
+            headers[AuthHeaders.AUTH_HEADER.value] = f"{AuthHeaders.BEARER_PREFIX.value}{self.token}"
+        head = f"{method} {self.prefix}{path} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+        self._writer.write(head.encode() + CRLF + body)
+        await self._writer.drain()
+
+        response = await self._read_response()
+        if response.headers.get("connection", "").lower() == CLOSE:
+            await self.close()
+        return response
+
+    async def _read_response(self) -> HttpResponse:
+        head = await self._reader.readuntil(HEADER_END)
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        try:
+            status = int(status_line.split(" ", 2)[1])
+        except (IndexError, ValueError):
+            raise HttpError(f"Malformed status line {status_line!r}")
+        headers = {}
+        for line in header_lines:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        if status in BODILESS_STATUSES:
+            body = b""
+        elif headers.get("transfer-encoding", "").lower() == CHUNKED:
+            body = await self._read_chunked()
+        elif "content-length" in headers:
+            body = await self._reader.readexactly(int(headers["content-length"]))
+        else:
+            # No length: the body runs until the server closes the connection
+            body = await self._reader.read()
+            headers["connection"] = CLOSE
+        return HttpResponse(status=status, headers=headers, body=body)
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self._reader.readuntil(CRLF)).split(b";")[0], 16)
+            if size == 0:
+                # Skip any trailer fields up to the blank line ending the message
+                while await self._reader.readuntil(CRLF) != CRLF:
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readexactly(len(CRLF))
@@ -0,0 +1,153 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from apps.monitoring.loadtest.client import AsyncHttpClient, HttpError, HttpResponse
+from apps.monitoring.loadtest.stats import LoadRecorder
+from common.enums import (
+    HomeworkProgress,
+    HttpStatus,
+    LoadJourneys,
+    LoadSteps,
+    ModelFields,
+    PaginationFields,
+    ResponseKeys,
+    SerializerFields,
+    TokenFields,
+    UserFields,
+    UserRole,
+)
+
+MS = 1000
+LOGIN = "/api/auth/login/"
+LOGOUT = "/api/auth/logout/"
+COURSES = "/api/courses/"
+MY_HOMEWORKS = "/api/me/homeworks/?page_size={page}"
+GRADING_QUEUE = "/api/me/grading-queue/?page_size={page}"
+HOMEWORK = "/api/courses/{course_id}/lectures/{lecture_id}/homeworks/{id}/"
+PAGE = 50
+# Tokens of a logged-out user are refused by DenyBlacklistedToken
+REJECTED = (HttpStatus.UNAUTHORIZED.value, HttpStatus.FORBIDDEN.value)
+NETWORK_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, HttpError)
+
+
+class JourneyAborted(Exception):
+    """A step failed, so the rest of the journey cannot run"""
+
+
+@dataclass(frozen=True)
+class Accounts:
+    """The users ``seed_data`` created: ``<role><n>@<namespace>.local`` sharing one password"""
+    namespace: str
+    password: str
+    teachers: int
+    students: int
+
+    def pick(self, role: UserRole, rng: random.Random) -> str:
+        count = self.teachers if role == UserRole.TEACHER else self.students
+        return f"{role.value}{rng.randrange(count)}@{self.namespace}.local"
+
+
+class Session:
+    """One virtual user working through a journey on its own connection"""
+
+    def __init__(self, journey: str, client: AsyncHttpClient, recorder: LoadRecorder, rng: random.Random,
+                 accounts: Accounts, batch_size: int):
+        self.journey = journey
+        self.client = client
+        self.recorder = recorder
+        self.rng = rng
+        self.accounts = accounts
+        self.batch_size = batch_size
+
+    async def call(self, step: LoadSteps, method: str, path: str, payload=None,
+                   expect=(HttpStatus.OK.value,)) -> HttpResponse:
+        """Send one request and record it; any status outside ``expect`` ends the journey"""
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, payload)
+        except NETWORK_ERRORS as exc:
+            self.recorder.request(self.journey, step.value, (time.perf_counter() - started) * MS, type(exc).__name__)
+            raise JourneyAborted(step.value) from exc
+        error = None if response.status in expect else str(response.status)
+        self.recorder.request(self.journey, step.value, (time.perf_counter() - started) * MS, error)
+        if error is not None:
+            raise JourneyAborted(step.value)
+        return response
+
+    async def login(self, role: UserRole) -> dict:
+        response = await self.call(LoadSteps.LOGIN, "POST", LOGIN, {
+            UserFields.EMAIL.value: self.accounts.pick(role, self.rng),
+            UserFields.PASSWORD.value: self.accounts.password,
+        })
+        tokens = response.json()[ResponseKeys.TOKENS.value]
+        self.client.token = tokens[TokenFields.ACCESS_SHORT.value]
+        return tokens
+
+
+async def browse_courses(session: Session) -> None:
+    await session.login(UserRole.STUDENT)
+    await session.call(LoadSteps.LIST_COURSES, "GET", COURSES)
+
+
+async def submit_homework(session: Session) -> None:
+    """Hand in a pending homework, or rework a submission awaiting its grade when nothing is pending"""
+    await session.login(UserRole.STUDENT)
+    response = await session.call(LoadSteps.MY_HOMEWORKS, "GET", MY_HOMEWORKS.format(page=PAGE))
+    homeworks = response.json()[PaginationFields.RESULTS.value]
+    answer = {ModelFields.CONTENT.value: f"Load test answer {session.rng.random()} " * 10}
+    by_status = {}
+    for homework in homeworks:
+        by_status.setdefault(homework[ResponseKeys.STATUS.value], []).append(homework)
+
+    if by_status.get(HomeworkProgress.PENDING.value):
+        homework = session.rng.choice(by_status[HomeworkProgress.PENDING.value])
+        await session.call(LoadSteps.SUBMIT, "POST", HOMEWORK.format(**homework) + "submissions/", answer,
+                           expect=(HttpStatus.CREATED.value,))
+    elif by_status.get(HomeworkProgress.SUBMITTED.value):
+        homework = session.rng.choice(by_status[HomeworkProgress.SUBMITTED.value])
+        path = HOMEWORK.format(**homework) + f"submissions/{homework[SerializerFields.SUBMISSION_ID.value]}/"
+        await session.call(LoadSteps.RESUBMIT, "PATCH", path, answer)
+
+
+async def grade_batch(session: Session) -> None:
+    """Grade the oldest waiting submissions of one homework from the teacher's queue in one bulk request"""
+    await session.login(UserRole.TEACHER)
+    response = await session.call(LoadSteps.GRADING_QUEUE, "GET", GRADING_QUEUE.format(page=session.batch_size))
+    queue = response.json()[PaginationFields.RESULTS.value]
+    if not queue:
+        return
+    first = queue[0]
+    rows = [
+        {
+            SerializerFields.SUBMISSION_ID.value: item[ModelFields.ID.value],
+            ModelFields.GRADE.value: session.rng.randint(50, 100),
+        }
+        for item in queue
+        if item[SerializerFields.HOMEWORK_ID.value] == first[SerializerFields.HOMEWORK_ID.value]
+    ]
+    path = HOMEWORK.format(
+        course_id=first[SerializerFields.COURSE_ID.value], lecture_id=first[SerializerFields.LECTURE_ID.value],
+        id=first[SerializerFields.HOMEWORK_ID.value],
+    )
+    await session.call(LoadSteps.BULK_GRADE, "POST", path + "grades/bulk/", rows)
+
+
+async def logout_storm(session: Session) -> None:
+    """Log in and straight out again, then check the access token is refused"""
+    tokens = await session.login(session.rng.choice((UserRole.STUDENT, UserRole.TEACHER)))
+    await session.call(LoadSteps.LOGOUT, "POST", LOGOUT, {
+        TokenFields.REFRESH.value: tokens[TokenFields.REFRESH_SHORT.value],
+        TokenFields.ACCESS.value: tokens[TokenFields.ACCESS_SHORT.value],
+    })
+    await session.call(LoadSteps.AFTER_LOGOUT, "GET", COURSES, expect=REJECTED)
+
+
+JOURNEYS: dict[str, Callable[[Session], Awaitable[None]]] = {
+    LoadJourneys.BROWSE_COURSES.value: browse_courses,
+    LoadJourneys.SUBMIT_HOMEWORK.value: submit_homework,
+    LoadJourneys.GRADE_BATCH.value: grade_batch,
+    LoadJourneys.LOGOUT_STORM.value: logout_storm,
+}
@@ -0,0 +1,89 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from apps.monitoring.loadtest.client import AsyncHttpClient
+from apps.monitoring.loadtest.journeys import JOURNEYS, Accounts, JourneyAborted, Session
+from apps.monitoring.loadtest.stats import LoadRecorder, LoadReport
+from common.enums import JourneyOutcomes
+
+
+@dataclass
+class LoadTest:
+    """
+    Runs weighted journeys against a live server until ``duration`` or ``max_journeys`` is reached.
+
+    Without ``rate`` the load is a closed loop: ``concurrency`` virtual users
+    each start their next journey as soon as the last one ends. With
+    ``rate`` journeys arrive as a Poisson process of that many per second,
+    however fast the server answers. Arrivals that find all ``concurrency``
+    slots busy are dropped and counted, which is what an overloaded server
+    looks like from outside. Every journey opens its own connection.
+    """
+    base_url: str
+    accounts: Accounts
+    mix: dict[str, float]
+    concurrency: int = 10
+    rate: Optional[float] = None
+    duration: float = 30.0
+    max_journeys: Optional[int] = None
+    batch_size: int = 20
+    timeout: float = 10.0
+    seed: int = 0
+
+    async def run(self) -> LoadReport:
+        recorder = LoadRecorder()
+        started = time.perf_counter()
+        self._deadline = started + self.duration
+        self._started = 0
+        if self.rate is None:
+            await asyncio.gather(*(self._virtual_user(index, recorder) for index in range(self.concurrency)))
+        else:
+            await self._arrivals(recorder)
+        return recorder.report(time.perf_counter() - started)
+
+    async def _virtual_user(self, index: int, recorder: LoadRecorder) -> None:
+        rng = random.Random(f"{self.seed}:{index}")
+        while self._take():
+            await self._journey(rng, recorder)
+
+    async def _arrivals(self, recorder: LoadRecorder) -> None:
+        rng = random.Random(self.seed)
+        slots = asyncio.Semaphore(self.concurrency)
+        running = set()
+        while True:
+            await asyncio.sleep(rng.expovariate(self.rate))
+            if not self._take():
+                break
+            if slots.locked():
+                recorder.dropped += 1
+                continue
+            await slots.acquire()
+            task = asyncio.create_task(self._journey(random.Random(rng.random()), recorder))
+            running.add(task)
+            task.add_done_callback(running.discard)
+            task.add_done_callback(lambda _: slots.release())
+        await asyncio.gather(*running)
+
+    def _take(self) -> bool:
+        if time.perf_counter() >= self._deadline:
+            return False
+        if self.max_journeys is not None and self._started >= self.max_journeys:
+            return False
+        self._started += 1
+        return True
+
+    async def _journey(self, rng: random.Random, recorder: LoadRecorder) -> None:
+        name = rng.choices(list(self.mix), weights=list(self.mix.values()))[0]
+        client = AsyncHttpClient(self.base_url, timeout=self.timeout)
+        session = Session(name, client, recorder, rng, self.accounts, self.batch_size)
+        recorder.journey(name, JourneyOutcomes.STARTED.value)
+        try:
+            await JOURNEYS[name](session)
+            recorder.journey(name, JourneyOutcomes.COMPLETED.value)
+        except JourneyAborted:
+            recorder.journey(name, JourneyOutcomes.FAILED.value)
+        finally:
+            await client.close()
@@ -0,0 +1,102 @@
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from apps.monitoring.benchmarks.measure import percentile
+from common.enums import JourneyOutcomes
+
+
+@dataclass(frozen=True)
+class StepSummary:
+    """Throughput, latency percentiles and errors of one journey step over a run"""
+    requests: int
+    errors: int
+    error_rate: float
+    throughput_rps: float
+    p50_ms: Optional[float]
+    p95_ms: Optional[float]
+    p99_ms: Optional[float]
+    max_ms: Optional[float]
+    errors_by_kind: dict[str, int]
+
+
+@dataclass(frozen=True)
+class JourneySummary:
+    started: int
+    completed: int
+    failed: int
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    elapsed_s: float
+    dropped_arrivals: int
+    journeys: dict[str, JourneySummary]
+    steps: dict[str, StepSummary]
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class StepStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+
+    def summary(self, elapsed_s: float) -> StepSummary:
+        requests = len(self.latencies_ms)
+        errors = sum(self.errors.values())
+
+        def quantile(q):
+            return round(percentile(self.latencies_ms, q), 2) if requests else None
+
+        return StepSummary(
+            requests=requests,
+            errors=errors,
+            error_rate=round(errors / requests, 4) if requests else 0.0,
+            throughput_rps=round(requests / elapsed_s, 2) if elapsed_s else 0.0,
+            p50_ms=quantile(0.5),
+            p95_ms=quantile(0.95),
+            p99_ms=quantile(0.99),
+            max_ms=round(max(self.latencies_ms), 2) if requests else None,
+            errors_by_kind=dict(self.errors),
+        )
+
+
+class LoadRecorder:
+    """
+    Collects every request and journey outcome of a load run.
+
+    Steps are keyed ``<journey>.<step>``, so a login under a logout storm is
+    reported apart from one before browsing. An error is the response
+    status, or the exception name when no response came back.
+    """
+
+    def __init__(self):
+        self.steps: dict[str, StepStats] = {}
+        self.journeys: dict[str, Counter] = {}
+        self.dropped = 0
+
+    def request(self, journey: str, step: str, latency_ms: float, error: Optional[str] = None) -> None:
+        stats = self.steps.setdefault(f"{journey}.{step}", StepStats())
+        stats.latencies_ms.append(latency_ms)
+        if error is not None:
+            stats.errors[error] += 1
+
+    def journey(self, journey: str, outcome: str) -> None:
+        self.journeys.setdefault(journey, Counter())[outcome] += 1
+
+    def report(self, elapsed_s: float) -> LoadReport:
+        return LoadReport(
+            elapsed_s=round(elapsed_s, 2),
+            dropped_arrivals=self.dropped,
+            journeys={
+                name: JourneySummary(
+                    started=outcomes[JourneyOutcomes.STARTED.value],
+                    completed=outcomes[JourneyOutcomes.COMPLETED.value],
+                    failed=outcomes[JourneyOutcomes.FAILED.value],
+                )
+                for name, outcomes in sorted(self.journeys.items())
+            },
+            steps={name: stats.summary(elapsed_s) for name, stats in sorted(self.steps.items())},
+        )
@@ -0,0 +1,101 @@
+import asyncio
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.monitoring.benchmarks.datasets import BENCHMARK_PASSWORD, PROFILES
+from apps.monitoring.loadtest import JOURNEYS, Accounts, LoadTest
+from common.enums import DatasetProfiles
+
+WEIGHT_SEPARATOR = "="
+
+
+class Command(BaseCommand):
+    help = "Drive a running server's HTTP API with scripted user journeys and report every step's latency and errors"
+
+    def add_arguments(self, parser):
+        seeded = PROFILES[DatasetProfiles.MEDIUM.value]
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument(
+            "--journey",
+            action="append",
+            default=[],
+            help=f"NAME or NAME=WEIGHT (repeatable); every journey equally when omitted. One of: {', '.join(JOURNEYS)}",
+        )
+        parser.add_argument("--concurrency", type=int, default=10, help="Virtual users, or open-model slots")
+        parser.add_argument(
+            "--rate",
+            type=float,
+            help="Journeys started per second (Poisson arrivals); a closed loop of --concurrency users when omitted",
+        )
+        parser.add_argument("--duration", type=float, default=30.0, help="Seconds to generate load for")
+        parser.add_argument("--max-journeys", type=int, help="Stop after starting this many journeys")
+        parser.add_argument("--namespace", default="seed", help="The --namespace the accounts were seeded with")
+        parser.add_argument("--teachers", type=int, default=seeded.teachers, help="Seeded teacher accounts to use")
+        parser.add_argument("--students", type=int, default=seeded.students, help="Seeded student accounts to use")
+        parser.add_argument("--password", default=BENCHMARK_PASSWORD)
+        parser.add_argument("--batch-size", type=int, default=20, help="Submissions a teacher grades per batch")
+        parser.add_argument("--timeout", type=float, default=10.0, help="Seconds before a request counts as failed")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", help="Also write the report as JSON to this file")
+        parser.add_argument(
+            "--max-error-rate",
+            type=float,
+            help="Fail when any step's error rate is above this (0.01 = 1%%)",
+        )
+
+    def handle(self, *args, **options):
+        load_test = LoadTest(
+            base_url=options["base_url"],
+            accounts=Accounts(
+                namespace=options["namespace"],
+                password=options["password"],
+                teachers=options["teachers"],
+                students=options["students"],
+            ),
+            mix=self.mix(options["journey"]),
+            concurrency=options["concurrency"],
+            rate=options["rate"],
+            duration=options["duration"],
+            max_journeys=options["max_journeys"],
+            batch_size=options["batch_size"],
+            timeout=options["timeout"],
+            seed=options["seed"],
+        )
+        report = asyncio.run(load_test.run())
+
+        self.stdout.write(f"{'step':<36} {'requests':>8} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+                          f"{'p99 ms':>9} {'errors':>7}")
+        for name, step in report.steps.items():
+            self.stdout.write(
+                f"{name:<36} {step.requests:>8} {step.throughput_rps:>8.1f} {step.p50_ms:>9.1f} {step.p95_ms:>9.1f} "
+                f"{step.p99_ms:>9.1f} {step.error_rate:>7.1%}"
+                + (f"  {step.errors_by_kind}" if step.errors else "")
+            )
+        for name, journey in report.journeys.items():
+            self.stdout.write(f"{name}: {journey.completed}/{journey.started} completed, {journey.failed} failed")
+        if report.dropped_arrivals:
+            self.stdout.write(self.style.WARNING(f"{report.dropped_arrivals} arrivals dropped: every slot was busy"))
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(report.as_dict(), indent=2))
+
+        limit = options["max_error_rate"]
+        failing = [name for name, step in report.steps.items() if limit is not None and step.error_rate > limit]
+        if failing:
+            raise CommandError(f"Error rate above {limit:.1%} in: {', '.join(failing)}")
+
+    @staticmethod
+    def mix(journeys: list[str]) -> dict[str, float]:
+        if not journeys:
+            return {name: 1.0 for name in JOURNEYS}
+        mix = {}
+        for entry in journeys:
+            name, _, weight = entry.partition(WEIGHT_SEPARATOR)
+            if name not in JOURNEYS:
+                raise CommandError(f"Unknown journey {name!r}; choose from {', '.join(JOURNEYS)}")
+            try:
+                mix[name] = float(weight) if weight else 1.0
+            except ValueError:
+                raise CommandError(f"Weight of {name!r} must be a number")
+        return mix
@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from apps.monitoring.benchmarks import PROFILES, BenchmarkRunner, compare
+from common.enums import DatasetProfiles
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a dataset profile into a throwaway test database, benchmark endpoints, services and serializers "
+        "against it and compare the results with a baseline"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profile", choices=sorted(PROFILES), default=DatasetProfiles.SMOKE.value)
+        parser.add_argument("--seed", type=int, default=0, help="Dataset seed; the same seed builds the same data")
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument(
+            "--only",
+            action="append",
+            default=[],
+            help="Run only cases whose name contains this text (repeatable)",
+        )
+        parser.add_argument("--output", default="benchmark-results.json", help="Where to write the JSON results")
+        parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="Allowed relative latency and memory growth over the baseline (0.2 = 20%%)",
+        )
+
+    def handle(self, *args, **options):
+        baseline = json.loads(Path(options["baseline"]).read_text()) if options["baseline"] else None
+        runner = BenchmarkRunner(
+            profile=options["profile"],
+            seed=options["seed"],
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+            only=options["only"],
+        )
+
+        setup_test_environment()
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            report = runner.run(progress=self.write_result).as_dict()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        Path(options["output"]).write_text(json.dumps(report, indent=2))
+        self.stdout.write(f"Seeded {options['profile']} in {report['seed_seconds']} s, results in {options['output']}")
+        if report["skipped"]:
+            self.stdout.write(f"Skipped, the dataset has no rows for them: {', '.join(report['skipped'])}")
+        if baseline is None:
+            return
+        if baseline["profile"] != report["profile"]:
+            raise CommandError(f"Baseline is for the {baseline['profile']} profile, not {report['profile']}")
+
+        regressions = compare(report, baseline, options["tolerance"])
+        for regression in regressions:
+            self.stderr.write(str(regression))
+        if regressions:
+            raise CommandError(f"{len(regressions)} regressions against {options['baseline']}")
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline"))
+
+    def write_result(self, result):
+        self.stdout.write(
+            f"{result.name:<50} p50 {result.p50_ms:>9.2f} ms  p99 {result.p99_ms:>9.2f} ms  "
+            f"{result.queries:>4} queries  {result.peak_memory_kb:>9.1f} KB"
+        )
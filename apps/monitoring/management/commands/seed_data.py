@@ -0,0 +1,91 @@
+import time
+from collections import Counter
+from dataclasses import fields, replace
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.monitoring.benchmarks.datasets import (
+    BATCH_SIZE,
+    BENCHMARK_PASSWORD,
+    PROFILES,
+    DatasetProfile,
+    DatasetSeeder,
+)
+from common.enums import DatasetProfiles, UserFields
+
+User = get_user_model()
+
+SQLITE = "sqlite"
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic dataset (users, courses, rosters, lectures, homeworks, submissions, grades, comments) "
+        "with bulk inserts into the configured database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profile",
+            choices=sorted(PROFILES),
+            default=DatasetProfiles.MEDIUM.value,
+            help="Base profile; every value can be overridden with the options below",
+        )
+        for profile_field in fields(DatasetProfile):
+            parser.add_argument(f"--{profile_field.name.replace('_', '-')}", type=profile_field.type)
+        parser.add_argument("--seed", type=int, default=0, help="The same seed and profile build the same data")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Rows per INSERT")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes writing course chunks in parallel (not on SQLite, which has a single writer)",
+        )
+        parser.add_argument(
+            "--namespace",
+            default="seed",
+            help="User e-mails end in @<namespace>.local; use a new one to seed the same database again",
+        )
+
+    def handle(self, *args, **options):
+        overrides = {
+            profile_field.name: options[profile_field.name]
+            for profile_field in fields(DatasetProfile)
+            if options[profile_field.name] is not None
+        }
+        profile = replace(PROFILES[options["profile"]], **overrides)
+        errors = profile.errors()
+        if errors:
+            raise CommandError("; ".join(errors))
+        if options["workers"] > 1 and connection.vendor == SQLITE:
+            raise CommandError("SQLite allows one writer at a time; use --workers 1")
+        domain = f"@{options['namespace']}.local"
+        if User.objects.filter(**{f"{UserFields.EMAIL.value}__endswith": domain}).exists():
+            raise CommandError(f"Users ending in {domain} already exist; pick another --namespace")
+
+        seeder = DatasetSeeder(
+            profile, options["seed"], batch_size=options["batch_size"], namespace=options["namespace"],
+        )
+        totals = Counter()
+        started = time.perf_counter()
+
+        def report(rows):
+            totals.update(rows)
+            if options["verbosity"] > 1:
+                self.stdout.write(f"{sum(totals.values())} rows after {time.perf_counter() - started:.1f} s")
+
+        fixtures = seeder.seed(workers=options["workers"], progress=report)
+        elapsed = time.perf_counter() - started
+
+        for label, count in sorted(totals.items()):
+            self.stdout.write(f"{label:<32} {count:>10}")
+        total = sum(totals.values())
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {total} rows in {elapsed:.1f} s, {total / elapsed:.0f} rows/s"
+        ))
+        self.stdout.write(
+            f"Users sign in with password {BENCHMARK_PASSWORD!r}; the target course is {fixtures.course_id}, "
+            f"taught by teacher0{domain}"
+        )
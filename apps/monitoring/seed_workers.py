@@ -0,0 +1,23 @@
+"""
+Entry points of ``DatasetSeeder`` worker processes.
+
+Workers are spawned, so they start without Django set up: this module must
+not import models at import time, and everything handed over is plain data.
+"""
+import django
+
+_worker = None
+
+
+def start(profile: dict, seed: int, batch_size: int, namespace: str, users: dict, blobs: list[str]) -> None:
+    global _worker
+    django.setup()
+    from apps.monitoring.benchmarks.datasets import DatasetProfile, DatasetSeeder, SeededUsers
+
+    seeder = DatasetSeeder(DatasetProfile(**profile), seed, batch_size=batch_size, namespace=namespace)
+    _worker = (seeder, SeededUsers(**users), blobs)
+
+
+def seed_chunk(start_index: int):
+    seeder, users, blobs = _worker
+    return seeder.seed_chunk(start_index, users, blobs)
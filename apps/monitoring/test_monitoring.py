@@ -0,0 +1,202 @@
+import asyncio
+import logging
+from dataclasses import replace
+from io import StringIO
+
+import pytest
+pytestmark = pytest.mark.django_db
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from apps.courses.models import Course, Lecture
+from apps.homeworks.models import Homework, HomeworkGrade
+from apps.monitoring.benchmarks import PROFILES, BenchmarkContext, BenchmarkRunner, compare
+from apps.monitoring.benchmarks.datasets import BENCHMARK_PASSWORD, DatasetSeeder
+from apps.monitoring.loadtest import JOURNEYS, Accounts, LoadTest
+from common.enums import BenchmarkKinds, DatasetProfiles, UserRole
+from common.metrics import Histogram, registry
+
+
+User = get_user_model()
+METRICS_URL = "/api/metrics/"
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+@pytest.fixture
+def teacher(db):
+    return User.objects.create_user(email="teacher@example.com", password="x", role=UserRole.TEACHER.value)
+
+
+@pytest.fixture
+def staff(db):
+    return User.objects.create_user(email="ops@example.com", password="x", role=UserRole.TEACHER.value, is_staff=True)
+
+
+@pytest.fixture
+def lecture(db, teacher):
+    course = Course.objects.create(name="C1", description="Desc", primary_owner=teacher)
+    course.teachers.add(teacher)
+    lecture = Lecture.objects.create(course=course, topic="L1", presentation="p.pdf")
+    Homework.objects.create(lecture=lecture, title="HW1", description="D", due_date="2030-01-01T00:00:00Z", created_by=teacher)
+    return lecture
+
+
+def homeworks_url(lecture):
+    return f"/api/courses/{lecture.course_id}/lectures/{lecture.id}/homeworks/"
+
+
+def test_requests_are_measured_per_view_and_action(api_client, teacher, staff, lecture, django_assert_num_queries):
+    api_client.force_authenticate(teacher)
+    with django_assert_num_queries(4):
+        assert api_client.get(homeworks_url(lecture)).status_code == status.HTTP_200_OK
+    api_client.get(homeworks_url(lecture))
+    api_client.get("/api/no-such-endpoint/")
+
+    assert api_client.get(METRICS_URL).status_code == status.HTTP_403_FORBIDDEN
+    api_client.force_authenticate(staff)
+    resp = api_client.get(METRICS_URL)
+    assert resp.status_code == status.HTTP_200_OK
+
+    endpoints = resp.data["endpoints"]
+    assert "HomeworkViewSet.list" in endpoints and "RequestMetricsView.get" in endpoints
+    listing = endpoints["HomeworkViewSet.list"]
+    assert listing["requests"] == 2 and listing["over_budget"] == 0
+    assert listing["queries"]["max"] == 4
+    assert listing["response_bytes"]["count"] == 2 and listing["response_bytes"]["min"] > 0
+    assert listing["serialization_time_ms"]["sum"] > 0
+
+    assert api_client.delete(METRICS_URL).status_code == status.HTTP_204_NO_CONTENT
+    assert list(registry.snapshot()) == ["RequestMetricsView.delete"]
+
+
+def test_requests_over_their_query_budget_are_logged(api_client, settings, teacher, lecture, caplog):
+    settings.REQUEST_METRICS_QUERY_BUDGETS = {"HomeworkViewSet.list": 1}
+    api_client.force_authenticate(teacher)
+    with caplog.at_level(logging.WARNING, logger="common.middleware"):
+        api_client.get(homeworks_url(lecture))
+    assert [record.endpoint for record in caplog.records] == ["HomeworkViewSet.list"]
+    assert registry.snapshot()["HomeworkViewSet.list"]["over_budget"] == 1
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    histogram = Histogram((1, 5, 10))
+    for value in (0, 1, 3, 4, 7, 50):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == 5
+    assert histogram.quantile(0.99) == 50
+    assert [bucket["count"] for bucket in histogram.snapshot()["buckets"]] == [2, 2, 1, 1]
+
+
+def test_benchmark_suite_runs_on_smoke_profile_and_flags_regressions(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    report = BenchmarkRunner(profile=DatasetProfiles.SMOKE.value, iterations=1, warmup=0).run().as_dict()
+
+    cases = report["cases"]
+    assert {case["kind"] for case in cases.values()} == {kind.value for kind in BenchmarkKinds}
+    for name, case in cases.items():
+        if case["kind"] == BenchmarkKinds.ENDPOINT.value:
+            budget = settings.REQUEST_METRICS_QUERY_BUDGETS.get(name, settings.REQUEST_METRICS_DEFAULT_QUERY_BUDGET)
+            assert case["queries"] <= budget, name
+
+    assert compare(report, report, tolerance=0.2) == []
+    baseline = {"cases": {"HomeworkViewSet.list": {**cases["HomeworkViewSet.list"], "queries": 1}}}
+    assert [(r.case, r.metric) for r in compare(report, baseline, tolerance=0.2)] == [("HomeworkViewSet.list", "queries")]
+
+
+def test_seed_data_is_deterministic_per_seed(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    options = {"profile": DatasetProfiles.SMOKE.value, "courses": 120, "roster_size": 4, "grade_mode": 60, "seed": 7}
+    call_command("seed_data", namespace="first", stdout=StringIO(), **options)
+    call_command("seed_data", namespace="second", stdout=StringIO(), **options)
+
+    def grades(namespace):
+        return list(
+            HomeworkGrade.objects.filter(graded_by__email__endswith=f"@{namespace}.local").order_by("id")
+            .values_list("grade", flat=True)
+        )
+
+    assert grades("first") and grades("first") == grades("second")
+    assert Course.objects.count() == 240
+    with pytest.raises(CommandError):
+        call_command("seed_data", namespace="first", stdout=StringIO(), **options)
+
+
+@pytest.mark.parametrize("overrides, skipped", [
+    ({"graded_rate": 0}, {"HomeworkGradeViewSet.list_comments", "HierarchyResolver.resolve"}),
+    ({"submission_rate": 0}, {"HomeworkSubmissionViewSet.retrieve", "HomeworkGradeViewSet.create"}),
+    ({"target_roster_size": 1}, {"HomeworkBulkGradeView.post", "SubmissionRevisionView.get"}),
+    ({"lectures_per_course": 0}, {"LectureViewSet.retrieve", "HomeworkSerializer", "CourseBulkHomeworkView.post"}),
+])
+def test_benchmarks_skip_cases_the_dataset_has_no_rows_for(settings, tmp_path, overrides, skipped):
+    settings.MEDIA_ROOT = tmp_path
+    profile = replace(PROFILES[DatasetProfiles.SMOKE.value], courses=2, **overrides)
+    fixtures = DatasetSeeder(profile, namespace="sparse").seed()
+
+    results, skipped_cases = BenchmarkRunner(profile=DatasetProfiles.SMOKE.value, iterations=1, warmup=0).measure_cases(
+        BenchmarkContext(fixtures)
+    )
+    assert skipped <= set(skipped_cases)
+    assert {"CourseViewSet.retrieve", "CourseGradebookView.get"} <= {result.name for result in results}
+
+
+def test_seed_data_rejects_an_impossible_profile_before_writing(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    with pytest.raises(CommandError, match="graded_rate"):
+        call_command("seed_data", profile=DatasetProfiles.SMOKE.value, graded_rate=1.5, stdout=StringIO())
+    with pytest.raises(CommandError, match="lectures_per_course"):
+        call_command("seed_data", profile=DatasetProfiles.SMOKE.value, lectures_per_course=-1, stdout=StringIO())
+    assert not User.objects.exists() and not Course.objects.exists()
+
+
+def test_load_test_journeys_run_against_a_live_server(live_server, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    profile = PROFILES[DatasetProfiles.SMOKE.value]
+    DatasetSeeder(profile, namespace="load").seed()
+    accounts = Accounts(namespace="load", password=BENCHMARK_PASSWORD, teachers=1, students=profile.target_roster_size)
+
+    # The live server shares the in-memory SQLite connection between threads, so one user at a time
+    for journey in JOURNEYS:
+        load_test = LoadTest(live_server.url, accounts, {journey: 1}, concurrency=1, max_journeys=2, duration=30)
+        report = asyncio.run(load_test.run())
+        assert report.journeys[journey].completed == 2, journey
+        assert all(step.errors == 0 and step.p50_ms is not None for step in report.steps.values()), report.steps
+
+
+def test_profiler_samples_only_picked_requests(api_client, settings, teacher, lecture, tmp_path):
+    settings.REQUEST_PROFILING_ENABLED = True
+    settings.REQUEST_PROFILING_DIR = tmp_path
+    settings.REQUEST_PROFILING_TOKEN = "let-me-profile"
+    settings.REQUEST_PROFILING_INTERVAL_MS = 0.1
+    api_client.force_authenticate(teacher)
+
+    api_client.get(homeworks_url(lecture), HTTP_X_PROFILE_REQUEST="wrong-token")
+    # Non-ASCII is valid latin-1 in a header and must not break the comparison
+    assert api_client.get(homeworks_url(lecture), HTTP_X_PROFILE_REQUEST="l\xe9t-me-profile").status_code \
+        == status.HTTP_200_OK
+    assert list(tmp_path.iterdir()) == []
+
+    collapsed = tmp_path / "HomeworkViewSet.list.collapsed"
+    # A fast request can finish before the sampler thread gets the GIL; a few tries make a sample certain
+    for _ in range(20):
+        api_client.get(homeworks_url(lecture), HTTP_X_PROFILE_REQUEST="let-me-profile")
+        if collapsed.exists():
+            break
+    lines = collapsed.read_text().splitlines()
+    stacks = [line.rsplit(" ", 1) for line in lines]
+    assert stacks and all(count.isdigit() for _, count in stacks)
+    assert not any(stack.startswith("common.middleware:RequestProfilerMiddleware") for stack, _ in stacks)
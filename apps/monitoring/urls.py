@@ -0,0 +1,8 @@
+from django.urls import path
+
+from apps.monitoring.views import RequestMetricsView
+from common.enums import URLPatterns
+
+urlpatterns = [
+    path(f'{URLPatterns.METRICS.value}/', RequestMetricsView.as_view(), name=URLPatterns.REQUEST_METRICS.value),
+]
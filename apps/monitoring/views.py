@@ -0,0 +1,24 @@
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.users.permissions import DenyBlacklistedToken
+from common.enums import HttpStatus, ResponseKeys
+from common.metrics import registry
+
+
+class RequestMetricsView(APIView):
+    """
+    Per-endpoint request metrics of this process (staff only).
+
+    - GET /metrics/ - query count, DB time, render time, duration and response size histograms
+    - DELETE /metrics/ - start counting again, e.g. before comparing two runs
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser, DenyBlacklistedToken]
+
+    def get(self, request, *args, **kwargs):
+        return Response({ResponseKeys.ENDPOINTS.value: registry.snapshot()}, status=HttpStatus.OK.value)
+
+    def delete(self, request, *args, **kwargs):
+        registry.reset()
+        return Response(status=HttpStatus.NO_CONTENT.value)
@@ -0,0 +1,19 @@
+from django.contrib import admin
+
+from .models import Notification, OutboxEvent
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ("id", "event_type", "created_at", "dispatched_at")
+    list_filter = ("event_type",)
+    readonly_fields = ("event_type", "payload", "created_at", "dispatched_at")
+
+
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    list_display = ("id", "recipient", "event", "created_at", "read_at")
+    raw_id_fields = ("recipient", "event")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("recipient", "event")
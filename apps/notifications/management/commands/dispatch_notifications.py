@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.notifications.services import OutboxDispatcher
+
+
+class Command(BaseCommand):
+    help = "Fan pending outbox events out into user notification inboxes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.NOTIFICATION_DISPATCH_BATCH_SIZE,
+            help="Events claimed, and inbox rows inserted, per statement",
+        )
+
+    def handle(self, *args, **options):
+        dispatched = OutboxDispatcher(batch_size=options["batch_size"]).dispatch_pending()
+        self.stdout.write(self.style.SUCCESS(f"Dispatched {dispatched} events"))
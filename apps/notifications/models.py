@@ -0,0 +1,68 @@
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from common.enums import ConstraintNames, IndexNames, ModelFields, NotificationEvents, RelatedNames
+
+User = get_user_model()
+
+
+class OutboxEvent(models.Model):
+    """
+    Domain event written in the same transaction as the change it describes.
+
+    A row exists exactly when the change committed. The dispatcher fans each
+    pending event out to its recipients' inboxes and stamps ``dispatched_at``.
+    """
+    event_type = models.CharField(max_length=64, choices=[(event.value, event.value) for event in NotificationEvents])
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Only undispatched events are ever scanned, so only they are indexed
+            models.Index(
+                fields=[ModelFields.ID.value],
+                condition=models.Q(dispatched_at__isnull=True),
+                name=IndexNames.OUTBOX_PENDING.value,
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} #{self.id}"
+
+
+class Notification(models.Model):
+    """One user's inbox entry for an outbox event"""
+    recipient = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name=RelatedNames.USER_NOTIFICATIONS.value, db_index=False,
+    )
+    event = models.ForeignKey(
+        OutboxEvent, on_delete=models.CASCADE, related_name=RelatedNames.EVENT_NOTIFICATIONS.value, db_index=False,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    read_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=[ModelFields.RECIPIENT.value, f'-{ModelFields.ID.value}'],
+                name=IndexNames.NOTIFICATION_INBOX.value,
+            ),
+            models.Index(
+                fields=[ModelFields.RECIPIENT.value],
+                condition=models.Q(read_at__isnull=True),
+                name=IndexNames.NOTIFICATION_UNREAD.value,
+            ),
+        ]
+        constraints = [
+            # Makes a re-run of a half-dispatched batch a no-op
+            models.UniqueConstraint(
+                fields=[ModelFields.EVENT.value, ModelFields.RECIPIENT.value],
+                name=ConstraintNames.UNIQUE_NOTIFICATION_PER_EVENT.value,
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.event.event_type} for {self.recipient.email}"
@@ -0,0 +1,6 @@
+from common.enums import ModelFields
+from common.pagination import KeysetPagination
+
+
+class NewestFirstPagination(KeysetPagination):
+    ordering = (f'-{ModelFields.ID.value}',)
@@ -0,0 +1,30 @@
+from rest_framework import serializers
+
+from apps.notifications.models import Notification
+from common.enums import ModelFields
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    event_type = serializers.CharField(source=f"{ModelFields.EVENT.value}.{ModelFields.EVENT_TYPE.value}")
+    payload = serializers.JSONField(source=f"{ModelFields.EVENT.value}.{ModelFields.PAYLOAD.value}")
+
+    class Meta:
+        model = Notification
+        fields = [
+            ModelFields.ID.value,
+            ModelFields.EVENT_TYPE.value,
+            ModelFields.PAYLOAD.value,
+            ModelFields.CREATED_AT.value,
+            ModelFields.READ_AT.value,
+        ]
+
+
+class NotificationFilterSerializer(serializers.Serializer):
+    """Query parameters of the notification inbox"""
+    unread = serializers.BooleanField(required=False, default=False)
+
+
+class NotificationReadSerializer(serializers.Serializer):
+    """Which unread notifications to mark read; neither field means all of them"""
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False)
+    up_to_id = serializers.IntegerField(min_value=1, required=False)
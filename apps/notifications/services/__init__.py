@@ -0,0 +1,11 @@
+# Notification services
+from .dispatcher import CourseRecipientResolver, OutboxDispatcher
+from .inbox import NotificationInboxService
+from .outbox import TransactionalOutbox
+
+__all__ = [
+    'CourseRecipientResolver',
+    'OutboxDispatcher',
+    'NotificationInboxService',
+    'TransactionalOutbox',
+]
@@ -0,0 +1,100 @@
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterator
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.courses.models import Course, CourseStudent, CourseTeacher
+from apps.notifications.models import Notification, OutboxEvent
+from apps.notifications.services.protocols import NotificationDispatcher, RecipientResolver
+from common.enums import ModelFields, NotificationEvents, SerializerFields
+
+USER_ID = f"{ModelFields.USER.value}_{ModelFields.ID.value}"
+PRIMARY_OWNER_ID = f"{ModelFields.PRIMARY_OWNER.value}_{ModelFields.ID.value}"
+COURSE_ID = f"{ModelFields.COURSE.value}_{ModelFields.ID.value}"
+
+
+class CourseRecipientResolver(RecipientResolver):
+    """
+    Recipients follow course membership at dispatch time:
+
+    - a new grade goes to the student who submitted;
+    - a new comment goes to that student and the course's teachers, except its author;
+    - a published homework goes to every enrolled student, streamed in id order.
+    """
+
+    def recipients(self, event: OutboxEvent) -> Iterator[int]:
+        resolve = {
+            NotificationEvents.GRADE_CREATED.value: self._grade_created,
+            NotificationEvents.COMMENT_CREATED.value: self._comment_created,
+            NotificationEvents.HOMEWORK_PUBLISHED.value: self._homework_published,
+        }.get(event.event_type)
+        return resolve(event.payload) if resolve else iter(())
+
+    @staticmethod
+    def _grade_created(payload: dict) -> Iterator[int]:
+        return iter((payload[SerializerFields.STUDENT_ID.value],))
+
+    @staticmethod
+    def _comment_created(payload: dict) -> Iterator[int]:
+        course_id = payload[SerializerFields.COURSE_ID.value]
+        people = {payload[SerializerFields.STUDENT_ID.value]}
+        people.update(Course.objects.filter(id=course_id).values_list(PRIMARY_OWNER_ID, flat=True))
+        people.update(CourseTeacher.objects.filter(**{COURSE_ID: course_id}).values_list(USER_ID, flat=True))
+        people.discard(payload[SerializerFields.AUTHOR_ID.value])
+        return iter(sorted(people))
+
+    @staticmethod
+    def _homework_published(payload: dict) -> Iterator[int]:
+        return (
+            CourseStudent.objects
+            .filter(**{COURSE_ID: payload[SerializerFields.COURSE_ID.value]})
+            .order_by(USER_ID)
+            .values_list(USER_ID, flat=True)
+            .iterator(chunk_size=settings.NOTIFICATION_DISPATCH_BATCH_SIZE)
+        )
+
+
+@dataclass
+class OutboxDispatcher(NotificationDispatcher):
+    """
+    Moves pending outbox events into per-user inbox rows.
+
+    Events are claimed a batch at a time (``SELECT ... FOR UPDATE SKIP
+    LOCKED`` where the database has it, so concurrent dispatchers never
+    share a batch). Each event's recipients are inserted with
+    ``bulk_create`` in chunks of the same size, and the batch is stamped
+    dispatched in the same transaction. Re-running a batch is harmless:
+    the (event, recipient) unique constraint drops duplicates.
+    """
+    resolver: RecipientResolver = field(default_factory=CourseRecipientResolver)
+    batch_size: int = field(default_factory=lambda: settings.NOTIFICATION_DISPATCH_BATCH_SIZE)
+
+    def dispatch_pending(self) -> int:
+        dispatched = 0
+        while True:
+            with transaction.atomic():
+                events = list(
+                    OutboxEvent.objects
+                    .select_for_update(skip_locked=True)
+                    .filter(**{f"{ModelFields.DISPATCHED_AT.value}__isnull": True})
+                    .order_by(ModelFields.ID.value)[:self.batch_size]
+                )
+                if not events:
+                    return dispatched
+                for event in events:
+                    self._fan_out(event)
+                OutboxEvent.objects.filter(
+                    **{f"{ModelFields.ID.value}__in": [event.id for event in events]}
+                ).update(**{ModelFields.DISPATCHED_AT.value: timezone.now()})
+            dispatched += len(events)
+
+    def _fan_out(self, event: OutboxEvent) -> None:
+        recipients = iter(self.resolver.recipients(event))
+        while chunk := list(islice(recipients, self.batch_size)):
+            Notification.objects.bulk_create(
+                [Notification(event=event, recipient_id=user_id) for user_id in chunk],
+                ignore_conflicts=True,
+            )
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.notifications.models import Notification
+from apps.notifications.services.protocols import NotificationInbox
+from common.enums import ModelFields
+
+UNREAD = {f"{ModelFields.READ_AT.value}__isnull": True}
+
+
+@dataclass
+class NotificationInboxService(NotificationInbox):
+    """A user's notifications; every query is answered from the recipient's inbox indexes"""
+
+    def notifications(self, *, user, unread=False) -> QuerySet:
+        queryset = Notification.objects.filter(recipient=user).select_related(ModelFields.EVENT.value)
+        if unread:
+            queryset = queryset.filter(**UNREAD)
+        return queryset
+
+    def unread_count(self, *, user) -> int:
+        return Notification.objects.filter(recipient=user, **UNREAD).count()
+
+    def mark_read(self, *, user, ids=None, up_to_id=None) -> int:
+        queryset = Notification.objects.filter(recipient=user, **UNREAD)
+        if ids is not None:
+            queryset = queryset.filter(**{f"{ModelFields.ID.value}__in": ids})
+        if up_to_id is not None:
+            queryset = queryset.filter(**{f"{ModelFields.ID.value}__lte": up_to_id})
+        return queryset.update(**{ModelFields.READ_AT.value: timezone.now()})
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.notifications.models import OutboxEvent
+from apps.notifications.services.dispatcher import OutboxDispatcher
+from apps.notifications.services.protocols import EventOutbox, NotificationDispatcher
+from common.enums import JobQueues, NotificationEvents
+from common.jobs import LocalJobQueue
+
+
+def build_job_queue() -> LocalJobQueue:
+    return LocalJobQueue(JobQueues.NOTIFICATION_DISPATCH.value, workers=settings.NOTIFICATION_DISPATCH_WORKERS)
+
+
+@dataclass
+class TransactionalOutbox(EventOutbox):
+    """
+    Records events as rows in the caller's transaction.
+
+    Call ``record`` inside the ``transaction.atomic`` block that makes the
+    change: the event is committed or rolled back with it. Dispatch is
+    scheduled for after the commit; anything a crash leaves behind is
+    picked up by the next dispatch or by ``manage.py dispatch_notifications``.
+    """
+    queue: LocalJobQueue = field(default_factory=build_job_queue)
+    dispatcher: NotificationDispatcher = field(default_factory=OutboxDispatcher)
+
+    def record(self, event_type: NotificationEvents, payload: dict) -> OutboxEvent:
+        event = OutboxEvent.objects.create(event_type=event_type.value, payload=payload)
+        self._schedule_dispatch()
+        return event
+
+    def record_many(self, event_type: NotificationEvents, payloads: list[dict]) -> list[OutboxEvent]:
+        if not payloads:
+            return []
+        events = OutboxEvent.objects.bulk_create(
+            [OutboxEvent(event_type=event_type.value, payload=payload) for payload in payloads]
+        )
+        self._schedule_dispatch()
+        return events
+
+    def _schedule_dispatch(self) -> None:
+        transaction.on_commit(partial(self.queue.submit, self.dispatcher.dispatch_pending))
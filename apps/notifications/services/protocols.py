@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+
+
+class EventOutbox(ABC):
+    """Interface for recording domain events alongside the change they describe"""
+
+    @abstractmethod
+    def record(self, event_type, payload) -> None:
+        """Write the event inside the caller's transaction and dispatch it once that commits"""
+        pass
+
+    @abstractmethod
+    def record_many(self, event_type, payloads) -> None:
+        """Same as ``record`` for many events of one type, in one insert"""
+        pass
+
+
+class RecipientResolver(ABC):
+    """Interface for deciding who is notified about an event"""
+
+    @abstractmethod
+    def recipients(self, event) -> None:
+        """Iterable of user ids"""
+        pass
+
+
+class NotificationDispatcher(ABC):
+    """Interface for fanning pending outbox events out into inboxes"""
+
+    @abstractmethod
+    def dispatch_pending(self) -> None:
+        """Dispatch every pending event; returns how many were dispatched"""
+        pass
+
+
+class NotificationInbox(ABC):
+    """Interface for reading and acknowledging a user's notifications"""
+
+    @abstractmethod
+    def notifications(self, *, user, unread=False) -> None:
+        pass
+
+    @abstractmethod
+    def unread_count(self, *, user) -> None:
+        pass
+
+    @abstractmethod
+    def mark_read(self, *, user, ids=None, up_to_id=None) -> None:
+        """Mark unread notifications read, optionally only the given ids or those up to an id"""
+        pass
@@ -0,0 +1,151 @@
+import threading
+
+import pytest
+pytestmark = pytest.mark.django_db
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from apps.courses.models import Course, Lecture
+from apps.homeworks.models import Homework, HomeworkGrade, HomeworkSubmission
+from apps.notifications.models import Notification, OutboxEvent
+from apps.notifications.services.dispatcher import OutboxDispatcher
+from common.enums import UserRole
+from common.jobs import LocalJobQueue
+
+
+User = get_user_model()
+NOTIFICATIONS_URL = "/api/me/notifications/"
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture(autouse=True)
+def inline_dispatch(settings):
+    settings.NOTIFICATION_DISPATCH_WORKERS = 0
+
+
+@pytest.fixture
+def teacher(db):
+    return User.objects.create_user(email="teacher@example.com", password="x", role=UserRole.TEACHER.value)
+
+
+@pytest.fixture
+def co_teacher(db):
+    return User.objects.create_user(email="teacher2@example.com", password="x", role=UserRole.TEACHER.value)
+
+
+@pytest.fixture
+def students(db):
+    return [
+        User.objects.create_user(email=f"s{n}@example.com", password="x", role=UserRole.STUDENT.value)
+        for n in range(3)
+    ]
+
+
+@pytest.fixture
+def lecture(teacher, co_teacher, students):
+    course = Course.objects.create(name="C1", description="D", primary_owner=teacher)
+    course.teachers.add(teacher, co_teacher)
+    course.students.add(*students)
+    return Lecture.objects.create(course=course, topic="L1")
+
+
+def auth(client, user):
+    client.force_authenticate(user=user)
+    return client
+
+
+def homeworks_url(lecture):
+    return f"/api/courses/{lecture.course_id}/lectures/{lecture.id}/homeworks/"
+
+
+def test_events_fan_out_to_inboxes(api_client, teacher, co_teacher, students, lecture,
+                                   django_capture_on_commit_callbacks):
+    client = auth(api_client, teacher)
+    with django_capture_on_commit_callbacks(execute=True):
+        resp = client.post(
+            homeworks_url(lecture), {"title": "HW1", "description": "D", "due_date": "2030-01-01T00:00:00Z"}, format="json",
+        )
+    assert resp.status_code == status.HTTP_201_CREATED
+    homework = Homework.objects.get(lecture=lecture, title="HW1")
+    submission = HomeworkSubmission.objects.create(homework=homework, student=students[0], content="Ans")
+
+    base = f"{homeworks_url(lecture)}{homework.id}/submissions/{submission.id}/grades/"
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(base, {"grade": 90, "comments": ""}, format="json")
+    grade_id = HomeworkGrade.objects.get(submission=submission).id
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(f"{base}{grade_id}/comments/", {"comment": "Nice"}, format="json")
+
+    assert not OutboxEvent.objects.filter(dispatched_at__isnull=True).exists()
+    inbox = auth(api_client, students[0]).get(NOTIFICATIONS_URL).data
+    assert [row["event_type"] for row in inbox["results"]] == ["comment.created", "grade.created", "homework.published"]
+    assert inbox["results"][1]["payload"]["homework_title"] == "HW1"
+    assert inbox["unread_count"] == 3
+    # The comment author is not notified of their own comment; the co-teacher is
+    assert Notification.objects.filter(recipient=teacher).count() == 0
+    assert Notification.objects.filter(recipient=co_teacher).count() == 1
+    assert Notification.objects.filter(recipient=students[1]).count() == 1
+
+
+def test_rolled_back_change_records_no_event(api_client, teacher, lecture):
+    resp = auth(api_client, teacher).post(homeworks_url(lecture), {"title": "", "description": "D"}, format="json")
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert OutboxEvent.objects.count() == 0
+
+
+def test_dispatch_is_idempotent_and_resumable(teacher, students, lecture):
+    event = OutboxEvent.objects.create(
+        event_type="homework.published", payload={"course_id": lecture.course_id, "homework_id": 1},
+    )
+    Notification.objects.create(event=event, recipient=students[0])
+
+    call_command("dispatch_notifications")
+    assert Notification.objects.filter(event=event).count() == len(students)
+    event.refresh_from_db()
+    assert event.dispatched_at is not None
+    assert OutboxDispatcher().dispatch_pending() == 0
+
+
+def test_inbox_pages_and_mark_read(api_client, students, lecture, django_assert_num_queries):
+    student = students[0]
+    events = OutboxEvent.objects.bulk_create(
+        [OutboxEvent(event_type="grade.created", payload={"student_id": student.id}) for _ in range(12)]
+    )
+    assert OutboxDispatcher().dispatch_pending() == 12
+    client = auth(api_client, student)
+
+    # page, unread count; no COUNT over the whole inbox for paging
+    with django_assert_num_queries(2):
+        first = client.get(NOTIFICATIONS_URL).data
+    assert len(first["results"]) == 10 and first["unread_count"] == 12
+    ids = [row["id"] for row in first["results"]]
+    assert ids == sorted(ids, reverse=True)
+    rest = client.get(first["next"]).data["results"]
+    assert len(rest) == 2 and rest[0]["id"] < ids[-1]
+
+    read = client.post(f"{NOTIFICATIONS_URL}read/", {"ids": ids[:2]}, format="json").data
+    assert read == {"updated": 2, "unread_count": 10}
+    read = client.post(f"{NOTIFICATIONS_URL}read/", {"up_to_id": ids[5]}, format="json").data
+    assert read["unread_count"] == 3
+    assert len(client.get(NOTIFICATIONS_URL, {"unread": "true"}).data["results"]) == 3
+    assert client.post(f"{NOTIFICATIONS_URL}read/", {}, format="json").data == {"updated": 3, "unread_count": 0}
+    assert len(events) == Notification.objects.filter(recipient=student).count()
+
+
+def test_job_queues_run_on_pools_of_their_own_size():
+    slow, fast = LocalJobQueue("test-slow", workers=1), LocalJobQueue("test-fast", workers=2)
+    release, done = threading.Event(), threading.Event()
+    slow.submit(release.wait, 5)
+    try:
+        fast.submit(done.set)
+        # not queued behind the blocked job of the other queue
+        assert done.wait(5)
+    finally:
+        release.set()
+    assert (slow._get_executor()._max_workers, fast._get_executor()._max_workers) == (1, 2)
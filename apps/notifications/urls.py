@@ -0,0 +1,9 @@
+from django.urls import path
+
+from apps.notifications.views import NotificationListView, NotificationReadView
+from common.enums import URLPatterns
+
+urlpatterns = [
+    path(f'{URLPatterns.ME.value}/{URLPatterns.NOTIFICATIONS.value}/', NotificationListView.as_view(), name=URLPatterns.MY_NOTIFICATIONS.value),
+    path(f'{URLPatterns.ME.value}/{URLPatterns.NOTIFICATIONS.value}/{URLPatterns.READ.value}/', NotificationReadView.as_view(), name=URLPatterns.MY_NOTIFICATIONS_READ.value),
+]
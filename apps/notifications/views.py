@@ -0,0 +1,61 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.notifications.pagination import NewestFirstPagination
+from apps.notifications.serializers import (
+    NotificationSerializer,
+    NotificationFilterSerializer,
+    NotificationReadSerializer,
+)
+from apps.notifications.services import NotificationInboxService
+from apps.notifications.services.protocols import NotificationInbox
+from apps.users.permissions import DenyBlacklistedToken
+from common.enums import HttpStatus, QueryParams, ResponseKeys
+
+
+class NotificationListView(APIView):
+    """
+    The requesting user's notifications, newest first.
+
+    - GET /me/notifications/?unread=true&cursor=<cursor> - ``unread_count`` counts every unread notification
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+    pagination_class = NewestFirstPagination
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.inbox: NotificationInbox = NotificationInboxService()
+
+    def get(self, request, *args, **kwargs):
+        filters = NotificationFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        notifications = self.inbox.notifications(user=request.user, unread=filters.validated_data[QueryParams.UNREAD.value])
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(notifications, request, view=self)
+        response = paginator.get_paginated_response(NotificationSerializer(page, many=True).data)
+        response.data[ResponseKeys.UNREAD_COUNT.value] = self.inbox.unread_count(user=request.user)
+        return response
+
+
+class NotificationReadView(APIView):
+    """
+    Acknowledge notifications.
+
+    - POST /me/notifications/read/ - body ``{"ids": [...]}``, ``{"up_to_id": n}`` or ``{}`` for all
+    """
+    permission_classes = [IsAuthenticated, DenyBlacklistedToken]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.inbox: NotificationInbox = NotificationInboxService()
+
+    def post(self, request, *args, **kwargs):
+        serializer = NotificationReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        updated = self.inbox.mark_read(user=request.user, **serializer.validated_data)
+        return Response({
+            ResponseKeys.UPDATED.value: updated,
+            ResponseKeys.UNREAD_COUNT.value: self.inbox.unread_count(user=request.user),
+        }, status=HttpStatus.OK.value)
@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from common.enums import ErrorMessages, UserRole, UserFields
 from apps.users.models import User
+from common.expansion import SparseFieldsetMixin
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -32,7 +33,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = [
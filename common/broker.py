@@ -0,0 +1,94 @@
+import threading
+from collections import deque
+from typing import Any, Optional
+
+from django.db import transaction
+
+
+class Subscription:
+    """
+    One listener's mailbox on a topic.
+
+    ``publish`` appends to it and wakes the waiting thread; ``wait`` drains
+    everything delivered so far. While nothing arrives the listener just
+    sleeps on a condition variable: no polling and no queries.
+    """
+
+    def __init__(self, broker: "LocalBroker", topic: str):
+        self.topic = topic
+        self._broker = broker
+        self._messages: deque = deque()
+        self._ready = threading.Condition()
+
+    def deliver(self, message: Any) -> None:
+        with self._ready:
+            self._messages.append(message)
+            self._ready.notify()
+
+    def wait(self, timeout: Optional[float]) -> list:
+        """Messages delivered since the last call, waiting up to ``timeout`` seconds for the first one"""
+        with self._ready:
+            if not self._messages:
+                self._ready.wait(timeout)
+            messages = list(self._messages)
+            self._messages.clear()
+        return messages
+
+    def close(self) -> None:
+        self._broker.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class LocalBroker:
+    """
+    In-process publish/subscribe keyed by topic name.
+
+    Delivery only reaches subscribers in the same process, so with several
+    worker processes a listener is only woken by what its own process
+    publishes. Listeners should therefore treat a message as a wake-up and
+    re-read the database on every wake and heartbeat.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[Subscription]] = {}
+
+    def subscribe(self, topic: str) -> Subscription:
+        subscription = Subscription(self, topic)
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            listeners = self._subscribers.get(subscription.topic)
+            if listeners is None:
+                return
+            listeners.discard(subscription)
+            if not listeners:
+                del self._subscribers[subscription.topic]
+
+    def publish(self, topic: str, message: Any) -> int:
+        """Deliver to every current subscriber of ``topic``; returns how many were reached"""
+        with self._lock:
+            listeners = list(self._subscribers.get(topic, ()))
+        for subscription in listeners:
+            subscription.deliver(message)
+        return len(listeners)
+
+    def subscriber_count(self, topic: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(topic, ()))
+
+
+broker = LocalBroker()
+
+
+def publish_on_commit(topic: str, message: Any) -> None:
+    """Publish once the surrounding transaction commits, so listeners never see rolled-back rows"""
+    transaction.on_commit(lambda: broker.publish(topic, message))
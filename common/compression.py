@@ -0,0 +1,19 @@
+import zlib
+
+from django.conf import settings
+
+TEXT_ENCODING = "utf-8"
+COMPRESSION_LEVEL = 6
+
+
+def should_compress(text: str) -> bool:
+    return len(text.encode(TEXT_ENCODING)) > settings.SUBMISSION_CONTENT_COMPRESSION_THRESHOLD
+
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode(TEXT_ENCODING), COMPRESSION_LEVEL)
+
+
+def decompress_text(data) -> str:
+    # Some backends hand BinaryField values back as memoryview
+    return zlib.decompress(bytes(data)).decode(TEXT_ENCODING)
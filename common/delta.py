@@ -0,0 +1,45 @@
+import difflib
+import json
+
+from common.compression import compress_text, decompress_text
+
+COPY = "c"
+INSERT = "i"
+
+
+def diff(old: str, new: str) -> list:
+    """
+    Line-level delta rebuilding ``new`` from ``old``.
+
+    ``[COPY, start, count]`` reuses ``count`` lines of the old text from
+    ``start``; ``[INSERT, text]`` adds new text. Removed lines are simply
+    not copied.
+    """
+    old_lines, new_lines = old.splitlines(keepends=True), new.splitlines(keepends=True)
+    operations = []
+    for tag, old_start, old_end, new_start, new_end in difflib.SequenceMatcher(None, old_lines, new_lines).get_opcodes():
+        if tag == "equal":
+            operations.append([COPY, old_start, old_end - old_start])
+        elif new_end > new_start:
+            operations.append([INSERT, "".join(new_lines[new_start:new_end])])
+    return operations
+
+
+def apply(old: str, operations: list) -> str:
+    lines = old.splitlines(keepends=True)
+    parts = []
+    for operation in operations:
+        if operation[0] == COPY:
+            _, start, count = operation
+            parts.extend(lines[start:start + count])
+        else:
+            parts.append(operation[1])
+    return "".join(parts)
+
+
+def encode(operations: list) -> bytes:
+    return compress_text(json.dumps(operations, separators=(",", ":")))
+
+
+def decode(data) -> list:
+    return json.loads(decompress_text(data))
@@ -40,8 +40,21 @@ class ErrorMessages(str, Enum):
     LECTURE_TOPIC_ALREADY_EXISTS = "A lecture with topic '{topic}' already exists in this course"
     HOMEWORK_TITLE_ALREADY_EXISTS = "A homework with title '{title}' already exists for this lecture"
     HOMEWORK_DOESNT_EXIST = "Homework does not exist"
+    LECTURE_DOESNT_EXIST = "Lecture does not exist"
+    BULK_GRADE_ROWS_REQUIRED = "Provide a non-empty list of grade rows"
+    BULK_GRADE_TOO_MANY_ROWS = "At most {limit} grade rows can be submitted at once"
+    BULK_GRADE_ROW_TARGET_REQUIRED = "Either submission_id or student_email is required"
+    BULK_GRADE_DUPLICATE_ROW = "Submission is graded more than once in this request"
+    BULK_HOMEWORK_ROWS_REQUIRED = "Provide a non-empty list of homework rows"
+    BULK_HOMEWORK_TOO_MANY_ROWS = "At most {limit} homework rows can be submitted at once"
+    BULK_HOMEWORK_DUPLICATE_ROW = "Homework '{title}' appears more than once for this lecture in this request"
+    LECTURE_NOT_IN_COURSE = "No lecture of this course matches the row"
+    SUBMISSION_NOT_IN_HOMEWORK = "No submission for this homework matches the row"
+    CSV_PARSE_ERROR = "CSV parse error: {error}"
+    UNSUPPORTED_EXPORT_FORMAT = "Unsupported export format '{format}'"
     SUBMISSION_ALREADY_EXISTS = "You have already submitted homework for this assignment"
     SUBMISSION_DOESNT_EXIST = "Homework submission does not exist"
+    REVISION_DOESNT_EXIST = "Submission revision does not exist"
     STUDENT_NOT_ENROLLED = "You must be enrolled in this course to submit homework"
     GRADE_ALREADY_EXISTS = "Grade already exists for this submission"
     GRADE_DOESNT_EXIST = "Grade does not exist"
@@ -49,6 +62,9 @@ class ErrorMessages(str, Enum):
     ONLY_TEACHERS_CAN_GRADE = "Only teachers can assign grades"
     ONLY_GRADED_BY_TEACHER_CAN_UPDATE = "Only the teacher who graded this can update it"
     YOU_ARE_NOT_ENROLLED_IN_THIS_COURSE = "You are not enrolled in this course"
+    PRESENTATION_NOT_FOUND = "Presentation file does not exist"
+    DOWNLOAD_LINK_INVALID = "Download link is invalid or has expired"
+    RANGE_NOT_SATISFIABLE = "Requested range not satisfiable"
 
 
 class SuccessMessages(str, Enum):
@@ -97,6 +113,18 @@ class ResponseKeys(str, Enum):
     MESSAGE = "message"
     USER = "user"
     TOKENS = "tokens"
+    CREATED = "created"
+    UPDATED = "updated"
+    FAILED = "failed"
+    RESULTS = "results"
+    ROW = "row"
+    STATUS = "status"
+    ERRORS = "errors"
+    GRADES = "grades"
+    HOMEWORKS = "homeworks"
+    COURSES = "courses"
+    UNREAD_COUNT = "unread_count"
+    ENDPOINTS = "endpoints"
 
 
 class RelatedNames(str, Enum):
@@ -110,6 +138,11 @@ class RelatedNames(str, Enum):
     USER_GRADES_GIVEN = "grades_given"
     GRADE_COMMENTS = "grade_comments"
     USER_GRADE_COMMENTS = "grade_comments"
+    USER_NOTIFICATIONS = "notifications"
+    EVENT_NOTIFICATIONS = "notifications"
+    SUBMISSION_SIMILARITY_BANDS = "similarity_bands"
+    HOMEWORK_SIMILARITY_BANDS = "similarity_bands"
+    SUBMISSION_REVISIONS = "revisions"
 
 
 class ModelVerboseNames(str, Enum):
@@ -129,6 +162,22 @@ class ConstraintNames(str, Enum):
     UNIQUE_COURSE_TEACHER = 'unique_course_teacher'
     UNIQUE_COURSE_STUDENT = 'unique_course_student'
     UNIQUE_TOPIC_PER_COURSE = 'unique_topic_per_course'
+    UNIQUE_NOTIFICATION_PER_EVENT = 'unique_notification_per_event'
+    UNIQUE_REVISION_NUMBER = 'unique_revision_number_per_submission'
+
+
+class IndexNames(str, Enum):
+    COURSE_CREATED = 'course_created_idx'
+    COURSE_STUDENT_USER_COURSE = 'course_student_user_idx'
+    LECTURE_COURSE_CREATED = 'lecture_course_created_idx'
+    HOMEWORK_LECTURE_DUE = 'homework_lecture_due_idx'
+    SUBMISSION_STUDENT_SUBMITTED = 'submission_student_recent_idx'
+    GRADE_COMMENT_GRADE_CREATED = 'grade_comment_created_idx'
+    OUTBOX_PENDING = 'outbox_pending_idx'
+    NOTIFICATION_INBOX = 'notification_inbox_idx'
+    NOTIFICATION_UNREAD = 'notification_unread_idx'
+    SIMILARITY_BAND_HOMEWORK = 'similarity_band_homework_idx'
+    SIMILARITY_BAND_KEY = 'similarity_band_key_idx'
 
 
 class ModelFields(str, Enum):
@@ -165,10 +214,33 @@ class ModelFields(str, Enum):
     COMMENT = "comment"
     COURSE_TEACHER = "CourseTeacher"
     COURSE_STUDENT = "CourseStudent"
+    BLOB = "blob"
+    STATUS = "status"
+    THUMBNAIL = "thumbnail"
+    PREVIEW = "preview"
+    INLINE_CONTENT = "inline_content"
+    CONTENT_LENGTH = "content_length"
+    CONTENT_PREVIEW = "content_preview"
+    CONTENT_COMPRESSED = "content_compressed"
+    COMPRESSED_CONTENT = "compressed_content"
+    DATA = "data"
+    EVENT = "event"
+    EVENT_TYPE = "event_type"
+    PAYLOAD = "payload"
+    DISPATCHED_AT = "dispatched_at"
+    RECIPIENT = "recipient"
+    READ_AT = "read_at"
+    SIMILARITY_SIGNATURE = "similarity_signature"
+    SIGNATURE = "signature"
+    BAND_KEY = "band_key"
+    NUMBER = "number"
+    IS_SNAPSHOT = "is_snapshot"
+    DEPTH = "depth"
 
 
 class UploadPaths(str, Enum):
     PRESENTATIONS = 'presentations/'
+    PREVIEWS = 'previews/'
 
 
 class SerializerFields(str, Enum):
@@ -178,6 +250,32 @@ class SerializerFields(str, Enum):
     PRIMARY_OWNER_ID = "primary_owner_id"
     TEACHER_COUNT = "teacher_count"
     STUDENT_COUNT = "student_count"
+    PREVIEW_STATUS = "preview_status"
+    THUMBNAIL_URL = "thumbnail_url"
+    PREVIEW_URL = "preview_url"
+    PREVIEW_THUMBNAIL = "preview_thumbnail"
+    SUBMISSION_ID = "submission_id"
+    STUDENT_EMAIL = "student_email"
+    GRADE_ID = "grade_id"
+    STUDENT_ID = "student_id"
+    LECTURE_ID = "lecture_id"
+    LECTURE_TOPIC = "lecture_topic"
+    GRADE_COMMENTS = "grade_comments"
+    PREVIEW_IMAGE = "preview_image"
+    COURSE_ID = "course_id"
+    COURSE_NAME = "course_name"
+    HOMEWORK_ID = "homework_id"
+    HOMEWORK_TITLE = "homework_title"
+    COUNT = "count"
+    COMMENT_ID = "comment_id"
+    AUTHOR_ID = "author_id"
+    GRADED_BY_ID = "graded_by_id"
+    IDS = "ids"
+    UP_TO_ID = "up_to_id"
+    OTHER_SUBMISSION_ID = "other_submission_id"
+    OTHER_STUDENT_ID = "other_student_id"
+    OTHER_HOMEWORK_ID = "other_homework_id"
+    SIMILARITY = "similarity"
 
 
 class FieldDisplayNames(str, Enum):
@@ -189,16 +287,20 @@ class FieldDisplayNames(str, Enum):
 class HttpStatus(Enum):
     OK = 200
     CREATED = 201
+    NO_CONTENT = 204
+    PARTIAL_CONTENT = 206
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     FORBIDDEN = 403
     NOT_FOUND = 404
+    RANGE_NOT_SATISFIABLE = 416
     INTERNAL_SERVER_ERROR = 500
 
 
 class RequestData(str, Enum):
     DATA = "data"
     REQUEST = "request"
+    RESOURCE_HIERARCHY = "resource_hierarchy"
 
 
 class ViewActions(str, Enum):
@@ -208,8 +310,10 @@ class ViewActions(str, Enum):
     LIST = "list"
     LIST_COMMENTS = "list_comments"
     CREATE_COMMENT = "create_comment"
+    STREAM_COMMENTS = "stream_comments"
     RETRIEVE = "retrieve"
     DESTROY = "destroy"
+    DOWNLOAD = "download"
     PARTIAL = 'partial'
 
 
@@ -235,6 +339,44 @@ class URLPatterns(str, Enum):
     GRADE_DETAIL = "grade_detail"
     GRADES = "grades"
     GRADE_COMMENTS = "grade_comments"
+    GRADE_COMMENTS_STREAM = "grade_comments_stream"
+    COMMENTS = "comments"
+    STREAM = "stream"
+    PRESENTATION = "presentation"
+    PRESENTATIONS = "presentations"
+    SIGNED = "signed"
+    PREVIEWS = "previews"
+    TOKEN = "token"
+    LECTURE_PRESENTATION = "lecture_presentation"
+    BULK = "bulk"
+    GRADE_BULK = "grade_bulk"
+    HOMEWORK_BULK = "homework_bulk"
+    GRADEBOOK = "gradebook"
+    COURSE_GRADEBOOK = "course_gradebook"
+    STATISTICS = "statistics"
+    EXPORT = "export"
+    SUBMISSION_EXPORT = "submission_export"
+    COURSE_STATISTICS = "course_statistics"
+    LECTURE_STATISTICS = "lecture_statistics"
+    HOMEWORK_STATISTICS = "homework_statistics"
+    PRESENTATION_SIGNED_DOWNLOAD = "presentation_signed_download"
+    PRESENTATION_PREVIEW_DOWNLOAD = "presentation_preview_download"
+    ME = "me"
+    MY_HOMEWORKS = "my_homeworks"
+    GRADING_QUEUE = "grading-queue"
+    MY_GRADING_QUEUE = "my_grading_queue"
+    NOTIFICATIONS = "notifications"
+    READ = "read"
+    MY_NOTIFICATIONS = "my_notifications"
+    MY_NOTIFICATIONS_READ = "my_notifications_read"
+    SIMILARITY = "similarity"
+    HOMEWORK_SIMILARITY = "homework_similarity"
+    REVISIONS = "revisions"
+    NUMBER = "number"
+    SUBMISSION_REVISIONS = "submission_revisions"
+    METRICS = "metrics"
+    REQUEST_METRICS = "request_metrics"
+    SUBMISSION_REVISION_DETAIL = "submission_revision_detail"
 
 
 class HTTPMethods(str, Enum):
@@ -257,8 +399,182 @@ class PaginationFields(str, Enum):
     CURRENT_PAGE = "current_page"
     TOTAL_PAGES = "total_pages"
     PAGE_INFO = "page_info"
+    CURSOR = "cursor"
+
+class QueryParams(str, Enum):
+    """Query parameters understood across list/retrieve endpoints"""
+    FIELDS = "fields"
+    EXPAND = "expand"
+    EXPORT = "export"
+    STATUS = "status"
+    DUE_BEFORE = "due_before"
+    SINCE_ID = "since_id"
+    TIMEOUT = "timeout"
+    UNREAD = "unread"
+    SCOPE = "scope"
+    THRESHOLD = "threshold"
+
 
 class SerializerKwargs(str, Enum):
     WRITE_ONLY = "write_only"
     REQUIRED = "required"
 
+
+class HttpHeaders(str, Enum):
+    """Header names used when serving files"""
+    RANGE = "HTTP_RANGE"
+    IF_RANGE = "HTTP_IF_RANGE"
+    ACCEPT_RANGES = "Accept-Ranges"
+    CONTENT_RANGE = "Content-Range"
+    CONTENT_LENGTH = "Content-Length"
+    CONTENT_TYPE = "Content-Type"
+    CONTENT_DISPOSITION = "Content-Disposition"
+    CACHE_CONTROL = "Cache-Control"
+    ETAG = "ETag"
+    LAST_MODIFIED = "Last-Modified"
+    X_ACCEL_REDIRECT = "X-Accel-Redirect"
+    X_SENDFILE = "X-Sendfile"
+    X_ACCEL_BUFFERING = "X-Accel-Buffering"
+    LAST_EVENT_ID = "HTTP_LAST_EVENT_ID"
+
+
+class PresentationDeliveryBackends(str, Enum):
+    """How presentation bytes leave the application"""
+    DIRECT = "direct"
+    X_ACCEL_REDIRECT = "x-accel-redirect"
+    X_SENDFILE = "x-sendfile"
+    SIGNED_URL = "signed-url"
+
+
+class PreviewStatus(str, Enum):
+    """Lifecycle of the rendered thumbnail/preview of a presentation blob"""
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+    UNAVAILABLE = "unavailable"
+
+    @classmethod
+    def choices(cls):
+        return [(status.value, status.name.capitalize()) for status in cls]
+
+
+class ContentTypes(str, Enum):
+    """Media types the API produces or accepts outside of JSON"""
+    CSV = "text/csv"
+    JSONL = "application/x-ndjson"
+    ZIP = "application/zip"
+    EVENT_STREAM = "text/event-stream"
+
+
+class ExportFormats(str, Enum):
+    """Values accepted by ``?export=``"""
+    CSV = "csv"
+    JSONL = "jsonl"
+    ZIP = "zip"
+
+
+class HomeworkProgress(str, Enum):
+    """Where a student stands on a homework: nothing handed in, awaiting a grade, or graded"""
+    PENDING = "pending"
+    SUBMITTED = "submitted"
+    GRADED = "graded"
+
+
+class NotificationEvents(str, Enum):
+    """Event types written to the notification outbox"""
+    GRADE_CREATED = "grade.created"
+    COMMENT_CREATED = "comment.created"
+    HOMEWORK_PUBLISHED = "homework.published"
+
+
+class BrokerTopics(str, Enum):
+    """Topic names on the in-process broker (``common.broker``)"""
+    GRADE_COMMENTS = "grade-comments:{grade_id}"
+
+
+class StatisticsScope(str, Enum):
+    """Level a grade statistics result was computed for"""
+    HOMEWORK = "homework"
+    LECTURE = "lecture"
+    COURSE = "course"
+
+
+class SimilarityScope(str, Enum):
+    """Which submissions a similarity report compares a homework's submissions against"""
+    HOMEWORK = "homework"
+    COURSES = "courses"
+
+
+class JobQueues(str, Enum):
+    """Background job queues; each gets its own worker pool (``common.jobs``)"""
+    PRESENTATION_PREVIEWS = "presentation-previews"
+    NOTIFICATION_DISPATCH = "notification-dispatch"
+    SUBMISSION_SIMILARITY = "submission-similarity"
+
+
+class BulkRowStatus(str, Enum):
+    """Outcome of a single row in a bulk write"""
+    CREATED = "created"
+    UPDATED = "updated"
+    ERROR = "error"
+
+
+class MetricFields(str, Enum):
+    """Keys of the per-endpoint request metrics (``common.metrics``)"""
+    REQUESTS = "requests"
+    OVER_BUDGET = "over_budget"
+    QUERIES = "queries"
+    DB_TIME_MS = "db_time_ms"
+    SERIALIZATION_TIME_MS = "serialization_time_ms"
+    DURATION_MS = "duration_ms"
+    RESPONSE_BYTES = "response_bytes"
+    COUNT = "count"
+    SUM = "sum"
+    MIN = "min"
+    MAX = "max"
+    P50 = "p50"
+    P95 = "p95"
+    P99 = "p99"
+    BUCKETS = "buckets"
+    LE = "le"
+
+
+class DatasetProfiles(str, Enum):
+    """Named dataset sizes the benchmark suite seeds"""
+    SMOKE = "smoke"
+    MEDIUM = "medium"
+    LARGE = "large"
+
+
+class BenchmarkKinds(str, Enum):
+    """Layer a benchmark case exercises"""
+    ENDPOINT = "endpoint"
+    SERVICE = "service"
+    SERIALIZER = "serializer"
+
+
+class LoadJourneys(str, Enum):
+    """Scripted user journeys the load-testing harness can run"""
+    BROWSE_COURSES = "browse_courses"
+    SUBMIT_HOMEWORK = "submit_homework"
+    GRADE_BATCH = "grade_batch"
+    LOGOUT_STORM = "logout_storm"
+
+
+class LoadSteps(str, Enum):
+    """Requests a load-testing journey is made of; reported one by one"""
+    LOGIN = "login"
+    LIST_COURSES = "list_courses"
+    MY_HOMEWORKS = "my_homeworks"
+    SUBMIT = "submit"
+    RESUBMIT = "resubmit"
+    GRADING_QUEUE = "grading_queue"
+    BULK_GRADE = "bulk_grade"
+    LOGOUT = "logout"
+    AFTER_LOGOUT = "after_logout"
+
+
+class JourneyOutcomes(str, Enum):
+    STARTED = "started"
+    COMPLETED = "completed"
+    FAILED = "failed"
@@ -0,0 +1,164 @@
+from typing import Iterator, Optional
+
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+from common.enums import QueryParams, RequestData, ViewActions
+
+PATH_SEPARATOR = "."
+LIST_SEPARATOR = ","
+LOOKUP_SEPARATOR = "__"
+
+
+def _parse_list(raw: Optional[str]) -> Optional[set[str]]:
+    if raw is None:
+        return None
+    return {item.strip() for item in raw.split(LIST_SEPARATOR) if item.strip()}
+
+
+def _with_prefixes(paths: set[str]) -> set[str]:
+    """``a.b.c`` also expands ``a.b`` and ``a``"""
+    expanded = set()
+    for path in paths:
+        parts = path.split(PATH_SEPARATOR)
+        expanded.update(PATH_SEPARATOR.join(parts[:depth]) for depth in range(1, len(parts) + 1))
+    return expanded
+
+
+class FieldSelection:
+    """
+    Parsed ``?fields=`` and ``?expand=`` parameters.
+
+    ``fields`` lists dotted paths to keep (``id,submission.student.email``);
+    naming a nested field keeps all of it. ``expand`` lists the nested
+    serializers to render in full; once it is given, every other nested
+    serializer collapses to its primary key. Both are ignored unless the
+    request is a read.
+    """
+
+    def __init__(self, fields: Optional[set[str]] = None, expand: Optional[set[str]] = None):
+        self.fields = fields
+        self.expand = _with_prefixes(expand) if expand is not None else None
+
+    @classmethod
+    def from_request(cls, request) -> Optional["FieldSelection"]:
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        params = request.query_params
+        fields = _parse_list(params.get(QueryParams.FIELDS.value))
+        expand = _parse_list(params.get(QueryParams.EXPAND.value))
+        if fields is None and expand is None:
+            return None
+        return cls(fields=fields, expand=expand)
+
+    def allowed(self, path: str) -> Optional[set[str]]:
+        """Field names to keep in the serializer at ``path``; None keeps everything"""
+        if self.fields is None:
+            return None
+        prefix = f"{path}{PATH_SEPARATOR}" if path else ""
+        allowed = set()
+        for selected in self.fields:
+            if path and (selected == path or path.startswith(f"{selected}{PATH_SEPARATOR}")):
+                return None
+            if selected.startswith(prefix):
+                allowed.add(selected[len(prefix):].split(PATH_SEPARATOR, 1)[0])
+        return allowed
+
+    def is_expanded(self, path: str) -> bool:
+        return self.expand is None or path in self.expand
+
+
+def _join(path: str, name: str) -> str:
+    return f"{path}{PATH_SEPARATOR}{name}" if path else name
+
+
+def _nested_serializer(field) -> Optional[serializers.BaseSerializer]:
+    if isinstance(field, serializers.ListSerializer):
+        return field.child
+    if isinstance(field, serializers.BaseSerializer):
+        return field
+    return None
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin honouring ``?fields=`` and ``?expand=`` on reads.
+
+    Works at any nesting depth: each nested serializer derives its dotted
+    path from its parents and prunes itself when DRF first builds its fields.
+    """
+
+    def _selection_path(self) -> str:
+        parts = []
+        node = self
+        while node.parent is not None:
+            if node.field_name:
+                parts.append(node.field_name)
+            node = node.parent
+        return PATH_SEPARATOR.join(reversed(parts))
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = FieldSelection.from_request(self.context.get(RequestData.REQUEST.value))
+        if selection is None:
+            return fields
+
+        path = self._selection_path()
+        allowed = selection.allowed(path)
+        if allowed is not None:
+            fields = {name: field for name, field in fields.items() if name in allowed}
+
+        for name, field in list(fields.items()):
+            if _nested_serializer(field) is not None and not selection.is_expanded(_join(path, name)):
+                fields[name] = self._collapse(field)
+        return fields
+
+    @staticmethod
+    def _collapse(field) -> serializers.Field:
+        kwargs = {"read_only": True, "many": isinstance(field, serializers.ListSerializer)}
+        if field.source is not None:
+            kwargs["source"] = field.source
+        return serializers.PrimaryKeyRelatedField(**kwargs)
+
+
+def rendered_relations(serializer_class, selection: FieldSelection, path: str = "", lookup: str = "") -> Iterator[str]:
+    """Yield ORM lookups of the nested serializers that will actually be rendered"""
+    allowed = selection.allowed(path)
+    for name, field in serializer_class._declared_fields.items():
+        nested = _nested_serializer(field)
+        if nested is None or (allowed is not None and name not in allowed):
+            continue
+        field_path = _join(path, name)
+        if not selection.is_expanded(field_path):
+            continue
+        relation = f"{lookup}{LOOKUP_SEPARATOR}{field.source or name}" if lookup else (field.source or name)
+        yield relation
+        yield from rendered_relations(type(nested), selection, field_path, relation)
+
+
+def _select_related_paths(tree: dict, prefix: str = "") -> Iterator[str]:
+    for name, children in tree.items():
+        path = f"{prefix}{LOOKUP_SEPARATOR}{name}" if prefix else name
+        yield path
+        yield from _select_related_paths(children, path)
+
+
+class ExpansionQuerysetMixin:
+    """
+    View mixin that drops ``select_related`` joins nobody will render.
+
+    Only list and retrieve are pruned: other actions may rely on the joined
+    parents for authorization.
+    """
+    prunable_actions = (ViewActions.LIST.value, ViewActions.RETRIEVE.value)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        selection = FieldSelection.from_request(self.request)
+        joins = queryset.query.select_related
+        if selection is None or self.action not in self.prunable_actions or not isinstance(joins, dict):
+            return queryset
+
+        needed = set(rendered_relations(self.get_serializer_class(), selection))
+        kept = [path for path in _select_related_paths(joins) if path in needed]
+        return queryset.select_related(None).select_related(*kept)
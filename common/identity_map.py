@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from django.db.models.signals import post_delete
+
+_MISSING = object()
+
+
+class IdentityMap:
+    """
+    Request-scoped cache of model instances keyed by ``(model, pk)``.
+
+    Every row is loaded at most once per scope and the same Python object is
+    handed to every caller, so a change made by one service is seen by the
+    next. Lookups that found nothing are remembered too.
+    """
+
+    def __init__(self):
+        self._entities: dict = {}
+
+    @staticmethod
+    def _key(model, pk) -> tuple:
+        return model._meta.concrete_model._meta.label_lower, str(pk)
+
+    def get(self, model, pk, queryset=None):
+        """Return the instance for ``pk``, raising ``model.DoesNotExist`` when there is none"""
+        key = self._key(model, pk)
+        instance = self._entities.get(key, _MISSING)
+        if instance is _MISSING:
+            source = queryset if queryset is not None else model._default_manager.all()
+            instance = source.filter(pk=pk).first()
+            self._entities[key] = instance
+        if instance is None:
+            raise model.DoesNotExist(f"{model.__name__} with pk={pk} does not exist")
+        return instance
+
+    def register(self, *instances) -> None:
+        """Seed the map with instances the caller already holds; known rows are kept"""
+        for instance in instances:
+            if instance is None or instance.pk is None:
+                continue
+            key = self._key(type(instance), instance.pk)
+            if self._entities.get(key) is None:
+                self._entities[key] = instance
+
+    def forget(self, model, pk) -> None:
+        self._entities.pop(self._key(model, pk), None)
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+
+_current: ContextVar[Optional[IdentityMap]] = ContextVar("identity_map", default=None)
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    return _current.get()
+
+
+@contextmanager
+def identity_scope() -> Iterator[IdentityMap]:
+    """Activate a fresh identity map for the enclosed block; nested scopes reuse the outer one"""
+    active = _current.get()
+    if active is not None:
+        yield active
+        return
+    identity_map = IdentityMap()
+    token = _current.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current.reset(token)
+
+
+def fetch(model, pk, queryset=None):
+    """
+    Load ``model`` by primary key through the active identity map.
+
+    Outside a scope this is a plain query, so services behave the same when
+    called from management commands or background jobs.
+    """
+    identity_map = _current.get()
+    if identity_map is None:
+        source = queryset if queryset is not None else model._default_manager.all()
+        return source.get(pk=pk)
+    return identity_map.get(model, pk, queryset=queryset)
+
+
+def register(*instances) -> None:
+    identity_map = _current.get()
+    if identity_map is not None:
+        identity_map.register(*instances)
+
+
+def _forget_deleted(sender, instance, **kwargs) -> None:
+    identity_map = _current.get()
+    if identity_map is not None:
+        identity_map.forget(sender, instance.pk)
+
+
+post_delete.connect(_forget_deleted, dispatch_uid="common.identity_map.forget_deleted")
@@ -0,0 +1,55 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from django.db import close_old_connections, connections
+
+logger = logging.getLogger(__name__)
+
+WORKER_THREAD_PREFIX = "ocms-job"
+
+
+class LocalJobQueue:
+    """
+    Process-local background job queue backed by a thread pool per queue name.
+
+    Each named queue gets its own pool sized by its own ``workers``, so slow
+    jobs of one queue never hold up another's. Jobs run off the request
+    path on their own database connection, which is closed when the job
+    finishes. With ``workers=0`` jobs run inline, which keeps tests and
+    management commands deterministic.
+    """
+    _executors: dict[str, ThreadPoolExecutor] = {}
+    _executors_lock = threading.Lock()
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+
+    def submit(self, job: Callable, *args) -> None:
+        if self.workers <= 0:
+            job(*args)
+            return
+        self._get_executor().submit(self._run, job, *args)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """The pool of this queue name, created by its first submit; later instances share it"""
+        with self._executors_lock:
+            executor = LocalJobQueue._executors.get(self.name)
+            if executor is None:
+                executor = LocalJobQueue._executors[self.name] = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix=f"{WORKER_THREAD_PREFIX}-{self.name}",
+                )
+            return executor
+
+    @staticmethod
+    def _run(job: Callable, *args) -> None:
+        close_old_connections()
+        try:
+            job(*args)
+        except Exception:
+            logger.exception("Background job %s failed", getattr(job, "__qualname__", job))
+        finally:
+            connections.close_all()
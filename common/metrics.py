@@ -0,0 +1,170 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence
+
+from django.db import connections
+
+from common.enums import MetricFields
+
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+TIME_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+SIZE_BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUANTILES = ((MetricFields.P50, 0.5), (MetricFields.P95, 0.95), (MetricFields.P99, 0.99))
+OVERFLOW_BOUND = "+Inf"
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram: memory stays constant however many values are observed.
+
+    Quantiles are estimated as the upper bound of the bucket they fall in
+    (the exact maximum for the overflow bucket), which is what the buckets
+    are sized for: spotting an endpoint that moved to a slower bucket.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for position, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.bounds[position] if position < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        empty = not self.count
+        return {
+            MetricFields.COUNT.value: self.count,
+            MetricFields.SUM.value: round(self.total, 3),
+            MetricFields.MIN.value: None if empty else round(self.min, 3),
+            MetricFields.MAX.value: None if empty else round(self.max, 3),
+            **{name.value: self.quantile(q) for name, q in QUANTILES},
+            MetricFields.BUCKETS.value: [
+                {MetricFields.LE.value: bound, MetricFields.COUNT.value: bucket_count}
+                for bound, bucket_count in zip((*self.bounds, OVERFLOW_BOUND), self.counts)
+            ],
+        }
+
+
+@dataclass(frozen=True)
+class RequestSample:
+    """What one request to an endpoint cost"""
+    queries: int
+    db_time_ms: float
+    serialization_time_ms: float
+    duration_ms: float
+    response_bytes: Optional[int] = None
+    over_budget: bool = False
+
+
+class EndpointMetrics:
+    """Histograms of every measured cost of one endpoint (view + action)"""
+
+    def __init__(self):
+        self.requests = 0
+        self.over_budget = 0
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.db_time_ms = Histogram(TIME_BUCKETS_MS)
+        self.serialization_time_ms = Histogram(TIME_BUCKETS_MS)
+        self.duration_ms = Histogram(TIME_BUCKETS_MS)
+        self.response_bytes = Histogram(SIZE_BUCKETS_BYTES)
+
+    def observe(self, sample: RequestSample) -> None:
+        self.requests += 1
+        self.over_budget += sample.over_budget
+        self.queries.observe(sample.queries)
+        self.db_time_ms.observe(sample.db_time_ms)
+        self.serialization_time_ms.observe(sample.serialization_time_ms)
+        self.duration_ms.observe(sample.duration_ms)
+        if sample.response_bytes is not None:
+            # Streamed responses have no size until the client has read them
+            self.response_bytes.observe(sample.response_bytes)
+
+    def snapshot(self) -> dict:
+        return {
+            MetricFields.REQUESTS.value: self.requests,
+            MetricFields.OVER_BUDGET.value: self.over_budget,
+            MetricFields.QUERIES.value: self.queries.snapshot(),
+            MetricFields.DB_TIME_MS.value: self.db_time_ms.snapshot(),
+            MetricFields.SERIALIZATION_TIME_MS.value: self.serialization_time_ms.snapshot(),
+            MetricFields.DURATION_MS.value: self.duration_ms.snapshot(),
+            MetricFields.RESPONSE_BYTES.value: self.response_bytes.snapshot(),
+        }
+
+
+class MetricsRegistry:
+    """
+    Process-local per-endpoint metrics.
+
+    Like ``common.broker``, every worker process keeps its own registry, so
+    the metrics endpoint reports what the process that answered it served.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, EndpointMetrics] = {}
+
+    def observe(self, endpoint: str, sample: RequestSample) -> None:
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            if metrics is None:
+                metrics = self._endpoints[endpoint] = EndpointMetrics()
+            metrics.observe(sample)
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {endpoint: self._endpoints[endpoint].snapshot() for endpoint in sorted(self._endpoints)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+registry = MetricsRegistry()
+
+
+class QueryRecorder:
+    """``execute_wrapper`` that counts the queries run through it and their total time"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryRecorder]:
+    """Record every query this thread runs on any database while the block is active"""
+    recorder = QueryRecorder()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        yield recorder
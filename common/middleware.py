@@ -0,0 +1,168 @@
+import hmac
+import logging
+import random
+import re
+import sys
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from common.identity_map import identity_scope
+from common.metrics import RequestSample, record_queries, registry
+from common.profiling import CollapsedStackWriter, StackSampler
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT_ATTR = "_metrics_endpoint"
+RENDER_TIME_ATTR = "_metrics_render_time"
+MS = 1000
+META_HEADER_PREFIX = "HTTP_"
+
+
+class IdentityMapMiddleware:
+    """Gives every request its own identity map; see ``common.identity_map``"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with identity_scope():
+            return self.get_response(request)
+
+
+class RequestMetricsMiddleware:
+    """
+    Measures what every request costs, per endpoint, into ``common.metrics.registry``.
+
+    The endpoint is the resolved view plus its action (``HomeworkViewSet.list``,
+    ``CourseGradebookView.get``). For each request it records the number of
+    queries and their time, the time spent rendering the response and the
+    response size. Queries a streamed response runs while it is being read, and
+    queries made by background workers, happen after the request and are not
+    counted. Requests over ``REQUEST_METRICS_QUERY_BUDGETS`` (or the default
+    budget) are logged as warnings.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        with record_queries() as queries:
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        endpoint = getattr(request, ENDPOINT_ATTR, None)
+        if endpoint is None:
+            # Nothing resolved (404) or a middleware answered before the view
+            return response
+
+        budget = settings.REQUEST_METRICS_QUERY_BUDGETS.get(endpoint, settings.REQUEST_METRICS_DEFAULT_QUERY_BUDGET)
+        over_budget = budget is not None and queries.count > budget
+        if over_budget:
+            logger.warning(
+                "%s %s ran %d queries (budget %d) taking %.1f ms",
+                request.method, request.path, queries.count, budget, queries.duration * MS,
+                extra={"endpoint": endpoint},
+            )
+
+        registry.observe(endpoint, RequestSample(
+            queries=queries.count,
+            db_time_ms=queries.duration * MS,
+            serialization_time_ms=getattr(request, RENDER_TIME_ATTR, 0.0) * MS,
+            duration_ms=duration * MS,
+            response_bytes=None if response.streaming else len(response.content),
+            over_budget=over_budget,
+        ))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        setattr(request, ENDPOINT_ATTR, self.endpoint_name(request, view_func))
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered (serialized to JSON) right after this hook
+        started = time.perf_counter()
+
+        def rendered(rendered_response):
+            setattr(request, RENDER_TIME_ATTR, time.perf_counter() - started)
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    @staticmethod
+    def endpoint_name(request, view_func) -> str:
+        view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+        if view_class is None:
+            return request.resolver_match.view_name if request.resolver_match else view_func.__qualname__
+        # Viewsets map the HTTP method to an action; plain views are named after the method
+        actions = getattr(view_func, "actions", None) or {}
+        method = request.method.lower()
+        return f"{view_class.__name__}.{actions.get(method, method)}"
+
+
+class RequestProfilerMiddleware:
+    """
+    Samples the stacks of picked requests into per-endpoint collapsed-stack files (flamegraph input).
+
+    A request is picked when its path matches one of ``REQUEST_PROFILING_PATHS``,
+    when it sends ``REQUEST_PROFILING_HEADER`` with ``REQUEST_PROFILING_TOKEN``,
+    or at random with probability ``REQUEST_PROFILING_SAMPLE_RATE``. Its stacks
+    are appended to ``<endpoint>.collapsed`` in ``REQUEST_PROFILING_DIR``, where
+    the endpoint is named as in ``RequestMetricsMiddleware``. While
+    ``REQUEST_PROFILING_ENABLED`` is off the middleware removes itself; while on,
+    a request that is not picked costs a header lookup, a random number and
+    the path patterns.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = settings.REQUEST_PROFILING_SAMPLE_RATE
+        self.paths = [re.compile(pattern) for pattern in settings.REQUEST_PROFILING_PATHS]
+        self.header = META_HEADER_PREFIX + settings.REQUEST_PROFILING_HEADER.upper().replace("-", "_")
+        self.token = settings.REQUEST_PROFILING_TOKEN.encode()
+        self.interval = settings.REQUEST_PROFILING_INTERVAL_MS / MS
+        self.writer = CollapsedStackWriter(settings.REQUEST_PROFILING_DIR)
+
+    def __call__(self, request):
+        if not self.picked(request):
+            return self.get_response(request)
+
+        # Frames from this one up (server, outer middleware) are left out of the stacks
+        with StackSampler(threading.get_ident(), self.interval, root=sys._getframe()) as sampler:
+            response = self.get_response(request)
+
+        endpoint = getattr(request, ENDPOINT_ATTR, None)
+        if endpoint is not None and sampler.stacks:
+            path = self.writer.write(endpoint, sampler.stacks)
+            logger.info(
+                "Profiled %s %s: %d samples appended to %s",
+                request.method, request.path, sum(sampler.stacks.values()), path,
+                extra={"endpoint": endpoint},
+            )
+        return response
+
+    def picked(self, request) -> bool:
+        sent = request.META.get(self.header)
+        if sent is not None and self.token and self._token_matches(sent):
+            return True
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+        return any(pattern.search(request.path) for pattern in self.paths)
+
+    def _token_matches(self, sent: str) -> bool:
+        """Constant-time comparison on bytes: ``compare_digest`` refuses non-ASCII ``str``"""
+        try:
+            # Header values reach META decoded as latin-1
+            return hmac.compare_digest(sent.encode("latin-1"), self.token)
+        except UnicodeEncodeError:
+            return False
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not hasattr(request, ENDPOINT_ATTR):
+            setattr(request, ENDPOINT_ATTR, RequestMetricsMiddleware.endpoint_name(request, view_func))
@@ -0,0 +1,123 @@
+import json
+from base64 import b64decode, b64encode
+from binascii import Error as Base64Error
+from typing import Optional
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from common.enums import PaginationFields
+
+DESCENDING = "-"
+CURSOR_VALUES = "v"
+CURSOR_REVERSE = "r"
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset pagination on ``ordering``: no COUNT and no OFFSET scan, however deep the page.
+
+    Unlike DRF's cursor, which keeps only the first ordering column and
+    steps over ties with an offset, the cursor holds every column of the
+    row a page starts after, and the next page is the row-value comparison
+    ``(a, b) > (x, y)`` spelled out as ``a > x OR (a = x AND b > y)``. Any
+    number of rows may share the leading column; the last column must be
+    unique. Rows are model instances or ``values()`` dicts.
+    """
+
+    page_size = 10
+    page_size_query_param = PaginationFields.PAGE_SIZE.value
+    max_page_size = 100
+    cursor_query_param = PaginationFields.CURSOR.value
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        position, reverse = self.decode_cursor(request, queryset.model)
+        queryset = queryset.order_by(*(self._flip(column) if reverse else column for column in self.ordering))
+        if position is not None:
+            queryset = queryset.filter(self._beyond(position, reverse))
+
+        rows = list(queryset[:self.page_size + 1])
+        more = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        if reverse:
+            self.page.reverse()
+        # Coming back from a later page there is always a next one
+        self.has_next = reverse or more
+        self.has_previous = more if reverse else position is not None
+        return self.page
+
+    def get_next_link(self) -> Optional[str]:
+        if not (self.has_next and self.page):
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not (self.has_previous and self.page):
+            return None
+        return self._link(self.page[0], reverse=True)
+
+    def decode_cursor(self, request, model=None) -> tuple[Optional[list], bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+        try:
+            cursor = json.loads(b64decode(encoded.encode("ascii"), validate=True))
+            raw, reverse = cursor[CURSOR_VALUES], bool(cursor[CURSOR_REVERSE])
+            if len(raw) != len(self.ordering):
+                raise ValueError
+            return [self._to_python(model, column, value) for column, value in zip(self.ordering, raw)], reverse
+        except (ValueError, TypeError, KeyError, UnicodeError, Base64Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, position: list, reverse: bool) -> str:
+        cursor = {CURSOR_VALUES: position, CURSOR_REVERSE: int(reverse)}
+        # isoformat() keeps microseconds, which DjangoJSONEncoder would cut to milliseconds
+        return b64encode(json.dumps(cursor, default=lambda value: value.isoformat()).encode()).decode("ascii")
+
+    def get_paginated_response(self, data):
+        return Response({
+            PaginationFields.NEXT.value: self.get_next_link(),
+            PaginationFields.PREVIOUS.value: self.get_previous_link(),
+            PaginationFields.RESULTS.value: data,
+        })
+
+    def _link(self, row, reverse: bool) -> str:
+        position = [self._value(row, column.lstrip(DESCENDING)) for column in self.ordering]
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, self.encode_cursor(position, reverse),
+        )
+
+    def _beyond(self, position: list, reverse: bool) -> Q:
+        """Rows strictly after ``position`` in the requested direction"""
+        condition = None
+        for column, value in reversed(list(zip(self.ordering, position))):
+            name = column.lstrip(DESCENDING)
+            lookup = "lt" if column.startswith(DESCENDING) != reverse else "gt"
+            beyond = Q(**{f"{name}__{lookup}": value})
+            condition = beyond if condition is None else beyond | (Q(**{name: value}) & condition)
+        return condition
+
+    @staticmethod
+    def _flip(column: str) -> str:
+        return column[1:] if column.startswith(DESCENDING) else f"{DESCENDING}{column}"
+
+    @staticmethod
+    def _value(row, name: str):
+        return row[name] if isinstance(row, dict) else getattr(row, name)
+
+    @staticmethod
+    def _to_python(model, column: str, value):
+        """Turn a JSON cursor value back into the column's type (datetimes arrive as ISO strings)"""
+        try:
+            return model._meta.get_field(column.lstrip(DESCENDING)).to_python(value)
+        except (AttributeError, FieldDoesNotExist):
+            return value
@@ -0,0 +1,82 @@
+import re
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+FRAME_SEPARATOR = ";"
+COLLAPSED_SUFFIX = ".collapsed"
+UNSAFE_FILENAME = re.compile(r"[^\w.-]")
+
+
+def collapse_stack(frame: FrameType, root: Optional[FrameType] = None) -> str:
+    """
+    One stack in collapsed form, outermost frame first: ``module:Class.method;module:function``.
+
+    Frames above ``root`` (the server and middleware that called it) are left out.
+    """
+    names = []
+    while frame is not None and frame is not root:
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}")
+        frame = frame.f_back
+    return FRAME_SEPARATOR.join(reversed(names))
+
+
+class StackSampler:
+    """
+    Statistical profiler of one thread: a helper thread records its stack every ``interval`` seconds.
+
+    The profiled thread is not instrumented at all; its cost is the helper
+    taking the GIL once per sample. A thread busy in Python code hands over
+    the GIL only every ``sys.getswitchinterval()`` (5 ms by default), so
+    shorter intervals only help while it waits on I/O such as the database.
+    """
+
+    def __init__(self, thread_id: int, interval: float, root: Optional[FrameType] = None):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.root = root
+        self.stacks: Counter = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse_stack(frame, self.root)] += 1
+
+
+class CollapsedStackWriter:
+    """
+    Appends sampled stacks to one ``<endpoint>.collapsed`` file per endpoint.
+
+    Every line is ``stack count``, the input ``flamegraph.pl`` and
+    speedscope read; repeated stacks from later requests are summed by them.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+
+    def path(self, endpoint: str) -> Path:
+        return self.directory / f"{UNSAFE_FILENAME.sub('_', endpoint)}{COLLAPSED_SUFFIX}"
+
+    def write(self, endpoint: str, stacks: Counter) -> Path:
+        path = self.path(endpoint)
+        lines = "".join(f"{stack} {count}\n" for stack, count in stacks.items() if stack)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with path.open("a") as collapsed:
+                collapsed.write(lines)
+        return path
@@ -0,0 +1,131 @@
+import csv
+import json
+import time
+import zipfile
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils.http import content_disposition_header
+
+from common.enums import ContentTypes, HttpHeaders
+
+JSONL_SEPARATOR = "\n"
+SSE_KEEPALIVE = ": keepalive\n\n"
+SSE_RETRY_MS = 3000
+
+
+class Echo:
+    """Write-only file-like object: ``write`` hands the encoded line straight back"""
+
+    def write(self, value):
+        return value
+
+
+class ClosingIterator:
+    """Wraps a response iterable so ``on_close`` runs when Django closes the response, even if it was never read"""
+
+    def __init__(self, iterable: Iterable, on_close: Callable[[], None]):
+        self._iterator = iter(iterable)
+        self._on_close = on_close
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._iterator)
+
+    def close(self) -> None:
+        self._on_close()
+
+
+class DrainableSink:
+    """Unseekable write-only sink for ``zipfile``; whatever was written so far is drained and yielded"""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_csv(rows: Iterable[Iterable]) -> Iterator[str]:
+    """Encode rows one line at a time; nothing but the current row is held in memory"""
+    writer = csv.writer(Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_jsonl(records: Iterable[dict]) -> Iterator[str]:
+    encoder = DjangoJSONEncoder()
+    for record in records:
+        yield encoder.encode(record) + JSONL_SEPARATOR
+
+
+def iter_zip(entries: Iterable[tuple[str, Iterable]]) -> Iterator[bytes]:
+    """
+    Stream a deflated ZIP archive built from ``(name, chunks)`` entries.
+
+    The archive is written to an unseekable sink, so ``zipfile`` emits data
+    descriptors and every member is flushed to the client as it is added.
+    Only the central directory (one small record per member) is kept.
+    """
+    sink = DrainableSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, chunks in entries:
+            with archive.open(name, mode="w") as member:
+                for chunk in chunks:
+                    member.write(chunk.encode() if isinstance(chunk, str) else chunk)
+            yield sink.drain()
+    yield sink.drain()
+
+
+def format_event(data, event_id: Optional[Any] = None) -> str:
+    """One Server-Sent Events frame carrying ``data`` as JSON"""
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines.append(f"data: {json.dumps(data, cls=DjangoJSONEncoder)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def iter_events(wait: Callable[[float], list], encode: Callable[[Any], tuple], *,
+                duration: float, heartbeat: float) -> Iterator[str]:
+    """
+    Server-Sent Events fed by a blocking ``wait(timeout)``.
+
+    Every batch ``wait`` returns becomes frames through ``encode(item) ->
+    (event_id, data)``; an empty batch becomes a keepalive comment so
+    proxies keep the connection open. The stream ends after ``duration``
+    seconds and the client reconnects with ``Last-Event-ID``.
+    """
+    yield f"retry: {SSE_RETRY_MS}\n\n"
+    deadline = time.monotonic() + duration
+    while True:
+        remaining = max(deadline - time.monotonic(), 0)
+        batch = wait(min(heartbeat, remaining))
+        if batch:
+            for item in batch:
+                event_id, data = encode(item)
+                yield format_event(data, event_id)
+        elif remaining:
+            yield SSE_KEEPALIVE
+        if time.monotonic() >= deadline:
+            return
+
+
+def streaming_download(chunks: Iterable, content_type: str, filename: str) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    response[HttpHeaders.CONTENT_DISPOSITION.value] = content_disposition_header(True, filename)
+    return response
+
+
+def streaming_csv_response(rows: Iterable[Iterable], filename: str) -> StreamingHttpResponse:
+    return streaming_download(iter_csv(rows), ContentTypes.CSV.value, filename)
@@ -45,10 +45,14 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt.token_blacklist',
     'apps.users',
     'apps.courses',
-    'apps.homeworks'
+    'apps.homeworks',
+    'apps.notifications',
+    'apps.monitoring',
 ]
 
 MIDDLEWARE = [
+    'common.middleware.RequestMetricsMiddleware',
+    'common.middleware.RequestProfilerMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -56,6 +60,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'common.middleware.IdentityMapMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -178,6 +183,98 @@ STATIC_URL = 'static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Presentation downloads: "direct" streams from Django (Range/conditional aware),
+# "x-accel-redirect"/"x-sendfile" hand the transfer to the web server,
+# "signed-url" redirects to a short-lived token URL.
+PRESENTATION_DELIVERY_BACKEND = os.getenv('PRESENTATION_DELIVERY_BACKEND', 'direct')
+PRESENTATION_ACCEL_REDIRECT_PREFIX = os.getenv('PRESENTATION_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+PRESENTATION_SIGNED_URL_MAX_AGE = int(os.getenv('PRESENTATION_SIGNED_URL_MAX_AGE', '300'))  # seconds
+
+# Blobs written or re-uploaded this recently are never collected when their last lecture goes: the
+# lecture re-using them may not have committed yet. Such blobs are left to `reclaim_presentations`
+PRESENTATION_COLLECT_MIN_AGE = int(os.getenv('PRESENTATION_COLLECT_MIN_AGE', '300'))  # seconds
+
+# Presentation previews are rendered after commit by an in-process worker pool;
+# 0 workers renders inline (tests, management commands).
+PRESENTATION_PREVIEW_WORKERS = int(os.getenv('PRESENTATION_PREVIEW_WORKERS', '2'))
+# A preview still pending after this long lost its job and is rendered again (`render_previews`)
+PRESENTATION_PREVIEW_TIMEOUT = int(os.getenv('PRESENTATION_PREVIEW_TIMEOUT', '600'))  # seconds
+PRESENTATION_THUMBNAIL_WIDTH = 320  # pixels
+PRESENTATION_PREVIEW_WIDTH = 1024  # pixels
+
+# Submission bodies above this many bytes are stored zlib-compressed in their own table
+SUBMISSION_CONTENT_COMPRESSION_THRESHOLD = int(os.getenv('SUBMISSION_CONTENT_COMPRESSION_THRESHOLD', '4096'))
+
+# Every content write keeps a revision: a compressed delta against the previous one, with a full
+# snapshot every SNAPSHOT_INTERVAL revisions. At most LIMIT revisions (plus the rest of the oldest
+# snapshot group) are kept; older whole groups are dropped when a new snapshot is written
+SUBMISSION_REVISION_SNAPSHOT_INTERVAL = int(os.getenv('SUBMISSION_REVISION_SNAPSHOT_INTERVAL', '10'))
+SUBMISSION_REVISION_LIMIT = int(os.getenv('SUBMISSION_REVISION_LIMIT', '50'))
+
+# The default cache stays per-process. Grade statistics get their own cache, which must be shared by
+# every worker process: they are invalidated by replacing a per-course version in it, which a
+# per-process (locmem) cache would only show to the worker that handled the write. REDIS_URL selects
+# Django's Redis backend (needs the redis package); otherwise entries live in a database table created
+# by `manage.py createcachetable` (check fails with homeworks.E001 while it is missing)
+REDIS_URL = os.getenv('REDIS_URL')
+CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'grade_statistics': (
+        {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': REDIS_URL}
+        if REDIS_URL else
+        {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'grade_statistics_cache'}
+    ),
+}
+
+# Grade statistics are cached per course until the next grade write bumps its version
+GRADE_STATISTICS_CACHE_TIMEOUT = int(os.getenv('GRADE_STATISTICS_CACHE_TIMEOUT', '3600'))  # seconds
+
+# New grade comments are pushed to waiting clients: long-polls are answered after at most
+# GRADE_COMMENT_POLL_TIMEOUT, event streams send a keepalive every GRADE_COMMENT_STREAM_HEARTBEAT
+# and are closed (the client reconnects) after GRADE_COMMENT_STREAM_DURATION
+GRADE_COMMENT_POLL_TIMEOUT = float(os.getenv('GRADE_COMMENT_POLL_TIMEOUT', '25'))  # seconds
+GRADE_COMMENT_STREAM_HEARTBEAT = float(os.getenv('GRADE_COMMENT_STREAM_HEARTBEAT', '15'))  # seconds
+GRADE_COMMENT_STREAM_DURATION = float(os.getenv('GRADE_COMMENT_STREAM_DURATION', '300'))  # seconds
+
+# Outbox events are fanned out into inboxes by a background worker after each commit;
+# 0 workers dispatches inline. The batch size bounds both events claimed and rows inserted per statement
+NOTIFICATION_DISPATCH_WORKERS = int(os.getenv('NOTIFICATION_DISPATCH_WORKERS', '1'))
+NOTIFICATION_DISPATCH_BATCH_SIZE = int(os.getenv('NOTIFICATION_DISPATCH_BATCH_SIZE', '500'))
+
+# Near-duplicate detection: each submission gets a MinHash signature of PERMUTATIONS values over its
+# SHINGLE_SIZE-word windows, built after commit by a worker pool (0 = inline). The signature is cut
+# into BANDS LSH bands; 16 bands of 8 rows make pairs above ~0.7 similarity likely candidates
+SUBMISSION_SIMILARITY_WORKERS = int(os.getenv('SUBMISSION_SIMILARITY_WORKERS', '1'))
+SUBMISSION_SIMILARITY_PERMUTATIONS = 128
+SUBMISSION_SIMILARITY_BANDS = 16
+SUBMISSION_SIMILARITY_SHINGLE_SIZE = 3  # words
+SUBMISSION_SIMILARITY_THRESHOLD = float(os.getenv('SUBMISSION_SIMILARITY_THRESHOLD', '0.8'))
+SUBMISSION_SIMILARITY_BATCH_SIZE = 500
+
+# Every request's query count, DB time, render time and response size are aggregated per endpoint
+# ("ViewClass.action") and served at /api/metrics/. Requests that run more queries than their
+# endpoint's budget (or the default budget; None disables it) are logged as warnings
+REQUEST_METRICS_ENABLED = os.getenv('REQUEST_METRICS_ENABLED', 'true').lower() == 'true'
+REQUEST_METRICS_DEFAULT_QUERY_BUDGET = int(os.getenv('REQUEST_METRICS_DEFAULT_QUERY_BUDGET', '20'))
+REQUEST_METRICS_QUERY_BUDGETS = {
+    'HomeworkViewSet.list': 6,
+    'HomeworkSubmissionViewSet.list': 8,
+    'CourseGradebookView.get': 8,
+    'StudentHomeworkView.get': 4,
+    'GradingQueueView.get': 4,
+}
+
+# Opt-in sampling profiler: picked requests (matching path regex, the header carrying the token, or
+# a random sample) get their stacks sampled every REQUEST_PROFILING_INTERVAL_MS and appended to
+# <endpoint>.collapsed files, ready for flamegraph.pl or speedscope. Disabled, it leaves the chain
+REQUEST_PROFILING_ENABLED = os.getenv('REQUEST_PROFILING_ENABLED', 'false').lower() == 'true'
+REQUEST_PROFILING_SAMPLE_RATE = float(os.getenv('REQUEST_PROFILING_SAMPLE_RATE', '0'))
+REQUEST_PROFILING_PATHS = [pattern for pattern in os.getenv('REQUEST_PROFILING_PATHS', '').split(',') if pattern]
+REQUEST_PROFILING_HEADER = 'X-Profile-Request'
+REQUEST_PROFILING_TOKEN = os.getenv('REQUEST_PROFILING_TOKEN', '')
+REQUEST_PROFILING_INTERVAL_MS = float(os.getenv('REQUEST_PROFILING_INTERVAL_MS', '2'))
+REQUEST_PROFILING_DIR = Path(os.getenv('REQUEST_PROFILING_DIR', BASE_DIR / 'profiles'))
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
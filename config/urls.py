@@ -25,6 +25,8 @@ urlpatterns = [
     path('api/', include('apps.users.urls')),
     path('api/', include('apps.courses.urls')),
     path('api/', include('apps.homeworks.urls')),
+    path('api/', include('apps.notifications.urls')),
+    path('api/', include('apps.monitoring.urls')),
     # API schema and Swagger UI
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),